@@ -0,0 +1,395 @@
+"""
+API Stub Server
+外部API スタブサーバー - 記録済みの NewsAPI / GNews / NVD / DeepL / Claude レスポンスを
+ローカルの aiohttp サーバーから返し、遅延・エラー率・記事件数を設定して再生する
+
+fixtures/api/ のレスポンスは各APIの実レスポンスと同じ構造で、記事は件数・文字数・
+ソースなどの形を保ったまま、重複除去で潰れないよう語彙から本文を組み立てた派生記事に
+置き換えて返す（同じリクエストには同じ記事を返す）。
+
+使用例:
+    python benchmarks/api_stub_server.py --port 8900 --volume 10 --latency-scale 0.5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import zlib
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+from aiohttp import web
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'api')
+
+# サービス別の既定応答遅延（ミリ秒、実APIの中央値程度）
+DEFAULT_LATENCY_MS = {
+    'newsapi': 150,
+    'gnews': 200,
+    'nvd': 400,
+    'deepl': 120,
+    'claude': 1500,
+}
+
+# 本番コードの base_url / api_url を置き換えるパス
+ROUTE_PREFIXES = {
+    'newsapi': '/newsapi/v2',
+    'gnews': '/gnews/api/v4',
+    'nvd': '/nvd/rest/json/cves/2.0',
+    'deepl': '/deepl/v2',
+    'claude': '/anthropic',
+}
+
+
+def load_fixture(name: str) -> Dict[str, Any]:
+    with open(os.path.join(FIXTURES_DIR, f'{name}.json'), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class ArticleFactory:
+    """記録済み記事をひな形に、語彙から派生記事を作る"""
+
+    def __init__(self, vocabulary: Dict[str, list]):
+        self.vocabulary = vocabulary
+
+    def sentence(self, rng: random.Random, language: str, words: int) -> str:
+        tokens = rng.choices(self.vocabulary[language], k=words)
+        if language == 'ja':
+            particles = ['の', 'が', 'で', 'を', 'と', '、']
+            return ''.join(token + rng.choice(particles) for token in tokens[:-1]) + tokens[-1] + '。'
+        return ' '.join(tokens).capitalize() + '.'
+
+    def title(self, rng: random.Random, language: str) -> str:
+        if language == 'ja':
+            return self.sentence(rng, 'ja', rng.randint(5, 7)).rstrip('。')
+        return ' '.join(word.capitalize() for word in rng.sample(self.vocabulary['en'], rng.randint(7, 10)))
+
+    def text(self, rng: random.Random, language: str, length: int) -> str:
+        sentences = []
+        total = 0
+        while total < length:
+            sentence = self.sentence(rng, language, rng.randint(8, 14))
+            sentences.append(sentence)
+            total += len(sentence) + 1
+        return ('' if language == 'ja' else ' ').join(sentences)
+
+    def url(self, rng: random.Random, template_url: str) -> str:
+        parts = urlsplit(template_url)
+        section = parts.path.strip('/').split('/')[0] or 'news'
+        slug = '-'.join(rng.sample(self.vocabulary['en'], 5))
+        return f"{parts.scheme}://{parts.netloc}/{section}/{slug}-{rng.getrandbits(32):08x}"
+
+    def published_at(self, rng: random.Random) -> str:
+        moment = datetime.utcnow() - timedelta(minutes=rng.randint(0, 24 * 60))
+        return moment.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    def news_article(self, rng: random.Random, template: Dict[str, Any], language: str) -> Dict[str, Any]:
+        """NewsAPI / GNews 形式の記事（キー構成はひな形のまま）"""
+        article = dict(template)
+        article['title'] = self.title(rng, language)
+        article['description'] = self.text(rng, language, len(template.get('description') or '') or 120)
+        article['content'] = self.text(rng, language, len(template.get('content') or '') or 600)
+        article['url'] = self.url(rng, template['url'])
+        article['publishedAt'] = self.published_at(rng)
+        return article
+
+    def vulnerability(self, rng: random.Random, template: Dict[str, Any]) -> Dict[str, Any]:
+        """NVD 形式の脆弱性（CVE ID と説明のみ差し替え）"""
+        cve = json.loads(json.dumps(template['cve']))
+        cve['id'] = f"CVE-2025-{rng.randint(10000, 99999)}"
+        cve['published'] = self.published_at(rng)[:-1] + '.000'
+        length = len(cve['descriptions'][0]['value'])
+        cve['descriptions'] = [{'lang': 'en', 'value': self.text(rng, 'en', length)}]
+        return {'cve': cve}
+
+
+class APIStubServer:
+    """記録済みAPIレスポンスを返すスタブサーバー
+
+    volume は1レスポンスあたりの記事件数の倍率（1倍 = 記録済みレスポンスの件数）。
+    遅延は latency_ms（サービス別）× latency_scale に ±20% の揺らぎを加え、
+    error_rate の確率で 503 を返す。
+    """
+
+    def __init__(
+        self,
+        volume: int = 1,
+        latency_ms: Optional[Dict[str, float]] = None,
+        latency_scale: float = 1.0,
+        error_rate: Optional[Dict[str, float]] = None,
+        seed: int = 42
+    ):
+        self.volume = volume
+        self.latency_ms = {**DEFAULT_LATENCY_MS, **(latency_ms or {})}
+        self.latency_scale = latency_scale
+        self.error_rate = error_rate or {}
+        self.seed = seed
+        self.fixtures = {
+            name: load_fixture(name)
+            for name in ('newsapi_top_headlines', 'newsapi_everything', 'gnews_search',
+                         'gnews_top_headlines', 'nvd_cves', 'deepl_translate', 'claude_messages')
+        }
+        self.factory = ArticleFactory(load_fixture('vocabulary'))
+        self._rng = random.Random(seed)
+        self._runner: Optional[web.AppRunner] = None
+        self.base_url: Optional[str] = None
+        self.reset_stats()
+
+    # ------------------------------------------------------------------
+    # 起動・設定
+    # ------------------------------------------------------------------
+
+    def create_app(self) -> web.Application:
+        app = web.Application(client_max_size=16 * 1024 * 1024)
+        app.router.add_get(f"{ROUTE_PREFIXES['newsapi']}/top-headlines", self.newsapi_top_headlines)
+        app.router.add_get(f"{ROUTE_PREFIXES['newsapi']}/everything", self.newsapi_everything)
+        app.router.add_get(f"{ROUTE_PREFIXES['gnews']}/search", self.gnews_search)
+        app.router.add_get(f"{ROUTE_PREFIXES['gnews']}/top-headlines", self.gnews_top_headlines)
+        app.router.add_get(ROUTE_PREFIXES['nvd'], self.nvd_cves)
+        app.router.add_post(f"{ROUTE_PREFIXES['deepl']}/translate", self.deepl_translate)
+        app.router.add_get(f"{ROUTE_PREFIXES['deepl']}/usage", self.deepl_usage)
+        app.router.add_post(f"{ROUTE_PREFIXES['claude']}/v1/messages", self.claude_messages)
+        app.router.add_get('/_control', self.get_control)
+        app.router.add_post('/_control', self.post_control)
+        return app
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """サーバーを起動してベースURLを返す（port=0 は空きポート）"""
+        self._runner = web.AppRunner(self.create_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://{host}:{bound_port}"
+        return self.base_url
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def configure(self, volume: Optional[int] = None, seed: Optional[int] = None, reset: bool = True):
+        """記事件数倍率・シードを変更（既定で統計もリセット）"""
+        if volume is not None:
+            self.volume = volume
+        if seed is not None:
+            self.seed = seed
+            self._rng = random.Random(seed)
+        if reset:
+            self.reset_stats()
+
+    def reset_stats(self):
+        self.stats: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: {'requests': 0, 'errors': 0, 'items': 0, 'latency_ms': 0.0})
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            service: {**values, 'latency_ms': round(values['latency_ms'], 1)}
+            for service, values in sorted(self.stats.items())
+        }
+
+    # ------------------------------------------------------------------
+    # 共通処理
+    # ------------------------------------------------------------------
+
+    async def _simulate(self, service: str) -> Optional[web.Response]:
+        """遅延を入れ、エラー注入時は 503 レスポンスを返す"""
+        stats = self.stats[service]
+        stats['requests'] += 1
+        delay_ms = self.latency_ms.get(service, 0) * self.latency_scale * self._rng.uniform(0.8, 1.2)
+        stats['latency_ms'] += delay_ms
+        await asyncio.sleep(delay_ms / 1000)
+
+        if self._rng.random() < self.error_rate.get(service, 0.0):
+            stats['errors'] += 1
+            return web.json_response(
+                {'status': 'error', 'code': 'serviceUnavailable', 'message': 'Injected stub failure'},
+                status=503)
+        return None
+
+    def _request_rng(self, service: str, request: web.Request, body: str = '') -> random.Random:
+        """同じリクエスト（日時・APIキー以外のパラメータが同じ）には同じ記事を返す乱数"""
+        params = sorted(
+            (key, value) for key, value in request.query.items()
+            if key not in ('apiKey', 'apikey', 'token') and 'Date' not in key
+        )
+        key = f"{self.seed}:{service}:{request.path}:{params}:{body}"
+        return random.Random(zlib.crc32(key.encode('utf-8')))
+
+    def _articles(self, rng: random.Random, templates: list, language: str) -> list:
+        return [
+            self.factory.news_article(rng, templates[index % len(templates)], language)
+            for index in range(len(templates) * self.volume)
+        ]
+
+    # ------------------------------------------------------------------
+    # ニュースAPI
+    # ------------------------------------------------------------------
+
+    async def _news_response(self, request: web.Request, service: str, fixture_name: str,
+                             total_key: str) -> web.Response:
+        error = await self._simulate(service)
+        if error is not None:
+            return error
+        fixture = self.fixtures[fixture_name]
+        language = 'ja' if request.query.get('country') == 'jp' or request.query.get('lang') == 'ja' else 'en'
+        articles = self._articles(self._request_rng(service, request), fixture['articles'], language)
+        self.stats[service]['items'] += len(articles)
+        response = {key: value for key, value in fixture.items() if key != 'articles'}
+        response[total_key] = max(fixture.get(total_key, 0), len(articles))
+        response['articles'] = articles
+        return web.json_response(response)
+
+    async def newsapi_top_headlines(self, request: web.Request) -> web.Response:
+        return await self._news_response(request, 'newsapi', 'newsapi_top_headlines', 'totalResults')
+
+    async def newsapi_everything(self, request: web.Request) -> web.Response:
+        return await self._news_response(request, 'newsapi', 'newsapi_everything', 'totalResults')
+
+    async def gnews_search(self, request: web.Request) -> web.Response:
+        return await self._news_response(request, 'gnews', 'gnews_search', 'totalArticles')
+
+    async def gnews_top_headlines(self, request: web.Request) -> web.Response:
+        return await self._news_response(request, 'gnews', 'gnews_top_headlines', 'totalArticles')
+
+    async def nvd_cves(self, request: web.Request) -> web.Response:
+        error = await self._simulate('nvd')
+        if error is not None:
+            return error
+        fixture = self.fixtures['nvd_cves']
+        rng = self._request_rng('nvd', request)
+        templates = fixture['vulnerabilities']
+        vulnerabilities = [
+            self.factory.vulnerability(rng, templates[index % len(templates)])
+            for index in range(len(templates) * self.volume)
+        ]
+        self.stats['nvd']['items'] += len(vulnerabilities)
+        response = {key: value for key, value in fixture.items() if key != 'vulnerabilities'}
+        response.update(resultsPerPage=len(vulnerabilities), totalResults=len(vulnerabilities),
+                        vulnerabilities=vulnerabilities,
+                        timestamp=datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%S.000'))
+        return web.json_response(response)
+
+    # ------------------------------------------------------------------
+    # 翻訳・分析API
+    # ------------------------------------------------------------------
+
+    async def deepl_translate(self, request: web.Request) -> web.Response:
+        """入力文字列ごとに訳文を返す（訳文は入力と同じ長さの日本語文）"""
+        form = await request.post()
+        error = await self._simulate('deepl')
+        if error is not None:
+            return error
+        texts = form.getall('text', [])
+        translation = self.fixtures['deepl_translate']['translations'][0]
+        translations = []
+        for text in texts:
+            rng = random.Random(zlib.crc32(text.encode('utf-8')))
+            translations.append({
+                'detected_source_language': translation['detected_source_language'],
+                'text': self.factory.text(rng, 'ja', max(len(text) // 2, 1))[:max(len(text), 1)]
+            })
+        self.stats['deepl']['items'] += len(texts)
+        self.stats['deepl'].setdefault('characters', 0)
+        self.stats['deepl']['characters'] += sum(len(text) for text in texts)
+        return web.json_response({'translations': translations})
+
+    async def deepl_usage(self, request: web.Request) -> web.Response:
+        return web.json_response({
+            'character_count': int(self.stats['deepl'].get('characters', 0)),
+            'character_limit': 500000
+        })
+
+    async def claude_messages(self, request: web.Request) -> web.Response:
+        """Messages API 形式で分析JSONを返す（重要度などはプロンプトから決定的に変える）"""
+        payload = await request.json()
+        error = await self._simulate('claude')
+        if error is not None:
+            return error
+        fixture = self.fixtures['claude_messages']
+        prompt = json.dumps(payload.get('messages', []), ensure_ascii=False)
+        rng = random.Random(zlib.crc32(prompt.encode('utf-8')))
+
+        text = fixture['content'][0]['text']
+        analysis = json.loads(text[text.index('{'):text.rindex('}') + 1])
+        analysis['importance_score'] = rng.randint(3, 9)
+        analysis['sentiment'] = rng.choice(['positive', 'neutral', 'negative'])
+        analysis['sentiment_score'] = round(rng.uniform(-0.8, 0.8), 2)
+        analysis['keywords'] = rng.sample(self.factory.vocabulary['ja'], 5)
+        analysis['summary'] = self.factory.text(rng, 'ja', len(analysis['summary']))
+
+        response = dict(fixture)
+        response['id'] = f"msg_stub{rng.getrandbits(64):016x}"
+        response['model'] = payload.get('model', fixture['model'])
+        response['content'] = [{
+            'type': 'text',
+            'text': '```json\n' + json.dumps(analysis, ensure_ascii=False, indent=2) + '\n```'
+        }]
+        response['usage'] = {'input_tokens': len(prompt) // 4, 'output_tokens': len(response['content'][0]['text']) // 4}
+        self.stats['claude']['items'] += 1
+        return web.json_response(response)
+
+    # ------------------------------------------------------------------
+    # 制御
+    # ------------------------------------------------------------------
+
+    async def get_control(self, request: web.Request) -> web.Response:
+        return web.json_response({'volume': self.volume, 'seed': self.seed, 'stats': self.get_stats()})
+
+    async def post_control(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        self.configure(volume=body.get('volume'), seed=body.get('seed'), reset=body.get('reset', True))
+        return await self.get_control(request)
+
+
+def parse_service_values(items) -> Dict[str, float]:
+    """'claude=800' 形式の指定を辞書に変換"""
+    values = {}
+    for item in items or []:
+        service, _, value = item.partition('=')
+        if service not in DEFAULT_LATENCY_MS or not value:
+            raise argparse.ArgumentTypeError(f"invalid service value: {item}")
+        values[service] = float(value)
+    return values
+
+
+async def serve(args):
+    server = APIStubServer(
+        volume=args.volume,
+        latency_ms=parse_service_values(args.latency),
+        latency_scale=args.latency_scale,
+        error_rate=parse_service_values(args.error_rate),
+        seed=args.seed
+    )
+    base_url = await server.start(args.host, args.port)
+    print(json.dumps({'base_url': base_url, 'routes': ROUTE_PREFIXES}, indent=2, ensure_ascii=False), flush=True)
+    try:
+        while True:
+            await asyncio.sleep(3600)
+    finally:
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Recorded API response stub server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8900)
+    parser.add_argument('--volume', type=int, default=1, help='記事件数倍率')
+    parser.add_argument('--latency', nargs='*', metavar='SERVICE=MS', help='サービス別遅延（例: claude=800）')
+    parser.add_argument('--latency-scale', type=float, default=1.0, help='全サービスの遅延倍率')
+    parser.add_argument('--error-rate', nargs='*', metavar='SERVICE=RATE', help='サービス別エラー率（例: gnews=0.05）')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
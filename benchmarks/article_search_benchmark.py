@@ -0,0 +1,176 @@
+"""
+Article Search Benchmark
+記事全文検索ベンチマーク - FTS5インデックスとLIKE全件走査の比較
+
+使用例:
+    python benchmarks/article_search_benchmark.py --rows 1000000
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from itertools import accumulate
+from pathlib import Path
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models.database import Database
+
+CATEGORIES = ['domestic_social', 'international_social', 'domestic_economy',
+              'international_economy', 'tech', 'security']
+VOCABULARY_SIZE = 20000
+KATAKANA = 'アイウエオカキクケコサシスセソタチツテトナニヌネノハヒフヘホマミムメモラリルレロ'
+
+
+def make_vocabulary(seed: int = 7):
+    """英語風・カタカナ語彙（Zipf分布で出現させる）"""
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    english = [''.join(rng.choices(letters, k=rng.randint(4, 10))) for _ in range(VOCABULARY_SIZE)]
+    japanese = [''.join(rng.choices(KATAKANA, k=rng.randint(3, 5))) for _ in range(VOCABULARY_SIZE // 10)]
+    return english, japanese
+
+
+ENGLISH, JAPANESE = make_vocabulary()
+ZIPF_CUM_WEIGHTS = list(accumulate(1.0 / (rank + 1) for rank in range(VOCABULARY_SIZE)))
+JA_CUM_WEIGHTS = ZIPF_CUM_WEIGHTS[:len(JAPANESE)]
+
+# (説明, クエリ) - 頻出語・中頻度語・稀な語・フレーズ・日本語
+QUERIES = [
+    ('common', ENGLISH[0]),
+    ('medium', ENGLISH[200]),
+    ('rare', ENGLISH[15000]),
+    ('two_terms', f'{ENGLISH[50]} {ENGLISH[120]}'),
+    ('phrase', f'"{ENGLISH[3]} {ENGLISH[4]}"'),
+    ('japanese', JAPANESE[30]),
+]
+
+
+class BenchmarkConfig:
+    """一時ディレクトリを使う設定"""
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def get_storage_path(self, name):
+        return self.root / name
+
+    def get(self, *path, default=None):
+        return default
+
+
+def generate_rows(count: int, seed: int = 42):
+    """合成記事行（articles テーブル形式）"""
+    rng = random.Random(seed)
+    base = datetime(2025, 1, 1)
+    for i in range(count):
+        title = ' '.join(rng.choices(ENGLISH, cum_weights=ZIPF_CUM_WEIGHTS, k=8))
+        translated = ''.join(rng.choices(JAPANESE, cum_weights=JA_CUM_WEIGHTS, k=3)) + 'に関する報道'
+        summary = ' '.join(rng.choices(ENGLISH, cum_weights=ZIPF_CUM_WEIGHTS, k=25))
+        keywords = json.dumps(rng.choices(ENGLISH, cum_weights=ZIPF_CUM_WEIGHTS, k=3))
+        published = (base + timedelta(minutes=i % 525600)).isoformat()
+        yield (f"https://example.com/{i}", f"hash{i}", title, translated, summary,
+               rng.choice(CATEGORIES), rng.randint(1, 10), keywords, published)
+
+
+def populate(database: Database, rows: int, chunk: int = 50000) -> float:
+    """記事投入（FTSはトリガーで同期）、所要秒数を返す"""
+    start = time.perf_counter()
+    with database.get_connection() as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        batch = []
+        for row in generate_rows(rows):
+            batch.append(row)
+            if len(batch) >= chunk:
+                conn.executemany('''
+                    INSERT INTO articles (url, url_hash, title, translated_title, summary,
+                                          category, importance_score, keywords, published_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', batch)
+                batch = []
+        if batch:
+            conn.executemany('''
+                INSERT INTO articles (url, url_hash, title, translated_title, summary,
+                                      category, importance_score, keywords, published_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', batch)
+        conn.commit()
+    return time.perf_counter() - start
+
+
+def like_scan(database: Database, query: str, limit: int):
+    """従来方式相当（インデックス無しの LIKE 全件走査、新しい順）"""
+    terms = [query.strip('"')] if query.startswith('"') else query.split()
+    conditions = ' AND '.join(
+        '(title LIKE ? OR translated_title LIKE ? OR summary LIKE ? OR keywords LIKE ?)' for _ in terms)
+    params = [p for t in terms for p in [f'%{t}%'] * 4]
+    with database.get_connection() as conn:
+        return conn.execute(
+            f"SELECT id FROM articles WHERE {conditions} "
+            f"ORDER BY published_at DESC LIMIT ?", params + [limit]).fetchall()
+
+
+def measure(func, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Article search benchmark')
+    parser.add_argument('--rows', type=int, default=1000000, help='記事数')
+    parser.add_argument('--repeat', type=int, default=5, help='クエリごとの繰り返し回数')
+    parser.add_argument('--limit', type=int, default=20, help='検索結果件数')
+    parser.add_argument('--skip-like', action='store_true', help='LIKE走査の計測を省略')
+    parser.add_argument('--output', help='結果JSON出力パス')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database = Database(BenchmarkConfig(Path(tmp)))
+        insert_seconds = populate(database, args.rows)
+
+        results = {}
+        for label, query in QUERIES:
+            fts = measure(lambda: database.search_articles(query, limit=args.limit), args.repeat)
+            entry = {
+                'query': query,
+                'fts_p50_ms': round(statistics.median(fts) * 1000, 2),
+                'fts_max_ms': round(max(fts) * 1000, 2),
+                'hits': len(database.search_articles(query, limit=args.limit))
+            }
+            if not args.skip_like:
+                like = measure(lambda: like_scan(database, query, args.limit), max(1, args.repeat // 2))
+                entry['like_p50_ms'] = round(statistics.median(like) * 1000, 2)
+                entry['speedup'] = round(statistics.median(like) / statistics.median(fts), 2)
+            results[label] = entry
+
+        db_size = sum(f.stat().st_size for f in Path(tmp).rglob('news.db*'))
+
+    result = {
+        'benchmark': 'article_search',
+        'rows': args.rows,
+        'insert_seconds': round(insert_seconds, 2),
+        'insert_rows_per_second': round(args.rows / insert_seconds),
+        'database_mb': round(db_size / 1024 / 1024, 1),
+        'queries': results,
+        'timestamp': datetime.now().isoformat()
+    }
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""
+Cache Admission Benchmark
+ハイブリッドキャッシュの L1 受け入れ方針の比較 - アクセス列を再生し、受け入れ判定なし
+（従来の LRU のみ）と TinyLFU での L1 ヒット率を L1 の件数ごとに比較する
+
+既定のアクセス列は配信1回分のキャッシュ参照を模したもの:
+  - 毎回読み直す RSS フィード本文（rss:*）
+  - 過去記事の分析結果（analysis:*、Zipf 分布で一部が繰り返し読まれる）
+  - その回限りの NewsAPI レスポンス・翻訳文字列（newsapi:<回>:*, translation:<回>:*）
+--trace で1行1キーのファイルを指定すると、そのアクセス列を再生する。
+
+L2 は件数無制限のインメモリキャッシュで代替する（Redis 不要）。
+
+使用例:
+    python benchmarks/cache_admission_benchmark.py --l1-sizes 100 250 500
+    python benchmarks/cache_admission_benchmark.py --trace access_trace.txt --output result.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+from datetime import datetime
+from typing import Any, Dict, List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.cache_manager_advanced import ADMISSION_POLICIES, HybridCacheBackend, MemoryCacheBackend
+
+
+def synthetic_trace(runs: int, feeds: int, analyses: int, analysis_reads: int,
+                    one_off: int, zipf: float, rng: random.Random) -> List[str]:
+    """配信を runs 回繰り返したときのキャッシュ参照列"""
+    weights = [1.0 / (rank ** zipf) for rank in range(1, analyses + 1)]
+    trace: List[str] = []
+    for run in range(runs):
+        long_lived = [f'rss:feed:{index}' for index in range(feeds)]
+        long_lived += [f'analysis:{index}' for index in
+                       rng.choices(range(analyses), weights=weights, k=analysis_reads)]
+        one_off_keys = [f'newsapi:{run}:{index}' for index in range(one_off // 2)]
+        one_off_keys += [f'translation:{run}:{index}' for index in range(one_off - one_off // 2)]
+
+        # 収集・翻訳の途中で長期エントリが読まれる順に混ぜる
+        run_keys = long_lived + one_off_keys
+        rng.shuffle(run_keys)
+        trace.extend(run_keys)
+    return trace
+
+
+def load_trace(path: str) -> List[str]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+async def replay(trace: List[str], l1_size: int, policy: str) -> Dict[str, Any]:
+    """アクセス列を再生（ミスしたキーは値を作って設定）"""
+    cache = HybridCacheBackend(l1_max_size=l1_size, admission_policy=policy)
+    cache.l2_cache = MemoryCacheBackend(max_size=len(trace) + 1, default_ttl=86400)
+
+    for key in trace:
+        if await cache.get(key) is None:
+            await cache.set(key, {'key': key})
+
+    l1_stats = await cache.l1_cache.get_stats()
+    l1_hits = l1_stats['hits']
+    result = {
+        'policy': policy,
+        'l1_size': l1_size,
+        'l1_hit_ratio': round(l1_hits / len(trace), 4),
+        'l1_evictions': l1_stats['evictions'],
+    }
+    if cache.admission is not None:
+        result['admission'] = cache.admission.stats()
+    return result
+
+
+async def run_benchmark(args) -> Dict[str, Any]:
+    if args.trace:
+        trace = load_trace(args.trace)
+        source = args.trace
+    else:
+        trace = synthetic_trace(args.runs, args.feeds, args.analyses, args.analysis_reads,
+                                args.one_off, args.zipf, random.Random(args.seed))
+        source = 'synthetic'
+
+    comparisons = []
+    for l1_size in sorted(args.l1_sizes):
+        results = {policy: await replay(trace, l1_size, policy) for policy in ADMISSION_POLICIES}
+        baseline = results['none']['l1_hit_ratio']
+        tinylfu = results['tinylfu']['l1_hit_ratio']
+        comparisons.append({
+            'l1_size': l1_size,
+            'lru_hit_ratio': baseline,
+            'tinylfu_hit_ratio': tinylfu,
+            'gain_points': round((tinylfu - baseline) * 100, 2),
+            'results': results,
+        })
+
+    return {
+        'benchmark': 'cache_admission',
+        'trace': source,
+        'accesses': len(trace),
+        'distinct_keys': len(set(trace)),
+        'comparisons': comparisons,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Hybrid cache L1 admission (LRU vs. TinyLFU) hit ratio')
+    parser.add_argument('--trace', help='再生するアクセス列（1行1キー）。省略時は合成')
+    parser.add_argument('--l1-sizes', type=int, nargs='+', default=[100, 250, 500], help='L1 の件数')
+    parser.add_argument('--runs', type=int, default=30, help='合成: 配信回数')
+    parser.add_argument('--feeds', type=int, default=40, help='合成: 毎回読む RSS フィード数')
+    parser.add_argument('--analyses', type=int, default=2000, help='合成: 分析結果の件数')
+    parser.add_argument('--analysis-reads', type=int, default=300, help='合成: 1回あたりの分析結果の参照数')
+    parser.add_argument('--one-off', type=int, default=400, help='合成: 1回あたりの使い捨てキー数')
+    parser.add_argument('--zipf', type=float, default=1.0, help='合成: 分析結果の参照の偏り')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='結果JSON出力パス')
+    args = parser.parse_args()
+
+    result = asyncio.run(run_benchmark(args))
+    result['timestamp'] = datetime.now().isoformat()
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
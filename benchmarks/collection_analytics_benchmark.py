@@ -0,0 +1,166 @@
+"""
+Collection Analytics Benchmark
+収集分析の履歴取得 - 配信 N 日分のセッションを記録し、期間（7・30・90日）ごとの
+履歴メトリクス取得（CollectionAnalytics._get_historical_metrics）の所要時間を計測する
+
+比較用に、従来の保存形式（CacheManager に日別キーで JSON を保存し、期間の日数だけ
+キャッシュを読んで JSON を復元する）も同じデータで計測する。
+
+使用例:
+    python benchmarks/collection_analytics_benchmark.py
+    python benchmarks/collection_analytics_benchmark.py --days 365 --sessions-per-day 3 --ranges 7 30 90 365
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import collectors.collection_analytics as collection_analytics
+from collectors.collection_analytics import CollectionAnalytics, CollectionMetrics
+from utils.cache_manager import CacheManager
+
+
+class BenchmarkConfig:
+    """一時ディレクトリを使う設定"""
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def get_storage_path(self, name):
+        path = self.root / name
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def get(self, *path, default=None):
+        return default
+
+
+def make_metrics(timestamp: datetime, rng: random.Random) -> CollectionMetrics:
+    total = rng.randint(40, 120)
+    return CollectionMetrics(
+        timestamp=timestamp.isoformat(),
+        total_articles=total,
+        articles_by_source={source: total // 4 for source in ('newsapi', 'gnews', 'reuters', 'bbc')},
+        articles_by_category={category: total // 6 for category in
+                              ('domestic_social', 'international_social', 'domestic_economy',
+                               'international_economy', 'tech', 'security')},
+        articles_by_language={'ja': total // 3, 'en': total - total // 3},
+        processing_time=rng.uniform(20, 90),
+        success_rate=rng.uniform(80, 100),
+        duplicate_rate=rng.uniform(2, 15),
+        average_importance=rng.uniform(4, 8),
+        urgent_articles=rng.randint(0, 3),
+        errors=[]
+    )
+
+
+class LegacyAnalyticsStore:
+    """従来の保存形式（日別キーの JSON をキャッシュに保存し、1日ずつ読む）"""
+
+    def __init__(self, cache: CacheManager):
+        self.cache = cache
+
+    def store(self, metrics: CollectionMetrics):
+        date_key = datetime.fromisoformat(metrics.timestamp).strftime('%Y-%m-%d')
+        self.cache.set(f"analytics:daily:{date_key}", json.dumps(asdict(metrics)),
+                       expire=86400 * 400, category='analytics')
+
+    def history(self, start_time: datetime, end_time: datetime) -> List[CollectionMetrics]:
+        metrics = []
+        current_time = start_time
+        while current_time <= end_time:
+            cached_data = self.cache.get(f"analytics:daily:{current_time.strftime('%Y-%m-%d')}",
+                                         category='analytics')
+            if cached_data:
+                metrics.append(CollectionMetrics(**json.loads(cached_data)))
+            current_time += timedelta(days=1)
+        return metrics
+
+
+def measure(func, repeats: int) -> List[float]:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def run_benchmark(args) -> Dict[str, Any]:
+    root = Path(tempfile.mkdtemp(prefix='collection_analytics_benchmark_'))
+    config = BenchmarkConfig(root)
+    collection_analytics.get_config = lambda: config
+
+    analytics = CollectionAnalytics()
+    analytics.timeseries.retention_days.update(raw=args.days + 1, day=args.days + 1)
+    legacy = LegacyAnalyticsStore(CacheManager(config))
+
+    rng = random.Random(args.seed)
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    started = time.perf_counter()
+    for days_ago in range(args.days, 0, -1):
+        for session in range(args.sessions_per_day):
+            metrics = make_metrics(today - timedelta(days=days_ago, hours=-(7 + session * 5)), rng)
+            analytics._store_metrics(metrics)
+            legacy.store(metrics)
+    record_seconds = time.perf_counter() - started
+
+    ranges = []
+    for range_days in args.ranges:
+        end_time = datetime.now()
+        start_time = end_time - timedelta(days=range_days)
+        # 従来形式はメモリ上のキャッシュを持つため、DBからの読み込みを計測するよう毎回消す
+        legacy_samples = measure(
+            lambda: (legacy.cache._memory_cache.clear(), legacy.history(start_time, end_time)), args.repeats)
+        store_samples = measure(lambda: analytics._get_historical_metrics(start_time, end_time), args.repeats)
+        legacy_ms = statistics.median(legacy_samples)
+        store_ms = statistics.median(store_samples)
+        ranges.append({
+            'range_days': range_days,
+            'days_returned': len(analytics._get_historical_metrics(start_time, end_time)),
+            'timeseries_ms': round(store_ms, 3),
+            'legacy_cache_ms': round(legacy_ms, 3),
+            'speedup': round(legacy_ms / store_ms, 1),
+        })
+
+    return {
+        'benchmark': 'collection_analytics',
+        'days': args.days,
+        'sessions_per_day': args.sessions_per_day,
+        'record_seconds': round(record_seconds, 2),
+        'ranges': ranges,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Collection analytics history query (time-series store vs. cache JSON)')
+    parser.add_argument('--days', type=int, default=120, help='記録する日数')
+    parser.add_argument('--sessions-per-day', type=int, default=3, help='1日あたりの収集セッション数')
+    parser.add_argument('--ranges', type=int, nargs='+', default=[7, 30, 90], help='取得期間（日）')
+    parser.add_argument('--repeats', type=int, default=20, help='計測回数（中央値を出力）')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='結果JSON出力パス')
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+    result['timestamp'] = datetime.now().isoformat()
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
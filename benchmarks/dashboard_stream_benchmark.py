@@ -0,0 +1,182 @@
+"""
+Dashboard Stream Benchmark
+ダッシュボードのメトリクス配信 - クライアント数（1・10・100）ごとに、1 tick あたりの
+配信CPU時間と1クライアントあたりの送信バイト数、遅いクライアントが1台いるときの
+tick の所要時間を計測する
+
+比較用に、従来の配信（tick ごとにチャート全体を作り直し、クライアントごとに
+json.dumps して順に await send する）も同じ条件で計測する。従来のチャートは
+matplotlib の PNG だったが、ここでは60分分の系列をそのまま JSON にしたものを
+チャート全体の代わりに使う（PNG より小さいため、従来側に有利な比較）。
+
+使用例:
+    python benchmarks/dashboard_stream_benchmark.py
+    python benchmarks/dashboard_stream_benchmark.py --clients 1 10 100 --ticks 50 --history 720
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from monitoring.dashboard import ApplicationMetrics, ClientChannel, MetricsDeltaStream, SystemMetrics
+
+
+class CountingWebSocket:
+    """送信バイト数を数える WebSocket（delay 秒かけて送信）"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.bytes_sent = 0
+        self.messages = 0
+
+    async def send(self, message: str):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.bytes_sent += len(message.encode('utf-8'))
+        self.messages += 1
+
+    async def close(self):
+        pass
+
+
+def metrics_at(index: int):
+    timestamp = datetime(2026, 10, 1, 9, 0) + timedelta(seconds=5 * index)
+    system = SystemMetrics(timestamp, 10 + index % 50, 50 + index % 7, 8 * 1024 ** 3, 40.0, 100 * 1024 ** 3,
+                           1024 * 1024 * index, 2048 * 1024 * index, 300, [0.5, 0.4, 0.3])
+    app = ApplicationMetrics(timestamp, 3, 100 + index, 95 + index, 5, 4.2, 250.0, 50, 75.0)
+    return system, app
+
+
+class LegacyBroadcaster:
+    """従来の配信（チャート全体を tick ごとに作り、クライアントごとにエンコードして順に送信）"""
+
+    def __init__(self, history: int):
+        self.history: List[Dict[str, Any]] = []
+        self.max_history = history
+
+    async def tick(self, index: int, clients: List[CountingWebSocket]):
+        system, app = metrics_at(index)
+        self.history.append({'system': system.to_dict(), 'app': app.to_dict()})
+        del self.history[:-self.max_history]
+        update_data = {
+            'type': 'metrics_update',
+            'data': {
+                'system_metrics': system.to_dict(),
+                'app_metrics': app.to_dict(),
+                'system_chart': [entry['system'] for entry in self.history],
+                'app_chart': [entry['app'] for entry in self.history],
+                'timestamp': datetime.now().isoformat()
+            }
+        }
+        for client in clients:
+            await client.send(json.dumps(update_data))
+
+
+class DeltaBroadcaster:
+    """差分配信（MetricsDeltaStream と ClientChannel）"""
+
+    def __init__(self, history: int):
+        self.stream = MetricsDeltaStream(max_points=history)
+        self.channels: Dict[CountingWebSocket, ClientChannel] = {}
+
+    def connect(self, clients: List[CountingWebSocket]):
+        for client in clients:
+            channel = self.channels[client] = ClientChannel(client, self.stream, send_timeout=60)
+            channel.start()
+
+    async def tick(self, index: int, clients: List[CountingWebSocket]):
+        self.stream.append(*metrics_at(index))
+        for channel in self.channels.values():
+            channel.notify()
+
+    async def close(self):
+        for channel in self.channels.values():
+            await channel.stop()
+
+
+async def drain():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+async def run_case(mode: str, clients_count: int, args) -> Dict[str, Any]:
+    clients = [CountingWebSocket() for _ in range(clients_count)]
+    broadcaster = LegacyBroadcaster(args.history) if mode == 'legacy' else DeltaBroadcaster(args.history)
+
+    # 履歴を埋めてから接続し、計測する（接続直後の全量送信は計測に含めない）
+    for index in range(args.history):
+        await broadcaster.tick(index, [])
+    if mode == 'delta':
+        broadcaster.connect(clients)
+    await drain()
+    sent_before = sum(client.bytes_sent for client in clients)
+
+    cpu_started = time.process_time()
+    for index in range(args.history, args.history + args.ticks):
+        await broadcaster.tick(index, clients)
+        await drain()
+    cpu_ms = (time.process_time() - cpu_started) * 1000 / args.ticks
+    bytes_per_client = (sum(client.bytes_sent for client in clients) - sent_before) / args.ticks / clients_count
+
+    # 1台が遅い（1回の送信に slow_seconds かかる）ときの tick の所要時間
+    slow = CountingWebSocket(delay=args.slow_seconds)
+    clients.append(slow)
+    if mode == 'delta':
+        broadcaster.connect([slow])
+    await drain()
+    started = time.perf_counter()
+    await broadcaster.tick(args.history + args.ticks, clients)
+    tick_with_slow_ms = (time.perf_counter() - started) * 1000
+
+    if mode == 'delta':
+        await broadcaster.close()
+
+    return {
+        'clients': clients_count,
+        'cpu_ms_per_tick': round(cpu_ms, 3),
+        'bytes_per_client_per_tick': round(bytes_per_client),
+        'tick_ms_with_slow_client': round(tick_with_slow_ms, 2),
+    }
+
+
+async def run_benchmark(args) -> Dict[str, Any]:
+    result = {
+        'benchmark': 'dashboard_stream',
+        'history_points': args.history,
+        'ticks': args.ticks,
+        'slow_client_send_seconds': args.slow_seconds,
+        'delta': [await run_case('delta', clients, args) for clients in args.clients],
+    }
+    if not args.skip_legacy:
+        result['legacy'] = [await run_case('legacy', clients, args) for clients in args.clients]
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Dashboard metrics broadcast (delta stream vs. full payload per client)')
+    parser.add_argument('--clients', type=int, nargs='+', default=[1, 10, 100], help='クライアント数')
+    parser.add_argument('--ticks', type=int, default=30, help='計測する tick 数')
+    parser.add_argument('--history', type=int, default=720, help='チャートの点数（5秒間隔で60分 = 720）')
+    parser.add_argument('--slow-seconds', type=float, default=1.0, help='遅いクライアントの1回の送信秒数')
+    parser.add_argument('--skip-legacy', action='store_true', help='従来実装の計測を省略')
+    parser.add_argument('--output', help='結果JSON出力パス')
+    args = parser.parse_args()
+
+    result = asyncio.run(run_benchmark(args))
+    result['timestamp'] = datetime.now().isoformat()
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,270 @@
+"""
+End-to-End Pipeline Benchmark
+エンドツーエンド・ベンチマーク - 記録済みAPIレスポンスを返すスタブサーバーに向けて
+NewsDeliverySystem の実パイプライン（収集→重複除去→翻訳→分析→レポート→保存）を
+記事件数 1倍・10倍・100倍で実行し、段階別の処理時間をJSONで出力する
+
+各件数は専用のデータディレクトリを持つ子プロセスで実行するため、キャッシュ・DB・
+シングルトンは毎回空の状態から始まる。段階別時間は実行ごとのトレースファイルから集計する。
+
+使用例:
+    python benchmarks/e2e_pipeline_benchmark.py --volumes 1 10 100 --output e2e.json
+    python benchmarks/e2e_pipeline_benchmark.py --volumes 1 5 --latency-scale 0.1 --error-rate gnews=0.1
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List
+
+BENCHMARK_DIR = os.path.abspath(os.path.dirname(__file__))
+SRC_DIR = os.path.abspath(os.path.join(BENCHMARK_DIR, '..', 'src'))
+
+sys.path.append(BENCHMARK_DIR)
+
+from api_stub_server import ROUTE_PREFIXES, APIStubServer, parse_service_values
+
+# 記事件数を記録するパイプライン段階（メソッド名 → 出力名）
+COUNTED_STAGES = {
+    'collect_news': 'collected',
+    'deduplicate': 'deduplicated',
+    'translate': 'translated',
+    'analyze': 'analyzed',
+}
+
+
+# ----------------------------------------------------------------------
+# 子プロセス側: 1回分のパイプライン実行
+# ----------------------------------------------------------------------
+
+def summarize_trace(trace: Dict[str, Any], limit: int) -> Dict[str, Any]:
+    """トレースから段階別時間（pipeline カテゴリ）とスパン名別の集計を作る"""
+    stages: Dict[str, float] = {}
+    spans: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+    for event in trace.get('traceEvents', []):
+        if event.get('ph') != 'X':
+            continue
+        duration_ms = event['dur'] / 1000
+        if event.get('cat') == 'pipeline':
+            stages[event['name']] = round(stages.get(event['name'], 0.0) + duration_ms, 2)
+        total = spans[event['name']]
+        total[0] += 1
+        total[1] += duration_ms
+        total[2] = max(total[2], duration_ms)
+
+    rows = [
+        {'name': name, 'count': count, 'total_ms': round(total_ms, 2), 'max_ms': round(max_ms, 2)}
+        for name, (count, total_ms, max_ms) in spans.items()
+    ]
+    rows.sort(key=lambda row: row['total_ms'], reverse=True)
+    return {'stages_ms': stages, 'spans': rows[:limit]}
+
+
+def count_rows(db_path: str, table: str) -> int:
+    try:
+        with sqlite3.connect(db_path) as conn:
+            return conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+    except sqlite3.Error:
+        return -1
+
+
+def run_worker(args) -> Dict[str, Any]:
+    """スタブサーバーに向けた設定でパイプラインを1回実行"""
+    data_dir = tempfile.mkdtemp(prefix=f'e2e_volume{args.volume}_')
+    stub = args.stub_url
+    os.environ.update({
+        'EXTERNAL_STORAGE_PATH': data_dir,
+        'NEWSAPI_KEY': 'benchmark-newsapi-key',
+        'GNEWS_API_KEY': 'benchmark-gnews-key',
+        'NVD_API_KEY': 'benchmark-nvd-key',
+        'DEEPL_API_KEY': 'benchmark-deepl-key:fx',
+        'ANTHROPIC_API_KEY': 'benchmark-anthropic-key',
+        'ANTHROPIC_BASE_URL': f"{stub}{ROUTE_PREFIXES['claude']}",
+    })
+    # HTMLレポートはカレントディレクトリ配下に保存されるため、データディレクトリで実行
+    os.chdir(data_dir)
+    sys.path.insert(0, SRC_DIR)
+    logging.disable(logging.WARNING if args.verbose else logging.CRITICAL)
+
+    try:
+        from main import NewsDeliverySystem
+        from utils.metrics import get_metrics_registry
+        from utils.path_resolver import get_data_path
+        from utils.rate_limiter import get_rate_limiter
+
+        system = NewsDeliverySystem()
+        system.test_delivery_mode = True
+
+        # 本番APIのURLをスタブサーバーに差し替え
+        for service, collector in system.collectors.items():
+            collector.base_url = f"{stub}{ROUTE_PREFIXES[service]}"
+        system.translator.api_url = f"{stub}{ROUTE_PREFIXES['deepl']}/translate"
+        system.translator.usage_url = f"{stub}{ROUTE_PREFIXES['deepl']}/usage"
+
+        # 日次上限・バースト制限は実運用の配分なので、計測では待ち時間が入らないよう外す
+        for limit in get_rate_limiter().limits.values():
+            limit.max_requests = 10 ** 9
+            limit.burst_limit = None
+            if limit.max_characters:
+                limit.max_characters = 10 ** 12
+
+        counts: Dict[str, int] = {}
+        for method_name, label in COUNTED_STAGES.items():
+            method = getattr(system, method_name)
+
+            async def counted(*method_args, _method=method, _label=label):
+                result = await _method(*method_args)
+                counts[_label] = len(result)
+                return result
+
+            setattr(system, method_name, counted)
+
+        started = time.perf_counter()
+        asyncio.run(system.run())
+        wall_seconds = time.perf_counter() - started
+
+        trace_files = sorted(get_data_path('traces').glob('trace_*.json'))
+        trace = {}
+        if trace_files:
+            with open(trace_files[-1], 'r', encoding='utf-8') as f:
+                trace = json.load(f)
+
+        registry = get_metrics_registry().snapshot()
+        db_path = str(getattr(system.db, 'db_path', os.path.join(data_dir, 'database', 'news.db')))
+        counts['saved'] = count_rows(db_path, 'articles')
+
+        return {
+            'volume': args.volume,
+            'wall_seconds': round(wall_seconds, 3),
+            'articles': counts,
+            **summarize_trace(trace, args.top_spans),
+            'dropped_spans': trace.get('otherData', {}).get('dropped_spans', 0),
+            'metrics': {
+                name: [{key: value for key, value in sample.items() if key != 'buckets'}
+                       for sample in family['samples']]
+                for name, family in registry['metrics'].items()
+                if name.startswith(('news_stage_', 'news_collected_', 'news_event_loop_'))
+            },
+        }
+    finally:
+        if not args.keep_data:
+            os.chdir(BENCHMARK_DIR)
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+
+# ----------------------------------------------------------------------
+# 親プロセス側: スタブサーバーの起動と件数ごとの実行
+# ----------------------------------------------------------------------
+
+async def run_volume(server: APIStubServer, args, volume: int) -> Dict[str, Any]:
+    """スタブの件数倍率を変え、子プロセスで1回実行"""
+    server.configure(volume=volume, seed=args.seed)
+    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as result_file:
+        result_path = result_file.name
+
+    command = [
+        sys.executable, os.path.abspath(__file__), '--worker',
+        '--stub-url', server.base_url, '--volume', str(volume),
+        '--result-file', result_path, '--top-spans', str(args.top_spans)
+    ]
+    if args.keep_data:
+        command.append('--keep-data')
+    if args.verbose:
+        command.append('--verbose')
+
+    process = await asyncio.create_subprocess_exec(
+        *command, stdout=asyncio.subprocess.DEVNULL,
+        stderr=None if args.verbose else asyncio.subprocess.PIPE)
+    try:
+        _, stderr = await asyncio.wait_for(process.communicate(), timeout=args.timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        os.unlink(result_path)
+        return {'volume': volume, 'error': f'timeout after {args.timeout}s', 'stub': server.get_stats()}
+
+    try:
+        if process.returncode != 0:
+            tail = (stderr or b'').decode('utf-8', 'replace').strip().splitlines()[-5:]
+            return {'volume': volume, 'error': f'worker exited with {process.returncode}',
+                    'stderr_tail': tail, 'stub': server.get_stats()}
+        with open(result_path, 'r', encoding='utf-8') as f:
+            result = json.load(f)
+    finally:
+        os.unlink(result_path)
+
+    result['stub'] = server.get_stats()
+    return result
+
+
+async def run_benchmark(args) -> Dict[str, Any]:
+    server = APIStubServer(
+        latency_ms=parse_service_values(args.latency),
+        latency_scale=args.latency_scale,
+        error_rate=parse_service_values(args.error_rate),
+        seed=args.seed
+    )
+    await server.start()
+    try:
+        runs = [await run_volume(server, args, volume) for volume in args.volumes]
+    finally:
+        await server.stop()
+
+    return {
+        'benchmark': 'e2e_pipeline',
+        'settings': {
+            'volumes': args.volumes,
+            'latency_ms': server.latency_ms,
+            'latency_scale': args.latency_scale,
+            'error_rate': server.error_rate,
+            'seed': args.seed
+        },
+        'runs': runs,
+        'timestamp': datetime.now().isoformat()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='End-to-end pipeline benchmark with recorded API fixtures')
+    parser.add_argument('--volumes', type=int, nargs='+', default=[1, 10, 100], help='記事件数倍率')
+    parser.add_argument('--latency', nargs='*', metavar='SERVICE=MS', help='サービス別遅延（例: claude=800）')
+    parser.add_argument('--latency-scale', type=float, default=1.0, help='全サービスの遅延倍率')
+    parser.add_argument('--error-rate', nargs='*', metavar='SERVICE=RATE', help='サービス別エラー率（例: gnews=0.05）')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--timeout', type=float, default=1800.0, help='1回の実行の上限秒数')
+    parser.add_argument('--top-spans', type=int, default=15, help='出力するスパン名別集計の件数')
+    parser.add_argument('--keep-data', action='store_true', help='実行ごとのデータディレクトリを残す')
+    parser.add_argument('--verbose', action='store_true', help='子プロセスの警告ログを表示')
+    parser.add_argument('--output', help='結果JSON出力パス')
+    # 子プロセス用
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--stub-url', help=argparse.SUPPRESS)
+    parser.add_argument('--volume', type=int, default=1, help=argparse.SUPPRESS)
+    parser.add_argument('--result-file', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        result = run_worker(args)
+        with open(args.result_file, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False)
+        return
+
+    result = asyncio.run(run_benchmark(args))
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+"""
+Hot Path Benchmark
+ホットパス・ベンチマーク - 重複除去・一括簡易翻訳・HTMLレンダリング・DB書き込みを
+繰り返し計測し、回帰判定用の標本（実行ごとの所要秒数）をJSONで出力・保存する
+
+キャッシュとDBは一時ディレクトリに作るため、実データには触れない。
+
+使用例:
+    python benchmarks/hot_path_benchmark.py --save --set-baseline
+    python benchmarks/hot_path_benchmark.py --save
+    python scripts/compare_benchmarks.py --store benchmarks/results
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+# キャッシュ・DBの保存先を読み込み前に一時ディレクトリへ向ける
+DATA_DIR = tempfile.mkdtemp(prefix='hot_path_benchmark_')
+os.environ['EXTERNAL_STORAGE_PATH'] = DATA_DIR
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from generators.html_generator import HTMLReportGenerator
+from models.article import Article
+from models.database import Database
+from processors.deduplicator import ArticleDeduplicator
+from utils.config import load_config
+from utils.simple_translator import SimpleTranslator
+
+from results_store import DEFAULT_STORE_DIR, environment_info, save_result, summarize_samples
+
+with open(os.path.join(os.path.dirname(__file__), 'fixtures', 'api', 'vocabulary.json'), encoding='utf-8') as f:
+    WORDS = json.load(f)['en']
+
+CATEGORIES = ['domestic_social', 'international_social', 'domestic_economy',
+              'international_economy', 'tech', 'security']
+
+
+def make_articles(count: int, rng: random.Random, url_prefix: str, duplicate_ratio: float = 0.1) -> List[Article]:
+    """合成記事（duplicate_ratio の割合でタイトル・本文がほぼ同じ記事を含む）"""
+    base = datetime(2025, 1, 1)
+    articles = []
+    for i in range(count):
+        if articles and rng.random() < duplicate_ratio:
+            original = rng.choice(articles)
+            title = original.title + ' update'
+            content = original.content
+        else:
+            title = ' '.join(word.capitalize() for word in rng.sample(WORDS, 8))
+            content = ' '.join(rng.choices(WORDS, k=120))
+        articles.append(Article(
+            url=f"https://{url_prefix}.example.com/{'-'.join(rng.sample(WORDS, 4))}-{i}",
+            title=title,
+            description=content[:160],
+            content=content,
+            source_name=f"source_{rng.randrange(20)}",
+            category=rng.choice(CATEGORIES),
+            importance_score=rng.randint(1, 10),
+            keywords=rng.sample(WORDS, 3),
+            summary=content[:200],
+            published_at=base + timedelta(minutes=rng.randrange(24 * 60))
+        ))
+    return articles
+
+
+def measure(setup: Callable[[int], Any], func: Callable[[Any], Any], repeats: int, warmup: int) -> List[float]:
+    """setup で入力を作り（計測外）、func の所要秒数を repeats 回記録"""
+    samples = []
+    for index in range(warmup + repeats):
+        payload = setup(index)
+        started = time.perf_counter()
+        func(payload)
+        elapsed = time.perf_counter() - started
+        if index >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+def run_hot_paths(args) -> Dict[str, Dict[str, Any]]:
+    config = load_config()
+    rng = random.Random(args.seed)
+    deduplicator = ArticleDeduplicator()
+    html_generator = HTMLReportGenerator(config)
+    database = Database(config)
+
+    benchmarks = {
+        # 収集記事の重複除去（URL・タイトル・本文の類似度判定）
+        'dedup': (
+            {'articles': args.dedup_articles},
+            lambda index: make_articles(args.dedup_articles, rng, f'dedup{index}'),
+            deduplicator.deduplicate
+        ),
+        # 分析対象外記事の要約・説明文の一括簡易翻訳
+        'translate_batch': (
+            {'articles': args.translate_articles},
+            lambda index: make_articles(args.translate_articles, rng, f'translate{index}'),
+            lambda articles: (
+                SimpleTranslator.create_summaries([(a.title, a.content) for a in articles]),
+                SimpleTranslator.translate_texts([a.description for a in articles])
+            )
+        ),
+        # 日次HTMLレポートのレンダリング
+        'render': (
+            {'articles': args.render_articles},
+            lambda index: make_articles(args.render_articles, rng, f'render{index}'),
+            html_generator.generate_daily_report
+        ),
+        # 記事の一括保存（日次ロールアップ更新を含む）
+        'db_write': (
+            {'articles': args.db_articles},
+            lambda index: make_articles(args.db_articles, rng, f'db{index}'),
+            database.save_articles
+        ),
+    }
+
+    results = {}
+    for name, (params, setup, func) in benchmarks.items():
+        if args.only and name not in args.only:
+            continue
+        samples = measure(setup, func, args.repeats, args.warmup)
+        summary = summarize_samples(samples)
+        results[name] = {
+            'unit': 'seconds',
+            'params': params,
+            'samples': [round(sample, 6) for sample in samples],
+            **{key: round(value, 6) if isinstance(value, float) else value for key, value in summary.items()}
+        }
+    return results
+
+
+def run_in_processes(args) -> Dict[str, Dict[str, Any]]:
+    """新しいインタプリタ processes 個で計測し、標本をまとめる
+
+    ハッシュシードやメモリ配置はプロセスごとに変わるため、1プロセス内の繰り返しだけでは
+    実行ごとのばらつきを過小評価する。複数プロセスの標本を合わせてMADに反映させ、
+    比較側が標準誤差を求められるよう独立した実行数（processes）も記録する。
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    for process_index in range(args.processes):
+        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as output:
+            output_path = output.name
+        command = [
+            sys.executable, os.path.abspath(__file__), '--processes', '1',
+            '--repeats', str(args.repeats), '--warmup', str(args.warmup),
+            '--dedup-articles', str(args.dedup_articles),
+            '--translate-articles', str(args.translate_articles),
+            '--render-articles', str(args.render_articles),
+            '--db-articles', str(args.db_articles),
+            '--seed', str(args.seed + process_index), '--output', output_path
+        ]
+        if args.only:
+            command += ['--only', *args.only]
+        try:
+            subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+            with open(output_path, 'r', encoding='utf-8') as f:
+                results = json.load(f)['results']
+        finally:
+            os.unlink(output_path)
+
+        for name, result in results.items():
+            entry = merged.setdefault(name, {'unit': result['unit'], 'params': result['params'],
+                                             'processes': 0, 'samples': []})
+            entry['processes'] += 1
+            entry['samples'].extend(result['samples'])
+
+    for entry in merged.values():
+        summary = summarize_samples(entry['samples'])
+        entry.update({key: round(value, 6) if isinstance(value, float) else value
+                      for key, value in summary.items()})
+    return merged
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Hot path benchmark for regression gating')
+    parser.add_argument('--repeats', type=int, default=5, help='プロセスあたりの計測回数')
+    parser.add_argument('--processes', type=int, default=3, help='計測するプロセス数（標本数 = repeats × processes）')
+    parser.add_argument('--warmup', type=int, default=1, help='計測前のウォームアップ回数')
+    parser.add_argument('--only', nargs='+', help='実行するベンチマーク名')
+    parser.add_argument('--dedup-articles', type=int, default=60, help='重複除去の記事数')
+    parser.add_argument('--translate-articles', type=int, default=500, help='一括簡易翻訳の記事数')
+    parser.add_argument('--render-articles', type=int, default=100, help='HTMLレンダリングの記事数')
+    parser.add_argument('--db-articles', type=int, default=500, help='DB書き込みの記事数')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--save', action='store_true', help='結果ストアに保存')
+    parser.add_argument('--set-baseline', action='store_true', help='この結果を比較基準にする（--save を含む）')
+    parser.add_argument('--store', default=str(DEFAULT_STORE_DIR), help='結果ストアのディレクトリ')
+    parser.add_argument('--output', help='結果JSON出力パス')
+    args = parser.parse_args()
+
+    # 計測区間にログ出力を含めない（出力JSONも汚さない）
+    logging.disable(logging.INFO)
+    try:
+        results = run_in_processes(args) if args.processes > 1 else run_hot_paths(args)
+    finally:
+        shutil.rmtree(DATA_DIR, ignore_errors=True)
+
+    result = {
+        'benchmark': 'hot_paths',
+        'settings': {'repeats': args.repeats, 'processes': args.processes,
+                     'warmup': args.warmup, 'seed': args.seed},
+        'environment': environment_info(),
+        'results': results,
+        'timestamp': datetime.now().isoformat()
+    }
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+    if args.save or args.set_baseline:
+        path = save_result(result, 'hot_paths', args.store, baseline=args.set_baseline)
+        print(f"saved: {path}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""
+HTTP Client Benchmark
+共有HTTPクライアント - ローカルサーバー（応答時間にばらつきあり）に対して
+batch_request の所要時間と、逐次リクエスト（遅延なし）の1件あたりの時間と接続再利用・DNSキャッシュの統計を計測する
+
+比較用に、従来の処理（10件ずつ区切って gather し区切りごとに最も遅い応答を待つバッチ、
+リクエストごとに新しい ClientSession を作る呼び出し）も同じサーバーで計測する。
+
+使用例:
+    python benchmarks/http_client_benchmark.py
+    python benchmarks/http_client_benchmark.py --requests 200 --concurrency 10 --sequential 100
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from collectors.session_manager import close_session_pool, get_api_client
+
+
+async def start_server(args) -> TestServer:
+    rng = random.Random(args.seed)
+
+    async def handler(request):
+        # 大半は速く、一部だけ遅い応答
+        delay = args.slow_ms if rng.random() < args.slow_ratio else args.fast_ms
+        await asyncio.sleep(delay / 1000)
+        return web.json_response({'id': request.query.get('id')})
+
+    async def ping(request):
+        return web.json_response({'id': request.query.get('id')})
+
+    app = web.Application()
+    app.router.add_get('/item', handler)
+    app.router.add_get('/ping', ping)
+    server = TestServer(app, host='127.0.0.1')
+    await server.start_server()
+    return server
+
+
+async def legacy_batch(client, requests: List[Dict]) -> List[Any]:
+    """従来のバッチ（10件ずつ gather）"""
+    results = []
+    for i in range(0, len(requests), 10):
+        batch = [client.request('bench', 'GET', req['url'], **req.get('kwargs', {})) for req in requests[i:i + 10]]
+        results.extend(await asyncio.gather(*batch, return_exceptions=True))
+    return results
+
+
+async def legacy_session_per_request(url: str, count: int):
+    """従来の呼び出し（リクエストごとに ClientSession を作って閉じる）"""
+    for index in range(count):
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url, params={'id': str(index)}) as response:
+                await response.json()
+
+
+async def run_benchmark(args) -> Dict[str, Any]:
+    server = await start_server(args)
+    base_url = f"http://localhost:{server.port}/item"
+    # 逐次の比較は接続の確立コストだけを見るため、遅延のないエンドポイントを使う
+    ping_url = f"http://localhost:{server.port}/ping"
+    requests = [{'url': base_url, 'kwargs': {'params': {'id': str(i)}}} for i in range(args.requests)]
+    try:
+        client = await get_api_client()
+
+        started = time.perf_counter()
+        await legacy_batch(client, requests)
+        legacy_batch_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        await client.batch_request('bench', requests, concurrency=args.concurrency)
+        window_seconds = time.perf_counter() - started
+        await close_session_pool()
+
+        started = time.perf_counter()
+        await legacy_session_per_request(ping_url, args.sequential)
+        per_request_seconds = time.perf_counter() - started
+
+        client = await get_api_client()
+        started = time.perf_counter()
+        for index in range(args.sequential):
+            await client.request('bench', 'GET', ping_url, params={'id': str(index)})
+        pooled_seconds = time.perf_counter() - started
+        host = client.session_pool.get_host_statistics()['localhost']
+    finally:
+        await close_session_pool()
+        await server.close()
+
+    return {
+        'benchmark': 'http_client',
+        'batch': {
+            'requests': args.requests,
+            'concurrency': args.concurrency,
+            'chunked_gather_seconds': round(legacy_batch_seconds, 3),
+            'sliding_window_seconds': round(window_seconds, 3),
+            'speedup': round(legacy_batch_seconds / window_seconds, 2),
+        },
+        'sequential': {
+            'requests': args.sequential,
+            'session_per_request_ms': round(per_request_seconds * 1000 / args.sequential, 3),
+            'pooled_ms': round(pooled_seconds * 1000 / args.sequential, 3),
+            'connections_created': host['connections_created'],
+            'connections_reused': host['connections_reused'],
+            'connection_reuse_rate': round(host['connection_reuse_rate'], 1),
+            'dns_cache_hit_rate': round(host['dns_cache_hit_rate'], 1),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Shared HTTP client (sliding-window batch, keep-alive reuse)')
+    parser.add_argument('--requests', type=int, default=200, help='バッチのリクエスト数')
+    parser.add_argument('--concurrency', type=int, default=10, help='バッチの同時実行数')
+    parser.add_argument('--sequential', type=int, default=100, help='逐次リクエスト数')
+    parser.add_argument('--fast-ms', type=float, default=5, help='通常の応答時間（ミリ秒）')
+    parser.add_argument('--slow-ms', type=float, default=200, help='遅い応答の応答時間（ミリ秒）')
+    parser.add_argument('--slow-ratio', type=float, default=0.05, help='遅い応答の割合')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='結果JSON出力パス')
+    args = parser.parse_args()
+
+    result = asyncio.run(run_benchmark(args))
+    result['timestamp'] = datetime.now().isoformat()
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+"""
+Log Tailer Benchmark
+ログ分析ベンチマーク - 全ファイル再読込（従来方式）と追記分だけの増分分析の比較
+
+使用例:
+    python benchmarks/log_tailer_benchmark.py --lines 200000 --append 2000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from monitoring.log_analyzer import LogAnalysisEngine, LogEntry, LogPatternDetector
+
+LEVELS = ['INFO'] * 14 + ['WARNING'] * 3 + ['ERROR'] * 2 + ['CRITICAL']
+MODULES = ['collectors.nhk', 'collectors.newsapi', 'processors.translator', 'processors.analyzer',
+           'generators.html', 'notifiers.gmail', 'models.database', 'main']
+MESSAGES = [
+    'Collected {n} articles',
+    'Request took {n}ms',
+    'Connection timeout while fetching feed',
+    'DatabaseError: database is locked',
+    'API rate limit exceeded, retrying in {n}s',
+    'GET /feed HTTP/1.1" 404',
+    'Translated {n} titles',
+    'Report generated in {n} ms',
+]
+
+
+# ----------------------------------------------------------------------
+# 従来実装（比較用の参照実装）: 全行をLogEntryに展開してから分析
+# ----------------------------------------------------------------------
+
+LEGACY_LINE_PATTERNS = [
+    re.compile(r'\[(?P<timestamp>\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2},\d{3})\]\s+'
+               r'\[(?P<level>\w+)\]\s+\[(?P<module>[\w\.]+)\]\s+(?P<message>.*)'),
+    re.compile(r'(?P<timestamp>\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s+'
+               r'(?P<level>\w+)\s+(?P<module>\S+)\s+(?P<message>.*)'),
+]
+LEGACY_RESPONSE_PATTERNS = [
+    r'response time[:\s]*(\d+(?:\.\d+)?)\s*ms',
+    r'took[:\s]*(\d+(?:\.\d+)?)\s*ms',
+    r'duration[:\s]*(\d+(?:\.\d+)?)\s*ms',
+    r'(\d+(?:\.\d+)?)\s*ms'
+]
+
+
+def legacy_analyze(log_dir: Path) -> int:
+    entries = []
+    for log_file in log_dir.rglob('*.log'):
+        with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                for pattern in LEGACY_LINE_PATTERNS:
+                    match = pattern.match(line)
+                    if match:
+                        groups = match.groupdict()
+                        entries.append(LogEntry(
+                            timestamp=datetime.strptime(groups['timestamp'], '%Y-%m-%d %H:%M:%S,%f'),
+                            level=groups['level'].upper(),
+                            module=groups['module'],
+                            message=groups['message'],
+                            raw_line=line
+                        ))
+                        break
+
+    detector = LogPatternDetector()
+    matches = 0
+    for entry in entries:
+        for compiled_pattern in detector.compiled_patterns.values():
+            if compiled_pattern.search(entry.message) or compiled_pattern.search(entry.raw_line):
+                matches += 1
+        for pattern in LEGACY_RESPONSE_PATTERNS:
+            if re.search(pattern, entry.message, re.IGNORECASE):
+                break
+    return len(entries)
+
+
+def make_lines(count: int, start: datetime, rng: random.Random):
+    lines = []
+    for i in range(count):
+        timestamp = start + timedelta(seconds=i * 2)
+        message = rng.choice(MESSAGES).format(n=rng.randint(1, 3000))
+        lines.append(f"[{timestamp:%Y-%m-%d %H:%M:%S},{i % 1000:03d}] "
+                     f"[{rng.choice(LEVELS)}] [{rng.choice(MODULES)}] {message}\n")
+    return lines
+
+
+def timed(func):
+    started = time.perf_counter()
+    value = func()
+    return time.perf_counter() - started, value
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Incremental log analysis benchmark')
+    parser.add_argument('--lines', type=int, default=200000, help='既存ログの行数')
+    parser.add_argument('--append', type=int, default=2000, help='分析間に追記される行数')
+    parser.add_argument('--output', help='結果JSON出力パス')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    start = datetime.now() - timedelta(seconds=args.lines * 2)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_dir = Path(tmp) / 'logs'
+        log_dir.mkdir()
+        log_file = log_dir / 'news_system.log'
+        with open(log_file, 'w', encoding='utf-8') as f:
+            f.writelines(make_lines(args.lines, start, rng))
+
+        engine = LogAnalysisEngine(str(log_dir), str(Path(tmp) / 'analysis.db'))
+        first_seconds, first = timed(lambda: asyncio.run(engine.analyze_logs()))
+
+        with open(log_file, 'a', encoding='utf-8') as f:
+            f.writelines(make_lines(args.append, datetime.now(), rng))
+
+        legacy_seconds, legacy_entries = timed(lambda: legacy_analyze(log_dir))
+        incremental_seconds, incremental = timed(lambda: asyncio.run(engine.analyze_logs()))
+
+    result = {
+        'benchmark': 'log_tailer',
+        'lines': args.lines,
+        'appended_lines': args.append,
+        'legacy_full_reread_seconds': round(legacy_seconds, 4),
+        'first_pass_seconds': round(first_seconds, 4),
+        'incremental_pass_seconds': round(incremental_seconds, 4),
+        'speedup_vs_full_reread': round(legacy_seconds / incremental_seconds, 1),
+        'legacy_entries_materialized': legacy_entries,
+        'first_pass_new_entries': first['summary']['new_entries'],
+        'incremental_new_entries': incremental['summary']['new_entries'],
+        'total_entries': incremental['summary']['total_entries'],
+        'timestamp': datetime.now().isoformat()
+    }
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Log Template Benchmark
+動的パターン検出ベンチマーク - 従来の TF-IDF + DBSCAN と Drain方式テンプレートマイナーの比較
+
+使用例:
+    python benchmarks/log_template_benchmark.py --errors 1000 5000 20000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from sklearn.cluster import DBSCAN
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from monitoring.log_templates import DrainTemplateMiner
+
+TEMPLATES = [
+    'Failed to fetch {url} after {n} retries',
+    'Database is locked, query took {n}ms',
+    'Translation API returned status {status} for article {id}',
+    'Connection timeout to {host}:{port}',
+    'Gmail send failed for {user}: quota exceeded',
+    'Unexpected token at line {n} in feed {url}',
+    'Worker {id} lost heartbeat',
+    'Rate limit hit for source {source}, backing off {n}s',
+]
+SOURCES = ['nhk', 'newsapi', 'reuters', 'bbc', 'nikkei']
+
+
+def make_messages(count: int, rng: random.Random):
+    return [
+        rng.choice(TEMPLATES).format(
+            url=f'https://{rng.choice(SOURCES)}.example.com/rss/{rng.randint(1, 500)}',
+            n=rng.randint(1, 5000), status=rng.choice([429, 500, 502, 503]),
+            id=rng.randint(1, 10 ** 6), host=f'10.0.{rng.randint(0, 255)}.{rng.randint(0, 255)}',
+            port=rng.choice([443, 5432, 6379]), user=f'user{rng.randint(1, 99)}@example.com',
+            source=rng.choice(SOURCES))
+        for _ in range(count)
+    ]
+
+
+def legacy_cluster(messages):
+    """従来実装: 全エラーの TF-IDF 密行列に DBSCAN"""
+    vectorizer = TfidfVectorizer(max_features=100, stop_words='english', ngram_range=(1, 2))
+    matrix = vectorizer.fit_transform(messages)
+    labels = DBSCAN(eps=0.5, min_samples=3).fit_predict(matrix.toarray())
+    return len(set(labels) - {-1})
+
+
+def drain_cluster(messages):
+    miner = DrainTemplateMiner()
+    for message in messages:
+        miner.add(message)
+    return len(miner.templates)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Dynamic log pattern detection benchmark')
+    parser.add_argument('--errors', type=int, nargs='+', default=[1000, 5000, 20000], help='エラーログ件数')
+    parser.add_argument('--skip-legacy-above', type=int, default=20000, help='従来実装を計測する上限件数')
+    parser.add_argument('--output', help='結果JSON出力パス')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    runs = []
+    for count in args.errors:
+        messages = make_messages(count, rng)
+        run = {'errors': count}
+
+        started = time.perf_counter()
+        run['drain_templates'] = drain_cluster(messages)
+        run['drain_seconds'] = round(time.perf_counter() - started, 4)
+        run['drain_per_line_us'] = round(run['drain_seconds'] / count * 1e6, 1)
+
+        if count <= args.skip_legacy_above:
+            started = time.perf_counter()
+            run['legacy_clusters'] = legacy_cluster(messages)
+            run['legacy_seconds'] = round(time.perf_counter() - started, 4)
+            run['speedup'] = round(run['legacy_seconds'] / run['drain_seconds'], 1)
+
+        runs.append(run)
+
+    result = {
+        'benchmark': 'log_templates',
+        'distinct_templates_generated': len(TEMPLATES),
+        'runs': runs,
+        'timestamp': datetime.now().isoformat()
+    }
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
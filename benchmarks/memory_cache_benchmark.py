@@ -0,0 +1,164 @@
+"""
+Memory Cache Benchmark
+インメモリキャッシュのマイクロベンチマーク - MemoryCacheBackend の件数を 1千〜100万件まで
+増やし、ヒット取得・上書き・容量超過時の追加（削除を伴う）の1操作あたりの時間が
+件数に依存しないことを確認する
+
+比較用に、従来の実装（アクセス順リストの remove と pickle によるサイズ計算）も
+--legacy-max-size 以下の件数で計測する。
+
+使用例:
+    python benchmarks/memory_cache_benchmark.py --sizes 1000 10000 100000 1000000
+    python benchmarks/memory_cache_benchmark.py --policy lfu --operations 20000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import pickle
+import random
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.cache_manager_advanced import EVICTION_POLICIES, MemoryCacheBackend
+
+
+class LegacyMemoryCache:
+    """従来の MemoryCacheBackend の取得・設定処理（アクセス順リスト + pickle サイズ）"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.cache: Dict[str, Any] = {}
+        self.access_order: List[str] = []
+        self.lock = asyncio.Lock()
+
+    async def get(self, key: str):
+        async with self.lock:
+            if key not in self.cache:
+                return None
+            if key in self.access_order:
+                self.access_order.remove(key)
+            self.access_order.append(key)
+            return self.cache[key]
+
+    async def set(self, key: str, value: Any, ttl=None):
+        async with self.lock:
+            len(pickle.dumps(value))
+            while len(self.cache) >= self.max_size and self.access_order:
+                oldest = self.access_order.pop(0)
+                self.cache.pop(oldest, None)
+            self.cache[key] = value
+            if key not in self.access_order:
+                self.access_order.append(key)
+            return True
+
+
+def make_value(index: int) -> Dict[str, Any]:
+    """キャッシュされるAPIレスポンス・翻訳結果程度の小さな値"""
+    return {'title': f'article {index}', 'score': index % 10, 'tags': ['news', 'tech']}
+
+
+async def fill(cache, size: int):
+    for index in range(size):
+        await cache.set(f'key:{index}', make_value(index))
+
+
+async def per_op_ns(operation, keys: List[str]) -> float:
+    started = time.perf_counter()
+    for key in keys:
+        await operation(key)
+    return (time.perf_counter() - started) / len(keys) * 1e9
+
+
+async def measure(cache, size: int, operations: int, rng: random.Random) -> Dict[str, float]:
+    fill_started = time.perf_counter()
+    await fill(cache, size)
+    fill_seconds = time.perf_counter() - fill_started
+
+    hit_keys = [f'key:{rng.randrange(size)}' for _ in range(operations)]
+    replace_keys = [f'key:{rng.randrange(size)}' for _ in range(operations)]
+    new_keys = [f'new:{index}' for index in range(operations)]
+    value = make_value(0)
+
+    # 同じキー列での素の dict 参照（大きな表へのランダムアクセス自体のCPUキャッシュミス分の目安）
+    entries = cache.cache
+    started = time.perf_counter()
+    for key in hit_keys:
+        entries.get(key)
+    dict_get_ns = (time.perf_counter() - started) / len(hit_keys) * 1e9
+
+    return {
+        'fill_seconds': round(fill_seconds, 3),
+        'dict_get_ns': round(dict_get_ns, 1),
+        'get_hit_ns': round(await per_op_ns(cache.get, hit_keys), 1),
+        'set_replace_ns': round(await per_op_ns(lambda key: cache.set(key, value), replace_keys), 1),
+        'set_evict_ns': round(await per_op_ns(lambda key: cache.set(key, value), new_keys), 1),
+    }
+
+
+def flatness(runs: List[Dict[str, Any]], metric: str) -> float:
+    """最大件数と最小件数での1操作時間の比（1に近いほど件数に依存しない）"""
+    return round(runs[-1][metric] / runs[0][metric], 2)
+
+
+async def run_benchmark(args) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    sizes = sorted(args.sizes)
+    runs = []
+    for size in sizes:
+        cache = MemoryCacheBackend(max_size=size, default_ttl=3600, eviction_policy=args.policy)
+        runs.append({'size': size, **await measure(cache, size, args.operations, rng)})
+        del cache
+
+    legacy_runs = []
+    for size in sizes:
+        if size > args.legacy_max_size:
+            continue
+        legacy = LegacyMemoryCache(max_size=size)
+        legacy_runs.append({'size': size, **await measure(legacy, size, args.legacy_operations, rng)})
+
+    metrics = ('dict_get_ns', 'get_hit_ns', 'set_replace_ns', 'set_evict_ns')
+    result = {
+        'benchmark': 'memory_cache',
+        'policy': args.policy,
+        'operations': args.operations,
+        'runs': runs,
+        'flatness': {metric: flatness(runs, metric) for metric in metrics},
+    }
+    if legacy_runs:
+        result['legacy'] = {
+            'operations': args.legacy_operations,
+            'runs': legacy_runs,
+            'flatness': {metric: flatness(legacy_runs, metric) for metric in metrics},
+        }
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='MemoryCacheBackend latency vs. entry count')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000, 1000000],
+                        help='計測するキャッシュ件数')
+    parser.add_argument('--policy', choices=sorted(EVICTION_POLICIES), default='lru', help='削除方針')
+    parser.add_argument('--operations', type=int, default=50000, help='件数ごとの各操作の回数')
+    parser.add_argument('--legacy-max-size', type=int, default=10000, help='従来実装を計測する最大件数')
+    parser.add_argument('--legacy-operations', type=int, default=2000, help='従来実装の各操作の回数')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='結果JSON出力パス')
+    args = parser.parse_args()
+
+    result = asyncio.run(run_benchmark(args))
+    result['timestamp'] = datetime.now().isoformat()
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
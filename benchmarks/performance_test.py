@@ -29,6 +29,8 @@ from utils.cache_manager_advanced import AdvancedCacheManager, CacheBackend
 from utils.async_executor import AsyncExecutor, TaskConfig, TaskPriority
 from monitoring.performance_monitor import PerformanceMonitor
 
+from results_store import DEFAULT_STORE_DIR, environment_info, save_result
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -614,12 +616,20 @@ class BenchmarkReporter:
     """ベンチマークレポート生成"""
     
     @staticmethod
-    def generate_report(suites: Dict[str, BenchmarkSuite], output_path: str = None) -> Dict[str, Any]:
-        """総合レポート生成"""
+    def generate_report(suites: Dict[str, BenchmarkSuite], output_path: str = None,
+                        store_dir: str = None) -> Dict[str, Any]:
+        """総合レポート生成
+        
+        results には「スイート.テスト名」ごとの平均操作時間を標本として含め、
+        scripts/compare_benchmarks.py で過去のレポートと比較できるようにする。
+        store_dir を指定すると結果ストアに履歴として保存する。
+        """
         report = {
             'generated_at': datetime.now().isoformat(),
+            'environment': environment_info(),
             'summary': {},
             'suites': {},
+            'results': {},
             'recommendations': []
         }
         
@@ -633,6 +643,11 @@ class BenchmarkReporter:
                 'summary': suite_summary,
                 'results': [asdict(result) for result in suite.results]
             }
+            for result in suite.results:
+                report['results'][f"{suite_name}.{result.test_name}"] = {
+                    'unit': 'seconds',
+                    'samples': [result.avg_operation_time]
+                }
             
             total_tests += suite_summary.get('total_tests', 0)
             total_duration += suite_summary.get('total_duration', 0)
@@ -655,7 +670,10 @@ class BenchmarkReporter:
         # ファイル出力
         if output_path:
             with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
+                json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+        
+        if store_dir:
+            save_result(json.loads(json.dumps(report, default=str)), 'performance', store_dir)
         
         return report
     
@@ -781,7 +799,7 @@ async def main():
         
         # レポート生成
         report_path = f"benchmark_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        report = BenchmarkReporter.generate_report(results, report_path)
+        report = BenchmarkReporter.generate_report(results, report_path, store_dir=str(DEFAULT_STORE_DIR))
         
         # 結果表示
         print("\n📊 Benchmark Results Summary:")
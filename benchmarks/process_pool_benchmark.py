@@ -0,0 +1,197 @@
+"""
+Process Pool Benchmark
+CPU処理のプロセスプール分担 - 記事件数ごとに、内容類似度による重複除去を
+  - serial: プロセス内で実行
+  - pickled: 記事オブジェクトのリストを範囲ごとに pickle してプロセスプールへ送る
+  - shared: 比較キーの列を共有メモリに1回だけ書き、handle と行範囲だけを送る（AsyncExecutor.map_shared）
+の3通りで計測し、あわせて1回の送信にかかる転送量（pickle したバイト数）と準備時間を比較する
+
+並列化による短縮はCPU数に依存する（1CPU環境では pool の方が遅くなる）。転送量の比較は
+CPU数によらない。
+
+使用例:
+    python benchmarks/process_pool_benchmark.py
+    python benchmarks/process_pool_benchmark.py --articles 200 500 1000 --workers 4 --output result.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import pickle
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+# 重複除去のキャッシュ保存先を読み込み前に一時ディレクトリへ向ける
+os.environ['EXTERNAL_STORAGE_PATH'] = tempfile.mkdtemp(prefix='process_pool_benchmark_')
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models.article import Article
+from processors.deduplicator import ArticleDeduplicator, balanced_row_ranges, similar_pairs
+from utils.async_executor import AsyncExecutor, SharedColumns
+
+with open(os.path.join(os.path.dirname(__file__), 'fixtures', 'api', 'vocabulary.json'), encoding='utf-8') as f:
+    WORDS = json.load(f)['en']
+
+# 重複除去器（プロセスプールは forkserver で起動するため、ワーカー側では初回に作成する）
+DEDUPLICATOR: ArticleDeduplicator = None
+
+
+def get_deduplicator() -> ArticleDeduplicator:
+    global DEDUPLICATOR
+    if DEDUPLICATOR is None:
+        DEDUPLICATOR = ArticleDeduplicator()
+    return DEDUPLICATOR
+
+
+def make_articles(count: int, rng: random.Random, duplicate_ratio: float = 0.1) -> List[Article]:
+    """合成記事（duplicate_ratio の割合でタイトル・本文がほぼ同じ記事を含む）"""
+    base = datetime(2025, 1, 1)
+    articles = []
+    for i in range(count):
+        if articles and rng.random() < duplicate_ratio:
+            original = rng.choice(articles)
+            title = original.title + ' update'
+            content = original.content
+        else:
+            title = ' '.join(word.capitalize() for word in rng.sample(WORDS, 8))
+            content = ' '.join(rng.choices(WORDS, k=120))
+        articles.append(Article(
+            url=f"https://bench.example.com/{'-'.join(rng.sample(WORDS, 4))}-{i}",
+            title=title,
+            description=content[:160],
+            content=content,
+            source_name=f"source_{rng.randrange(20)}",
+            importance_score=rng.randint(1, 10),
+            keywords=rng.sample(WORDS, 3),
+            summary=content[:200],
+            published_at=base + timedelta(minutes=rng.randrange(24 * 60))
+        ))
+    return articles
+
+
+def pairs_from_articles(articles: List[Article], start: int, stop: int) -> List:
+    """pickled モードのワーカー側: 受け取った記事から比較キーを作り [start, stop) 行の類似組を列挙"""
+    deduplicator = get_deduplicator()
+    keys = [deduplicator._comparison_keys(article) for article in articles]
+    return similar_pairs(keys, range(start, stop), deduplicator.title_similarity_threshold,
+                         deduplicator.content_similarity_threshold)
+
+
+def warm_up(columns: SharedColumns, start: int, stop: int) -> int:
+    get_deduplicator()
+    return stop - start
+
+
+def comparison_columns(articles: List[Article]):
+    keys = [DEDUPLICATOR._comparison_keys(article) for article in articles]
+    titles, contents, sources, published = zip(*keys)
+    return {'title': titles, 'content': contents, 'source': sources}, {'published': published}
+
+
+def measure_transfer(articles: List[Article], parts: int) -> Dict[str, Any]:
+    """1回の分担で送るデータ量（pickle 後のバイト数）と準備時間"""
+    started = time.perf_counter()
+    pickled = sum(len(pickle.dumps((articles, 0, 0))) for _ in range(parts))
+    pickled_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    with SharedColumns.create(*comparison_columns(articles)) as columns:
+        shared = sum(len(pickle.dumps((columns.handle, 0, 0))) for _ in range(parts))
+        shared_ms = (time.perf_counter() - started) * 1000
+        shared_block = columns.shm.size
+
+    return {
+        'pickled': {'bytes_sent': pickled, 'prepare_ms': round(pickled_ms, 2)},
+        'shared': {'bytes_sent': shared, 'shared_block_bytes': shared_block, 'prepare_ms': round(shared_ms, 2)},
+    }
+
+
+async def run_case(count: int, executor: AsyncExecutor, args) -> Dict[str, Any]:
+    articles = make_articles(count, random.Random(args.seed))
+    workers = executor.worker_pool.process_pool_size
+    ranges = balanced_row_ranges(count, workers)
+    loop = asyncio.get_running_loop()
+
+    async def serial():
+        return DEDUPLICATOR._deduplicate_by_content(articles)
+
+    async def pickled():
+        chunks = await asyncio.gather(*[
+            loop.run_in_executor(executor.worker_pool.process_pool, pairs_from_articles, articles, start, stop)
+            for start, stop in ranges
+        ])
+        return DEDUPLICATOR._deduplicate_by_content(articles, {pair for chunk in chunks for pair in chunk})
+
+    async def shared():
+        pairs = await DEDUPLICATOR.find_similar_pairs(articles, executor)
+        return DEDUPLICATOR._deduplicate_by_content(articles, pairs)
+
+    modes = {'serial': serial, 'pickled': pickled, 'shared': shared}
+    timings = {}
+    unique_counts = {}
+    for name, run in modes.items():
+        samples = []
+        for _ in range(args.repeats):
+            started = time.perf_counter()
+            unique, _ = await run()
+            samples.append(time.perf_counter() - started)
+        timings[name] = round(statistics.median(samples) * 1000, 2)
+        unique_counts[name] = len(unique)
+
+    return {
+        'articles': count,
+        'median_ms': timings,
+        'shared_speedup_vs_serial': round(timings['serial'] / timings['shared'], 2),
+        'shared_speedup_vs_pickled': round(timings['pickled'] / timings['shared'], 2),
+        'same_result': len(set(unique_counts.values())) == 1,
+        'transfer': measure_transfer(articles, len(ranges)),
+    }
+
+
+async def run_benchmark(args) -> Dict[str, Any]:
+    get_deduplicator()
+
+    executor = AsyncExecutor(max_workers=1, enable_monitoring=False, process_pool_size=args.workers)
+    try:
+        # プロセスの起動とワーカー側の重複除去器の作成を計測から外す
+        await executor.map_shared(warm_up, {'x': ['warmup'] * args.workers})
+        runs = [await run_case(count, executor, args) for count in args.articles]
+    finally:
+        await executor.stop()
+
+    return {
+        'benchmark': 'process_pool',
+        'cpu_count': os.cpu_count(),
+        'workers': args.workers,
+        'repeats': args.repeats,
+        'runs': runs,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Process pool offload (pickled articles vs. shared-memory columns)')
+    parser.add_argument('--articles', type=int, nargs='+', default=[50, 100], help='記事件数')
+    parser.add_argument('--workers', type=int, default=max(2, os.cpu_count() or 1), help='プロセス数')
+    parser.add_argument('--repeats', type=int, default=3, help='各モードの計測回数（中央値を出力）')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='結果JSON出力パス')
+    args = parser.parse_args()
+
+    result = asyncio.run(run_benchmark(args))
+    result['timestamp'] = datetime.now().isoformat()
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,196 @@
+"""
+Report Statistics Benchmark
+レポート統計ベンチマーク - 従来の複数走査と列指向一回走査の比較
+
+使用例:
+    python benchmarks/report_statistics_benchmark.py --articles 100000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import List, Dict, Any
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models.article import Article
+from generators.article_columns import ArticleColumns
+
+CATEGORIES = ['domestic_social', 'international_social', 'domestic_economy',
+              'international_economy', 'tech', 'security']
+KEYWORDS = [f"keyword_{i}" for i in range(500)]
+
+
+def make_articles(count: int, seed: int = 42) -> List[Article]:
+    """合成記事生成"""
+    rng = random.Random(seed)
+    base = datetime(2025, 1, 1)
+    articles = []
+    for i in range(count):
+        category = rng.choice(CATEGORIES)
+        articles.append(Article(
+            url=f"https://example.com/{i}",
+            title=f"Article {i}",
+            category=category,
+            source_name=f"source_{rng.randrange(50)}",
+            importance_score=rng.randint(1, 10),
+            sentiment_score=rng.uniform(-1, 1),
+            cvss_score=rng.uniform(0, 10) if category == 'security' else None,
+            keywords=rng.sample(KEYWORDS, rng.randint(0, 5)),
+            published_at=base + timedelta(minutes=rng.randrange(7 * 24 * 60))
+        ))
+    return articles
+
+
+# ----------------------------------------------------------------------
+# 従来実装（比較用の参照実装）
+# ----------------------------------------------------------------------
+
+def legacy_html_statistics(articles: List[Article]) -> Dict[str, Any]:
+    importance_scores = [getattr(a, 'importance_score', 5) for a in articles]
+    stats = {
+        'total_count': len(articles),
+        'avg_importance': sum(importance_scores) / len(importance_scores),
+        'high_importance': len([s for s in importance_scores if s >= 8]),
+        'medium_importance': len([s for s in importance_scores if 5 <= s < 8]),
+        'low_importance': len([s for s in importance_scores if s < 5]),
+        'urgent_count': len([a for a in articles if getattr(a, 'importance_score', 0) >= 9]),
+        'security_count': len([a for a in articles if getattr(a, 'category', None) == 'security'])
+    }
+    category_counts = {}
+    for article in articles:
+        category = getattr(article, 'category', None)
+        if category:
+            category_counts[category] = category_counts.get(category, 0) + 1
+    stats['category_breakdown'] = category_counts
+    return stats
+
+
+def legacy_advanced_statistics(articles: List[Article]) -> Dict[str, Any]:
+    importance_scores = [a.importance_score for a in articles]
+    sentiment_scores = [a.sentiment_score for a in articles if hasattr(a, 'sentiment_score')]
+    language_counts, source_counts, hour_counts = {}, {}, {}
+    for article in articles:
+        lang = getattr(article, 'language', 'unknown')
+        language_counts[lang] = language_counts.get(lang, 0) + 1
+    for article in articles:
+        source = getattr(article, 'source_name', 'Unknown')
+        source_counts[source] = source_counts.get(source, 0) + 1
+    for article in articles:
+        hour = article.published_at.hour
+        hour_counts[hour] = hour_counts.get(hour, 0) + 1
+    return {
+        'avg_importance': round(sum(importance_scores) / len(articles), 2),
+        'max_importance': max(importance_scores),
+        'min_importance': min(importance_scores),
+        'importance_distribution': {
+            'critical': len([a for a in articles if a.importance_score >= 9]),
+            'high': len([a for a in articles if 7 <= a.importance_score < 9]),
+            'medium': len([a for a in articles if 5 <= a.importance_score < 7]),
+            'low': len([a for a in articles if a.importance_score < 5])
+        },
+        'sentiment_analysis': {
+            'avg_sentiment': round(sum(sentiment_scores) / len(sentiment_scores), 2),
+            'positive_count': len([s for s in sentiment_scores if s > 0.1]),
+            'negative_count': len([s for s in sentiment_scores if s < -0.1]),
+            'neutral_count': len([s for s in sentiment_scores if -0.1 <= s <= 0.1])
+        },
+        'language_distribution': dict(sorted(language_counts.items(), key=lambda x: x[1], reverse=True)[:5]),
+        'source_distribution': dict(sorted(source_counts.items(), key=lambda x: x[1], reverse=True)[:5]),
+        'time_distribution': hour_counts
+    }
+
+
+def legacy_categories_weekly(articles: List[Article]) -> Dict[str, Dict[str, Any]]:
+    category_data = {}
+    for article in articles:
+        category = getattr(article, 'detailed_category', getattr(article, 'category', '未分類'))
+        if category not in category_data:
+            category_data[category] = {'count': 0, 'urgent_count': 0, 'total_importance': 0, 'keywords': []}
+        cat_data = category_data[category]
+        cat_data['count'] += 1
+        cat_data['total_importance'] += getattr(article, 'importance_score', 5)
+        if getattr(article, 'is_urgent', False):
+            cat_data['urgent_count'] += 1
+        if getattr(article, 'keywords', None):
+            cat_data['keywords'].extend(article.keywords)
+    for data in category_data.values():
+        data['avg_importance'] = data['total_importance'] / data['count']
+        keyword_counts = {}
+        for keyword in data['keywords']:
+            keyword_counts[keyword] = keyword_counts.get(keyword, 0) + 1
+        data['top_keywords'] = [k for k, v in sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True)[:5]]
+    return category_data
+
+
+def legacy_trending_keywords(articles: List[Article]) -> List[tuple]:
+    all_keywords = []
+    for article in articles:
+        if getattr(article, 'keywords', None):
+            all_keywords.extend(article.keywords)
+    keyword_counts = {}
+    for keyword in all_keywords:
+        keyword_counts[keyword] = keyword_counts.get(keyword, 0) + 1
+    return sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True)[:15]
+
+
+def run_legacy(articles: List[Article]):
+    legacy_html_statistics(articles)
+    legacy_advanced_statistics(articles)
+    legacy_categories_weekly(articles)
+    legacy_trending_keywords(articles)
+
+
+def run_columnar(articles: List[Article]):
+    columns = ArticleColumns.from_articles(articles)
+    columns.html_statistics()
+    columns.advanced_statistics()
+    columns.categories_weekly()
+    columns.trending_keywords(15)
+
+
+def time_best(func, articles: List[Article], repeat: int) -> float:
+    """最良値（秒）"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(articles)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report statistics benchmark')
+    parser.add_argument('--articles', type=int, default=100000, help='記事数')
+    parser.add_argument('--repeat', type=int, default=5, help='繰り返し回数')
+    parser.add_argument('--output', help='結果JSON出力パス')
+    args = parser.parse_args()
+
+    articles = make_articles(args.articles)
+
+    legacy = time_best(run_legacy, articles, args.repeat)
+    columnar = time_best(run_columnar, articles, args.repeat)
+    build_only = time_best(ArticleColumns.from_articles, articles, args.repeat)
+
+    result = {
+        'benchmark': 'report_statistics',
+        'articles': args.articles,
+        'legacy_seconds': round(legacy, 4),
+        'columnar_seconds': round(columnar, 4),
+        'columnar_build_seconds': round(build_only, 4),
+        'speedup': round(legacy / columnar, 2) if columnar else None,
+        'timestamp': datetime.now().isoformat()
+    }
+
+    print(json.dumps(result, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
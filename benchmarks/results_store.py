@@ -0,0 +1,92 @@
+"""
+Benchmark Results Store
+ベンチマーク結果ストア - 実行ごとの結果JSONを履歴として保存し、基準（baseline）と
+最新の結果を取り出す
+
+保存形式:
+    <store>/<name>_<YYYYmmdd_HHMMSS>.json   実行ごとの結果
+    <store>/<name>_baseline.json             比較基準（--set-baseline で更新）
+
+結果JSONの results は {ベンチマーク名: {'unit': 'seconds', 'samples': [...], ...}} で、
+scripts/compare_benchmarks.py が中央値とMADで比較する。
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+DEFAULT_STORE_DIR = Path(__file__).parent / 'results'
+
+# 正規分布でMADを標準偏差相当に換算する係数
+MAD_TO_SIGMA = 1.4826
+
+
+def summarize_samples(samples: List[float]) -> Dict[str, float]:
+    """標本の中央値・MAD・最小値・最大値"""
+    median = statistics.median(samples)
+    return {
+        'median': median,
+        'mad': statistics.median(abs(sample - median) for sample in samples),
+        'min': min(samples),
+        'max': max(samples),
+        'n': len(samples)
+    }
+
+
+def environment_info() -> Dict[str, Any]:
+    """比較時に実行環境の違いを確認するための情報"""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=Path(__file__).parent,
+            capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'git_commit': commit
+    }
+
+
+def save_result(result: Dict[str, Any], name: str,
+                store_dir: Union[str, Path] = DEFAULT_STORE_DIR,
+                baseline: bool = False) -> Path:
+    """結果を履歴に保存（baseline=True なら比較基準としても保存）"""
+    store = Path(store_dir)
+    store.mkdir(parents=True, exist_ok=True)
+    path = store / f"{name}_{datetime.now():%Y%m%d_%H%M%S}.json"
+    payload = json.dumps(result, indent=2, ensure_ascii=False)
+    path.write_text(payload, encoding='utf-8')
+    if baseline:
+        (store / f"{name}_baseline.json").write_text(payload, encoding='utf-8')
+    return path
+
+
+def history(name: str, store_dir: Union[str, Path] = DEFAULT_STORE_DIR) -> List[Path]:
+    """保存済み結果（古い順、基準ファイルを除く）"""
+    store = Path(store_dir)
+    if not store.exists():
+        return []
+    return sorted(path for path in store.glob(f"{name}_*.json")
+                  if path.name != f"{name}_baseline.json")
+
+
+def latest(name: str, store_dir: Union[str, Path] = DEFAULT_STORE_DIR) -> Optional[Path]:
+    runs = history(name, store_dir)
+    return runs[-1] if runs else None
+
+
+def baseline(name: str, store_dir: Union[str, Path] = DEFAULT_STORE_DIR) -> Optional[Path]:
+    """比較基準（未設定なら最も古い結果）"""
+    path = Path(store_dir) / f"{name}_baseline.json"
+    if path.exists():
+        return path
+    runs = history(name, store_dir)
+    return runs[0] if runs else None
@@ -0,0 +1,173 @@
+"""
+Simple Translator Benchmark
+簡易翻訳ベンチマーク - 従来のフレーズ毎 re.sub とコンパイル済み一回走査の比較
+
+使用例:
+    python benchmarks/simple_translator_benchmark.py --headlines 10000
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.simple_translator import SimpleTranslator
+
+COMPANIES = ['Apple', 'Toyota', 'Microsoft', 'Sony', 'Nvidia', 'Tesla', 'Rakuten', 'Samsung']
+FILLER = ['after', 'amid', 'as', 'over', 'says', 'new', 'plan', 'talks', 'deal', 'report',
+          'shares', 'outlook', 'record', 'quarter', 'sales', 'profit', 'rules', 'users']
+NUMBERS = ['5%', '12%', '$40', '$3 billion', '200 million', '7 thousand', '2025']
+
+
+# ----------------------------------------------------------------------
+# 従来実装（比較用の参照実装）
+# ----------------------------------------------------------------------
+
+LEGACY_MONTHS = SimpleTranslator.MONTHS
+LEGACY_WEEKDAYS = SimpleTranslator.WEEKDAYS
+LEGACY_VERBS = SimpleTranslator.VERB_MAP
+
+
+def legacy_is_mostly_english(text: str) -> bool:
+    if not text:
+        return False
+    alpha_chars = sum(1 for c in text if c.isalpha() and ord(c) < 128)
+    total_chars = sum(1 for c in text if c.isalpha())
+    if total_chars == 0:
+        return False
+    return (alpha_chars / total_chars) > 0.7
+
+
+def legacy_convert_to_japanese_structure(text: str, max_length: int = 200) -> str:
+    proper_nouns = re.findall(r'\b[A-Z][a-zA-Z]+\b', text)
+    text = re.sub(r'(\d+)%', r'\1％', text)
+    text = re.sub(r'\$(\d+)', r'\1ドル', text)
+    for eng, jpn in LEGACY_VERBS.items():
+        text = re.sub(eng, jpn, text, flags=re.IGNORECASE)
+    if legacy_is_mostly_english(text):
+        summary_parts = []
+        if proper_nouns:
+            summary_parts.append(proper_nouns[0])
+        numbers = re.findall(r'\d+[％%]|\d+ドル', text)
+        if numbers:
+            summary_parts.extend(numbers[:2])
+        keywords = re.findall(r'IPO|AI|security|cryptocurrency|blockchain', text, re.IGNORECASE)
+        if keywords:
+            for kw in keywords[:2]:
+                summary_parts.append(SimpleTranslator.COMMON_PHRASES.get(kw, kw))
+        if summary_parts:
+            text = '、'.join(summary_parts) + 'に関する記事'
+        else:
+            text = '詳細は原文をご覧ください'
+    if len(text) > max_length:
+        text = text[:max_length] + "..."
+    return text
+
+
+def legacy_translate_text(text: str, max_length: int = 200) -> str:
+    if not text:
+        return ""
+    result = text
+    for eng, jpn in SimpleTranslator.COMMON_PHRASES.items():
+        pattern = r'\b' + re.escape(eng) + r'\b'
+        result = re.sub(pattern, jpn, result, flags=re.IGNORECASE)
+    result = re.sub(r'(\d+)\s*billion', r'\1億', result)
+    result = re.sub(r'(\d+)\s*million', r'\1百万', result)
+    result = re.sub(r'(\d+)\s*thousand', r'\1千', result)
+    result = re.sub(r'(\d+)%', r'\1％', result)
+    result = re.sub(r'\$(\d+)', r'\1ドル', result)
+    for eng, jpn in LEGACY_MONTHS.items():
+        result = re.sub(eng, jpn, result, flags=re.IGNORECASE)
+    for eng, jpn in LEGACY_WEEKDAYS.items():
+        result = re.sub(eng, jpn, result, flags=re.IGNORECASE)
+    if len(result) > max_length:
+        result = result[:max_length] + "..."
+    if legacy_is_mostly_english(result):
+        result = legacy_convert_to_japanese_structure(result, max_length)
+    return result
+
+
+def make_headlines(count: int, seed: int = 42) -> List[str]:
+    """辞書語・月名・数値・一般語を混ぜた合成見出し"""
+    rng = random.Random(seed)
+    phrases = list(SimpleTranslator.COMMON_PHRASES)
+    calendar = list(LEGACY_MONTHS) + list(LEGACY_WEEKDAYS)
+    verbs = list(LEGACY_VERBS)
+    headlines = []
+    for _ in range(count):
+        words = [rng.choice(COMPANIES)]
+        for _ in range(rng.randint(6, 14)):
+            roll = rng.random()
+            if roll < 0.3:
+                words.append(rng.choice(phrases))
+            elif roll < 0.4:
+                words.append(rng.choice(NUMBERS))
+            elif roll < 0.45:
+                words.append(rng.choice(calendar))
+            elif roll < 0.5:
+                words.append(rng.choice(verbs))
+            else:
+                words.append(rng.choice(FILLER))
+        headlines.append(' '.join(words))
+    return headlines
+
+
+def measure(func, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Simple translator benchmark')
+    parser.add_argument('--headlines', type=int, default=10000, help='見出し数')
+    parser.add_argument('--repeat', type=int, default=3, help='繰り返し回数')
+    parser.add_argument('--output', help='結果JSON出力パス')
+    args = parser.parse_args()
+
+    headlines = make_headlines(args.headlines)
+    SimpleTranslator.translate_text('warm up')
+
+    legacy = measure(lambda: [legacy_translate_text(h, 100) for h in headlines], args.repeat)
+    compiled = measure(lambda: [SimpleTranslator.translate_text(h, 100) for h in headlines], args.repeat)
+    batch = measure(lambda: SimpleTranslator.translate_texts(headlines, 100), args.repeat)
+
+    expected = [legacy_translate_text(h, 100) for h in headlines]
+    actual = SimpleTranslator.translate_texts(headlines, 100)
+    mismatches = [(h, e, a) for h, e, a in zip(headlines, expected, actual) if e != a]
+
+    result = {
+        'benchmark': 'simple_translator',
+        'headlines': args.headlines,
+        'legacy_seconds': round(legacy, 4),
+        'compiled_seconds': round(compiled, 4),
+        'batch_seconds': round(batch, 4),
+        'speedup': round(legacy / compiled, 1),
+        'legacy_per_headline_us': round(legacy / args.headlines * 1e6, 1),
+        'compiled_per_headline_us': round(compiled / args.headlines * 1e6, 1),
+        'output_mismatches': len(mismatches),
+        'mismatch_examples': [
+            {'input': h, 'legacy': e, 'compiled': a} for h, e, a in mismatches[:3]
+        ],
+        'timestamp': datetime.now().isoformat()
+    }
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Startup Benchmark
+起動時間ベンチマーク - python -X importtime によるメインエントリーポイントの読み込み時間計測
+
+使用例:
+    python benchmarks/startup_benchmark.py --runs 10 --budget-ms 300
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# 起動時に読み込まれてはならない重い依存
+HEAVY_MODULES = ['anthropic', 'jinja2', 'aiohttp', 'googleapiclient', 'google.oauth2',
+                 'weasyprint', 'psutil', 'collectors.base_collector', 'processors.analyzer',
+                 'utils.monitoring_system', 'services.self_healing_system']
+
+
+def parse_importtime(stderr: str) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """-X importtime 出力を (自己時間, 累積時間) のマイクロ秒辞書に変換"""
+    self_us, cumulative_us = {}, {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, self_part, cumulative_part, name = (part for part in line.replace('import time:', '|', 1).split('|'))
+        module = name.strip()
+        self_us[module] = int(self_part)
+        cumulative_us[module] = int(cumulative_part)
+    return self_us, cumulative_us
+
+
+def run_once(module: str) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """新しいインタプリタでモジュールを読み込み、読み込み時間を取得"""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=SRC_DIR, capture_output=True, text=True, check=True
+    )
+    return parse_importtime(completed.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Startup import-time benchmark')
+    parser.add_argument('--module', default='main', help='計測するモジュール')
+    parser.add_argument('--runs', type=int, default=10, help='計測回数（初回はウォームアップ）')
+    parser.add_argument('--budget-ms', type=float, default=300.0, help='読み込み時間の目標上限（中央値、ミリ秒）')
+    parser.add_argument('--top', type=int, default=10, help='自己時間の大きいモジュール表示数')
+    parser.add_argument('--output', help='結果JSON出力パス')
+    args = parser.parse_args()
+
+    run_once(args.module)  # .pyc 生成・ディスクキャッシュのウォームアップ
+
+    totals: List[float] = []
+    last_self: Dict[str, int] = {}
+    last_cumulative: Dict[str, int] = {}
+    for _ in range(args.runs):
+        last_self, last_cumulative = run_once(args.module)
+        totals.append(last_cumulative.get(args.module, 0) / 1000)
+
+    median_ms = statistics.median(totals)
+    heavy_loaded = [name for name in HEAVY_MODULES if name in last_cumulative]
+    slowest = sorted(last_self.items(), key=lambda item: item[1], reverse=True)[:args.top]
+
+    result = {
+        'benchmark': 'startup',
+        'module': args.module,
+        'runs': args.runs,
+        'import_ms_p50': round(median_ms, 1),
+        'import_ms_max': round(max(totals), 1),
+        'budget_ms': args.budget_ms,
+        'within_budget': median_ms <= args.budget_ms and not heavy_loaded,
+        'modules_loaded': len(last_cumulative),
+        'heavy_modules_loaded': heavy_loaded,
+        'slowest_modules': [{'module': name, 'self_ms': round(us / 1000, 1)} for name, us in slowest],
+        'timestamp': datetime.now().isoformat()
+    }
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+    sys.exit(0 if result['within_budget'] else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""
+Threshold Update Benchmark
+動的閾値の更新 - 履歴（100・1000件）を埋めた DynamicThresholdManager で、
+標本の追加と閾値の再計算（_update_threshold）1回あたりの所要時間を計測する
+
+比較用に、従来の再計算（履歴全体から numpy で平均・標準偏差・polyfit を求め、
+IsolationForest を学習し直して閾値を探す）も同じ履歴で計測する。
+
+使用例:
+    python benchmarks/threshold_update_benchmark.py
+    python benchmarks/threshold_update_benchmark.py --history 100 1000 --updates 200
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from sklearn.ensemble import IsolationForest
+from sklearn.preprocessing import StandardScaler
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from monitoring.alert_system import DynamicThresholdManager, ThresholdConfig
+
+
+def legacy_candidates(values: List[float], config: ThresholdConfig) -> List[Optional[float]]:
+    """従来の閾値候補（統計・トレンド・IsolationForest）"""
+    statistical = np.mean(values) + config.std_multiplier * np.std(values)
+
+    slope = np.polyfit(np.arange(len(values)), np.array(values), 1)[0]
+    if slope > config.trend_sensitivity:
+        trend = config.base_threshold * (1 + slope * 0.1)
+    elif slope < -config.trend_sensitivity:
+        trend = config.base_threshold * (1 - abs(slope) * 0.05)
+    else:
+        trend = config.base_threshold
+
+    model = IsolationForest(contamination=0.1, random_state=42)
+    scaler = StandardScaler()
+    scaled = scaler.fit_transform(np.array(values).reshape(-1, 1))
+    model.fit(scaled)
+    threshold_score = np.percentile(model.decision_function(scaled), 10)
+    test_values = np.linspace(min(values), max(values) * 2, 1000).reshape(-1, 1)
+    test_scores = model.decision_function(scaler.transform(test_values))
+    valid = test_scores <= threshold_score
+    ml = float(np.max(test_values[valid])) if np.any(valid) else None
+    return [statistical, trend, ml]
+
+
+def measure(func, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def run_case(history: int, args, rng: random.Random) -> Dict[str, Any]:
+    manager = DynamicThresholdManager(db_path=os.path.join(tempfile.mkdtemp(), 'thresholds.db'))
+    config = ThresholdConfig(metric_name='cpu_percent', base_threshold=80.0,
+                             min_threshold=40.0, max_threshold=95.0)
+    manager.register_threshold(config)
+    # DBへの記録は両方式で共通なので計測から除く
+    manager._save_threshold_update = lambda *_: None
+
+    now = datetime.now()
+    values = [rng.gauss(50, 5) for _ in range(history)]
+    for value in values:
+        manager.add_metric_value('cpu_percent', value, now)
+
+    counter = iter(range(10 ** 9))
+
+    def add_sample():
+        manager.add_metric_value('cpu_percent', 50 + next(counter) % 10, now)
+
+    window = [item['value'] for item in manager.metrics_history['cpu_percent']]
+    legacy_update_ms = measure(lambda: legacy_candidates(window, config), args.legacy_updates)
+    online_update_ms = measure(lambda: manager._update_threshold('cpu_percent'), args.updates)
+    online_add_ms = measure(add_sample, args.updates)
+
+    return {
+        'history': len(window),
+        'online_add_us': round(online_add_ms * 1000, 2),
+        'online_update_us': round(online_update_ms * 1000, 2),
+        'legacy_update_ms': round(legacy_update_ms, 2),
+        'speedup': round(legacy_update_ms / online_update_ms),
+        'threshold': round(manager.get_threshold('cpu_percent'), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Dynamic threshold update (online estimators vs. full-history recompute)')
+    parser.add_argument('--history', type=int, nargs='+', default=[100, 1000], help='履歴件数')
+    parser.add_argument('--updates', type=int, default=500, help='逐次統計の計測回数（中央値を出力）')
+    parser.add_argument('--legacy-updates', type=int, default=10, help='従来実装の計測回数')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='結果JSON出力パス')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    result = {
+        'benchmark': 'threshold_update',
+        'cases': [run_case(history, args, rng) for history in args.history],
+        'timestamp': datetime.now().isoformat(),
+    }
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
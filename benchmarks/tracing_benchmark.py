@@ -0,0 +1,137 @@
+"""
+Tracing Benchmark
+実行トレースのオーバーヘッド計測 - 模擬パイプライン（並行収集・翻訳・分析・レンダリング）を
+トレース無効／有効で実行し、スパンあたりのコストと実行時間への影響を比較する
+
+使用例:
+    python benchmarks/tracing_benchmark.py --requests 200 --work-ms 20 --repeat 5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.tracing import Tracer, bind_context, current_span, trace_span, traced
+
+
+def busy(ms: float):
+    """CPUを使う処理の代わり（レンダリング等）"""
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        pass
+
+
+@traced('collector.fetch', category='collect')
+async def fetch(work_ms: float, index: int):
+    current_span().set('page', index)
+    await asyncio.sleep(work_ms / 1000)
+
+
+@traced('deepl.translate', category='translate')
+async def translate(work_ms: float):
+    await asyncio.sleep(work_ms / 1000)
+    busy(work_ms / 10)
+
+
+async def pipeline(requests: int, work_ms: float):
+    with trace_span('run', category='pipeline'):
+        with trace_span('collect', category='pipeline'):
+            await asyncio.gather(*(fetch(work_ms, i) for i in range(requests)))
+        with trace_span('translate', category='pipeline'):
+            for _ in range(requests // 4):
+                await translate(work_ms)
+        with trace_span('render', category='pipeline'):
+            def render():
+                with trace_span('report.html', category='render'):
+                    busy(work_ms * 5)
+            await asyncio.get_running_loop().run_in_executor(None, bind_context(render))
+
+
+def run_once(requests: int, work_ms: float, tracing: bool, trace_dir: Path):
+    """1回実行し、（全体の秒数, トレースファイル書き出しの秒数, スパン数）を返す"""
+    tracer = Tracer('benchmark') if tracing else None
+    started = time.perf_counter()
+    if tracer is None:
+        asyncio.run(pipeline(requests, work_ms))
+        return time.perf_counter() - started, 0.0, 0
+    with tracer:
+        asyncio.run(pipeline(requests, work_ms))
+    write_started = time.perf_counter()
+    tracer.write(trace_dir / 'trace.json')
+    finished = time.perf_counter()
+    return finished - started, finished - write_started, len(tracer.spans)
+
+
+def span_cost_ns(iterations: int, tracing: bool) -> float:
+    def loop():
+        started = time.perf_counter_ns()
+        for _ in range(iterations):
+            with trace_span('tick', category='bench', index=1):
+                pass
+        return (time.perf_counter_ns() - started) / iterations
+
+    if not tracing:
+        return loop()
+    with Tracer('cost', max_spans=iterations):
+        return loop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pipeline tracing overhead benchmark')
+    parser.add_argument('--requests', type=int, default=200, help='模擬収集リクエスト数')
+    parser.add_argument('--work-ms', type=float, default=20.0, help='1処理あたりの模擬処理時間（ms、API呼び出し相当）')
+    parser.add_argument('--repeat', type=int, default=5, help='繰り返し回数（中央値を採用）')
+    parser.add_argument('--span-iterations', type=int, default=100000, help='スパン単体コストの計測回数')
+    parser.add_argument('--output', help='結果JSON出力パス')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        disabled, enabled, writes, spans = [], [], [], 0
+        # 交互に実行して環境の揺らぎを両者に均等にかける
+        for _ in range(args.repeat):
+            disabled.append(run_once(args.requests, args.work_ms, False, Path(tmp))[0])
+            seconds, write_seconds, spans = run_once(args.requests, args.work_ms, True, Path(tmp))
+            enabled.append(seconds)
+            writes.append(write_seconds)
+        trace_bytes = (Path(tmp) / 'trace.json').stat().st_size
+
+    disabled_median = statistics.median(disabled)
+    enabled_median = statistics.median(enabled)
+    span_enabled_ns = span_cost_ns(args.span_iterations, True)
+    span_disabled_ns = span_cost_ns(args.span_iterations, False)
+
+    result = {
+        'benchmark': 'tracing',
+        'requests': args.requests,
+        'work_ms': args.work_ms,
+        'spans_per_run': spans,
+        'trace_file_bytes': trace_bytes,
+        'trace_write_ms': round(statistics.median(writes) * 1000, 2),
+        'disabled_median_seconds': round(disabled_median, 4),
+        'enabled_median_seconds': round(enabled_median, 4),
+        'overhead_percent': round((enabled_median - disabled_median) / disabled_median * 100, 2),
+        'span_cost_enabled_ns': round(span_enabled_ns, 1),
+        'span_cost_disabled_ns': round(span_disabled_ns, 1),
+        # 計測ノイズを除いた見積もり: (スパン数 × スパン単体コスト + 書き出し) / 実行時間
+        'estimated_overhead_percent': round(
+            (spans * span_enabled_ns / 1e9 + statistics.median(writes)) / disabled_median * 100, 3),
+        'timestamp': datetime.now().isoformat()
+    }
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+"""
+Worker Pool Benchmark
+ワーカープールのディスパッチ遅延とアイドル時CPU使用率 - ワーカー数（1・16・64）ごとに、
+待機中のワーカーがタスク投入から実行開始までにかかる時間と、タスクがないときに
+プロセスが消費するCPU時間を計測する
+
+比較用に、従来の実装（優先度ごとのキューを wait_for(0.01) で走査し、空なら
+sleep(0.1) して再試行するワーカー）も同じ条件で計測する。
+
+使用例:
+    python benchmarks/worker_pool_benchmark.py
+    python benchmarks/worker_pool_benchmark.py --workers 1 16 64 --dispatches 100 --idle-seconds 3
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.async_executor import Task, TaskConfig, TaskPriority, TaskQueue, WorkerPool
+
+
+class LegacyTaskQueue:
+    """従来の TaskQueue（優先度ごとのキューを順に走査）"""
+
+    def __init__(self, max_size: int = 1000):
+        self.max_size = max_size
+        self.queues = {priority: asyncio.PriorityQueue() for priority in (
+            TaskPriority.URGENT, TaskPriority.HIGH, TaskPriority.NORMAL, TaskPriority.LOW)}
+        self.task_counter = 0
+
+    async def put(self, task: Task):
+        await self.queues[task.config.priority].put((self.task_counter, task))
+        self.task_counter += 1
+
+    async def get(self) -> Optional[Task]:
+        for priority in [TaskPriority.URGENT, TaskPriority.HIGH, TaskPriority.NORMAL, TaskPriority.LOW]:
+            priority_queue = self.queues[priority]
+            if not priority_queue.empty():
+                try:
+                    _, task = await asyncio.wait_for(priority_queue.get(), timeout=0.01)
+                    return task
+                except asyncio.TimeoutError:
+                    continue
+        return None
+
+
+class LegacyWorkerPool(WorkerPool):
+    """従来のワーカーループ（キューが空なら sleep(0.1) して再取得）"""
+
+    async def _worker(self, worker_name: str):
+        while self.running:
+            try:
+                task = await self.task_queue.get()
+                if task is None:
+                    await asyncio.sleep(0.1)
+                    continue
+                self.active_workers += 1
+                result = await self._execute_task(task, worker_name)
+                self.active_workers -= 1
+                if result is not None and self.on_result is not None:
+                    self.on_result(result)
+            except asyncio.CancelledError:
+                break
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+async def measure_idle_cpu(seconds: float) -> float:
+    """待機中のプロセスCPU使用率（%、1コア=100%）"""
+    cpu_started = time.process_time()
+    wall_started = time.perf_counter()
+    await asyncio.sleep(seconds)
+    return (time.process_time() - cpu_started) / (time.perf_counter() - wall_started) * 100
+
+
+async def measure_dispatch(queue, dispatches: int, gap: float) -> List[float]:
+    """待機中のワーカーへ1件ずつ投入し、投入から実行開始までの時間（ms）を計測"""
+    loop = asyncio.get_running_loop()
+    latencies = []
+    for index in range(dispatches):
+        started = loop.create_future()
+
+        async def job(future=started):
+            future.set_result(time.perf_counter())
+
+        submitted = time.perf_counter()
+        await queue.put(Task(f'dispatch-{index}', job, config=TaskConfig(max_retries=0)))
+        latencies.append((await started - submitted) * 1000)
+        # ワーカーが再び待機状態に戻るまで空ける
+        await asyncio.sleep(gap)
+    return latencies
+
+
+async def run_case(workers: int, legacy: bool, args) -> Dict[str, Any]:
+    queue = LegacyTaskQueue() if legacy else TaskQueue()
+    pool = (LegacyWorkerPool if legacy else WorkerPool)(max_workers=workers)
+    await pool.start(queue)
+    try:
+        await asyncio.sleep(0.2)
+        idle_cpu = await measure_idle_cpu(args.idle_seconds)
+        latencies = await measure_dispatch(queue, args.dispatches, args.gap)
+    finally:
+        await pool.stop()
+
+    return {
+        'workers': workers,
+        'idle_cpu_percent': round(idle_cpu, 2),
+        'dispatch_ms': {
+            'median': round(statistics.median(latencies), 3),
+            'p95': round(percentile(latencies, 0.95), 3),
+            'max': round(max(latencies), 3),
+        },
+    }
+
+
+async def run_benchmark(args) -> Dict[str, Any]:
+    result = {
+        'benchmark': 'worker_pool',
+        'idle_seconds': args.idle_seconds,
+        'dispatches': args.dispatches,
+        'runs': [await run_case(workers, False, args) for workers in args.workers],
+    }
+    if not args.skip_legacy:
+        result['legacy'] = {'runs': [await run_case(workers, True, args) for workers in args.workers]}
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='WorkerPool dispatch latency and idle CPU usage')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 16, 64], help='ワーカー数')
+    parser.add_argument('--dispatches', type=int, default=50, help='ディスパッチ遅延の計測回数')
+    parser.add_argument('--gap', type=float, default=0.02, help='ディスパッチ間の待機秒数')
+    parser.add_argument('--idle-seconds', type=float, default=2.0, help='アイドルCPUの計測秒数')
+    parser.add_argument('--skip-legacy', action='store_true', help='従来実装の計測を省略')
+    parser.add_argument('--output', help='結果JSON出力パス')
+    args = parser.parse_args()
+
+    result = asyncio.run(run_benchmark(args))
+    result['timestamp'] = datetime.now().isoformat()
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
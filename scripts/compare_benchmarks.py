@@ -1,182 +1,305 @@
 #!/usr/bin/env python3
 """
 ベンチマーク結果の比較とパフォーマンス劣化検出
+
+基準と今回の結果をベンチマークごとに中央値で比較し、変化率が閾値を超え、かつ
+差が中央値の標準誤差（MADを標準偏差に換算し、独立した実行数で割ったもの）の
+noise_k 倍を超える場合だけ劣化と判定する。同じプロセス内の標本は独立ではないため、
+独立した実行数には計測プロセス数（記録がなければ1）を使う。ホットパス（重複除去・
+一括翻訳・レンダリング・DB書き込み）に劣化があるか、基準にあるそれらが今回の結果に
+無い（MISSING）場合は終了コード1を返す。
+
+読み込める結果形式:
+    - benchmarks/hot_path_benchmark.py などの {'results': {名前: {'samples': [...]}}}
+    - benchmarks/performance_test.py の BenchmarkReporter レポート（同じ results を含む）
+    - pytest-benchmark の --benchmark-json 出力（stats.data または median/iqr）
+
+使用例:
+    python scripts/compare_benchmarks.py baseline.json current.json
+    python scripts/compare_benchmarks.py --store benchmarks/results --name hot_paths
 """
+import argparse
 import json
+import math
+import os
 import sys
-from pathlib import Path
-from typing import Dict, Any, List
+from typing import Any, Dict, List, Optional
 import logging
 
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+from results_store import DEFAULT_STORE_DIR, MAD_TO_SIGMA, baseline, latest, summarize_samples
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 劣化時に失敗させるベンチマーク（いずれも含まれない結果では全ベンチマークが対象）
+GATED_BENCHMARKS = ('dedup', 'translate_batch', 'render', 'db_write')
+
+# 中央値の標準誤差 ≒ 1.2533 × σ / √n（正規分布の場合）
+MEDIAN_SE_FACTOR = 1.2533
+
+
 class BenchmarkComparator:
-    def __init__(self, threshold_percent: float = 20.0):
+    def __init__(self, threshold_percent: float = 10.0, noise_k: float = 3.0,
+                 gated: Optional[List[str]] = None):
         """
         Args:
-            threshold_percent: パフォーマンス劣化の閾値（％）
+            threshold_percent: パフォーマンス劣化の閾値（中央値の変化率、％）
+            noise_k: 差を中央値の標準誤差の何倍まで雑音とみなすか
+            gated: 劣化時に失敗させるベンチマーク名
         """
         self.threshold = threshold_percent
-        
+        self.noise_k = noise_k
+        self.gated = list(gated) if gated is not None else list(GATED_BENCHMARKS)
+
     def load_benchmark_data(self, filepath: str) -> Dict[str, Any]:
         """ベンチマークJSONファイルを読み込み"""
         try:
-            with open(filepath, 'r') as f:
+            with open(filepath, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except (FileNotFoundError, json.JSONDecodeError) as e:
             logger.error(f"Failed to load benchmark data from {filepath}: {e}")
             return {}
-    
-    def extract_metrics(self, benchmark_data: Dict[str, Any]) -> Dict[str, float]:
-        """ベンチマークデータからメトリクスを抽出"""
+
+    def extract_metrics(self, benchmark_data: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+        """ベンチマークデータから {名前: {'median', 'sigma', 'runs', 'n'}} を抽出"""
         metrics = {}
-        
-        if 'benchmarks' not in benchmark_data:
-            return metrics
-            
-        for benchmark in benchmark_data['benchmarks']:
+
+        for name, result in benchmark_data.get('results', {}).items():
+            samples = result.get('samples') or []
+            if samples:
+                summary = summarize_samples(samples)
+                metrics[name] = {
+                    'median': summary['median'],
+                    'sigma': summary['mad'] * MAD_TO_SIGMA,
+                    'runs': result.get('processes', 1),
+                    'n': summary['n']
+                }
+
+        # pytest-benchmark 形式（1プロセス内の計測）
+        for benchmark in benchmark_data.get('benchmarks', []):
             name = benchmark.get('name', 'unknown')
             stats = benchmark.get('stats', {})
-            
-            # 主要メトリクスを抽出
-            if 'mean' in stats:
-                metrics[f"{name}_mean"] = stats['mean']
-            if 'min' in stats:
-                metrics[f"{name}_min"] = stats['min']
-            if 'max' in stats:
-                metrics[f"{name}_max"] = stats['max']
-            if 'stddev' in stats:
-                metrics[f"{name}_stddev"] = stats['stddev']
-                
+            if stats.get('data'):
+                summary = summarize_samples(stats['data'])
+                metrics[name] = {
+                    'median': summary['median'],
+                    'sigma': summary['mad'] * MAD_TO_SIGMA,
+                    'runs': 1,
+                    'n': summary['n']
+                }
+            elif 'median' in stats or 'mean' in stats:
+                # 標本がない場合は IQR（なければ標準偏差）からばらつきを推定
+                sigma = stats['iqr'] / 1.349 if stats.get('iqr') is not None else stats.get('stddev', 0.0)
+                metrics[name] = {
+                    'median': stats.get('median', stats.get('mean')),
+                    'sigma': sigma or 0.0,
+                    'runs': 1,
+                    'n': stats.get('rounds', 1)
+                }
+
         return metrics
-    
-    def compare_metrics(self, baseline: Dict[str, float], current: Dict[str, float]) -> Dict[str, Dict[str, Any]]:
+
+    @staticmethod
+    def _standard_error(metric: Dict[str, float]) -> float:
+        return MEDIAN_SE_FACTOR * metric['sigma'] / math.sqrt(max(metric['runs'], 1))
+
+    def compare_metrics(self, baseline: Dict[str, Dict[str, float]],
+                        current: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, Any]]:
         """メトリクスの比較と劣化検出"""
         results = {}
-        
+
         for metric_name in baseline.keys():
+            base = baseline[metric_name]
+
             if metric_name not in current:
+                # ゲート対象が消えた（クラッシュ・改名）場合は劣化と同じく失敗させる
+                if metric_name in self.gated:
+                    results[metric_name] = {
+                        'baseline': base['median'],
+                        'current': None,
+                        'percent_change': None,
+                        'noise': None,
+                        'samples': (base['n'], 0),
+                        'is_regression': True,
+                        'status': 'MISSING'
+                    }
                 continue
-                
-            baseline_value = baseline[metric_name]
-            current_value = current[metric_name]
-            
-            if baseline_value == 0:
+
+            cur = current[metric_name]
+
+            if not base['median']:
                 continue
-                
-            # パーセンテージ変化を計算
-            percent_change = ((current_value - baseline_value) / baseline_value) * 100
-            
-            # 劣化判定（実行時間の増加は劣化）
-            is_regression = percent_change > self.threshold
-            
+
+            delta = cur['median'] - base['median']
+            percent_change = delta / base['median'] * 100
+            noise = math.hypot(self._standard_error(base), self._standard_error(cur))
+            significant = abs(delta) > self.noise_k * noise
+
+            # 劣化判定（実行時間の増加は劣化、ばらつきの範囲内の変化は雑音）
+            if abs(percent_change) <= self.threshold:
+                status = 'OK'
+            elif not significant:
+                status = 'NOISY'
+            elif delta > 0:
+                status = 'REGRESSION'
+            else:
+                status = 'IMPROVED'
+
             results[metric_name] = {
-                'baseline': baseline_value,
-                'current': current_value,
+                'baseline': base['median'],
+                'current': cur['median'],
                 'percent_change': percent_change,
-                'is_regression': is_regression,
-                'status': 'REGRESSION' if is_regression else 'OK'
+                'noise': noise,
+                'samples': (base['n'], cur['n']),
+                'is_regression': status == 'REGRESSION',
+                'status': status
             }
-            
+
         return results
-    
+
+    def gated_metrics(self, comparison_results: Dict[str, Dict[str, Any]]) -> List[str]:
+        """終了コードに影響するベンチマーク名"""
+        gated = [name for name in comparison_results if name in self.gated]
+        return gated or list(comparison_results)
+
+    def format_table(self, comparison_results: Dict[str, Dict[str, Any]]) -> str:
+        """差分の簡潔な表（端末表示用）"""
+        gated = set(self.gated_metrics(comparison_results))
+        name_width = max([len(name) for name in comparison_results] + [9]) + 2
+        lines = [
+            f"{'benchmark':<{name_width}}{'baseline':>12}{'current':>12}{'change':>10}{'noise':>12}  status",
+            '-' * (name_width + 54)
+        ]
+        for name, data in comparison_results.items():
+            marker = '' if name in gated else ' (not gated)'
+            if data['status'] == 'MISSING':
+                lines.append(f"{name:<{name_width}}{_format_seconds(data['baseline']):>12}"
+                             f"{'-':>12}{'-':>10}{'-':>12}  MISSING{marker}")
+                continue
+            lines.append(
+                f"{name:<{name_width}}{_format_seconds(data['baseline']):>12}"
+                f"{_format_seconds(data['current']):>12}{data['percent_change']:>+9.1f}%"
+                f"{'±' + _format_seconds(self.noise_k * data['noise']):>12}  {data['status']}{marker}"
+            )
+        return "\n".join(lines)
+
     def generate_report(self, comparison_results: Dict[str, Dict[str, Any]]) -> str:
-        """比較結果のレポート生成"""
+        """比較結果のレポート生成（Markdown）"""
         report_lines = []
         report_lines.append("# 📊 Performance Comparison Report")
         report_lines.append("")
-        
+        report_lines.append(f"閾値: 中央値の変化 {self.threshold:.0f}% 超 かつ 標準誤差の {self.noise_k:g} 倍超")
+        report_lines.append("")
+
         regressions = [k for k, v in comparison_results.items() if v['is_regression']]
-        
+
         if regressions:
             report_lines.append("## ⚠️ Performance Regressions Detected")
-            report_lines.append("")
-            report_lines.append("| Metric | Baseline | Current | Change | Status |")
-            report_lines.append("|--------|----------|---------|--------|--------|")
-            
-            for metric in regressions:
-                data = comparison_results[metric]
-                report_lines.append(
-                    f"| {metric} | {data['baseline']:.4f} | {data['current']:.4f} | "
-                    f"{data['percent_change']:+.2f}% | {data['status']} |"
-                )
         else:
             report_lines.append("## ✅ No Performance Regressions")
-            
-        report_lines.append("")
-        report_lines.append("## 📈 All Metrics")
+
         report_lines.append("")
-        report_lines.append("| Metric | Baseline | Current | Change | Status |")
-        report_lines.append("|--------|----------|---------|--------|--------|")
-        
+        report_lines.append("| Metric | Baseline | Current | Change | Noise (±) | Status |")
+        report_lines.append("|--------|----------|---------|--------|-----------|--------|")
+
         for metric, data in comparison_results.items():
             status_emoji = "⚠️" if data['is_regression'] else "✅"
+            if data['status'] == 'MISSING':
+                report_lines.append(
+                    f"| {metric} | {_format_seconds(data['baseline'])} | - | - | - | {status_emoji} MISSING |"
+                )
+                continue
             report_lines.append(
-                f"| {metric} | {data['baseline']:.4f} | {data['current']:.4f} | "
-                f"{data['percent_change']:+.2f}% | {status_emoji} {data['status']} |"
+                f"| {metric} | {_format_seconds(data['baseline'])} | {_format_seconds(data['current'])} | "
+                f"{data['percent_change']:+.2f}% | {_format_seconds(self.noise_k * data['noise'])} | "
+                f"{status_emoji} {data['status']} |"
             )
-            
+
         return "\n".join(report_lines)
-    
-    def run_comparison(self, baseline_file: str, current_file: str) -> bool:
-        """ベンチマーク比較の実行"""
+
+    def run_comparison(self, baseline_file: str, current_file: str,
+                       report_path: Optional[str] = None) -> bool:
+        """ベンチマーク比較の実行（ゲート対象に劣化がなければ True）"""
         logger.info(f"Comparing benchmarks: {baseline_file} vs {current_file}")
-        
+
         # データ読み込み
         baseline_data = self.load_benchmark_data(baseline_file)
         current_data = self.load_benchmark_data(current_file)
-        
+
         if not baseline_data or not current_data:
             logger.error("Failed to load benchmark data")
             return False
-            
+
         # メトリクス抽出
         baseline_metrics = self.extract_metrics(baseline_data)
         current_metrics = self.extract_metrics(current_data)
-        
-        if not baseline_metrics or not current_metrics:
-            logger.warning("No metrics found in benchmark data")
+
+        # 今回の結果が空でも、基準にあるゲート対象は MISSING として比較する
+        if not baseline_metrics:
+            logger.warning("No metrics found in baseline data")
             return True
-            
+
         # 比較実行
         comparison_results = self.compare_metrics(baseline_metrics, current_metrics)
-        
-        # レポート生成
-        report = self.generate_report(comparison_results)
-        
-        # レポートを出力
-        print(report)
-        
-        # ファイルに保存
-        with open('performance-comparison-report.md', 'w') as f:
-            f.write(report)
-            
+
+        print(self.format_table(comparison_results))
+
+        if report_path:
+            with open(report_path, 'w', encoding='utf-8') as f:
+                f.write(self.generate_report(comparison_results))
+
         # 劣化があったかチェック
-        regressions = [k for k, v in comparison_results.items() if v['is_regression']]
-        
+        regressions = [name for name in self.gated_metrics(comparison_results)
+                       if comparison_results[name]['is_regression']]
+
+        missing = [name for name in regressions if comparison_results[name]['status'] == 'MISSING']
+        if missing:
+            logger.warning(f"Gated benchmarks missing from current results: {', '.join(missing)}")
         if regressions:
-            logger.warning(f"Performance regressions detected: {len(regressions)} metrics")
-            # GitHub Actionsの場合は環境変数に設定
-            with open('performance-regression.txt', 'w') as f:
-                f.write(f"REGRESSIONS={len(regressions)}\n")
+            logger.warning(f"Performance regressions detected: {', '.join(regressions)}")
             return False
         else:
             logger.info("No performance regressions detected")
             return True
 
+
+def _format_seconds(value: float) -> str:
+    if value >= 1:
+        return f"{value:.3f}s"
+    if value >= 1e-3:
+        return f"{value * 1e3:.2f}ms"
+    return f"{value * 1e6:.1f}us"
+
+
 def main():
-    if len(sys.argv) != 3:
-        print("Usage: python compare_benchmarks.py <baseline.json> <current.json>")
-        sys.exit(1)
-        
-    baseline_file = sys.argv[1]
-    current_file = sys.argv[2]
-    
-    comparator = BenchmarkComparator(threshold_percent=20.0)
-    success = comparator.run_comparison(baseline_file, current_file)
-    
+    parser = argparse.ArgumentParser(description='Compare benchmark results against a baseline')
+    parser.add_argument('baseline', nargs='?', help='基準の結果JSON')
+    parser.add_argument('current', nargs='?', help='今回の結果JSON')
+    parser.add_argument('--store', help=f'結果ストアから基準と最新を選ぶ（例: {DEFAULT_STORE_DIR}）')
+    parser.add_argument('--name', default='hot_paths', help='結果ストア内のベンチマーク名')
+    parser.add_argument('--threshold', type=float, default=10.0, help='中央値の変化率の閾値（％）')
+    parser.add_argument('--noise-k', type=float, default=3.0, help='雑音とみなす標準誤差の倍率')
+    parser.add_argument('--gate', nargs='+', default=list(GATED_BENCHMARKS), help='劣化時に失敗させるベンチマーク名')
+    parser.add_argument('--report', help='Markdownレポートの出力パス')
+    args = parser.parse_args()
+
+    if args.store:
+        baseline_file = args.baseline or baseline(args.name, args.store)
+        current_file = args.current or latest(args.name, args.store)
+        if baseline_file is None or current_file is None or str(baseline_file) == str(current_file):
+            logger.error(f"Need a baseline and a newer result for '{args.name}' in {args.store}")
+            sys.exit(2)
+    elif args.baseline and args.current:
+        baseline_file, current_file = args.baseline, args.current
+    else:
+        parser.error('specify <baseline.json> <current.json> or --store')
+
+    comparator = BenchmarkComparator(threshold_percent=args.threshold, noise_k=args.noise_k, gated=args.gate)
+    success = comparator.run_comparison(str(baseline_file), str(current_file), report_path=args.report)
+
     sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
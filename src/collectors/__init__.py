@@ -3,14 +3,15 @@ News Collectors Module
 ニュース収集モジュール
 """
 
-from .base_collector import BaseCollector
-from .newsapi_collector import NewsAPICollector
-from .gnews_collector import GNewsCollector
-from .nvd_collector import NVDCollector
+try:
+    from ..utils.lazy_exports import lazy_exports
+except ImportError:
+    from utils.lazy_exports import lazy_exports
 
-__all__ = [
-    'BaseCollector',
-    'NewsAPICollector', 
-    'GNewsCollector',
-    'NVDCollector'
-]
\ No newline at end of file
+# サブモジュールは属性の初回参照時に読み込む（起動時間短縮）
+lazy_exports(globals(), {
+    'BaseCollector': '.base_collector',
+    'NewsAPICollector': '.newsapi_collector',
+    'GNewsCollector': '.gnews_collector',
+    'NVDCollector': '.nvd_collector',
+})
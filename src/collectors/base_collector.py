@@ -3,7 +3,6 @@ Base Collector Class
 ニュース収集の基底クラス - 強化版
 """
 
-import asyncio
 import aiohttp
 import time
 import hashlib
@@ -16,9 +15,12 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils.cache_manager import CacheManager
-from utils.rate_limiter import RateLimiter
+from utils.cache_manager import get_cache_manager
+from utils.rate_limiter import get_rate_limiter
+from utils.metrics import stage_event_counter, stage_latency_histogram
+from utils.tracing import current_span, trace_span
 from models.article import Article
+from .session_manager import get_api_client
 
 
 class CollectionError(Exception):
@@ -43,9 +45,9 @@ class BaseCollector(ABC):
         self.config = config
         self.logger = logger
         self.service_name = service_name
-        self.cache = CacheManager()
-        self.rate_limiter = RateLimiter()
-        self.session = None
+        # キャッシュとレート制限は全コレクターで共有（サービス別の制限は共通の台帳で管理）
+        self.cache = get_cache_manager()
+        self.rate_limiter = get_rate_limiter()
         
         # API設定
         self.api_key = config.get_api_key(service_name) if hasattr(config, 'get_api_key') else None
@@ -71,6 +73,9 @@ class BaseCollector(ABC):
             'errors': [],
             'rate_limit_hits': 0
         }
+        # プロセス全体のメトリクスレジストリへの記録先（段階 collect / サービス名）
+        self._stage_events = stage_event_counter()
+        self._request_latency = stage_latency_histogram().labels('collect', service_name)
         
         # バリデーション設定
         self.validation_rules = {
@@ -85,28 +90,11 @@ class BaseCollector(ABC):
     
     async def __aenter__(self):
         """非同期コンテキストマネージャー入口"""
-        self.session = aiohttp.ClientSession(timeout=self.timeout)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """非同期コンテキストマネージャー出口"""
-        if self.session and not self.session.closed:
-            await self.session.close()
-    
-    async def _ensure_session(self):
-        """セッションの存在と有効性を確保"""
-        try:
-            if not self.session or self.session.closed:
-                # 既存のセッションをクローズ（念のため）
-                if self.session and not self.session.closed:
-                    await self.session.close()
-                
-                # 新しいセッションを作成
-                self.session = aiohttp.ClientSession(timeout=self.timeout)
-                self.logger.info(f"Created new session for {self.service_name}")
-        except Exception as e:
-            self.logger.error(f"Failed to ensure session for {self.service_name}: {e}")
-            raise CollectionError(f"Session creation failed: {e}")
+        """非同期コンテキストマネージャー出口（セッションは共有プールが持つため閉じない）"""
+        pass
     
     @abstractmethod
     async def collect(self, **kwargs) -> List[Article]:
@@ -116,6 +104,15 @@ class BaseCollector(ABC):
     async def fetch_with_cache(self, url: str, params: Dict[str, Any], 
                               cache_ttl: int = 3600) -> Optional[Dict[str, Any]]:
         """キャッシュ付きHTTPリクエスト（レート制限・リトライ機能付き）"""
+        with trace_span(f"{self.service_name}.fetch", category='collect',
+                        service=self.service_name, url=url) as span:
+            data = await self._fetch_with_cache(url, params, cache_ttl)
+            span.set('ok', data is not None)
+            return data
+    
+    async def _fetch_with_cache(self, url: str, params: Dict[str, Any],
+                                cache_ttl: int) -> Optional[Dict[str, Any]]:
+        """キャッシュ確認・レート制限待ち・リトライを含むリクエスト本体"""
         
         # キャッシュキー生成
         cache_key = f"{url}:{str(sorted(params.items()))}"
@@ -124,132 +121,52 @@ class BaseCollector(ABC):
         cached_response = self.cache.get_api_cache(url, params)
         if cached_response:
             self.logger.debug(f"Cache hit for {self.service_name}: {url}")
+            current_span().set('cache_hit', True)
             return cached_response
         
         # レート制限チェック
-        await self.rate_limiter.wait_if_needed(self.service_name)
+        with trace_span('rate_limit.wait', category='collect', service=self.service_name):
+            await self.rate_limiter.wait_if_needed(self.service_name)
         
-        # リトライロジック付きHTTPリクエスト
-        for attempt in range(self.max_retries):
-            try:
-                # セッション状態チェック
-                if not self.session or self.session.closed:
-                    self.logger.warning(f"Session is closed or None for {self.service_name}, creating new session")
-                    # 新しいセッションを作成
-                    await self._ensure_session()
-                
-                start_time = time.time()
-                
-                async with self.session.get(url, params=params) as response:
-                    response_time = (time.time() - start_time) * 1000
-                    
-                    # レート制限記録
-                    self.rate_limiter.record_request(self.service_name)
-                    
-                    # API使用量ログ
-                    if hasattr(self.config, 'log_api_usage'):
-                        self.config.log_api_usage(
-                            self.service_name, 'GET', response.status, response_time
-                        )
-                    
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        # キャッシュに保存
-                        self.cache.set_api_cache(url, params, data, cache_ttl)
-                        
-                        self.logger.debug(
-                            f"HTTP request successful for {self.service_name}: "
-                            f"{response.status} in {response_time:.1f}ms"
-                        )
-                        
-                        return data
-                    
-                    elif response.status == 429:  # Too Many Requests
-                        retry_after = response.headers.get('Retry-After', '60')
-                        wait_time = min(int(retry_after), self.max_retry_delay)
-                        
-                        self.logger.warning(
-                            f"Rate limit exceeded for {self.service_name}. "
-                            f"Waiting {wait_time}s (attempt {attempt + 1}/{self.max_retries})"
-                        )
-                        
-                        if attempt < self.max_retries - 1:
-                            await asyncio.sleep(wait_time)
-                            continue
-                    
-                    elif response.status in [401, 403]:  # Unauthorized/Forbidden
-                        self.logger.error(
-                            f"Authentication error for {self.service_name}: {response.status}"
-                        )
-                        return None
-                    
-                    elif response.status >= 500:  # Server Error
-                        wait_time = min(self.base_retry_delay * (2 ** attempt), self.max_retry_delay)
-                        
-                        self.logger.warning(
-                            f"Server error for {self.service_name}: {response.status}. "
-                            f"Retrying in {wait_time}s (attempt {attempt + 1}/{self.max_retries})"
-                        )
-                        
-                        if attempt < self.max_retries - 1:
-                            await asyncio.sleep(wait_time)
-                            continue
-                    
-                    else:
-                        self.logger.error(
-                            f"HTTP error for {self.service_name}: {response.status}"
-                        )
-                        return None
-            
-            except asyncio.TimeoutError:
-                wait_time = min(self.base_retry_delay * (2 ** attempt), self.max_retry_delay)
-                
-                self.logger.warning(
-                    f"Timeout for {self.service_name}. "
-                    f"Retrying in {wait_time}s (attempt {attempt + 1}/{self.max_retries})"
-                )
-                
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(wait_time)
-                    continue
-            
-            except (aiohttp.ClientConnectionError, aiohttp.ClientError) as e:
-                wait_time = min(self.base_retry_delay * (2 ** attempt), self.max_retry_delay)
-                
-                self.logger.warning(
-                    f"Connection error for {self.service_name}: {e}. "
-                    f"Retrying in {wait_time}s (attempt {attempt + 1}/{self.max_retries})"
-                )
-                
-                # セッションエラーの場合はセッションを再作成
-                try:
-                    if self.session and not self.session.closed:
-                        await self.session.close()
-                    await self._ensure_session()
-                except Exception as session_error:
-                    self.logger.error(f"Failed to recreate session: {session_error}")
-                
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(wait_time)
-                    continue
-                    
-            except Exception as e:
-                wait_time = min(self.base_retry_delay * (2 ** attempt), self.max_retry_delay)
-                
-                self.logger.error(
-                    f"Request error for {self.service_name}: {e}. "
-                    f"Retrying in {wait_time}s (attempt {attempt + 1}/{self.max_retries})"
-                )
-                
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(wait_time)
-                    continue
+        # 共有クライアントで送信（リトライ・429/5xx の待機はクライアント側）
+        api_client = await get_api_client()
+        data = await api_client.request(
+            self.service_name, 'GET', url, params=params, timeout=self.timeout,
+            max_retries=self.max_retries, on_response=self._record_response
+        )
+        
+        if data is None:
+            self.logger.error(
+                f"All {self.max_retries} attempts failed for {self.service_name}: {url}"
+            )
+            return None
+        
+        # キャッシュに保存
+        self.cache.set_api_cache(url, params, data, cache_ttl)
+        self.logger.debug(f"HTTP request successful for {self.service_name}: {url}")
+        return data
+    
+    def _record_response(self, status: int, response_time: float, attempt: int):
+        """応答ごとのレート制限記録・API使用量ログ"""
+        current_span().set('status', status).set('attempts', attempt + 1)
+        
+        # レート制限記録
+        self.rate_limiter.record_request(self.service_name)
         
-        self.logger.error(
-            f"All {self.max_retries} attempts failed for {self.service_name}: {url}"
+        # API使用量ログ
+        if hasattr(self.config, 'log_api_usage'):
+            self.config.log_api_usage(self.service_name, 'GET', status, response_time)
+    
+    async def fetch_text(self, url: str, headers: Optional[Dict[str, str]] = None,
+                         timeout: Optional[aiohttp.ClientTimeout] = None,
+                         max_retries: Optional[int] = None) -> Optional[str]:
+        """本文を文字列で取得（RSS・HTML用、失敗時は None）"""
+        api_client = await get_api_client()
+        return await api_client.request(
+            self.service_name, 'GET', url, response_type='text', headers=headers,
+            timeout=timeout or self.timeout,
+            max_retries=self.max_retries if max_retries is None else max_retries
         )
-        return None
     
     def parse_date(self, date_str: str) -> str:
         """日付文字列のパース"""
@@ -379,6 +296,9 @@ class BaseCollector(ABC):
     def update_collection_stats(self, operation: str, **kwargs):
         """収集統計の更新"""
         try:
+            self._stage_events.labels('collect', self.service_name, operation).inc(
+                kwargs.get('count', 1) if operation.startswith('articles_') else 1)
+            
             if operation == 'request_made':
                 self.collection_stats['requests_made'] += 1
                 
@@ -386,6 +306,7 @@ class BaseCollector(ABC):
                 self.collection_stats['successful_requests'] += 1
                 response_time = kwargs.get('response_time', 0)
                 self.collection_stats['total_processing_time'] += response_time
+                self._request_latency.observe(response_time)
                 
                 # 平均レスポンス時間の更新
                 total_requests = self.collection_stats['successful_requests']
@@ -77,9 +77,6 @@ class BBCCollector(BaseCollector):
             self.logger.info(f"Starting BBC news collection: category={category}, count={count}")
             start_time = datetime.now()
             
-            # セッション状態確認
-            await self._ensure_session()
-            
             # 対象フィードを決定
             target_feeds = self._get_target_feeds(category)
             
@@ -154,19 +151,14 @@ class BBCCollector(BaseCollector):
             
             if not cached_data:
                 # RSS フィードを取得
-                try:
-                    async with self.session.get(feed_url, headers=self.headers, timeout=aiohttp.ClientTimeout(total=15)) as response:
-                        if response.status == 200:
-                            rss_content = await response.text()
-                            # キャッシュに保存（10分）
-                            self.cache.set(cache_key, rss_content, 600)
-                            cached_data = rss_content
-                        else:
-                            self.logger.error(f"RSS fetch failed for {feed_name}: {response.status}")
-                            return articles
-                except asyncio.TimeoutError:
-                    self.logger.error(f"Timeout fetching RSS feed: {feed_name}")
+                rss_content = await self.fetch_text(feed_url, headers=self.headers,
+                                                    timeout=aiohttp.ClientTimeout(total=15))
+                if rss_content is None:
+                    self.logger.error(f"RSS fetch failed for {feed_name}")
                     return articles
+                # キャッシュに保存（10分）
+                self.cache.set(cache_key, rss_content, 600)
+                cached_data = rss_content
             
             # RSS パース
             try:
@@ -8,7 +8,6 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import time
-import json
 import logging
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
@@ -17,8 +16,9 @@ from collections import defaultdict, Counter
 import statistics
 
 from models.article import Article, ArticleCategory, ArticleLanguage
-from utils.cache_manager import get_cache_manager
 from utils.config import get_config
+from utils.metrics import get_metrics_registry, stage_latency_histogram
+from utils.timeseries_store import TimeSeriesStore
 
 
 @dataclass
@@ -37,6 +37,12 @@ class CollectionMetrics:
     errors: List[str]
 
 
+# 時系列ストアに数値列として保存する CollectionMetrics の項目（残りはペイロードの JSON）
+TIMESERIES_FIELDS = ('total_articles', 'processing_time', 'success_rate', 'duplicate_rate',
+                     'average_importance', 'urgent_articles')
+_INTEGER_FIELDS = ('total_articles', 'urgent_articles')
+
+
 @dataclass
 class PerformanceMetrics:
     """パフォーマンスメトリクス"""
@@ -67,13 +73,31 @@ class CollectionAnalytics:
     
     def __init__(self):
         self.config = get_config()
-        self.cache = get_cache_manager()
         self.logger = logging.getLogger(__name__)
         
+        # 収集セッションの集計はメトリクスレジストリにも記録
+        registry = get_metrics_registry()
+        self._session_latency = stage_latency_histogram().labels('collection_session', 'all')
+        self._session_articles = registry.counter(
+            'news_collected_articles_total', 'Articles recorded by collection sessions', ('source',))
+        self._session_rates = registry.gauge(
+            'news_collection_session_rate', 'Latest collection session rates (percent)', ('rate',))
+        
         # メトリクス保存設定
-        self.metrics_retention_days = 30
+        self.metrics_retention_days = 90
         self.detailed_metrics_retention_hours = 72
         
+        # セッションごとのメトリクス（分・時・日単位の集計付き）
+        self.timeseries = TimeSeriesStore(
+            self.config.get_storage_path('analytics') / 'collection_metrics.db',
+            'collection', TIMESERIES_FIELDS,
+            retention_days={
+                'raw': self.metrics_retention_days,
+                'hour': self.detailed_metrics_retention_hours / 24,
+                'day': self.metrics_retention_days,
+            }
+        )
+        
         # 分析閾値
         self.quality_thresholds = {
             'min_sources': 3,
@@ -117,6 +141,7 @@ class CollectionAnalytics:
             
             # キャッシュに保存
             self._store_metrics(metrics)
+            self._record_registry_metrics(metrics)
             
             # アラート条件チェック
             self._check_alert_conditions(metrics)
@@ -139,6 +164,14 @@ class CollectionAnalytics:
                 errors=[str(e)]
             )
     
+    def _record_registry_metrics(self, metrics: CollectionMetrics):
+        """セッション結果をメトリクスレジストリに記録"""
+        self._session_latency.observe(metrics.processing_time)
+        for source, count in metrics.articles_by_source.items():
+            self._session_articles.labels(source).inc(count)
+        self._session_rates.labels('success').set(metrics.success_rate)
+        self._session_rates.labels('duplicate').set(metrics.duplicate_rate)
+    
     def analyze_collector_performance(self, collector_stats: Dict[str, Any]) -> List[PerformanceMetrics]:
         """収集器パフォーマンス分析"""
         performance_metrics = []
@@ -498,62 +531,74 @@ class CollectionAnalytics:
         return (covered_buckets / time_buckets) * 100
     
     def _store_metrics(self, metrics: CollectionMetrics):
-        """メトリクスをキャッシュに保存"""
+        """メトリクスを時系列ストアに追記"""
         try:
-            # 日別サマリー用のキー
-            date_key = datetime.fromisoformat(metrics.timestamp).strftime('%Y-%m-%d')
-            daily_key = f"analytics:daily:{date_key}"
-            
-            # 時間別詳細データ用のキー
-            hour_key = datetime.fromisoformat(metrics.timestamp).strftime('%Y-%m-%d:%H')
-            hourly_key = f"analytics:hourly:{hour_key}"
-            
-            # メトリクスをJSON化
-            metrics_data = asdict(metrics)
-            
-            # 保存
-            self.cache.set(
-                daily_key, 
-                json.dumps(metrics_data), 
-                expire=86400 * self.metrics_retention_days,
-                category='analytics'
-            )
-            
-            self.cache.set(
-                hourly_key, 
-                json.dumps(metrics_data), 
-                expire=3600 * self.detailed_metrics_retention_hours,
-                category='analytics'
+            self.timeseries.append(
+                datetime.fromisoformat(metrics.timestamp),
+                {field: getattr(metrics, field) for field in TIMESERIES_FIELDS},
+                payload={
+                    'articles_by_source': metrics.articles_by_source,
+                    'articles_by_category': metrics.articles_by_category,
+                    'articles_by_language': metrics.articles_by_language,
+                    'errors': metrics.errors,
+                }
             )
             
         except Exception as e:
             self.logger.error(f"Failed to store metrics: {e}")
     
     def _get_historical_metrics(self, start_time: datetime, end_time: datetime) -> List[CollectionMetrics]:
-        """期間内の履歴メトリクスを取得"""
+        """期間内の履歴メトリクスを取得（日ごとにその日の最新セッション）"""
         metrics = []
         
         try:
-            current_time = start_time
-            while current_time <= end_time:
-                date_key = current_time.strftime('%Y-%m-%d')
-                daily_key = f"analytics:daily:{date_key}"
-                
-                cached_data = self.cache.get(daily_key, category='analytics')
-                if cached_data:
-                    try:
-                        metrics_data = json.loads(cached_data)
-                        metrics.append(CollectionMetrics(**metrics_data))
-                    except (json.JSONDecodeError, TypeError) as e:
-                        self.logger.warning(f"Failed to parse cached metrics for {date_key}: {e}")
-                
-                current_time += timedelta(days=1)
+            for bucket in self.timeseries.rollups('day', start_time, end_time):
+                metrics.append(self._metrics_from_values(
+                    bucket['last_ts'], {field: bucket[field]['last'] for field in TIMESERIES_FIELDS},
+                    bucket['payload']
+                ))
                 
         except Exception as e:
             self.logger.error(f"Failed to get historical metrics: {e}")
         
         return metrics
     
+    def get_metrics_series(self, resolution: str = 'hour',
+                           time_range: timedelta = None) -> List[Dict[str, Any]]:
+        """ダッシュボード用の集計系列（resolution: minute / hour / day）
+        
+        各要素はバケット先頭時刻・セッション数と、項目ごとの平均・最小・最大・最新値。
+        """
+        if time_range is None:
+            time_range = timedelta(days=1)
+        
+        end_time = datetime.now()
+        return [
+            {
+                'bucket': bucket['bucket'].isoformat(),
+                'sessions': bucket['count'],
+                **{field: bucket[field] for field in TIMESERIES_FIELDS},
+            }
+            for bucket in self.timeseries.rollups(resolution, end_time - time_range, end_time)
+        ]
+    
+    def _metrics_from_values(self, timestamp: datetime, values: Dict[str, Optional[float]],
+                             payload: Optional[Dict[str, Any]]) -> CollectionMetrics:
+        """時系列ストアの値とペイロードから CollectionMetrics を復元"""
+        payload = payload or {}
+        values = {field: (value if value is not None else 0) for field, value in values.items()}
+        for field in _INTEGER_FIELDS:
+            values[field] = int(values[field])
+        
+        return CollectionMetrics(
+            timestamp=timestamp.isoformat(),
+            articles_by_source=payload.get('articles_by_source', {}),
+            articles_by_category=payload.get('articles_by_category', {}),
+            articles_by_language=payload.get('articles_by_language', {}),
+            errors=payload.get('errors', []),
+            **values
+        )
+    
     def _analyze_trends(self, metrics: List[CollectionMetrics]) -> Dict[str, Any]:
         """トレンド分析"""
         if len(metrics) < 2:
@@ -919,13 +964,15 @@ class CollectionAnalytics:
     def get_real_time_metrics(self) -> Dict[str, Any]:
         """リアルタイムメトリクス取得"""
         try:
-            # 最新の時間別データを取得
-            current_hour = datetime.now().strftime('%Y-%m-%d:%H')
-            hourly_key = f"analytics:hourly:{current_hour}"
-            
-            cached_data = self.cache.get(hourly_key, category='analytics')
-            if cached_data:
-                metrics_data = json.loads(cached_data)
+            # 現在の時間帯の最新セッションを取得
+            current_hour = datetime.now().replace(minute=0, second=0, microsecond=0)
+            
+            sample = self.timeseries.latest(since=current_hour)
+            if sample:
+                metrics_data = asdict(self._metrics_from_values(
+                    sample['timestamp'], {field: sample[field] for field in TIMESERIES_FIELDS},
+                    sample['payload']
+                ))
                 return {
                     'current_metrics': metrics_data,
                     'timestamp': metrics_data.get('timestamp'),
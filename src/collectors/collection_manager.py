@@ -34,6 +34,7 @@ class CollectionTarget:
     priority: int
     enabled: bool = True
     filters: Dict[str, Any] = None
+    deadline_seconds: Optional[float] = None  # 収集の期限（None は collection.target_timeout_seconds）
     
     def __post_init__(self):
         if self.filters is None:
@@ -89,7 +90,9 @@ class CollectionManager:
         
         # 並行処理設定
         self.max_concurrent_collectors = self.config.get('collection', 'max_concurrent', default=3)
+        self.max_concurrent_per_source = self.config.get('collection', 'max_concurrent_per_source', default=1)
         self.collection_timeout = self.config.get('collection', 'timeout_seconds', default=300)
+        self.target_timeout = self.config.get('collection', 'target_timeout_seconds', default=60)
         
         # 品質管理設定
         self.quality_thresholds = {
@@ -171,7 +174,8 @@ class CollectionManager:
                     count=target_config.get('count', 10),
                     priority=target_config.get('priority', 5),
                     enabled=target_config.get('enabled', True),
-                    filters=target_config.get('filters', {})
+                    filters=target_config.get('filters', {}),
+                    deadline_seconds=target_config.get('deadline_seconds')
                 )
                 targets.append(target)
                 
@@ -271,67 +275,93 @@ class CollectionManager:
             }
     
     async def _execute_parallel_collection(self, max_articles_per_category: int = None) -> List[CollectionResult]:
-        """並行収集の実行"""
-        collection_tasks = []
-        
-        # 有効な収集対象に対してタスク作成
+        """並行収集の実行
+        
+        収集対象を優先度・期限の短い順に並べ、空きができた時点で次の対象を開始する
+        （全体で max_concurrent_collectors 件、同一ソースで max_concurrent_per_source 件まで）。
+        期限を過ぎた対象・全体の制限時間内に開始できなかった対象は失敗として記録し、
+        他の対象の収集結果はそのまま返す。
+        """
+        pending = []
         for target in self.collection_targets:
             if not target.enabled or target.source not in self.collectors:
                 continue
-            
             count = min(target.count, max_articles_per_category) if max_articles_per_category else target.count
-            
-            task = asyncio.create_task(
-                self._collect_from_source(target.source, target.category, count, target.filters)
-            )
-            collection_tasks.append(task)
-        
-        # 並行実行制限
-        semaphore = asyncio.Semaphore(self.max_concurrent_collectors)
-        
-        async def limited_collect(task):
-            async with semaphore:
-                return await task
-        
-        # タイムアウト付きで並行実行
+            pending.append((target, count))
+        pending.sort(key=lambda item: (item[0].priority, self._target_deadline(item[0])))
+        
+        loop = asyncio.get_running_loop()
+        session_deadline = loop.time() + self.collection_timeout
+        results: List[Optional[CollectionResult]] = [None] * len(pending)
+        queue = list(enumerate(pending))
+        running_per_source: Dict[str, int] = {}
+        slot_freed = asyncio.Condition()
+        
+        async def next_target():
+            """同一ソースの上限に達していない最も優先度の高い対象を取り出す（なければ空きを待つ）"""
+            async with slot_freed:
+                while queue:
+                    for position, (_, (target, _)) in enumerate(queue):
+                        if running_per_source.get(target.source, 0) < self.max_concurrent_per_source:
+                            running_per_source[target.source] = running_per_source.get(target.source, 0) + 1
+                            return queue.pop(position)
+                    await slot_freed.wait()
+                return None
+        
+        async def run_slot():
+            while True:
+                item = await next_target()
+                if item is None:
+                    return
+                index, (target, count) = item
+                try:
+                    results[index] = await self._collect_with_deadline(target, count, session_deadline)
+                finally:
+                    async with slot_freed:
+                        running_per_source[target.source] -= 1
+                        slot_freed.notify_all()
+        
+        slots = min(self.max_concurrent_collectors, len(pending))
+        await asyncio.gather(*(run_slot() for _ in range(slots)))
+        return results
+    
+    def _target_deadline(self, target: CollectionTarget) -> float:
+        """収集対象ごとの期限（秒）"""
+        return target.deadline_seconds if target.deadline_seconds is not None else self.target_timeout
+    
+    async def _collect_with_deadline(self, target: CollectionTarget, count: int,
+                                     session_deadline: float) -> CollectionResult:
+        """対象の期限と全体の制限時間のうち早い方までに収集（超過時は失敗結果）"""
+        remaining = session_deadline - asyncio.get_running_loop().time()
+        if remaining <= 0:
+            return self._failed_result(target, 0, "Not started: collection timeout reached")
+        
+        timeout = min(self._target_deadline(target), remaining)
+        start_time = time.time()
         try:
-            limited_tasks = [limited_collect(task) for task in collection_tasks]
-            results = await asyncio.wait_for(
-                asyncio.gather(*limited_tasks, return_exceptions=True),
-                timeout=self.collection_timeout
+            return await asyncio.wait_for(
+                self._collect_from_source(target.source, target.category, count, target.filters),
+                timeout=timeout
             )
-            
-            # 例外処理
-            processed_results = []
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    target = self.collection_targets[i]
-                    error_result = CollectionResult(
-                        source=target.source,
-                        category=target.category,
-                        articles_collected=0,
-                        articles_filtered=0,
-                        processing_time=0,
-                        success=False,
-                        error_message=str(result)
-                    )
-                    processed_results.append(error_result)
-                else:
-                    processed_results.append(result)
-            
-            return processed_results
-            
         except asyncio.TimeoutError:
-            self.logger.error(f"Collection timeout after {self.collection_timeout}s")
-            return [CollectionResult(
-                source="timeout",
-                category="all",
-                articles_collected=0,
-                articles_filtered=0,
-                processing_time=self.collection_timeout,
-                success=False,
-                error_message="Collection timeout"
-            )]
+            self.logger.error(f"Collection deadline exceeded for {target.source}.{target.category} "
+                              f"after {timeout:.1f}s")
+            return self._failed_result(target, time.time() - start_time,
+                                       f"Deadline exceeded after {timeout:.1f}s")
+        except Exception as e:
+            self.logger.error(f"Collection failed for {target.source}.{target.category}: {e}")
+            return self._failed_result(target, time.time() - start_time, str(e))
+    
+    def _failed_result(self, target: CollectionTarget, processing_time: float, error_message: str) -> CollectionResult:
+        return CollectionResult(
+            source=target.source,
+            category=target.category,
+            articles_collected=0,
+            articles_filtered=0,
+            processing_time=processing_time,
+            success=False,
+            error_message=error_message
+        )
     
     async def _collect_from_source(self, source: str, category: str, 
                                  count: int, filters: Dict[str, Any]) -> CollectionResult:
@@ -703,12 +733,5 @@ class CollectionManager:
             return 'stable'
     
     async def cleanup(self):
-        """リソースクリーンアップ"""
-        for collector in self.collectors.values():
-            try:
-                if hasattr(collector, 'session') and collector.session:
-                    await collector.session.close()
-            except Exception as e:
-                self.logger.warning(f"Error closing collector session: {e}")
-        
+        """リソースクリーンアップ（HTTPセッションは共有プールが持ち、close_session_pool() で閉じる）"""
         self.logger.info("Collection manager cleanup completed")
\ No newline at end of file
@@ -76,9 +76,6 @@ class ReutersCollector(BaseCollector):
             self.logger.info(f"Starting Reuters news collection: category={category}, count={count}")
             start_time = datetime.now()
             
-            # セッション状態確認
-            await self._ensure_session()
-            
             # 対象フィードを決定
             target_feeds = self._get_target_feeds(category)
             
@@ -148,15 +145,13 @@ class ReutersCollector(BaseCollector):
             
             if not cached_data:
                 # RSS フィードを取得
-                async with self.session.get(feed_url, headers=self.headers) as response:
-                    if response.status == 200:
-                        rss_content = await response.text()
-                        # キャッシュに保存（15分）
-                        self.cache.set(cache_key, rss_content, 900)
-                        cached_data = rss_content
-                    else:
-                        self.logger.error(f"RSS fetch failed for {feed_name}: {response.status}")
-                        return articles
+                rss_content = await self.fetch_text(feed_url, headers=self.headers)
+                if rss_content is None:
+                    self.logger.error(f"RSS fetch failed for {feed_name}")
+                    return articles
+                # キャッシュに保存（15分）
+                self.cache.set(cache_key, rss_content, 900)
+                cached_data = rss_content
             
             # RSS パース
             feed_data = feedparser.parse(cached_data)
@@ -263,17 +258,16 @@ class ReutersCollector(BaseCollector):
             # レート制限（過度なWebアクセスを防ぐ）
             await asyncio.sleep(0.5)  # 500ms待機
             
-            async with self.session.get(url, headers=self.headers) as response:
-                if response.status == 200:
-                    html_content = await response.text()
-                    
-                    # 簡易的なコンテンツ抽出（正規表現ベース）
-                    content = self._extract_content_from_html(html_content)
-                    
-                    if content and len(content) > 100:
-                        # キャッシュに保存（1時間）
-                        self.cache.set(cache_key, content, 3600)
-                        return content
+            # 本文はフォールバックがあるため再試行しない
+            html_content = await self.fetch_text(url, headers=self.headers, max_retries=1)
+            if html_content is not None:
+                # 簡易的なコンテンツ抽出（正規表現ベース）
+                content = self._extract_content_from_html(html_content)
+                
+                if content and len(content) > 100:
+                    # キャッシュに保存（1時間）
+                    self.cache.set(cache_key, content, 3600)
+                    return content
                     
         except Exception as e:
             self.logger.debug(f"Content extraction failed for {url}: {e}")
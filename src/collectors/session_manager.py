@@ -7,14 +7,39 @@ import asyncio
 import aiohttp
 import time
 import logging
-from typing import Dict, Optional, Any, List
+from collections import defaultdict
+from typing import Callable, Dict, Optional, Any, List
 from datetime import datetime, timedelta
 from contextlib import asynccontextmanager
 import json
 from pathlib import Path
 
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.metrics import get_metrics_registry
+
 logger = logging.getLogger(__name__)
 
+# ホスト別の接続・DNS キャッシュのイベント件数（event: request / connection_created /
+# connection_reused / connection_queued / dns_cache_hit / dns_cache_miss）
+CONNECTION_EVENTS_METRIC = 'news_http_connection_events_total'
+
+ResponseCallback = Callable[[int, float, int], None]
+
+
+def _new_host_stats() -> Dict[str, float]:
+    return {
+        'requests': 0,
+        'connections_created': 0,
+        'connections_reused': 0,
+        'connections_queued': 0,
+        'dns_cache_hits': 0,
+        'dns_cache_misses': 0,
+        'dns_resolve_time': 0.0,
+    }
+
 
 class SessionPool:
     """セッションプール管理クラス"""
@@ -25,6 +50,13 @@ class SessionPool:
         self.sessions: Dict[str, List[aiohttp.ClientSession]] = {}
         self.session_stats: Dict[str, Dict] = {}
         self.lock = asyncio.Lock()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._cleanup_task: Optional[asyncio.Task] = None
+        
+        # ホスト別の Keep-Alive 接続再利用・DNS キャッシュ統計
+        self.host_stats: Dict[str, Dict[str, float]] = defaultdict(_new_host_stats)
+        self._connection_events = get_metrics_registry().counter(
+            CONNECTION_EVENTS_METRIC, 'HTTP connection reuse and DNS cache events by host', ('host', 'event'))
         
         # コネクタ設定
         self.connector_config = {
@@ -53,7 +85,7 @@ class SessionPool:
             'trace_configs': [],  # トレース設定
         }
         
-        # パフォーマンス統計
+        # パフォーマンス統計（connections_* はセッションの作成・再利用回数）
         self.performance_stats = {
             'total_requests': 0,
             'successful_requests': 0,
@@ -69,19 +101,36 @@ class SessionPool:
         self.session_idle_timeout = 600  # 10分アイドルでクローズ
         
     async def initialize(self):
-        """セッションプール初期化"""
+        """セッションプール初期化（セッションは実行中のイベントループに結び付く）"""
+        self.loop = asyncio.get_running_loop()
+        
         # トレース設定の初期化
         trace_config = aiohttp.TraceConfig()
         trace_config.on_request_start.append(self._on_request_start)
         trace_config.on_request_end.append(self._on_request_end)
         trace_config.on_request_exception.append(self._on_request_exception)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        trace_config.on_connection_queued_start.append(self._on_connection_queued_start)
+        trace_config.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(self._on_dns_cache_miss)
+        trace_config.on_dns_resolvehost_start.append(self._on_dns_resolvehost_start)
+        trace_config.on_dns_resolvehost_end.append(self._on_dns_resolvehost_end)
         self.session_config['trace_configs'] = [trace_config]
         
         # クリーンアップタスク開始
-        asyncio.create_task(self._cleanup_sessions())
+        self._cleanup_task = asyncio.create_task(self._cleanup_sessions())
         
         logger.info("Session pool initialized")
     
+    async def close(self):
+        """クリーンアップタスクを止めて全セッションをクローズ"""
+        if self._cleanup_task is not None:
+            self._cleanup_task.cancel()
+            await asyncio.gather(self._cleanup_task, return_exceptions=True)
+            self._cleanup_task = None
+        await self.close_all_sessions()
+    
     @asynccontextmanager
     async def get_session(self, service_name: str, base_url: str = None, timeout: float = 30.0) -> aiohttp.ClientSession:
         """セッション取得（コンテキストマネージャー・タイムアウト付き）"""
@@ -117,6 +166,9 @@ class SessionPool:
                         'total_response_time': 0.0,
                     }
                 
+                # 外部で閉じられたセッションは上限に数えない
+                self.sessions[service_name] = [s for s in self.sessions[service_name] if not s.closed]
+
                 # 既存セッションの再利用
                 for session in self.sessions[service_name]:
                     if not session.closed:
@@ -238,45 +290,47 @@ class SessionPool:
                 
                 # タイムアウト付きでロック取得
                 try:
-                    async with asyncio.wait_for(self.lock.acquire(), timeout=5.0):
-                        for service_name, sessions in list(self.sessions.items()):
-                            try:
-                                # アイドルセッションのクローズ
-                                if service_name in self.session_stats:
-                                    last_used = datetime.fromisoformat(self.session_stats[service_name]['last_used'])
-                                    idle_time = (datetime.now() - last_used).total_seconds()
-                                    
-                                    if idle_time > self.session_idle_timeout:
-                                        for session in sessions[:]:  # コピーを作成してイテレート
-                                            if not session.closed:
-                                                try:
-                                                    await asyncio.wait_for(session.close(), timeout=2.0)
-                                                    self.performance_stats['connections_closed'] += 1
-                                                except asyncio.TimeoutError:
-                                                    logger.warning(f"Session close timeout for {service_name}")
-                                                except Exception as close_error:
-                                                    logger.warning(f"Session close error for {service_name}: {close_error}")
-                                        self.sessions[service_name] = []
-                                        logger.info(f"Cleaned up idle sessions for {service_name}")
-                                
-                                # 閉じたセッションの削除
-                                active_sessions = []
-                                for session in sessions:
-                                    if not session.closed:
-                                        active_sessions.append(session)
-                                
-                                if len(active_sessions) < len(sessions):
-                                    removed = len(sessions) - len(active_sessions)
-                                    self.sessions[service_name] = active_sessions
-                                    logger.debug(f"Removed {removed} closed sessions for {service_name}")
-                                    
-                            except Exception as service_error:
-                                logger.error(f"Cleanup error for service {service_name}: {service_error}")
-                        
-                        self.lock.release()
-                        
+                    await asyncio.wait_for(self.lock.acquire(), timeout=5.0)
                 except asyncio.TimeoutError:
                     logger.warning("Session cleanup skipped due to lock timeout")
+                    continue
+                
+                try:
+                    for service_name, sessions in list(self.sessions.items()):
+                        try:
+                            # アイドルセッションのクローズ
+                            if service_name in self.session_stats:
+                                last_used = datetime.fromisoformat(self.session_stats[service_name]['last_used'])
+                                idle_time = (datetime.now() - last_used).total_seconds()
+                                
+                                if idle_time > self.session_idle_timeout:
+                                    for session in sessions[:]:  # コピーを作成してイテレート
+                                        if not session.closed:
+                                            try:
+                                                await asyncio.wait_for(session.close(), timeout=2.0)
+                                                self.performance_stats['connections_closed'] += 1
+                                            except asyncio.TimeoutError:
+                                                logger.warning(f"Session close timeout for {service_name}")
+                                            except Exception as close_error:
+                                                logger.warning(f"Session close error for {service_name}: {close_error}")
+                                    self.sessions[service_name] = []
+                                    logger.info(f"Cleaned up idle sessions for {service_name}")
+                            
+                            # 閉じたセッションの削除
+                            active_sessions = []
+                            for session in sessions:
+                                if not session.closed:
+                                    active_sessions.append(session)
+                            
+                            if len(active_sessions) < len(sessions):
+                                removed = len(sessions) - len(active_sessions)
+                                self.sessions[service_name] = active_sessions
+                                logger.debug(f"Removed {removed} closed sessions for {service_name}")
+                                
+                        except Exception as service_error:
+                            logger.error(f"Cleanup error for service {service_name}: {service_error}")
+                finally:
+                    self.lock.release()
                 
             except Exception as e:
                 logger.error(f"Session cleanup error: {e}")
@@ -284,10 +338,22 @@ class SessionPool:
                 logger.info("Session cleanup task cancelled")
                 break
     
+    @staticmethod
+    def _service_name(trace_config_ctx) -> str:
+        """リクエスト時に trace_request_ctx で渡されたサービス名"""
+        request_ctx = trace_config_ctx.trace_request_ctx
+        return request_ctx.get('service_name', 'unknown') if isinstance(request_ctx, dict) else 'unknown'
+    
+    def _record_host_event(self, host: str, event: str, stat: str):
+        self.host_stats[host][stat] += 1
+        self._connection_events.labels(host, event).inc()
+    
     async def _on_request_start(self, session, trace_config_ctx, params):
         """リクエスト開始トレース"""
         trace_config_ctx.start = time.time()
+        trace_config_ctx.host = params.url.host or 'unknown'
         self.performance_stats['total_requests'] += 1
+        self._record_host_event(trace_config_ctx.host, 'request', 'requests')
     
     async def _on_request_end(self, session, trace_config_ctx, params):
         """リクエスト終了トレース"""
@@ -296,7 +362,7 @@ class SessionPool:
         self.performance_stats['total_response_time'] += elapsed
         
         # サービス別統計更新
-        service_name = getattr(trace_config_ctx, 'service_name', 'unknown')
+        service_name = self._service_name(trace_config_ctx)
         if service_name in self.session_stats:
             self.session_stats[service_name]['request_count'] += 1
             self.session_stats[service_name]['total_response_time'] += elapsed
@@ -305,10 +371,51 @@ class SessionPool:
         """リクエスト例外トレース"""
         self.performance_stats['failed_requests'] += 1
         
-        service_name = getattr(trace_config_ctx, 'service_name', 'unknown')
+        service_name = self._service_name(trace_config_ctx)
         if service_name in self.session_stats:
             self.session_stats[service_name]['error_count'] += 1
     
+    async def _on_connection_create_end(self, session, trace_config_ctx, params):
+        """新しい TCP 接続を作成した"""
+        self._record_host_event(getattr(trace_config_ctx, 'host', 'unknown'),
+                                'connection_created', 'connections_created')
+    
+    async def _on_connection_reuseconn(self, session, trace_config_ctx, params):
+        """Keep-Alive 接続を再利用した"""
+        self._record_host_event(getattr(trace_config_ctx, 'host', 'unknown'),
+                                'connection_reused', 'connections_reused')
+    
+    async def _on_connection_queued_start(self, session, trace_config_ctx, params):
+        """接続数の上限で空きを待った"""
+        self._record_host_event(getattr(trace_config_ctx, 'host', 'unknown'),
+                                'connection_queued', 'connections_queued')
+    
+    async def _on_dns_cache_hit(self, session, trace_config_ctx, params):
+        self._record_host_event(params.host, 'dns_cache_hit', 'dns_cache_hits')
+    
+    async def _on_dns_cache_miss(self, session, trace_config_ctx, params):
+        self._record_host_event(params.host, 'dns_cache_miss', 'dns_cache_misses')
+    
+    async def _on_dns_resolvehost_start(self, session, trace_config_ctx, params):
+        trace_config_ctx.dns_start = time.time()
+    
+    async def _on_dns_resolvehost_end(self, session, trace_config_ctx, params):
+        self.host_stats[params.host]['dns_resolve_time'] += time.time() - trace_config_ctx.dns_start
+    
+    def get_host_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """ホスト別の接続再利用率・DNS キャッシュヒット率"""
+        hosts = {}
+        for host, host_stats in self.host_stats.items():
+            stats = dict(host_stats)
+            connections = stats['connections_created'] + stats['connections_reused']
+            lookups = stats['dns_cache_hits'] + stats['dns_cache_misses']
+            stats['connection_reuse_rate'] = stats['connections_reused'] / connections * 100 if connections else 0
+            stats['dns_cache_hit_rate'] = stats['dns_cache_hits'] / lookups * 100 if lookups else 0
+            stats['average_dns_resolve_ms'] = (stats['dns_resolve_time'] / stats['dns_cache_misses'] * 1000
+                                               if stats['dns_cache_misses'] else 0)
+            hosts[host] = stats
+        return hosts
+    
     def get_statistics(self) -> Dict[str, Any]:
         """統計情報取得"""
         stats = self.performance_stats.copy()
@@ -338,6 +445,8 @@ class SessionPool:
         else:
             stats['reuse_rate'] = 0
         
+        stats['hosts'] = self.get_host_statistics()
+        
         return stats
     
     def save_statistics(self, filepath: Path):
@@ -371,24 +480,30 @@ class OptimizedAPIClient:
         # レート制限
         self.rate_limits: Dict[str, Dict] = {}
         
-    async def request(self, service_name: str, method: str, url: str, 
-                      **kwargs) -> Optional[Dict]:
-        """最適化されたHTTPリクエスト"""
+    async def request(self, service_name: str, method: str, url: str, *,
+                      response_type: str = 'json', max_retries: Optional[int] = None,
+                      on_response: Optional[ResponseCallback] = None, **kwargs) -> Optional[Any]:
+        """最適化されたHTTPリクエスト
+        
+        サービスごとのプール済みセッション（Keep-Alive 接続と DNS キャッシュを共有）で送信し、
+        429・5xx・タイムアウト・接続エラーは再試行する。成功時は response_type に応じて
+        JSON（'json'）か本文の文字列（'text'）を返し、それ以外は None。
+        on_response(status, elapsed_ms, attempt) は応答を受け取るたびに呼ばれる。
+        """
         
         # レート制限チェック
         if not await self._check_rate_limit(service_name):
             self.logger.warning(f"Rate limit exceeded for {service_name}")
             return None
         
+        retries = self.max_retries if max_retries is None else max_retries
+        # トレースでサービス別統計を取るためのコンテキスト
+        kwargs.setdefault('trace_request_ctx', {'service_name': service_name})
+        
         # リトライロジック
-        for attempt in range(self.max_retries):
+        for attempt in range(retries):
             try:
                 async with self.session_pool.get_session(service_name) as session:
-                    # トレースコンテキスト設定
-                    if hasattr(session, '_trace_configs'):
-                        for trace_config in session._trace_configs:
-                            trace_config.ctx.service_name = service_name
-                    
                     # リクエスト実行
                     start_time = time.time()
                     
@@ -397,23 +512,30 @@ class OptimizedAPIClient:
                         
                         # レート制限ヘッダー更新
                         self._update_rate_limits(service_name, response.headers)
+                        if on_response is not None:
+                            on_response(response.status, elapsed * 1000, attempt)
                         
                         if response.status == 200:
-                            data = await response.json()
+                            if response_type == 'text':
+                                data = await response.text()
+                            else:
+                                data = await response.json()
                             self.logger.debug(
                                 f"{service_name} request successful: {response.status} in {elapsed:.2f}s"
                             )
                             return data
                         
                         elif response.status == 429:  # Too Many Requests
-                            retry_after = response.headers.get('Retry-After', '60')
-                            wait_time = min(int(retry_after), self.max_retry_delay)
+                            try:
+                                wait_time = min(int(response.headers.get('Retry-After', '60')), self.max_retry_delay)
+                            except ValueError:
+                                wait_time = self.max_retry_delay
                             
                             self.logger.warning(
                                 f"Rate limit for {service_name}: waiting {wait_time}s"
                             )
                             
-                            if attempt < self.max_retries - 1:
+                            if attempt < retries - 1:
                                 await asyncio.sleep(wait_time)
                                 continue
                         
@@ -428,7 +550,7 @@ class OptimizedAPIClient:
                                 f"retrying in {wait_time}s"
                             )
                             
-                            if attempt < self.max_retries - 1:
+                            if attempt < retries - 1:
                                 await asyncio.sleep(wait_time)
                                 continue
                         
@@ -448,14 +570,14 @@ class OptimizedAPIClient:
                     f"Timeout for {service_name}, retrying in {wait_time}s"
                 )
                 
-                if attempt < self.max_retries - 1:
+                if attempt < retries - 1:
                     await asyncio.sleep(wait_time)
                     continue
             
             except Exception as e:
                 self.logger.error(f"Request error for {service_name}: {e}")
                 
-                if attempt < self.max_retries - 1:
+                if attempt < retries - 1:
                     await asyncio.sleep(self.base_retry_delay)
                     continue
         
@@ -504,30 +626,30 @@ class OptimizedAPIClient:
                 except (ValueError, TypeError):
                     pass
     
-    async def batch_request(self, service_name: str, requests: List[Dict]) -> List[Optional[Dict]]:
-        """バッチリクエスト処理"""
-        tasks = []
-        
-        for req in requests:
-            task = self.request(
-                service_name,
-                req.get('method', 'GET'),
-                req['url'],
-                **req.get('kwargs', {})
-            )
-            tasks.append(task)
-        
-        # 並行実行（最大10並行）
-        results = []
-        for i in range(0, len(tasks), 10):
-            batch = tasks[i:i+10]
-            batch_results = await asyncio.gather(*batch, return_exceptions=True)
-            results.extend(batch_results)
+    async def batch_request(self, service_name: str, requests: List[Dict],
+                            concurrency: int = 10) -> List[Optional[Dict]]:
+        """バッチリクエスト処理（結果は requests の順）
+        
+        同時実行数 concurrency のスライディングウィンドウで送り、1件終わるごとに次を開始する
+        （一定件数ずつ区切って、区切りの中で最も遅いリクエストを待つことはしない）。
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def request_with_semaphore(req: Dict):
+            async with semaphore:
+                return await self.request(
+                    service_name,
+                    req.get('method', 'GET'),
+                    req['url'],
+                    **req.get('kwargs', {})
+                )
         
-        return results
+        return await asyncio.gather(
+            *(request_with_semaphore(req) for req in requests), return_exceptions=True
+        )
 
 
-# グローバルインスタンス
+# グローバルインスタンス（セッションはイベントループに結び付くため、ループごとに作り直す）
 _session_pool: Optional[SessionPool] = None
 _api_client: Optional[OptimizedAPIClient] = None
 
@@ -535,7 +657,7 @@ _api_client: Optional[OptimizedAPIClient] = None
 async def get_session_pool() -> SessionPool:
     """セッションプール取得"""
     global _session_pool
-    if _session_pool is None:
+    if _session_pool is None or _session_pool.loop is not asyncio.get_running_loop():
         _session_pool = SessionPool()
         await _session_pool.initialize()
     return _session_pool
@@ -544,7 +666,15 @@ async def get_session_pool() -> SessionPool:
 async def get_api_client() -> OptimizedAPIClient:
     """APIクライアント取得"""
     global _api_client
-    if _api_client is None:
-        session_pool = await get_session_pool()
+    session_pool = await get_session_pool()
+    if _api_client is None or _api_client.session_pool is not session_pool:
         _api_client = OptimizedAPIClient(session_pool)
-    return _api_client
\ No newline at end of file
+    return _api_client
+
+
+async def close_session_pool():
+    """実行中のイベントループのセッションプールをクローズ（実行の終了時に呼ぶ）"""
+    global _session_pool, _api_client
+    session_pool, _session_pool, _api_client = _session_pool, None, None
+    if session_pool is not None and session_pool.loop is asyncio.get_running_loop():
+        await session_pool.close()
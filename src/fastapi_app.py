@@ -23,7 +23,8 @@ from .infrastructure.redis_cache import RedisCache
 from .infrastructure.security import SecurityManager
 from .middleware.logging_middleware import LoggingMiddleware
 from .middleware.rate_limit import RateLimitMiddleware
-from .routers import news, delivery, admin, health
+from .routers import news, delivery, admin, health, search, metrics
+from .models.database_orm import AsyncDatabase as ArticleDatabase
 
 
 @asynccontextmanager
@@ -39,6 +40,9 @@ async def lifespan(app: FastAPI):
         await app.state.database.connect()
         logger.info("Database connection established")
         
+        # Article repository (full-text search)
+        await app.state.article_db.initialize()
+        
         # Initialize Redis cache
         await app.state.redis_cache.connect()
         logger.info("Redis cache connection established")
@@ -76,6 +80,9 @@ async def lifespan(app: FastAPI):
             await app.state.database.disconnect()
             logger.info("Database connection closed")
         
+        if hasattr(app.state, 'article_db'):
+            await app.state.article_db.close()
+        
         # Close Redis connection
         if hasattr(app.state, 'redis_cache'):
             await app.state.redis_cache.disconnect()
@@ -104,6 +111,7 @@ def create_app() -> FastAPI:
     app.state.config = config
     app.state.logger = logger
     app.state.database = AsyncDatabase(config)
+    app.state.article_db = ArticleDatabase(config)
     app.state.redis_cache = RedisCache(config)
     app.state.security_manager = SecurityManager(config)
     
@@ -128,6 +136,8 @@ def create_app() -> FastAPI:
     app.include_router(news.router, prefix="/api/v1/news", tags=["news"])
     app.include_router(delivery.router, prefix="/api/v1/delivery", tags=["delivery"])
     app.include_router(admin.router, prefix="/api/v1/admin", tags=["admin"])
+    app.include_router(search.router, prefix="/api/v1/search", tags=["search"])
+    app.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
     
     # Global exception handler
     @app.exception_handler(HTTPException)
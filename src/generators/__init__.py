@@ -3,7 +3,17 @@ Report Generation Module
 レポート生成モジュール
 """
 
-from .html_generator import HTMLReportGenerator
-from .pdf_generator import PDFReportGenerator
+try:
+    from ..utils.lazy_exports import lazy_exports
+except ImportError:
+    from utils.lazy_exports import lazy_exports
 
-__all__ = ['HTMLReportGenerator', 'PDFReportGenerator']
\ No newline at end of file
+# サブモジュールは属性の初回参照時に読み込む（起動時間短縮）
+lazy_exports(globals(), {
+    'HTMLReportGenerator': '.html_generator',
+    'PDFReportGenerator': '.pdf_generator',
+    'ReportBuilder': '.report_builder',
+    'ReportArtifacts': '.report_builder',
+    'compute_content_hash': '.report_builder',
+    'ArticleColumns': '.article_columns',
+})
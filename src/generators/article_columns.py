@@ -0,0 +1,360 @@
+"""
+Columnar Article Statistics
+記事統計の列指向ビルダー - 一回の走査で全レポート統計を算出
+
+記事リストを一度だけ走査して重要度・センチメント・CVSS・時刻・カテゴリ等を
+NumPy配列に格納し、各レポートジェネレーターの統計はこの列から
+ベクトル演算で算出する。
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collections import Counter
+from itertools import chain
+from operator import attrgetter
+from datetime import datetime, date
+from typing import List, Dict, Any, Optional, Tuple, Hashable
+
+import numpy as np
+
+from models.article import Article
+
+# datetime64 の日数（1970-01-01起点）を date.toordinal() に変換するオフセット
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    """公開日時をdatetimeに変換（変換できない場合はNone）"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    return None
+
+
+def _category_label(category: Any) -> Optional[str]:
+    """カテゴリ表示名（Enumの場合は値）"""
+    if not category:
+        return None
+    return category.value if hasattr(category, 'value') else str(category)
+
+
+def _as_number(value: float):
+    """NumPyスカラーをPythonの数値へ（整数値はintに戻す）"""
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+def _source_label(article: Article) -> str:
+    """配信元名"""
+    source = getattr(article, 'source', None)
+    if isinstance(source, dict):
+        return source.get('name', 'Unknown')
+    if source:
+        return str(source)
+    return getattr(article, 'source_name', None) or 'Unknown'
+
+
+_MISSING = object()
+
+# 一回の走査で取り出すフィールドと既定値
+_FIELD_DEFAULTS = (
+    ('importance_score', 5),
+    ('sentiment_score', None),
+    ('cvss_score', None),
+    ('published_at', None),
+    ('category', None),
+    ('language', 'unknown'),
+    ('source_name', None),
+    ('is_urgent', False),
+    ('keywords', None),
+)
+_FIELD_GETTERS = tuple(attrgetter(name) for name, _ in _FIELD_DEFAULTS)
+
+
+def _factorize(values: List[Hashable]) -> Tuple[List[int], List[Hashable]]:
+    """値を出現順のコードに変換"""
+    uniques = list(dict.fromkeys(values))
+    index: Dict[Hashable, int] = {value: code for code, value in enumerate(uniques)}
+    return list(map(index.__getitem__, values)), uniques
+
+
+def _relabel(codes: List[int], raw_labels: List[Hashable], label_func) -> Tuple[np.ndarray, List[Hashable]]:
+    """生の値のコードを表示ラベル単位のコードへ付け替え（Noneラベルは-1）"""
+    remap = []
+    labels: List[Hashable] = []
+    label_index: Dict[Hashable, int] = {}
+    for raw in raw_labels:
+        label = label_func(raw)
+        if label is None:
+            remap.append(-1)
+        else:
+            remap.append(label_index.setdefault(label, len(labels)))
+            if len(labels) < len(label_index):
+                labels.append(label)
+    if not codes:
+        return np.empty(0, dtype=np.int32), labels
+    return np.array(remap, dtype=np.int32)[np.array(codes, dtype=np.int64)], labels
+
+
+class ArticleColumns:
+    """記事リストの列指向表現"""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.importance = np.empty(size, dtype=np.float64)
+        self.sentiment = np.empty(size, dtype=np.float64)
+        self.cvss = np.empty(size, dtype=np.float64)
+        self.published_ts = np.empty(size, dtype=np.float64)
+        self.hour = np.empty(size, dtype=np.int8)
+        self.day = np.empty(size, dtype=np.int32)
+        self.category = np.empty(size, dtype=np.int32)
+        self.detailed_category = np.empty(size, dtype=np.int32)
+        self.language = np.empty(size, dtype=np.int32)
+        self.source = np.empty(size, dtype=np.int32)
+        self.urgent = np.empty(size, dtype=np.bool_)
+
+        self.category_labels: List[str] = []
+        self.detailed_category_labels: List[Hashable] = []
+        self.language_labels: List[Hashable] = []
+        self.source_labels: List[str] = []
+
+        # キーワードはフラット配列 + 所属記事インデックス
+        self.keywords: List[str] = []
+        self.keyword_rows = np.empty(0, dtype=np.int32)
+
+    @classmethod
+    def from_articles(cls, articles: List[Article]) -> 'ArticleColumns':
+        """記事リストを一回走査して列を構築
+
+        各フィールドを attrgetter + map で列として直接取り出す
+        （行タプルを作らないためPythonレベルのループ・GC負荷が小さい）。
+        """
+        size = len(articles)
+        columns = cls(0)
+        columns.size = size
+
+        try:
+            fields = [list(map(getter, articles)) for getter in _FIELD_GETTERS]
+        except AttributeError:
+            # Article以外のオブジェクトが混在する場合は既定値付きで取得
+            fields = [[getattr(a, name, default) for a in articles]
+                      for name, default in _FIELD_DEFAULTS]
+
+        (importance, sentiment, cvss, published, categories,
+         languages, source_names, urgent, keywords) = fields
+
+        # 数値列（NoneはNaN、重要度のNoneは既定値5）
+        if None in importance:
+            importance = [5 if v is None else v for v in importance]
+        columns.importance = np.array(importance, dtype=np.float64)
+        columns.sentiment = np.array(sentiment, dtype=np.float64)
+        columns.cvss = np.array(cvss, dtype=np.float64)
+        columns.urgent = np.array(urgent, dtype=np.bool_)
+
+        # 時刻列（表示時刻＝壁時計基準）
+        stamps = [v if type(v) is datetime else _parse_datetime(v) for v in published]
+        ordinals = np.array([d.toordinal() if d is not None else -1 for d in stamps], dtype=np.int64)
+        day_seconds = np.array([d.hour * 3600 + d.minute * 60 + d.second if d is not None else -1
+                                for d in stamps], dtype=np.int64)
+        known = ordinals >= 0
+        columns.day = ordinals.astype(np.int32)
+        columns.hour = np.where(known, day_seconds // 3600, -1).astype(np.int8)
+        columns.published_ts = np.where(
+            known, (ordinals - _EPOCH_ORDINAL) * 86400 + day_seconds, np.nan).astype(np.float64)
+
+        # カテゴリ列
+        codes, raw = _factorize(categories)
+        columns.category, columns.category_labels = _relabel(codes, raw, _category_label)
+
+        detailed = [getattr(a, 'detailed_category', _MISSING) for a in articles]
+        if detailed.count(_MISSING) == size:
+            detailed = ['未分類' if c is None else c for c in categories]
+        else:
+            detailed = [(c if c is not None else '未分類') if d is _MISSING else d
+                        for d, c in zip(detailed, categories)]
+        codes, columns.detailed_category_labels = _factorize(detailed)
+        columns.detailed_category = np.array(codes, dtype=np.int32)
+
+        codes, columns.language_labels = _factorize(languages)
+        columns.language = np.array(codes, dtype=np.int32)
+
+        # 配信元列（旧形式の source 辞書にも対応）
+        sources = [getattr(a, 'source', None) for a in articles]
+        if sources.count(None) == size:
+            sources = [name or 'Unknown' for name in source_names]
+        else:
+            sources = [_source_label(a) for a in articles]
+        codes, columns.source_labels = _factorize(sources)
+        columns.source = np.array(codes, dtype=np.int32)
+
+        # キーワード（フラット化 + 所属行）
+        keyword_counts = [len(k) if k else 0 for k in keywords]
+        columns.keywords = list(chain.from_iterable(k for k in keywords if k))
+        columns.keyword_rows = np.repeat(
+            np.arange(size, dtype=np.int32), np.array(keyword_counts, dtype=np.int64))
+        return columns
+
+    # ------------------------------------------------------------------
+    # 基本集計
+    # ------------------------------------------------------------------
+
+    def _label_counts(self, codes: np.ndarray, labels: List[Hashable]) -> np.ndarray:
+        valid = codes[codes >= 0]
+        return np.bincount(valid, minlength=len(labels))
+
+    def _top_labels(self, codes: np.ndarray, labels: List[Hashable], limit: int) -> Dict[Hashable, int]:
+        """件数上位のラベル（同数は出現順）"""
+        counts = self._label_counts(codes, labels)
+        order = np.argsort(-counts, kind='stable')[:limit]
+        return {labels[c]: int(counts[c]) for c in order if counts[c] > 0}
+
+    def category_counts(self) -> Dict[str, int]:
+        """カテゴリ別件数（出現順）"""
+        counts = self._label_counts(self.category, self.category_labels)
+        return {label: int(count) for label, count in zip(self.category_labels, counts) if count}
+
+    def count_category(self, label: str) -> int:
+        try:
+            code = self.category_labels.index(label)
+        except ValueError:
+            return 0
+        return int(np.count_nonzero(self.category == code))
+
+    def trending_keywords(self, limit: int = 10) -> List[Tuple[str, int]]:
+        """頻出キーワード"""
+        return Counter(self.keywords).most_common(limit)
+
+    # ------------------------------------------------------------------
+    # レポート別統計
+    # ------------------------------------------------------------------
+
+    def html_statistics(self) -> Dict[str, Any]:
+        """HTMLReportGenerator 用の統計"""
+        if not self.size:
+            return {}
+
+        scores = self.importance
+        return {
+            'total_count': self.size,
+            'avg_importance': float(scores.mean()),
+            'high_importance': int(np.count_nonzero(scores >= 8)),
+            'medium_importance': int(np.count_nonzero((scores >= 5) & (scores < 8))),
+            'low_importance': int(np.count_nonzero(scores < 5)),
+            'urgent_count': int(np.count_nonzero(scores >= 9)),
+            'security_count': self.count_category('security'),
+            'category_breakdown': self.category_counts()
+        }
+
+    def advanced_statistics(self) -> Dict[str, Any]:
+        """ReportGenerator 用の詳細統計"""
+        if not self.size:
+            return {}
+
+        scores = self.importance
+        sentiment = self.sentiment[~np.isnan(self.sentiment)]
+        avg_sentiment = float(sentiment.mean()) if sentiment.size else 0
+
+        hours = self.hour[self.hour >= 0]
+        hour_counts = np.bincount(hours, minlength=24) if hours.size else np.zeros(24, dtype=np.int64)
+
+        return {
+            'avg_importance': round(float(scores.mean()), 2),
+            'max_importance': _as_number(scores.max()),
+            'min_importance': _as_number(scores.min()),
+            'importance_distribution': {
+                'critical': int(np.count_nonzero(scores >= 9)),
+                'high': int(np.count_nonzero((scores >= 7) & (scores < 9))),
+                'medium': int(np.count_nonzero((scores >= 5) & (scores < 7))),
+                'low': int(np.count_nonzero(scores < 5))
+            },
+            'sentiment_analysis': {
+                'avg_sentiment': round(avg_sentiment, 2),
+                'positive_count': int(np.count_nonzero(sentiment > 0.1)),
+                'negative_count': int(np.count_nonzero(sentiment < -0.1)),
+                'neutral_count': int(np.count_nonzero((sentiment >= -0.1) & (sentiment <= 0.1)))
+            },
+            'language_distribution': self._top_labels(self.language, self.language_labels, 5),
+            'source_distribution': self._top_labels(self.source, self.source_labels, 5),
+            'time_distribution': {hour: int(count) for hour, count in enumerate(hour_counts) if count}
+        }
+
+    def weekly_statistics(self) -> Dict[str, Any]:
+        """週次統計（日別件数・カテゴリトレンド）"""
+        known = self.day >= 0
+        days = self.day[known]
+        if not days.size:
+            return {'daily_counts': {}, 'category_trends': {}, 'peak_day': None, 'total_days': 0}
+
+        unique_days, day_index = np.unique(days, return_inverse=True)
+        day_keys = [date.fromordinal(int(d)).strftime('%Y-%m-%d') for d in unique_days]
+        day_totals = np.bincount(day_index, minlength=len(unique_days))
+        daily_counts = {key: int(count) for key, count in zip(day_keys, day_totals)}
+
+        # カテゴリ×日の二次元集計
+        categories = self.category[known]
+        has_category = categories >= 0
+        category_trends: Dict[str, Dict[str, int]] = {}
+        if np.any(has_category):
+            n_days = len(unique_days)
+            flat = categories[has_category].astype(np.int64) * n_days + day_index[has_category]
+            grid = np.bincount(flat, minlength=len(self.category_labels) * n_days)
+            grid = grid.reshape(len(self.category_labels), n_days)
+            for code, label in enumerate(self.category_labels):
+                row = grid[code]
+                nonzero = np.nonzero(row)[0]
+                if nonzero.size:
+                    category_trends[label] = {day_keys[d]: int(row[d]) for d in nonzero}
+
+        return {
+            'daily_counts': daily_counts,
+            'category_trends': category_trends,
+            'peak_day': day_keys[int(np.argmax(day_totals))],
+            'total_days': len(daily_counts)
+        }
+
+    def categories_weekly(self, top_keywords: int = 5) -> Dict[Hashable, Dict[str, Any]]:
+        """週次カテゴリ分析（詳細カテゴリ単位）"""
+        labels = self.detailed_category_labels
+        n_labels = len(labels)
+        if not self.size:
+            return {}
+
+        codes = self.detailed_category
+        counts = np.bincount(codes, minlength=n_labels)
+        urgent_counts = np.bincount(codes, weights=self.urgent, minlength=n_labels)
+        importance_sums = np.bincount(codes, weights=self.importance, minlength=n_labels)
+
+        # キーワードをカテゴリごとにまとめる
+        keyword_lists: List[List[str]] = [[] for _ in range(n_labels)]
+        if self.keywords:
+            keyword_codes = codes[self.keyword_rows]
+            for code, keyword in zip(keyword_codes.tolist(), self.keywords):
+                keyword_lists[code].append(keyword)
+
+        category_data = {}
+        for code, label in enumerate(labels):
+            count = int(counts[code])
+            total_importance = _as_number(importance_sums[code])
+            category_data[label] = {
+                'count': count,
+                'urgent_count': int(urgent_counts[code]),
+                'total_importance': total_importance,
+                'keywords': keyword_lists[code],
+                'avg_importance': total_importance / count if count > 0 else 0,
+                'top_keywords': [k for k, _ in Counter(keyword_lists[code]).most_common(top_keywords)]
+            }
+        return category_data
+
+    def unique_source_count(self) -> int:
+        return len(self.source_labels)
+
+    def mean_importance(self) -> float:
+        return float(self.importance.mean()) if self.size else 0
@@ -15,6 +15,7 @@ from jinja2 import Environment, FileSystemLoader, Template
 from models.article import Article, ArticleCategory
 from utils.config import get_config
 from utils.source_translator import SourceTranslator
+from .article_columns import ArticleColumns
 
 logger = logging.getLogger(__name__)
 
@@ -225,63 +226,12 @@ class HTMLReportGenerator:
         return {k: v for k, v in categories.items() if v}
     
     def _generate_statistics(self, articles: List[Article]) -> Dict[str, Any]:
-        """統計情報生成"""
-        if not articles:
-            return {}
-        
-        importance_scores = [getattr(a, 'importance_score', 5) for a in articles]
-        
-        stats = {
-            'total_count': len(articles),
-            'avg_importance': sum(importance_scores) / len(importance_scores),
-            'high_importance': len([s for s in importance_scores if s >= 8]),
-            'medium_importance': len([s for s in importance_scores if 5 <= s < 8]),
-            'low_importance': len([s for s in importance_scores if s < 5]),
-            'urgent_count': len([a for a in articles if getattr(a, 'importance_score', 0) >= 9]),
-            'security_count': len([a for a in articles 
-                                 if getattr(a, 'category', None) == ArticleCategory.SECURITY])
-        }
-        
-        # カテゴリ別統計
-        category_counts = {}
-        for article in articles:
-            category = getattr(article, 'category', None)
-            if category:
-                category_name = category.value if hasattr(category, 'value') else str(category)
-                category_counts[category_name] = category_counts.get(category_name, 0) + 1
-        
-        stats['category_breakdown'] = category_counts
-        
-        return stats
+        """統計情報生成（列指向で一回走査）"""
+        return ArticleColumns.from_articles(articles).html_statistics()
     
     def _generate_weekly_statistics(self, articles: List[Article]) -> Dict[str, Any]:
         """週次統計生成"""
-        daily_counts = {}
-        category_trends = {}
-        
-        for article in articles:
-            # 日別カウント
-            pub_date = getattr(article, 'published_at', datetime.now())
-            if isinstance(pub_date, str):
-                pub_date = datetime.fromisoformat(pub_date.replace('Z', '+00:00'))
-            
-            day_key = pub_date.strftime('%Y-%m-%d')
-            daily_counts[day_key] = daily_counts.get(day_key, 0) + 1
-            
-            # カテゴリトレンド
-            category = getattr(article, 'category', None)
-            if category:
-                cat_name = category.value if hasattr(category, 'value') else str(category)
-                if cat_name not in category_trends:
-                    category_trends[cat_name] = {}
-                category_trends[cat_name][day_key] = category_trends[cat_name].get(day_key, 0) + 1
-        
-        return {
-            'daily_counts': daily_counts,
-            'category_trends': category_trends,
-            'peak_day': max(daily_counts, key=daily_counts.get) if daily_counts else None,
-            'total_days': len(daily_counts)
-        }
+        return ArticleColumns.from_articles(articles).weekly_statistics()
     
     def _extract_urgent_alerts(self, articles: List[Article]) -> List[Article]:
         """緊急アラート記事抽出"""
@@ -62,13 +62,15 @@ class PDFReportGenerator:
         logger.info(f"PDF Report Generator initialized. wkhtmltopdf: {self.wkhtmltopdf_path}")
     
     def generate_daily_report(self, articles: List[Article], 
-                            report_date: datetime = None) -> Optional[str]:
-        """日次PDFレポート生成"""
+                            report_date: datetime = None,
+                            html_content: Optional[str] = None) -> Optional[str]:
+        """日次PDFレポート生成（レンダリング済みHTMLがあれば再利用）"""
         try:
             report_date = report_date or datetime.now()
             
             # HTML生成
-            html_content = self.html_generator.generate_daily_report(articles, report_date)
+            if html_content is None:
+                html_content = self.html_generator.generate_daily_report(articles, report_date)
             
             # PDF出力パス
             date_str = report_date.strftime('%Y%m%d')
@@ -143,6 +145,24 @@ class PDFReportGenerator:
             logger.error(f"Weekly PDF summary generation failed: {e}")
             return None
     
+    def render_pdf_bytes(self, html_content: str) -> Optional[bytes]:
+        """HTMLからPDFをメモリ上のバイト列として生成"""
+        if not self.wkhtmltopdf_path:
+            return None
+        
+        fd, temp_pdf_path = tempfile.mkstemp(suffix='.pdf')
+        os.close(fd)
+        try:
+            if not self._generate_pdf_from_html(html_content, temp_pdf_path):
+                return None
+            with open(temp_pdf_path, 'rb') as f:
+                return f.read()
+        finally:
+            try:
+                os.unlink(temp_pdf_path)
+            except OSError:
+                pass
+    
     def _generate_pdf_from_html(self, html_content: str, output_path: str) -> bool:
         """HTMLからPDF生成"""
         try:
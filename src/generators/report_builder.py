@@ -0,0 +1,318 @@
+"""
+Report Build Stage
+レポートビルドステージ - 単一レンダリング・コンテンツハッシュキャッシュ
+
+記事セットのコンテンツハッシュを計算し、各フォーマットを一度だけ生成する。
+生成物はハッシュ単位でキャッシュされ、同一内容の再実行（メール失敗後の
+リトライ等）では再レンダリングせずに再利用する。
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+import shutil
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterable
+
+from models.article import Article
+from utils.config import get_config
+from utils.tracing import trace_span
+
+logger = logging.getLogger(__name__)
+
+
+# ハッシュ対象フィールド（レンダリング結果に影響するもの）
+# html_generator のテンプレートが読む article.* はすべて含める（テストで照合）
+_HASH_FIELDS = (
+    'url', 'title', 'translated_title', 'summary', 'content', 'translated_content',
+    'source', 'source_name', 'category', 'importance_score', 'sentiment',
+    'cvss_score', 'cve_id', 'published_at', 'keywords',
+)
+
+
+def _normalize_field(value: Any) -> str:
+    """ハッシュ用フィールド正規化"""
+    if value is None:
+        return ''
+    if hasattr(value, 'value'):  # Enum
+        value = value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return '\x1f'.join(str(v) for v in value)
+    return str(value)
+
+
+def compute_content_hash(articles: Iterable[Article], report_type: str = 'daily',
+                         report_date: Optional[datetime] = None) -> str:
+    """記事セットのコンテンツハッシュ計算
+
+    記事の並び順もレンダリング結果に影響するため、順序を保持してハッシュする。
+    """
+    hasher = hashlib.sha256()
+    hasher.update(report_type.encode('utf-8'))
+    if report_date is not None:
+        hasher.update(report_date.strftime('%Y%m%d').encode('utf-8'))
+
+    for article in articles:
+        hasher.update(b'\x1e')
+        for name in _HASH_FIELDS:
+            hasher.update(_normalize_field(getattr(article, name, None)).encode('utf-8'))
+            hasher.update(b'\x1f')
+
+    return hasher.hexdigest()
+
+
+@dataclass
+class ReportArtifacts:
+    """レポート生成物（メモリ上のバイト列と公開パス）"""
+    content_hash: str
+    report_type: str
+    html_content: str
+    pdf_bytes: Optional[bytes] = None
+    html_path: Optional[str] = None
+    pdf_path: Optional[str] = None
+    cache_hit: bool = False
+    created_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def html_bytes(self) -> bytes:
+        return self.html_content.encode('utf-8')
+
+    @property
+    def pdf_filename(self) -> Optional[str]:
+        return os.path.basename(self.pdf_path) if self.pdf_path else None
+
+    @property
+    def paths(self) -> Dict[str, str]:
+        """従来の report_paths 形式"""
+        paths = {}
+        if self.html_path:
+            paths['html'] = self.html_path
+        if self.pdf_path:
+            paths['pdf'] = self.pdf_path
+        return paths
+
+
+class ReportBuilder:
+    """マルチフォーマットレポートビルダー"""
+
+    HTML_FILENAME = 'report.html'
+    PDF_FILENAME = 'report.pdf'
+    MANIFEST_FILENAME = 'manifest.json'
+
+    def __init__(self, config=None, html_generator=None, pdf_generator=None,
+                 cache_dir: Optional[Path] = None, max_cached_builds: Optional[int] = None):
+        self.config = config or get_config()
+
+        if html_generator is None:
+            from .html_generator import HTMLReportGenerator
+            html_generator = HTMLReportGenerator(self.config)
+        self.html_generator = html_generator
+        self.pdf_generator = pdf_generator
+
+        self.cache_dir = Path(cache_dir) if cache_dir else self._default_cache_dir()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_cached_builds = max_cached_builds or self.config.get(
+            'reporting', 'max_cached_builds', default=10)
+
+        # 同一プロセス内のリトライ用メモリキャッシュ
+        self._memory_cache: Dict[str, ReportArtifacts] = {}
+        self._lock = threading.Lock()
+
+        self.build_stats = {
+            'builds': 0,
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'html_renders': 0,
+            'pdf_renders': 0
+        }
+
+    def _default_cache_dir(self) -> Path:
+        """既定のキャッシュディレクトリ"""
+        try:
+            return Path(self.config.get_storage_path('cache')) / 'reports'
+        except Exception:
+            project_root = Path(__file__).parent.parent.parent
+            return project_root / 'data' / 'cache' / 'reports'
+
+    def build_daily_report(self, articles: List[Article],
+                           report_date: datetime = None,
+                           formats: Iterable[str] = ('html', 'pdf')) -> ReportArtifacts:
+        """日次レポートビルド（HTML一回レンダリング、PDFは同一HTMLから生成）"""
+        report_date = report_date or datetime.now()
+        formats = set(formats)
+        content_hash = compute_content_hash(articles, 'daily', report_date)
+
+        with self._lock, trace_span('report.build', category='render', articles=len(articles)) as span:
+            self.build_stats['builds'] += 1
+
+            artifacts = self._lookup(content_hash, formats)
+            span.set('cache_hit', artifacts is not None)
+            if artifacts is not None:
+                logger.info(f"Report cache hit: {content_hash[:12]} ({len(articles)} articles)")
+            else:
+                # HTMLは一度だけレンダリングし、PDFも同じHTMLから生成
+                with trace_span('report.html', category='render'):
+                    html_content = self.html_generator.generate_daily_report(articles, report_date)
+                self.build_stats['html_renders'] += 1
+
+                pdf_bytes = None
+                if 'pdf' in formats and self._pdf_available():
+                    with trace_span('report.pdf', category='render'):
+                        pdf_bytes = self.pdf_generator.render_pdf_bytes(html_content)
+                    self.build_stats['pdf_renders'] += 1
+
+                artifacts = ReportArtifacts(
+                    content_hash=content_hash,
+                    report_type='daily',
+                    html_content=html_content,
+                    pdf_bytes=pdf_bytes
+                )
+                self._store(artifacts)
+                logger.info(f"Report built: {content_hash[:12]} "
+                            f"(html={len(html_content)}B, pdf={len(pdf_bytes or b'')}B)")
+
+        if artifacts.pdf_bytes and not artifacts.pdf_path:
+            artifacts.pdf_path = self._publish_pdf(
+                artifacts.pdf_bytes, f"daily_news_report_{report_date.strftime('%Y%m%d')}.pdf")
+
+        return artifacts
+
+    def _lookup(self, content_hash: str, formats: set) -> Optional[ReportArtifacts]:
+        """メモリ→ディスクの順でキャッシュ検索"""
+        artifacts = self._memory_cache.get(content_hash)
+        if artifacts is not None and self._satisfies(artifacts, formats):
+            self.build_stats['memory_hits'] += 1
+            artifacts.cache_hit = True
+            return artifacts
+
+        artifacts = self._load_from_disk(content_hash)
+        if artifacts is not None and self._satisfies(artifacts, formats):
+            self.build_stats['disk_hits'] += 1
+            self._memory_cache[content_hash] = artifacts
+            return artifacts
+
+        return None
+
+    def _satisfies(self, artifacts: ReportArtifacts, formats: set) -> bool:
+        """要求フォーマットをキャッシュが満たすか"""
+        if 'pdf' in formats and self._pdf_available() and not artifacts.pdf_bytes:
+            # PDF生成に失敗したビルドは再試行する
+            return False
+        return True
+
+    def _pdf_available(self) -> bool:
+        """PDF生成が利用可能か"""
+        return (self.pdf_generator is not None and
+                bool(getattr(self.pdf_generator, 'wkhtmltopdf_path', None)))
+
+    def _load_from_disk(self, content_hash: str) -> Optional[ReportArtifacts]:
+        """ディスクキャッシュ読み込み"""
+        entry_dir = self.cache_dir / content_hash
+        manifest_path = entry_dir / self.MANIFEST_FILENAME
+        if not manifest_path.exists():
+            return None
+
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+
+            html_content = (entry_dir / self.HTML_FILENAME).read_text(encoding='utf-8')
+            pdf_file = entry_dir / self.PDF_FILENAME
+            pdf_bytes = pdf_file.read_bytes() if pdf_file.exists() else None
+
+            return ReportArtifacts(
+                content_hash=content_hash,
+                report_type=manifest.get('report_type', 'daily'),
+                html_content=html_content,
+                pdf_bytes=pdf_bytes,
+                cache_hit=True,
+                created_at=datetime.fromisoformat(manifest['created_at'])
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load cached report {content_hash[:12]}: {e}")
+            return None
+
+    def _store(self, artifacts: ReportArtifacts):
+        """メモリ・ディスクキャッシュへ保存"""
+        self._memory_cache[artifacts.content_hash] = artifacts
+
+        entry_dir = self.cache_dir / artifacts.content_hash
+        tmp_dir = self.cache_dir / f".{artifacts.content_hash}.tmp"
+        try:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            tmp_dir.mkdir(parents=True)
+            (tmp_dir / self.HTML_FILENAME).write_text(artifacts.html_content, encoding='utf-8')
+            if artifacts.pdf_bytes:
+                (tmp_dir / self.PDF_FILENAME).write_bytes(artifacts.pdf_bytes)
+            manifest = {
+                'content_hash': artifacts.content_hash,
+                'report_type': artifacts.report_type,
+                'created_at': artifacts.created_at.isoformat(),
+                'formats': ['html'] + (['pdf'] if artifacts.pdf_bytes else [])
+            }
+            with open(tmp_dir / self.MANIFEST_FILENAME, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False)
+
+            # アトミックに置き換え
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(tmp_dir, entry_dir)
+        except Exception as e:
+            logger.warning(f"Failed to cache report {artifacts.content_hash[:12]}: {e}")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return
+
+        self._evict_old_builds()
+
+    def _evict_old_builds(self):
+        """古いキャッシュエントリ削除"""
+        try:
+            entries = [p for p in self.cache_dir.iterdir()
+                       if p.is_dir() and not p.name.startswith('.')]
+            if len(entries) <= self.max_cached_builds:
+                return
+            entries.sort(key=lambda p: p.stat().st_mtime)
+            for entry in entries[:len(entries) - self.max_cached_builds]:
+                shutil.rmtree(entry, ignore_errors=True)
+                self._memory_cache.pop(entry.name, None)
+        except Exception as e:
+            logger.warning(f"Report cache eviction failed: {e}")
+
+    def _publish_pdf(self, pdf_bytes: bytes, filename: str) -> Optional[str]:
+        """PDFを公開ディレクトリに書き出し"""
+        try:
+            pdf_path = Path(self.pdf_generator.output_dir) / 'daily' / filename
+            pdf_path.parent.mkdir(parents=True, exist_ok=True)
+            pdf_path.write_bytes(pdf_bytes)
+            return str(pdf_path)
+        except Exception as e:
+            logger.warning(f"Failed to publish PDF report: {e}")
+            return None
+
+    def invalidate(self, content_hash: Optional[str] = None):
+        """キャッシュ無効化（ハッシュ指定なしで全削除）"""
+        with self._lock:
+            if content_hash:
+                self._memory_cache.pop(content_hash, None)
+                shutil.rmtree(self.cache_dir / content_hash, ignore_errors=True)
+            else:
+                self._memory_cache.clear()
+                for entry in self.cache_dir.iterdir():
+                    shutil.rmtree(entry, ignore_errors=True)
+
+    def get_build_statistics(self) -> Dict[str, Any]:
+        """ビルド統計取得"""
+        stats = self.build_stats.copy()
+        builds = stats['builds']
+        hits = stats['memory_hits'] + stats['disk_hits']
+        stats['hit_rate'] = hits / builds if builds else 0.0
+        stats['cached_builds'] = len(self._memory_cache)
+        return stats
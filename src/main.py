@@ -10,31 +10,29 @@ import asyncio
 import sys
 import os
 import logging
+from contextlib import nullcontext
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from functools import cached_property
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from pathlib import Path
 
 # Add src directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Import modules according to CLAUDE.md specification
-from collectors.newsapi_collector import NewsAPICollector
-from collectors.nvd_collector import NVDCollector
-from collectors.gnews_collector import GNewsCollector
-from processors.translator import DeepLTranslator
-from processors.analyzer import ClaudeAnalyzer
-from processors.deduplicator import ArticleDeduplicator
-from generators.html_generator import HTMLReportGenerator
-from generators.pdf_generator import PDFReportGenerator
-from notifiers.gmail_sender import GmailSender
+# 起動時に読み込むのは軽量なモジュールのみ
+# 収集・翻訳・分析・レポート・通知・監視の各サブシステム（aiohttp、Anthropic SDK、
+# Jinja2、Google APIクライアント等）は初回使用時に読み込み・構築する
 from models.article import Article
-from models.database import Database
+from models.database_orm import AsyncDatabase, DeliveryHistory
 from utils.config import ConfigManager
 from utils.logger import setup_logger
-from utils.cache_manager import CacheManager
-from utils.simple_translator import SimpleTranslator
-from utils.monitoring_system import get_monitoring_system
-from services.self_healing_system import get_self_healing_system
+from utils.simple_translator import SimpleTranslator, summaries_from_shared, translations_from_shared
+from utils.loop_watchdog import LoopWatchdog
+from utils.profiler import RunProfiler, install_signal_trigger, stages_from_tracer
+from utils.tracing import Tracer, bind_context, trace_span, traced
+
+if TYPE_CHECKING:
+    from generators.report_builder import ReportArtifacts
 
 
 class NewsDeliverySystem:
@@ -43,63 +41,178 @@ class NewsDeliverySystem:
     def __init__(self):
         self.config = ConfigManager()
         self.logger = setup_logger(__name__)
-        self.db = Database()
-        self.cache_manager = CacheManager()
+        self.db = AsyncDatabase(self.config)
         self.test_delivery_mode = False  # テスト配信モード
+        self.profile_mode = False  # 設定に関わらずプロファイルを採取
         
-        # Initialize monitoring and self-healing systems
-        self.monitoring_system = get_monitoring_system()
-        self.healing_system = get_self_healing_system()
-        
-        # Initialize collectors
-        self.collectors = {}
+        self.logger.info("News Delivery System initialized - CLAUDE.md specification compliant")
+    
+    @cached_property
+    def cache_manager(self):
+        """共有キャッシュマネージャー（収集・翻訳・分析と同一インスタンス）"""
+        from utils.cache_manager import get_cache_manager
+        return get_cache_manager()
+    
+    @cached_property
+    def monitoring_system(self):
+        from utils.monitoring_system import get_monitoring_system
+        return get_monitoring_system()
+    
+    @cached_property
+    def healing_system(self):
+        from services.self_healing_system import get_self_healing_system
+        return get_self_healing_system()
+    
+    @cached_property
+    def collectors(self) -> Dict[str, Any]:
+        """APIキーが設定されているコレクター"""
+        collectors = {}
         try:
             if self.config.get_api_key('newsapi'):
-                self.collectors['newsapi'] = NewsAPICollector(self.config, self.logger)
+                from collectors.newsapi_collector import NewsAPICollector
+                collectors['newsapi'] = NewsAPICollector(self.config, self.logger)
                 self.logger.info("NewsAPI collector initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize NewsAPI collector: {e}")
         
         try:
             if self.config.get_api_key('nvd'):
-                self.collectors['nvd'] = NVDCollector(self.config, self.logger)
+                from collectors.nvd_collector import NVDCollector
+                collectors['nvd'] = NVDCollector(self.config, self.logger)
                 self.logger.info("NVD collector initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize NVD collector: {e}")
         
         try:
             if self.config.get_api_key('gnews'):
-                self.collectors['gnews'] = GNewsCollector(self.config, self.logger)
+                from collectors.gnews_collector import GNewsCollector
+                collectors['gnews'] = GNewsCollector(self.config, self.logger)
                 self.logger.info("GNews collector initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize GNews collector: {e}")
         
-        active_collectors = {k: v for k, v in self.collectors.items() if v is not None}
+        active_collectors = {k: v for k, v in collectors.items() if v is not None}
         if not active_collectors:
             self.logger.warning("No collectors initialized successfully - running in test mode")
         else:
             self.logger.info(f"Successfully initialized {len(active_collectors)} collectors: {list(active_collectors.keys())}")
+        return collectors
+    
+    @cached_property
+    def translator(self):
+        from processors.translator import DeepLTranslator
+        return DeepLTranslator(self.config)
+    
+    @cached_property
+    def analyzer(self):
+        from processors.analyzer import ClaudeAnalyzer
+        return ClaudeAnalyzer(self.config)
+    
+    @cached_property
+    def deduplicator(self):
+        from processors.deduplicator import ArticleDeduplicator
+        return ArticleDeduplicator()
+    
+    @cached_property
+    def process_executor(self):
+        """CPU処理（類似度比較・簡易翻訳）用のプロセスプール（無効・1CPUなら None）"""
+        if not self.config.get('process_pool', 'enabled', default=True):
+            return None
+        workers = self.config.get('process_pool', 'workers', default=0) or os.cpu_count() or 1
+        if workers < 2:
+            return None
+        from utils.async_executor import AsyncExecutor
+        return AsyncExecutor(max_workers=1, enable_monitoring=False, process_pool_size=workers)
+    
+    @cached_property
+    def html_generator(self):
+        from generators.html_generator import HTMLReportGenerator
+        return HTMLReportGenerator(self.config)
+    
+    @cached_property
+    def pdf_generator(self):
+        from generators.pdf_generator import PDFReportGenerator
+        return PDFReportGenerator(self.config)
+    
+    @cached_property
+    def report_builder(self):
+        from generators.report_builder import ReportBuilder
+        return ReportBuilder(self.config, self.html_generator, self.pdf_generator)
+    
+    @cached_property
+    def gmail_sender(self):
+        from notifiers.gmail_sender import GmailSender
+        return GmailSender(self.config)
+    
+    async def run(self):
+        """メイン処理フロー - CLAUDE.md仕様
         
-        # Initialize processors
-        self.translator = DeepLTranslator(self.config)
-        self.analyzer = ClaudeAnalyzer(self.config)
-        self.deduplicator = ArticleDeduplicator()
-        
-        # Initialize generators
-        self.html_generator = HTMLReportGenerator(self.config)
-        self.pdf_generator = PDFReportGenerator(self.config)
-        
-        # Initialize notifier
-        self.gmail_sender = GmailSender(self.config)
+        トレースが有効な場合は各ステップをスパンとして記録し、実行ごとに
+        Chrome トレース形式のファイルを出力する。プロファイルが有効な場合（設定・
+        --profile・SIGUSR1）はスタックを採取し、トレースの各ステップ別に書き出す。
+        イベントループを止める同期処理はステップ・スタック付きでログとメトリクスに記録する。
+        """
+        tracer = Tracer('news_delivery') if self.config.get('tracing', 'enabled', default=True) else None
+        profiler = RunProfiler(self.config, 'news_delivery', force=self.profile_mode)
+        watchdog = LoopWatchdog.from_config(self.config)
         
-        self.logger.info("News Delivery System initialized - CLAUDE.md specification compliant")
+        try:
+            with profiler, (watchdog or nullcontext()):
+                if tracer is None:
+                    await self._run_workflow()
+                    return
+                
+                with tracer:
+                    try:
+                        with trace_span('run', category='pipeline', test_delivery=self.test_delivery_mode):
+                            await self._run_workflow()
+                    finally:
+                        self._write_trace(tracer)
+        finally:
+            profiler.write(stages_from_tracer(tracer))
+            if watchdog is not None:
+                self._log_loop_summary(watchdog)
     
-    async def run(self):
-        """メイン処理フロー - CLAUDE.md仕様"""
+    def _log_loop_summary(self, watchdog: LoopWatchdog):
+        """実行中のループ遅延とブロッキング処理の集計をログ出力"""
+        summary = watchdog.summary()
+        if not summary['blocks']:
+            self.logger.info(f"Event loop: max lag {summary['max_lag'] * 1000:.0f}ms, no blocking calls")
+            return
+        stages = ', '.join(
+            f"{stage}={data['count']}x/{data['total_seconds']:.2f}s"
+            for stage, data in sorted(summary['by_stage'].items(), key=lambda item: -item[1]['total_seconds'])
+        )
+        self.logger.warning(
+            f"Event loop: {summary['blocks']} blocking calls, max lag {summary['max_lag'] * 1000:.0f}ms ({stages})"
+        )
+    
+    def _write_trace(self, tracer: Tracer):
+        """トレースファイルの出力と古いファイルの削除"""
+        try:
+            from utils.path_resolver import get_data_path
+            
+            trace_dir = get_data_path('traces')
+            trace_path = tracer.write(trace_dir / f"trace_{tracer.started_at:%Y%m%d_%H%M%S}.json")
+            
+            keep_files = self.config.get('tracing', 'keep_files', default=30)
+            for old_trace in sorted(trace_dir.glob('trace_*.json'))[:-keep_files]:
+                old_trace.unlink()
+            
+            slowest = ', '.join(f"{row['name']}={row['total_ms']:.0f}ms" for row in tracer.summary(5))
+            self.logger.info(f"Trace written: {trace_path} ({len(tracer.spans)} spans; {slowest})")
+        except Exception as e:
+            self.logger.warning(f"Failed to write trace: {e}")
+    
+    async def _run_workflow(self):
+        """メイン処理フロー本体"""
         try:
             self.logger.info("Starting news delivery system main workflow")
             start_time = datetime.now()
             
+            # データベース接続（実行中は単一の長寿命接続を使用）
+            await self.db.initialize()
+            
             # 監視・自己修復システム開始
             await self.monitoring_system.start_monitoring()
             await self.healing_system.start_healing_loop()
@@ -129,11 +242,11 @@ class NewsDeliverySystem:
             
             # 5. レポート生成
             self.logger.info("Step 5: Generating HTML and PDF reports")
-            report_paths = await self.generate_reports(analyzed_articles)
+            report = await self.generate_reports(analyzed_articles)
         
             # 6. メール配信
             self.logger.info("Step 6: Sending email notifications")
-            await self.send_notifications(report_paths, analyzed_articles)
+            await self.send_notifications(report, analyzed_articles)
             
             # 7. データ保存
             self.logger.info("Step 7: Saving data to database")
@@ -164,7 +277,14 @@ class NewsDeliverySystem:
                 await self.monitoring_system.stop_monitoring()
             except:
                 pass
+            process_executor = self.__dict__.pop('process_executor', None)
+            if process_executor is not None:
+                await process_executor.stop()
+            from collectors.session_manager import close_session_pool
+            await close_session_pool()
+            await self.db.close()
     
+    @traced('collect', category='pipeline')
     async def collect_news(self) -> List[Article]:
         """ニュース収集 - CLAUDE.md仕様準拠"""
         try:
@@ -351,15 +471,35 @@ class NewsDeliverySystem:
         }
         return queries.get(category, category)
     
+    @traced('deduplicate', category='pipeline')
     async def deduplicate(self, articles: List[Article]) -> List[Article]:
         """重複除去"""
         try:
-            result = self.deduplicator.deduplicate(articles)
+            executor = self._process_executor_for(len(articles))
+            if executor is not None:
+                result = await self.deduplicator.deduplicate_async(
+                    articles, executor, min_articles=self._process_pool_min_articles()
+                )
+            else:
+                result = self.deduplicator.deduplicate(articles)
             return result.unique_articles
         except Exception as e:
             self.logger.error(f"Deduplication failed: {e}")
             return articles
     
+    def _process_pool_min_articles(self) -> int:
+        return self.config.get('process_pool', 'min_articles', default=200)
+    
+    def _process_executor_for(self, rows: int):
+        """rows 件の CPU処理をプロセスプールへ送る場合はその実行エンジン（送らない場合は None）
+        
+        件数が少ないとプロセス間の往復の方が高くつくため、process_pool.min_articles 未満は送らない。
+        """
+        if rows < self._process_pool_min_articles():
+            return None
+        return self.process_executor
+    
+    @traced('translate', category='pipeline')
     async def translate(self, articles: List[Article]) -> List[Article]:
         """翻訳処理 - CLAUDE.md仕様準拠"""
         try:
@@ -370,6 +510,7 @@ class NewsDeliverySystem:
             await self.monitoring_system.handle_error_with_classification(e, "translation")
             return articles
     
+    @traced('analyze', category='pipeline')
     async def analyze(self, articles: List[Article]) -> List[Article]:
         """AI分析・要約 - CLAUDE.md仕様準拠"""
         try:
@@ -386,7 +527,9 @@ class NewsDeliverySystem:
             # Claude分析実行
             analyzed_articles = await self.analyzer.analyze_batch(high_priority_articles)
             
-            # 残りは簡易分析
+            # 残りは簡易分析（簡易翻訳はまとめて実行）
+            pending_summaries = []
+            pending_translations = []
             for article in remaining_articles:
                 article.importance_score = getattr(article, 'importance_score', 5)
                 
@@ -401,29 +544,34 @@ class NewsDeliverySystem:
                 elif original_content:
                     # 英語コンテンツの場合は翻訳して要約を生成
                     if any(char.isalpha() and ord(char) < 128 for char in original_content[:50]):
-                        # SimpleTranslatorで翻訳＋要約
-                        translated_summary = SimpleTranslator.create_summary(
-                            article.title or '',
-                            original_content,
-                            max_length=200
-                        )
-                        article.summary = translated_summary
-                        # 翻訳された要約を translated_content にも保存
-                        if not translated_content:
-                            article.translated_content = translated_summary
+                        pending_summaries.append((article, article.title or '', original_content))
                     else:
                         article.summary = original_content[:200] + '...'
                 else:
                     # 説明またはタイトルから要約を生成
                     desc = getattr(article, 'description', '') or getattr(article, 'title', '')
                     if desc and any(char.isalpha() and ord(char) < 128 for char in desc[:50]):
-                        article.summary = SimpleTranslator.translate_text(desc, max_length=200)
+                        pending_translations.append((article, desc))
                     else:
                         article.summary = desc[:200] if desc else '要約なし'
                 
                 article.keywords = []
                 article.sentiment = 'neutral'
             
+            # SimpleTranslatorで翻訳＋要約（件数が多い場合はプロセスプールで分担）
+            summaries = await self._simple_summaries(
+                [title for _, title, _ in pending_summaries],
+                [content for _, _, content in pending_summaries]
+            )
+            for (article, _, _), translated_summary in zip(pending_summaries, summaries):
+                article.summary = translated_summary
+                # 翻訳された要約を translated_content にも保存
+                article.translated_content = translated_summary
+            
+            translations = await self._simple_translations([desc for _, desc in pending_translations])
+            for (article, _), translated in zip(pending_translations, translations):
+                article.summary = translated
+            
             return analyzed_articles + remaining_articles
             
         except Exception as e:
@@ -432,31 +580,60 @@ class NewsDeliverySystem:
             await self.monitoring_system.handle_error_with_classification(e, "ai_analysis")
             return articles
     
-    async def generate_reports(self, articles: List[Article]) -> Dict[str, str]:
-        """レポート生成 - CLAUDE.md仕様準拠"""
+    async def _simple_summaries(self, titles: List[str], contents: List[str]) -> List[str]:
+        """簡易翻訳による要約（件数が多い場合はプロセスプール、失敗時はプロセス内で実行）"""
+        executor = self._process_executor_for(len(titles))
+        if executor is not None:
+            try:
+                chunks = await executor.map_shared(
+                    summaries_from_shared, {'title': titles, 'content': contents}, args=(200,)
+                )
+                return [summary for chunk in chunks for summary in chunk]
+            except Exception as e:
+                self.logger.warning(f"Process pool summaries failed, running in-process: {e}")
+        return SimpleTranslator.create_summaries(zip(titles, contents), max_length=200)
+    
+    async def _simple_translations(self, texts: List[str]) -> List[str]:
+        """簡易翻訳（件数が多い場合はプロセスプール、失敗時はプロセス内で実行）"""
+        executor = self._process_executor_for(len(texts))
+        if executor is not None:
+            try:
+                chunks = await executor.map_shared(
+                    translations_from_shared, {'text': texts}, args=(200,)
+                )
+                return [translated for chunk in chunks for translated in chunk]
+            except Exception as e:
+                self.logger.warning(f"Process pool translations failed, running in-process: {e}")
+        return SimpleTranslator.translate_texts(texts, max_length=200)
+    
+    @traced('render', category='pipeline')
+    async def generate_reports(self, articles: List[Article]) -> Optional['ReportArtifacts']:
+        """レポート生成 - CLAUDE.md仕様準拠
+        
+        HTMLは一度だけレンダリングし、PDFも同じHTMLから生成する。
+        同一記事セットの再実行ではキャッシュ済み生成物を再利用する。
+        """
         try:
-            report_paths = {}
-            
-            # HTML生成
-            html_content = self.html_generator.generate_daily_report(articles)
+            loop = asyncio.get_running_loop()
+            report = await loop.run_in_executor(
+                None, bind_context(self.report_builder.build_daily_report), articles
+            )
             
             # HTMLファイル保存
-            html_path = self._save_html_report(html_content)
+            html_path = self._save_html_report(report.html_content)
             if html_path:
-                report_paths['html'] = html_path
+                report.html_path = html_path
             
-            # PDF生成
-            pdf_path = self.pdf_generator.generate_daily_report(articles)
-            if pdf_path:
-                report_paths['pdf'] = pdf_path
+            if report.cache_hit:
+                self.logger.info(f"Reusing cached report build {report.content_hash[:12]}")
             
-            return report_paths
+            return report
             
         except Exception as e:
             self.logger.error(f"Report generation failed: {e}")
             # エラー分類・処理
             await self.monitoring_system.handle_error_with_classification(e, "report_generation")
-            return {}
+            return None
     
     def _save_html_report(self, html_content: str) -> Optional[str]:
         """HTMLレポート保存"""
@@ -487,17 +664,18 @@ class NewsDeliverySystem:
             self.logger.error(f"Failed to save HTML report: {e}")
             return None
     
-    async def send_notifications(self, report_paths: Dict[str, str], articles: List[Article]):
+    @traced('send', category='pipeline')
+    async def send_notifications(self, report: Optional['ReportArtifacts'], articles: List[Article]):
         """メール配信 - CLAUDE.md仕様準拠"""
         try:
-            # HTML内容読み込み
-            html_content = ""
-            if 'html' in report_paths and os.path.exists(report_paths['html']):
-                with open(report_paths['html'], 'r', encoding='utf-8') as f:
-                    html_content = f.read()
+            # ビルド済みのメモリ上HTMLを使用
+            if report is not None:
+                html_content = report.html_content
+                report_paths = report.paths
             else:
                 # フォールバック: HTMLジェネレーターで再生成
                 html_content = self.html_generator.generate_daily_report(articles)
+                report_paths = {}
             
             # テスト配信モードではメール送信をスキップ
             if self.test_delivery_mode:
@@ -513,7 +691,8 @@ class NewsDeliverySystem:
             success = await self.gmail_sender.send_daily_report(
                 html_content=html_content,
                 pdf_path=report_paths.get('pdf'),
-                articles=articles
+                articles=articles,
+                pdf_bytes=report.pdf_bytes if report is not None else None
             )
             
             if success:
@@ -526,26 +705,30 @@ class NewsDeliverySystem:
             # エラー分類・処理
             await self.monitoring_system.handle_error_with_classification(e, "email_notification")
     
+    @traced('save', category='pipeline')
     async def save_data(self, articles: List[Article]):
         """データ保存 - CLAUDE.md仕様準拠"""
         try:
             # 記事をデータベースに保存
-            saved_count = self.db.save_articles(articles)
+            saved_count = await self.db.save_articles_batch(articles)
             
             # 配信履歴をログ
             recipients = self.config.get('delivery.recipients', [])
             if not recipients:
                 recipients = [self.config.get('recipient_email', 'default@example.com')]
             
-            for recipient in (recipients or []):
-                self.db.log_delivery(
+            categories = [str(getattr(a, 'category', 'unknown')) for a in articles]
+            await self.db.log_deliveries([
+                DeliveryHistory(
                     delivery_type='scheduled',
                     recipient_email=recipient,
                     subject=f'ニュース配信レポート - {datetime.now().strftime("%Y年%m月%d日")}',
                     article_count=len(articles),
-                    categories=[str(getattr(a, 'category', 'unknown')) for a in articles],
+                    categories=categories,
                     status='sent'
                 )
+                for recipient in (recipients or [])
+            ])
             
             self.logger.info(f"Saved {saved_count} articles and logged delivery")
             
@@ -554,6 +737,7 @@ class NewsDeliverySystem:
             # エラー分類・処理
             await self.monitoring_system.handle_error_with_classification(e, "data_saving")
     
+    @traced('emergency_alerts', category='pipeline')
     async def check_emergency_alerts(self, articles: List[Article]):
         """緊急アラートチェック - CLAUDE.md仕様準拠"""
         try:
@@ -583,14 +767,16 @@ class NewsDeliverySystem:
             # 緊急配信ログ
             if success:
                 recipients = self.config.get('delivery.recipients', [])
-                for recipient in recipients:
-                    self.db.log_delivery(
+                await self.db.log_deliveries([
+                    DeliveryHistory(
                         delivery_type='urgent',
                         recipient_email=recipient,
                         subject=f'緊急ニュースアラート - {len(emergency_articles)}件',
                         article_count=len(emergency_articles),
                         status='sent'
                     )
+                    for recipient in recipients
+                ])
             
         except Exception as e:
             self.logger.error(f"Emergency alert check failed: {e}")
@@ -734,6 +920,34 @@ class NewsDeliverySystem:
         return test_articles
 
 
+def search_articles_cli(query: str, category: Optional[str] = None,
+                        days: Optional[int] = None, limit: int = 20) -> int:
+    """保存済み記事の全文検索結果を表示"""
+    from models.database import Database
+    from models.article_search import SearchQueryError
+    
+    start_date = datetime.now() - timedelta(days=days) if days else None
+    try:
+        hits = Database().search_articles(query, category=category,
+                                          start_date=start_date, limit=limit)
+    except SearchQueryError as e:
+        print(f"検索エラー: {e}")
+        return 2
+    
+    if not hits:
+        print("該当する記事はありません")
+        return 0
+    
+    for i, hit in enumerate(hits, 1):
+        title = hit['translated_title'] or hit['title']
+        published = (hit['published_at'] or '')[:10]
+        print(f"{i:2d}. [{hit['category'] or '-'}] {title} ({published}, 重要度{hit['importance_score']})")
+        if hit['snippet']:
+            print(f"    {hit['snippet']}")
+        print(f"    {hit['url']}")
+    return 0
+
+
 def main():
     """メインエントリーポイント - CLAUDE.md仕様準拠"""
     import argparse
@@ -744,6 +958,11 @@ def main():
     parser.add_argument('--config', help='設定ファイルパス')
     parser.add_argument('--debug', action='store_true', help='デバッグモード')
     parser.add_argument('--test-delivery', action='store_true', help='テスト配信（メール送信なし）')
+    parser.add_argument('--profile', action='store_true', help='サンプリング・プロファイルを採取')
+    parser.add_argument('--search', metavar='QUERY', help='保存済み記事の全文検索')
+    parser.add_argument('--category', help='検索対象カテゴリ（--search と併用）')
+    parser.add_argument('--days', type=int, help='検索対象期間（日数、--search と併用）')
+    parser.add_argument('--limit', type=int, default=20, help='検索結果件数（--search と併用）')
     
     args = parser.parse_args()
     
@@ -751,6 +970,10 @@ def main():
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    if args.search:
+        # 全文検索のみ（配信システムは初期化しない）
+        sys.exit(search_articles_cli(args.search, args.category, args.days, args.limit))
+    
     try:
         system = NewsDeliverySystem()
         
@@ -758,6 +981,10 @@ def main():
         if args.test_delivery:
             system.test_delivery_mode = True
         
+        # プロファイル（--profile または実行中の SIGUSR1 で採取）
+        system.profile_mode = args.profile
+        install_signal_trigger()
+        
         if args.mode == 'daily' or args.test_delivery:
             # 通常の日次処理またはテスト配信
             asyncio.run(system.run())
@@ -0,0 +1,263 @@
+"""
+Article Full-Text Search
+記事全文検索 - SQLite FTS5インデックスと検索クエリ
+"""
+
+import html
+import re
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+
+
+# FTS5 外部コンテンツテーブル（articles をコンテンツとして参照し、トリガーで同期）
+# trigram トークナイザは分かち書きの無い日本語でも部分一致検索できる
+ARTICLE_FTS_SQL = (
+    '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+        title, translated_title, summary, keywords,
+        content='articles', content_rowid='id',
+        tokenize='trigram'
+    )
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+        INSERT INTO articles_fts(rowid, title, translated_title, summary, keywords)
+        VALUES (new.id, new.title, new.translated_title, new.summary, new.keywords);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+        INSERT INTO articles_fts(articles_fts, rowid, title, translated_title, summary, keywords)
+        VALUES ('delete', old.id, old.title, old.translated_title, old.summary, old.keywords);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS articles_fts_update
+    AFTER UPDATE OF title, translated_title, summary, keywords ON articles BEGIN
+        INSERT INTO articles_fts(articles_fts, rowid, title, translated_title, summary, keywords)
+        VALUES ('delete', old.id, old.title, old.translated_title, old.summary, old.keywords);
+        INSERT INTO articles_fts(rowid, title, translated_title, summary, keywords)
+        VALUES (new.id, new.title, new.translated_title, new.summary, new.keywords);
+    END
+    ''',
+)
+
+# インデックスが空で記事がある場合（既存DB）に再構築
+FTS_NEEDS_REBUILD_SQL = '''
+    SELECT EXISTS (SELECT 1 FROM articles)
+       AND NOT EXISTS (SELECT 1 FROM articles_fts_docsize)
+'''
+FTS_REBUILD_SQL = "INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')"
+
+# 列重み（title, translated_title, summary, keywords）
+_COLUMN_WEIGHTS = (('title', 10.0), ('translated_title', 10.0), ('summary', 3.0), ('keywords', 5.0))
+_SEARCH_COLUMNS = tuple(column for column, _ in _COLUMN_WEIGHTS)
+_BM25_WEIGHTS = ', '.join(str(weight) for _, weight in _COLUMN_WEIGHTS)
+
+_FILTER_CONDITIONS = '''
+      AND (? IS NULL OR a.category = ?)
+      AND (? IS NULL OR a.published_at >= ?)
+      AND (? IS NULL OR a.published_at < ?)
+'''
+
+# 一致件数が上限以上あるか（新しい順に上限件目が存在するか）
+SEARCH_MANY_MATCHES_SQL = '''
+    SELECT EXISTS (
+        SELECT rowid FROM articles_fts WHERE articles_fts MATCH ?
+        ORDER BY rowid DESC LIMIT 1 OFFSET ?
+    )
+'''
+
+# 一致件数が少ない場合: 全一致記事を bm25 で順位付け
+SEARCH_ARTICLES_SQL = f'''
+    SELECT a.id, a.url, a.title, a.translated_title, a.summary, a.source_name,
+           a.category, a.importance_score, a.published_at,
+           snippet(articles_fts, -1, ?, ?, '…', 16) AS snippet,
+           bm25(articles_fts, {_BM25_WEIGHTS}) AS rank
+    FROM articles_fts
+    JOIN articles AS a ON a.id = articles_fts.rowid
+    WHERE articles_fts MATCH ?
+{_FILTER_CONDITIONS}
+    ORDER BY rank
+    LIMIT ? OFFSET ?
+'''
+
+# 一致件数が多い場合: bm25 は逆文書頻度の計算で全一致を走査するため、
+# 新しい順の候補だけを列重み付きの一致有無で順位付け（同点は新しい順）
+SEARCH_RECENT_ARTICLES_SQL = f'''
+    WITH candidates AS (
+        SELECT articles_fts.rowid AS id
+        FROM articles_fts
+        JOIN articles AS a ON a.id = articles_fts.rowid
+        WHERE articles_fts MATCH ?
+{_FILTER_CONDITIONS}
+        ORDER BY articles_fts.rowid DESC
+        LIMIT ?
+    )
+    SELECT a.id, a.url, a.title, a.translated_title, a.summary, a.source_name,
+           a.category, a.importance_score, a.published_at,
+           NULL AS snippet,
+           -({{score}}) AS rank
+    FROM candidates
+    JOIN articles AS a ON a.id = candidates.id
+    ORDER BY rank, a.id DESC
+    LIMIT ? OFFSET ?
+'''
+
+# 表示するページ分だけスニペットを作成
+SEARCH_SNIPPETS_SQL = '''
+    SELECT rowid, snippet(articles_fts, -1, ?, ?, '…', 16)
+    FROM articles_fts
+    WHERE articles_fts MATCH ? AND rowid IN ({placeholders})
+'''
+
+# trigram は3文字未満の語を索引で引けないため LIKE で絞り込む
+SEARCH_ARTICLES_SHORT_SQL = f'''
+    SELECT a.id, a.url, a.title, a.translated_title, a.summary, a.source_name,
+           a.category, a.importance_score, a.published_at,
+           NULL AS snippet,
+           0.0 AS rank
+    FROM articles AS a
+    WHERE {{conditions}}
+{_FILTER_CONDITIONS}
+    ORDER BY a.importance_score DESC, a.published_at DESC
+    LIMIT ? OFFSET ?
+'''
+
+_MIN_TRIGRAM_LENGTH = 3
+
+# bm25 で全件順位付けする一致件数の上限（これ以上は新しい順の候補から順位付け）
+DEFAULT_MAX_CANDIDATES = 2000
+
+
+# HTML 用スニペットの一致箇所マーカー（記事本文をエスケープしてから <mark> に置換する）
+SNIPPET_MARKERS = ('\x02', '\x03')
+_MARKED_RE = re.compile('\x02([^\x02\x03]*)\x03')
+
+
+class SearchQueryError(ValueError):
+    """検索クエリが不正"""
+    pass
+
+
+def split_terms(text: str) -> List[str]:
+    """検索文字列を語に分割（空白区切り、"..." はフレーズ）"""
+    terms = []
+    for phrase, word in re.findall(r'"([^"]*)"|(\S+)', text or ''):
+        term = (phrase or word).strip()
+        if term:
+            terms.append(term)
+    return terms
+
+
+def build_match_query(terms: List[str]) -> str:
+    """FTS5 MATCH 式を作成（各語をフレーズとしてクォートしAND結合）"""
+    return ' '.join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+class ArticleSearchQuery:
+    """検索1回分のSQL組み立て（同期/非同期データベース共通）
+
+    実行手順:
+        1. probe() が返すSQLで一致件数が max_candidates 以上かを調べる
+        2. statement(many_matches) の本検索を実行
+        3. snippet_statement() があればページ分のスニペットを取得し apply_snippets()
+
+    3文字未満の語を含む場合は LIKE 検索となり、probe() とスニペットは無い。
+    max_candidates が None の場合は常に bm25 で全一致を順位付けする。
+    """
+
+    def __init__(self, text: str, category: Optional[str] = None,
+                 start_date: Optional[datetime] = None,
+                 end_date: Optional[datetime] = None,
+                 limit: int = 20, offset: int = 0,
+                 highlight: Tuple[str, str] = ('[', ']'),
+                 max_candidates: Optional[int] = DEFAULT_MAX_CANDIDATES):
+        self.terms = split_terms(text)
+        if not self.terms:
+            raise SearchQueryError("検索語が指定されていません")
+
+        start = start_date.isoformat() if start_date else None
+        end = end_date.isoformat() if end_date else None
+        self.filters = (category, category, start, start, end, end)
+        self.page = (max(1, int(limit)), max(0, int(offset)))
+        self.highlight = tuple(highlight)
+        self.max_candidates = None if max_candidates is None else max(1, int(max_candidates))
+        self.uses_index = all(len(t) >= _MIN_TRIGRAM_LENGTH for t in self.terms)
+        self.match = build_match_query(self.terms) if self.uses_index else None
+        self._many_matches = False
+
+    def probe(self) -> Optional[Tuple[str, Tuple]]:
+        """一致件数判定SQL（不要な場合は None）"""
+        if not self.uses_index or self.max_candidates is None:
+            return None
+        return SEARCH_MANY_MATCHES_SQL, (self.match, self.max_candidates - 1)
+
+    def statement(self, many_matches: bool = False) -> Tuple[str, Tuple]:
+        """本検索SQLとパラメータ"""
+        if not self.uses_index:
+            return self._like_statement()
+
+        self._many_matches = bool(many_matches)
+        if not self._many_matches:
+            return SEARCH_ARTICLES_SQL, self.highlight + (self.match,) + self.filters + self.page
+
+        score_terms = []
+        score_params: List[Any] = []
+        for term in self.terms:
+            for column, weight in _COLUMN_WEIGHTS:
+                score_terms.append(f"{weight} * (ifnull(instr(lower(a.{column}), ?), 0) > 0)")
+                score_params.append(term.lower())
+        sql = SEARCH_RECENT_ARTICLES_SQL.format(score=' + '.join(score_terms))
+        params = (self.match,) + self.filters + (self.max_candidates,) + tuple(score_params) + self.page
+        return sql, params
+
+    def snippet_statement(self, hits: List[Dict[str, Any]]) -> Optional[Tuple[str, Tuple]]:
+        """候補から順位付けした場合のスニペット取得SQL（不要な場合は None）"""
+        if not self._many_matches or not hits:
+            return None
+        ids = tuple(hit['id'] for hit in hits)
+        sql = SEARCH_SNIPPETS_SQL.format(placeholders=', '.join('?' * len(ids)))
+        return sql, self.highlight + (self.match,) + ids
+
+    @staticmethod
+    def apply_snippets(hits: List[Dict[str, Any]], rows) -> List[Dict[str, Any]]:
+        snippets = {row[0]: row[1] for row in rows}
+        for hit in hits:
+            hit['snippet'] = snippets.get(hit['id'])
+        return hits
+
+    def _like_statement(self) -> Tuple[str, Tuple]:
+        # 短い語を含む場合は全語をLIKEで評価
+        conditions = []
+        params: List[Any] = []
+        for term in self.terms:
+            pattern = '%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            conditions.append('(' + ' OR '.join(
+                f"a.{column} LIKE ? ESCAPE '\\'" for column in _SEARCH_COLUMNS) + ')')
+            params.extend([pattern] * len(_SEARCH_COLUMNS))
+        sql = SEARCH_ARTICLES_SHORT_SQL.format(conditions=' AND '.join(conditions))
+        return sql, tuple(params) + self.filters + self.page
+
+
+def row_to_search_hit(row) -> Dict[str, Any]:
+    """検索結果行を辞書に変換"""
+    hit = dict(row)
+    hit['rank'] = float(hit['rank'] or 0.0)
+    return hit
+
+
+def html_snippet(snippet: Optional[str], tag: str = 'mark') -> Optional[str]:
+    """SNIPPET_MARKERS で囲んだスニペットをHTML断片に変換
+
+    記事由来のテキストはすべてエスケープし、対になったマーカーだけを tag に置き換える
+    （本文に紛れたマーカー文字は取り除く）。
+    """
+    if snippet is None:
+        return None
+    parts = _MARKED_RE.split(snippet)
+    rendered = []
+    for index, part in enumerate(parts):
+        text = html.escape(part.replace(SNIPPET_MARKERS[0], '').replace(SNIPPET_MARKERS[1], ''))
+        rendered.append(f"<{tag}>{text}</{tag}>" if index % 2 else text)
+    return ''.join(rendered)
@@ -14,9 +14,189 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from contextlib import contextmanager
 import hashlib
+import re
 
 from utils.config import load_config
 from utils.logger import setup_logger
+from models.article_search import (
+    ARTICLE_FTS_SQL, FTS_NEEDS_REBUILD_SQL, FTS_REBUILD_SQL, DEFAULT_MAX_CANDIDATES,
+    ArticleSearchQuery, row_to_search_hit
+)
+
+
+# ----------------------------------------------------------------------
+# 日次集計（ロールアップ） - 同期/非同期データベース共通
+# ----------------------------------------------------------------------
+
+ROLLUP_TABLES_SQL = (
+    '''
+    CREATE TABLE IF NOT EXISTS daily_category_rollup (
+        day TEXT NOT NULL,  -- YYYY-MM-DD
+        category TEXT NOT NULL,
+        article_count INTEGER NOT NULL DEFAULT 0,
+        importance_sum INTEGER NOT NULL DEFAULT 0,
+        high_importance_count INTEGER NOT NULL DEFAULT 0,  -- importance_score >= 8
+        urgent_count INTEGER NOT NULL DEFAULT 0,
+        sentiment_positive INTEGER NOT NULL DEFAULT 0,
+        sentiment_neutral INTEGER NOT NULL DEFAULT 0,
+        sentiment_negative INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, category)
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS daily_keyword_rollup (
+        day TEXT NOT NULL,
+        category TEXT NOT NULL,
+        keyword TEXT NOT NULL,
+        frequency INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, category, keyword)
+    )
+    ''',
+    "CREATE INDEX IF NOT EXISTS idx_keyword_rollup_day_keyword ON daily_keyword_rollup(day, keyword)",
+)
+
+CATEGORY_ROLLUP_UPSERT_SQL = '''
+    INSERT INTO daily_category_rollup (
+        day, category, article_count, importance_sum, high_importance_count,
+        urgent_count, sentiment_positive, sentiment_neutral, sentiment_negative
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(day, category) DO UPDATE SET
+        article_count = article_count + excluded.article_count,
+        importance_sum = importance_sum + excluded.importance_sum,
+        high_importance_count = high_importance_count + excluded.high_importance_count,
+        urgent_count = urgent_count + excluded.urgent_count,
+        sentiment_positive = sentiment_positive + excluded.sentiment_positive,
+        sentiment_neutral = sentiment_neutral + excluded.sentiment_neutral,
+        sentiment_negative = sentiment_negative + excluded.sentiment_negative
+'''
+
+KEYWORD_ROLLUP_UPSERT_SQL = '''
+    INSERT INTO daily_keyword_rollup (day, category, keyword, frequency)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(day, category, keyword) DO UPDATE SET
+        frequency = frequency + excluded.frequency
+'''
+
+SENTIMENT_BUCKETS = ('positive', 'neutral', 'negative')
+UNCATEGORIZED = '未分類'
+# 重要度による件数の基準（緊急は保存済みの importance_score だけで判定し、再構築時と一致させる）
+HIGH_IMPORTANCE_SCORE = 8
+URGENT_IMPORTANCE_SCORE = 10
+
+# 集計日・カテゴリ（articles AS a に対する式。DailyRollupBatch / rollup_day と同じ規則）
+_ROLLUP_DAY_SQL = '''
+    CASE WHEN a.published_at GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*'
+         THEN substr(a.published_at, 1, 10)
+         ELSE substr(a.collected_at, 1, 10) END
+'''
+_ROLLUP_CATEGORY_SQL = "COALESCE(NULLIF(a.category, ''), ?)"
+
+# 集計に無い（日, カテゴリ）の記事があるか（集計導入前のDBや、集計を伴わない書き込みの後）
+ROLLUP_NEEDS_REBUILD_SQL = (f'''
+    SELECT EXISTS (
+        SELECT 1 FROM articles AS a
+        WHERE NOT EXISTS (
+            SELECT 1 FROM daily_category_rollup AS r
+            WHERE r.day = {_ROLLUP_DAY_SQL} AND r.category = {_ROLLUP_CATEGORY_SQL}
+        )
+    )
+''', (UNCATEGORIZED,))
+
+# 記事テーブルからSQLのみで集計を再構築（緊急フラグは保存されないため重要度で数える）
+ROLLUP_REBUILD_SQL = (
+    ("DELETE FROM daily_category_rollup", ()),
+    ("DELETE FROM daily_keyword_rollup", ()),
+    (f'''
+    INSERT INTO daily_category_rollup (
+        day, category, article_count, importance_sum, high_importance_count,
+        urgent_count, sentiment_positive, sentiment_neutral, sentiment_negative
+    )
+    SELECT {_ROLLUP_DAY_SQL} AS day, {_ROLLUP_CATEGORY_SQL} AS cat,
+           COUNT(*),
+           SUM(COALESCE(a.importance_score, 5)),
+           SUM(COALESCE(a.importance_score, 5) >= {HIGH_IMPORTANCE_SCORE}),
+           SUM(COALESCE(a.importance_score, 5) >= {URGENT_IMPORTANCE_SCORE}),
+           SUM(COALESCE(a.sentiment, '') = 'positive'),
+           SUM(COALESCE(a.sentiment, '') NOT IN ('positive', 'negative')),
+           SUM(COALESCE(a.sentiment, '') = 'negative')
+    FROM articles AS a
+    GROUP BY day, cat
+    ''', (UNCATEGORIZED,)),
+    (f'''
+    INSERT INTO daily_keyword_rollup (day, category, keyword, frequency)
+    SELECT day, cat, keyword, COUNT(*)
+    FROM (
+        SELECT DISTINCT a.id, {_ROLLUP_DAY_SQL} AS day, {_ROLLUP_CATEGORY_SQL} AS cat,
+               CAST(k.value AS TEXT) AS keyword
+        FROM articles AS a, json_each(a.keywords) AS k
+        WHERE json_valid(a.keywords) AND k.value IS NOT NULL AND k.value != ''
+    )
+    GROUP BY day, cat, keyword
+    ''', (UNCATEGORIZED,)),
+)
+_DAY_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}')
+
+
+def rollup_day(published_at: Any, collected_at: Any) -> str:
+    """集計日（公開日、無効な場合は収集日）"""
+    for value in (published_at, collected_at):
+        text = value.isoformat() if isinstance(value, datetime) else str(value or '')
+        if _DAY_PATTERN.match(text):
+            return text[:10]
+    return datetime.now().strftime('%Y-%m-%d')
+
+
+def generate_article_hash(article) -> str:
+    """記事のハッシュ値生成（重複チェック用）"""
+    # Handle both dict and Article dataclass objects
+    if hasattr(article, 'title'):  # Article dataclass
+        title = article.title or ''
+        url = article.url or ''
+        published_at = article.published_at.isoformat() if isinstance(article.published_at, datetime) else str(article.published_at)
+    else:  # Dictionary
+        title = article.get('title', '')
+        url = article.get('url', '')
+        published_at = str(article.get('published_at', ''))
+    
+    content = f"{title}{url}{published_at}"
+    return hashlib.md5(content.encode('utf-8')).hexdigest()
+
+
+class DailyRollupBatch:
+    """保存バッチ内の日次集計を積み上げ、UPSERT用の行に変換"""
+    
+    def __init__(self):
+        # (day, category) -> [count, importance_sum, high_importance, urgent, positive, neutral, negative]
+        self.categories: Dict[Tuple[str, str], List[int]] = {}
+        self.keywords: Dict[Tuple[str, str, str], int] = {}
+    
+    def add(self, day: str, category: Optional[str], importance_score: Any,
+            sentiment: Any, keywords: Any):
+        category = category or UNCATEGORIZED
+        try:
+            importance = int(importance_score if importance_score is not None else 5)
+        except (TypeError, ValueError):
+            importance = 5
+        bucket = sentiment if sentiment in SENTIMENT_BUCKETS else 'neutral'
+        
+        row = self.categories.setdefault((day, category), [0] * 7)
+        row[0] += 1
+        row[1] += importance
+        row[2] += 1 if importance >= HIGH_IMPORTANCE_SCORE else 0
+        row[3] += 1 if importance >= URGENT_IMPORTANCE_SCORE else 0
+        row[4 + SENTIMENT_BUCKETS.index(bucket)] += 1
+        
+        for keyword in set(keywords or []):
+            if keyword:
+                key = (day, category, str(keyword))
+                self.keywords[key] = self.keywords.get(key, 0) + 1
+    
+    def category_rows(self) -> List[Tuple]:
+        return [(day, category, *values) for (day, category), values in self.categories.items()]
+    
+    def keyword_rows(self) -> List[Tuple]:
+        return [(day, category, keyword, count)
+                for (day, category, keyword), count in self.keywords.items()]
 
 
 class Database:
@@ -51,10 +231,16 @@ class Database:
                 self._create_cache_table(cursor)
                 self._create_security_vulnerabilities_table(cursor)
                 self._create_system_metrics_table(cursor)
+                self._create_rollup_tables(cursor)
                 
                 # Create indexes
                 self._create_indexes(cursor)
+                self._create_search_index(cursor)
+                
+                conn.commit()
                 
+                # 既存DBで集計に含まれていない記事があればバックフィル
+                self._backfill_rollups_if_needed(cursor)
                 conn.commit()
                 self.logger.info("データベースを正常に初期化しました")
                 
@@ -168,6 +354,11 @@ class Database:
             )
         ''')
     
+    def _create_rollup_tables(self, cursor):
+        """日次集計テーブル作成（週次・月次サマリー用）"""
+        for statement in ROLLUP_TABLES_SQL:
+            cursor.execute(statement)
+    
     def _create_indexes(self, cursor):
         """インデックス作成 - CLAUDE.md仕様準拠"""
         indexes = [
@@ -187,6 +378,15 @@ class Database:
         for index_sql in indexes:
             cursor.execute(index_sql)
     
+    def _create_search_index(self, cursor):
+        """全文検索インデックス（FTS5）作成、既存記事があれば再構築"""
+        for statement in ARTICLE_FTS_SQL:
+            cursor.execute(statement)
+        cursor.execute(FTS_NEEDS_REBUILD_SQL)
+        if cursor.fetchone()[0]:
+            cursor.execute(FTS_REBUILD_SQL)
+            self.logger.info("全文検索インデックスを既存記事から再構築しました")
+    
     @contextmanager
     def get_connection(self):
         """データベース接続コンテキストマネージャー"""
@@ -206,23 +406,13 @@ class Database:
     
     def _generate_article_hash(self, article) -> str:
         """記事のハッシュ値生成（重複チェック用）"""
-        # Handle both dict and Article dataclass objects
-        if hasattr(article, 'title'):  # Article dataclass
-            title = article.title or ''
-            url = article.url or ''
-            published_at = article.published_at.isoformat() if isinstance(article.published_at, datetime) else str(article.published_at)
-        else:  # Dictionary
-            title = article.get('title', '')
-            url = article.get('url', '')
-            published_at = str(article.get('published_at', ''))
-        
-        content = f"{title}{url}{published_at}"
-        return hashlib.md5(content.encode('utf-8')).hexdigest()
+        return generate_article_hash(article)
     
     def save_articles(self, articles) -> int:
         """記事をデータベースに保存 - CLAUDE.md仕様準拠"""
         try:
             saved_count = 0
+            rollups = DailyRollupBatch()
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
@@ -285,7 +475,16 @@ class Database:
                         sentiment, False
                     ))
                     saved_count += 1
-                
+                    
+                    rollups.add(
+                        day=rollup_day(published_at, collected_at),
+                        category=category,
+                        importance_score=importance_score,
+                        sentiment=sentiment,
+                        keywords=keywords
+                    )
+                
+                self._apply_rollups(cursor, rollups)
                 conn.commit()
                 self.logger.info(f"データベースに {saved_count} 件の新しい記事を保存しました")
                 return saved_count
@@ -337,6 +536,169 @@ class Database:
             self.logger.error(f"Error retrieving articles: {e}")
             return []
     
+    # ------------------------------------------------------------------
+    # 日次集計（ロールアップ）
+    # ------------------------------------------------------------------
+    
+    def _apply_rollups(self, cursor, rollups: DailyRollupBatch):
+        """積み上げた集計をUPSERTで反映（記事保存と同一トランザクション）"""
+        if rollups.categories:
+            cursor.executemany(CATEGORY_ROLLUP_UPSERT_SQL, rollups.category_rows())
+        if rollups.keywords:
+            cursor.executemany(KEYWORD_ROLLUP_UPSERT_SQL, rollups.keyword_rows())
+    
+    def _backfill_rollups_if_needed(self, cursor):
+        """集計に含まれていない記事があれば集計を再構築（集計導入前のDB等）"""
+        cursor.execute(*ROLLUP_NEEDS_REBUILD_SQL)
+        if cursor.fetchone()[0]:
+            self._rebuild_rollups(cursor)
+            self.logger.info("日次集計テーブルを既存記事から再構築しました")
+    
+    def rebuild_daily_rollups(self):
+        """日次集計テーブルを記事テーブルから再構築"""
+        with self.get_connection() as conn:
+            self._rebuild_rollups(conn.cursor())
+            conn.commit()
+    
+    def _rebuild_rollups(self, cursor):
+        """記事テーブルからSQLのみで集計を再構築（非同期版 AsyncDatabase と共通定義）"""
+        for statement, params in ROLLUP_REBUILD_SQL:
+            cursor.execute(statement, params)
+    
+    def get_period_summary(self, start_date: datetime, end_date: datetime,
+                           keyword_limit: int = 15,
+                           category_keyword_limit: int = 5) -> Dict[str, Any]:
+        """期間サマリーを日次集計テーブルから取得
+
+        記事本体は読み込まず、集計テーブルへのインデックス付きクエリのみで
+        週次・月次サマリーに必要な統計を返す。
+        """
+        start_day = start_date.strftime('%Y-%m-%d')
+        end_day = end_date.strftime('%Y-%m-%d')
+        summary = {
+            'start_date': start_day,
+            'end_date': end_day,
+            'total_articles': 0,
+            'importance_sum': 0,
+            'avg_importance': 0.0,
+            'high_importance_count': 0,
+            'urgent_count': 0,
+            'sentiment_distribution': {bucket: 0 for bucket in SENTIMENT_BUCKETS},
+            'daily_counts': {},
+            'categories': {},
+            'top_keywords': []
+        }
+        
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                # カテゴリ別
+                cursor.execute('''
+                    SELECT category,
+                           SUM(article_count) AS count,
+                           SUM(importance_sum) AS importance_sum,
+                           SUM(high_importance_count) AS high_importance_count,
+                           SUM(urgent_count) AS urgent_count,
+                           SUM(sentiment_positive) AS positive,
+                           SUM(sentiment_neutral) AS neutral,
+                           SUM(sentiment_negative) AS negative
+                    FROM daily_category_rollup
+                    WHERE day BETWEEN ? AND ?
+                    GROUP BY category
+                    ORDER BY count DESC, category
+                ''', (start_day, end_day))
+                
+                for row in cursor.fetchall():
+                    count = row['count']
+                    summary['categories'][row['category']] = {
+                        'count': count,
+                        'importance_sum': row['importance_sum'],
+                        'avg_importance': row['importance_sum'] / count if count else 0.0,
+                        'high_importance_count': row['high_importance_count'],
+                        'urgent_count': row['urgent_count'],
+                        'top_keywords': []
+                    }
+                    summary['total_articles'] += count
+                    summary['importance_sum'] += row['importance_sum']
+                    summary['high_importance_count'] += row['high_importance_count']
+                    summary['urgent_count'] += row['urgent_count']
+                    for bucket in SENTIMENT_BUCKETS:
+                        summary['sentiment_distribution'][bucket] += row[bucket]
+                
+                if summary['total_articles']:
+                    summary['avg_importance'] = summary['importance_sum'] / summary['total_articles']
+                
+                # 日別件数
+                cursor.execute('''
+                    SELECT day, SUM(article_count) FROM daily_category_rollup
+                    WHERE day BETWEEN ? AND ?
+                    GROUP BY day ORDER BY day
+                ''', (start_day, end_day))
+                summary['daily_counts'] = {day: count for day, count in cursor.fetchall()}
+                
+                # 全体のトレンドキーワード
+                cursor.execute('''
+                    SELECT keyword, SUM(frequency) AS frequency FROM daily_keyword_rollup
+                    WHERE day BETWEEN ? AND ?
+                    GROUP BY keyword
+                    ORDER BY frequency DESC, keyword
+                    LIMIT ?
+                ''', (start_day, end_day, keyword_limit))
+                summary['top_keywords'] = [(row['keyword'], row['frequency']) for row in cursor.fetchall()]
+                
+                # カテゴリ別上位キーワード
+                cursor.execute('''
+                    SELECT category, keyword FROM (
+                        SELECT category, keyword,
+                               ROW_NUMBER() OVER (
+                                   PARTITION BY category
+                                   ORDER BY SUM(frequency) DESC, keyword
+                               ) AS rank
+                        FROM daily_keyword_rollup
+                        WHERE day BETWEEN ? AND ?
+                        GROUP BY category, keyword
+                    )
+                    WHERE rank <= ?
+                    ORDER BY category, rank
+                ''', (start_day, end_day, category_keyword_limit))
+                for row in cursor.fetchall():
+                    if row['category'] in summary['categories']:
+                        summary['categories'][row['category']]['top_keywords'].append(row['keyword'])
+                
+                return summary
+                
+        except Exception as e:
+            self.logger.error(f"Error getting period summary: {e}")
+            return summary
+
+    def search_articles(self, query: str,
+                        category: Optional[str] = None,
+                        start_date: Optional[datetime] = None,
+                        end_date: Optional[datetime] = None,
+                        limit: int = 20,
+                        offset: int = 0,
+                        highlight: Tuple[str, str] = ('[', ']'),
+                        max_candidates: Optional[int] = DEFAULT_MAX_CANDIDATES) -> List[Dict[str, Any]]:
+        """全文検索（タイトル・翻訳タイトル・要約・キーワード）
+
+        一致が max_candidates 件未満なら全一致を関連度順（bm25）、それ以上なら
+        新しい max_candidates 件を列重み付きで順位付けする。結果は一致箇所を
+        highlight で囲んだ snippet を含む。不正な検索語は SearchQueryError を送出する。
+        """
+        search = ArticleSearchQuery(query, category, start_date, end_date, limit, offset,
+                                    highlight, max_candidates)
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            probe = search.probe()
+            many_matches = bool(probe and cursor.execute(*probe).fetchone()[0])
+            cursor.execute(*search.statement(many_matches))
+            hits = [row_to_search_hit(row) for row in cursor.fetchall()]
+            snippets = search.snippet_statement(hits)
+            if snippets:
+                search.apply_snippets(hits, cursor.execute(*snippets).fetchall())
+            return hits
+    
     def log_delivery(self, 
                     delivery_type: str,
                     recipient_email: str,
@@ -461,6 +823,10 @@ class Database:
                 cursor.execute("DELETE FROM articles WHERE published_at < ?", (article_cutoff,))
                 articles_deleted = cursor.rowcount
                 
+                # 保持期間外の日次集計も削除
+                cursor.execute("DELETE FROM daily_category_rollup WHERE day < ?", (article_cutoff[:10],))
+                cursor.execute("DELETE FROM daily_keyword_rollup WHERE day < ?", (article_cutoff[:10],))
+                
                 # Cleanup old delivery history
                 delivery_cutoff = (datetime.now() - timedelta(
                     days=self.config.get('data_retention', 'delivery_history_days', default=90)
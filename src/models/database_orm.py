@@ -20,6 +20,14 @@ from dataclasses import dataclass, asdict
 
 from utils.config import load_config
 from utils.logger import setup_logger
+from models.database import (
+    ROLLUP_TABLES_SQL, ROLLUP_NEEDS_REBUILD_SQL, ROLLUP_REBUILD_SQL,
+    CATEGORY_ROLLUP_UPSERT_SQL, KEYWORD_ROLLUP_UPSERT_SQL, DailyRollupBatch, generate_article_hash, rollup_day
+)
+from models.article_search import (
+    ARTICLE_FTS_SQL, FTS_NEEDS_REBUILD_SQL, FTS_REBUILD_SQL, DEFAULT_MAX_CANDIDATES,
+    ArticleSearchQuery, row_to_search_hit
+)
 
 
 @dataclass
@@ -85,52 +93,174 @@ class ApiUsage:
             self.created_at = datetime.now()
 
 
+# 接続ごとに一度だけ適用するPRAGMA
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",  # 64MB cache
+    "PRAGMA temp_store=memory",
+    "PRAGMA busy_timeout=30000",
+)
+
+# 固定SQL（同一文字列を使い回し、接続の文キャッシュで準備済み文として再利用）
+_INSERT_ARTICLE_SQL = '''
+    INSERT INTO articles (
+        url, url_hash, title, translated_title, description, content,
+        translated_content, summary, source_name, author, published_at,
+        collected_at, category, importance_score, keywords, sentiment, processed
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(url) DO NOTHING
+'''
+
+_EXISTING_ARTICLES_SQL = '''
+    SELECT url, url_hash FROM articles
+    WHERE url IN (SELECT value FROM json_each(?))
+       OR url_hash IN (SELECT value FROM json_each(?))
+'''
+
+_SELECT_ARTICLES_SQL = '''
+    SELECT * FROM articles
+    WHERE published_at >= ? AND importance_score >= ?
+      AND (? IS NULL OR category = ?)
+      AND (? = 0 OR processed = 1)
+    ORDER BY importance_score DESC, published_at DESC
+    LIMIT ?
+'''
+
+_SELECT_URGENT_ARTICLES_SQL = '''
+    SELECT * FROM articles
+    WHERE importance_score >= ?
+    ORDER BY importance_score DESC, published_at DESC
+'''
+
+_INSERT_DELIVERY_SQL = '''
+    INSERT INTO delivery_history (
+        delivery_type, recipient_email, subject, article_count,
+        categories, status, error_message, html_path, pdf_path, delivered_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
 class AsyncDatabase:
-    """非同期SQLiteデータベース管理クラス - 高パフォーマンス実装"""
+    """非同期SQLiteデータベース管理クラス - 高パフォーマンス実装
+
+    書き込みは長寿命の単一接続に直列化し、読み取りはWALモードの
+    小さな読み取り専用接続プールで並行に処理する。PRAGMAは接続の
+    オープン時に一度だけ適用する。同期版 Database と同じ news.db を共有する。
+    """
     
-    def __init__(self, config=None):
+    def __init__(self, config=None, read_pool_size: int = 2):
         self.config = config or load_config()
         self.logger = setup_logger(__name__)
-        self.db_path = self.config.get_storage_path('database') / 'news_system.db'
+        db_dir = self.config.get_storage_path('database')
+        db_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_dir / 'news.db'
         
         # バッチ処理設定
         self.batch_size = 100
         self.connection_timeout = 30.0
+        self.read_pool_size = max(0, read_pool_size)
+        self.cached_statements = 256
         
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._write_lock = asyncio.Lock()
+        self._readers: List[aiosqlite.Connection] = []
+        self._reader_pool: Optional[asyncio.Queue] = None
+        self._open_lock = asyncio.Lock()
+        self._initialized = False
+    
+    async def __aenter__(self) -> 'AsyncDatabase':
+        await self.initialize()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
     async def initialize(self):
-        """データベースの非同期初期化"""
-        try:
-            async with self.get_connection() as conn:
-                await self._create_tables(conn)
-                await self._create_indexes(conn)
-                await conn.commit()
+        """データベースの非同期初期化（接続オープン・スキーマ作成）"""
+        async with self._open_lock:
+            if self._initialized:
+                return
+            try:
+                self._writer = await self._open_connection()
+                await self._writer.execute("PRAGMA journal_mode=WAL")
+                await self._create_tables(self._writer)
+                await self._create_indexes(self._writer)
+                await self._writer.commit()
+                
+                self._reader_pool = asyncio.Queue()
+                for _ in range(self.read_pool_size):
+                    reader = await self._open_connection()
+                    await reader.execute("PRAGMA query_only=ON")
+                    self._readers.append(reader)
+                    self._reader_pool.put_nowait(reader)
+                
+                self._initialized = True
                 self.logger.info("Async database initialized successfully")
                 
-        except Exception as e:
-            self.logger.error(f"Async database initialization failed: {e}")
-            raise
+            except Exception as e:
+                self.logger.error(f"Async database initialization failed: {e}")
+                await self._close_connections()
+                raise
+    
+    async def close(self):
+        """全接続のクローズ"""
+        async with self._open_lock:
+            await self._close_connections()
+    
+    async def _close_connections(self):
+        connections = self._readers + ([self._writer] if self._writer else [])
+        self._writer = None
+        self._readers = []
+        self._reader_pool = None
+        self._initialized = False
+        for conn in connections:
+            try:
+                await conn.close()
+            except Exception as e:
+                self.logger.debug(f"Error closing connection: {e}")
+    
+    async def _open_connection(self) -> aiosqlite.Connection:
+        """接続オープンとPRAGMA適用（接続ごとに一度）"""
+        conn = await aiosqlite.connect(
+            str(self.db_path),
+            timeout=self.connection_timeout,
+            cached_statements=self.cached_statements
+        )
+        conn.row_factory = aiosqlite.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            await conn.execute(pragma)
+        return conn
     
     @asynccontextmanager
     async def get_connection(self):
-        """非同期データベース接続コンテキストマネージャー"""
-        conn = None
+        """書き込み用接続（長寿命・排他）"""
+        if not self._initialized:
+            await self.initialize()
+        async with self._write_lock:
+            conn = self._writer
+            try:
+                yield conn
+            except Exception as e:
+                await conn.rollback()
+                self.logger.error(f"Async database connection error: {e}")
+                raise
+    
+    @asynccontextmanager
+    async def _read_connection(self):
+        """読み取り用接続（プールから貸し出し、空きが無ければ待機）"""
+        if not self._initialized:
+            await self.initialize()
+        if not self._readers:
+            # 読み取りプール無効時は書き込み接続を共有
+            async with self.get_connection() as conn:
+                yield conn
+            return
+        pool = self._reader_pool
+        conn = await pool.get()
         try:
-            conn = await aiosqlite.connect(str(self.db_path), timeout=self.connection_timeout)
-            conn.row_factory = aiosqlite.Row
-            # パフォーマンス最適化
-            await conn.execute("PRAGMA journal_mode=WAL")
-            await conn.execute("PRAGMA synchronous=NORMAL")
-            await conn.execute("PRAGMA cache_size=-64000")  # 64MB cache
-            await conn.execute("PRAGMA temp_store=memory")
             yield conn
-        except Exception as e:
-            if conn:
-                await conn.rollback()
-            self.logger.error(f"Async database connection error: {e}")
-            raise
         finally:
-            if conn:
-                await conn.close()
+            pool.put_nowait(conn)
     
     async def _create_tables(self, conn):
         """テーブル作成 - CLAUDE.md仕様準拠"""
@@ -200,6 +330,26 @@ class AsyncDatabase:
             )
         ''')
     
+    async def _create_rollup_tables(self, conn):
+        """日次集計テーブル作成と、集計に含まれていない記事のバックフィル（同期版 Database と共通定義）"""
+        for statement in ROLLUP_TABLES_SQL:
+            await conn.execute(statement)
+        async with conn.execute(*ROLLUP_NEEDS_REBUILD_SQL) as cursor:
+            needs_rebuild = (await cursor.fetchone())[0]
+        if needs_rebuild:
+            for statement, params in ROLLUP_REBUILD_SQL:
+                await conn.execute(statement, params)
+            self.logger.info("Rebuilt daily rollup tables from existing articles")
+    
+    async def _create_search_index(self, conn):
+        """全文検索インデックス（FTS5、同期版 Database と共通定義）"""
+        for statement in ARTICLE_FTS_SQL:
+            await conn.execute(statement)
+        async with conn.execute(FTS_NEEDS_REBUILD_SQL) as cursor:
+            needs_rebuild = (await cursor.fetchone())[0]
+        if needs_rebuild:
+            await conn.execute(FTS_REBUILD_SQL)
+    
     async def _create_indexes(self, conn):
         """インデックス作成 - パフォーマンス最適化"""
         indexes = [
@@ -218,101 +368,99 @@ class AsyncDatabase:
         
         for index_sql in indexes:
             await conn.execute(index_sql)
+        
+        await self._create_rollup_tables(conn)
+        await self._create_search_index(conn)
     
     def _generate_url_hash(self, url: str) -> str:
-        """URL ハッシュ生成（重複チェック用）"""
+        """URL ハッシュ生成"""
         return hashlib.md5(url.encode('utf-8')).hexdigest()
     
+    @staticmethod
+    def _field(article, name: str, default: Any = None) -> Any:
+        """Article/辞書のどちらからもフィールド取得"""
+        if isinstance(article, dict):
+            return article.get(name, default)
+        return getattr(article, name, default)
+    
+    @classmethod
+    def _article_params(cls, article, url_hash: str) -> Tuple:
+        """INSERT用パラメータ（Article/辞書のどちらにも対応）"""
+        def get(name, default=None):
+            return cls._field(article, name, default)
+        
+        category = get('category')
+        if hasattr(category, 'value'):
+            category = category.value
+        published_at = get('published_at')
+        collected_at = get('collected_at') or datetime.now()
+        return (
+            get('url'), url_hash, get('title'), get('translated_title'),
+            get('description'), get('content'), get('translated_content'),
+            get('summary'), get('source_name'), get('author'),
+            published_at.isoformat() if isinstance(published_at, datetime) else published_at,
+            collected_at.isoformat() if isinstance(collected_at, datetime) else str(collected_at),
+            str(category) if category else None,
+            get('importance_score', 5),
+            json.dumps(get('keywords') or [], ensure_ascii=False),
+            get('sentiment', 'neutral') or 'neutral',
+            bool(get('processed', False))
+        )
+    
     async def save_article(self, article: Article) -> bool:
         """単一記事の保存"""
-        try:
-            async with self.get_connection() as conn:
-                url_hash = self._generate_url_hash(article.url)
-                
-                # 重複チェック
-                async with conn.execute("SELECT id FROM articles WHERE url_hash = ?", (url_hash,)) as cursor:
-                    if await cursor.fetchone():
-                        self.logger.debug(f"Article already exists: {article.title}")
-                        return False
-                
-                # 記事挿入
-                await conn.execute('''
-                    INSERT INTO articles (
-                        url, url_hash, title, translated_title, description, content,
-                        translated_content, summary, source_name, author, published_at,
-                        collected_at, category, importance_score, keywords, sentiment, processed
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    article.url, url_hash, article.title, article.translated_title,
-                    article.description, article.content, article.translated_content,
-                    article.summary, article.source_name, article.author,
-                    article.published_at.isoformat() if article.published_at else None,
-                    article.collected_at.isoformat() if article.collected_at else datetime.now().isoformat(),
-                    article.category, article.importance_score,
-                    json.dumps(article.keywords, ensure_ascii=False),
-                    article.sentiment, article.processed
-                ))
-                
-                await conn.commit()
-                self.logger.debug(f"Saved article: {article.title}")
-                return True
-                
-        except Exception as e:
-            self.logger.error(f"Error saving article: {e}")
-            return False
+        return await self.save_articles_batch([article]) > 0
     
     async def save_articles_batch(self, articles: List[Article]) -> int:
-        """記事のバッチ保存 - 高パフォーマンス"""
+        """記事のバッチ保存 - 高パフォーマンス
+
+        重複は URL・記事ハッシュの両方で判定し（同期版 Database と同じ規則）、
+        新規記事の挿入と日次集計の更新を同一トランザクションで行う。
+        """
         saved_count = 0
         
         try:
             async with self.get_connection() as conn:
+                rollups = DailyRollupBatch()
+                
                 # バッチサイズごとに分割処理
                 for i in range(0, len(articles), self.batch_size):
                     batch = articles[i:i + self.batch_size]
+                    params = [self._article_params(article, generate_article_hash(article))
+                              for article in batch]
                     
-                    # 重複チェック用ハッシュ生成
-                    url_hashes = [self._generate_url_hash(article.url) for article in batch]
-                    
-                    # 既存記事チェック
-                    placeholders = ','.join(['?' for _ in url_hashes])
-                    existing_query = f"SELECT url_hash FROM articles WHERE url_hash IN ({placeholders})"
-                    
-                    async with conn.execute(existing_query, url_hashes) as cursor:
-                        existing_hashes = {row[0] for row in await cursor.fetchall()}
+                    # 既存記事チェック（固定SQL + JSON配列パラメータ）
+                    async with conn.execute(_EXISTING_ARTICLES_SQL, (
+                        json.dumps([p[0] for p in params]),
+                        json.dumps([p[1] for p in params])
+                    )) as cursor:
+                        existing = set()
+                        for row in await cursor.fetchall():
+                            existing.update((row[0], row[1]))
                     
-                    # 新規記事のみ挿入
-                    new_articles = [
-                        article for article in batch 
-                        if self._generate_url_hash(article.url) not in existing_hashes
-                    ]
+                    # 新規記事のみ挿入（バッチ内の重複も除外）
+                    new_params = []
+                    for article, p in zip(batch, params):
+                        if p[0] in existing or p[1] in existing:
+                            continue
+                        existing.update((p[0], p[1]))
+                        new_params.append(p)
+                        rollups.add(
+                            day=rollup_day(p[10], p[11]),
+                            category=p[12],
+                            importance_score=p[13],
+                            sentiment=p[15],
+                            keywords=self._field(article, 'keywords', [])
+                        )
                     
-                    if new_articles:
-                        # バッチ挿入用データ準備
-                        insert_data = []
-                        for article in new_articles:
-                            url_hash = self._generate_url_hash(article.url)
-                            insert_data.append((
-                                article.url, url_hash, article.title, article.translated_title,
-                                article.description, article.content, article.translated_content,
-                                article.summary, article.source_name, article.author,
-                                article.published_at.isoformat() if article.published_at else None,
-                                article.collected_at.isoformat() if article.collected_at else datetime.now().isoformat(),
-                                article.category, article.importance_score,
-                                json.dumps(article.keywords, ensure_ascii=False),
-                                article.sentiment, article.processed
-                            ))
-                        
-                        # バッチ挿入実行
-                        await conn.executemany('''
-                            INSERT INTO articles (
-                                url, url_hash, title, translated_title, description, content,
-                                translated_content, summary, source_name, author, published_at,
-                                collected_at, category, importance_score, keywords, sentiment, processed
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ''', insert_data)
-                        
-                        saved_count += len(new_articles)
+                    if new_params:
+                        await conn.executemany(_INSERT_ARTICLE_SQL, new_params)
+                        saved_count += len(new_params)
+                
+                if rollups.categories:
+                    await conn.executemany(CATEGORY_ROLLUP_UPSERT_SQL, rollups.category_rows())
+                if rollups.keywords:
+                    await conn.executemany(KEYWORD_ROLLUP_UPSERT_SQL, rollups.keyword_rows())
                 
                 await conn.commit()
                 self.logger.info(f"Batch saved {saved_count} new articles")
@@ -320,7 +468,7 @@ class AsyncDatabase:
                 
         except Exception as e:
             self.logger.error(f"Error in batch save: {e}")
-            return saved_count
+            return 0
     
     async def get_articles(self, 
                           category: Optional[str] = None,
@@ -328,64 +476,67 @@ class AsyncDatabase:
                           min_importance: int = 0,
                           limit: int = 100,
                           processed_only: bool = False) -> List[Dict[str, Any]]:
-        """記事取得 - 柔軟な検索条件"""
+        """記事取得 - 柔軟な検索条件（固定SQLで条件をパラメータ化）"""
         try:
-            async with self.get_connection() as conn:
-                query = "SELECT * FROM articles WHERE published_at >= ? AND importance_score >= ?"
-                params = [
+            async with self._read_connection() as conn:
+                params = (
                     (datetime.now() - timedelta(days=days_back)).isoformat(),
-                    min_importance
-                ]
-                
-                if category:
-                    query += " AND category = ?"
-                    params.append(category)
-                
-                if processed_only:
-                    query += " AND processed = 1"
-                
-                query += " ORDER BY importance_score DESC, published_at DESC LIMIT ?"
-                params.append(limit)
-                
-                async with conn.execute(query, params) as cursor:
+                    min_importance,
+                    category, category,
+                    1 if processed_only else 0,
+                    limit
+                )
+                async with conn.execute(_SELECT_ARTICLES_SQL, params) as cursor:
                     rows = await cursor.fetchall()
                 
-                articles = []
-                for row in rows:
-                    article = dict(row)
-                    # JSON フィールドのパース
-                    if article['keywords']:
-                        article['keywords'] = json.loads(article['keywords'])
-                    articles.append(article)
-                
-                return articles
+                return [self._row_to_article(row) for row in rows]
                 
         except Exception as e:
             self.logger.error(f"Error retrieving articles: {e}")
             return []
     
+    async def search_articles(self, query: str,
+                              category: Optional[str] = None,
+                              start_date: Optional[datetime] = None,
+                              end_date: Optional[datetime] = None,
+                              limit: int = 20,
+                              offset: int = 0,
+                              highlight: Tuple[str, str] = ('[', ']'),
+                              max_candidates: Optional[int] = DEFAULT_MAX_CANDIDATES) -> List[Dict[str, Any]]:
+        """全文検索（関連度順・スニペット付き、読み取りプールを使用）"""
+        search = ArticleSearchQuery(query, category, start_date, end_date, limit, offset,
+                                    highlight, max_candidates)
+        async with self._read_connection() as conn:
+            many_matches = False
+            probe = search.probe()
+            if probe:
+                async with conn.execute(*probe) as cursor:
+                    many_matches = bool((await cursor.fetchone())[0])
+            async with conn.execute(*search.statement(many_matches)) as cursor:
+                hits = [row_to_search_hit(row) for row in await cursor.fetchall()]
+            snippets = search.snippet_statement(hits)
+            if snippets:
+                async with conn.execute(*snippets) as cursor:
+                    search.apply_snippets(hits, await cursor.fetchall())
+        return hits
+    
+    @staticmethod
+    def _row_to_article(row) -> Dict[str, Any]:
+        article = dict(row)
+        # JSON フィールドのパース
+        if article['keywords']:
+            article['keywords'] = json.loads(article['keywords'])
+        return article
+    
     async def get_urgent_articles(self, cvss_threshold: float = 9.0, 
                                  importance_threshold: int = 10) -> List[Dict[str, Any]]:
         """緊急記事の取得"""
         try:
-            async with self.get_connection() as conn:
-                query = """
-                    SELECT * FROM articles 
-                    WHERE importance_score >= ? 
-                    ORDER BY importance_score DESC, published_at DESC
-                """
-                
-                async with conn.execute(query, (importance_threshold,)) as cursor:
+            async with self._read_connection() as conn:
+                async with conn.execute(_SELECT_URGENT_ARTICLES_SQL, (importance_threshold,)) as cursor:
                     rows = await cursor.fetchall()
                 
-                articles = []
-                for row in rows:
-                    article = dict(row)
-                    if article['keywords']:
-                        article['keywords'] = json.loads(article['keywords'])
-                    articles.append(article)
-                
-                return articles
+                return [self._row_to_article(row) for row in rows]
                 
         except Exception as e:
             self.logger.error(f"Error retrieving urgent articles: {e}")
@@ -408,26 +559,30 @@ class AsyncDatabase:
     
     async def log_delivery(self, delivery: DeliveryHistory) -> bool:
         """配信履歴の記録"""
+        return await self.log_deliveries([delivery]) > 0
+    
+    async def log_deliveries(self, deliveries: List[DeliveryHistory]) -> int:
+        """配信履歴の一括記録（単一トランザクション）"""
+        if not deliveries:
+            return 0
         try:
             async with self.get_connection() as conn:
-                await conn.execute('''
-                    INSERT INTO delivery_history (
-                        delivery_type, recipient_email, subject, article_count,
-                        categories, status, error_message, html_path, pdf_path, delivered_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    delivery.delivery_type, delivery.recipient_email, delivery.subject,
-                    delivery.article_count, json.dumps(delivery.categories, ensure_ascii=False),
-                    delivery.status, delivery.error_message, delivery.html_path,
-                    delivery.pdf_path, delivery.delivered_at.isoformat()
-                ))
+                await conn.executemany(_INSERT_DELIVERY_SQL, [
+                    (
+                        delivery.delivery_type, delivery.recipient_email, delivery.subject,
+                        delivery.article_count, json.dumps(delivery.categories, ensure_ascii=False),
+                        delivery.status, delivery.error_message, delivery.html_path,
+                        delivery.pdf_path, delivery.delivered_at.isoformat()
+                    )
+                    for delivery in deliveries
+                ])
                 
                 await conn.commit()
-                return True
+                return len(deliveries)
                 
         except Exception as e:
             self.logger.error(f"Error logging delivery: {e}")
-            return False
+            return 0
     
     async def log_api_usage(self, usage: ApiUsage) -> bool:
         """API使用履歴の記録"""
@@ -454,7 +609,7 @@ class AsyncDatabase:
     async def get_delivery_statistics(self, days_back: int = 30) -> Dict[str, Any]:
         """配信統計の取得"""
         try:
-            async with self.get_connection() as conn:
+            async with self._read_connection() as conn:
                 cutoff_date = (datetime.now() - timedelta(days=days_back)).isoformat()
                 
                 # 配信成功率
@@ -495,7 +650,7 @@ class AsyncDatabase:
     async def get_api_statistics(self, days_back: int = 30) -> Dict[str, Any]:
         """API使用統計の取得"""
         try:
-            async with self.get_connection() as conn:
+            async with self._read_connection() as conn:
                 cutoff_date = (datetime.now() - timedelta(days=days_back)).isoformat()
                 
                 async with conn.execute('''
@@ -536,6 +691,8 @@ class AsyncDatabase:
                 article_cutoff = (datetime.now() - timedelta(days=articles_days)).isoformat()
                 result = await conn.execute("DELETE FROM articles WHERE published_at < ?", (article_cutoff,))
                 cleanup_counts['articles'] = result.rowcount
+                await conn.execute("DELETE FROM daily_category_rollup WHERE day < ?", (article_cutoff[:10],))
+                await conn.execute("DELETE FROM daily_keyword_rollup WHERE day < ?", (article_cutoff[:10],))
                 
                 # 古い配信履歴削除
                 delivery_cutoff = (datetime.now() - timedelta(days=delivery_days)).isoformat()
@@ -21,6 +21,7 @@ import statistics
 from ..utils.path_resolver import get_path_resolver
 from ..utils.config import get_config
 from ..utils.logger import setup_logger
+from ..utils.metrics import STAGE_DURATION_METRIC, STAGE_EVENTS_METRIC, get_metrics_registry
 
 
 class MetricsCollector:
@@ -332,20 +333,41 @@ class MetricsCollector:
             return {'status': 'error', 'message': str(e)}
     
     async def _gather_api_metrics(self) -> Dict[str, Any]:
-        """API使用状況メトリクス"""
-        api_metrics = {}
-        
-        # 各APIの使用状況を取得
-        for api_name in ['newsapi', 'deepl', 'claude', 'gnews', 'nvd']:
-            if self.config.is_service_enabled(api_name):
-                # APIごとの統計（実際の実装では各コレクターから取得）
-                api_metrics[api_name] = {
-                    'enabled': True,
-                    'requests_today': 0,  # 実装時は実際の値を取得
-                    'rate_limit_remaining': 100,  # 実装時は実際の値を取得
-                    'last_request': None,
-                    'average_response_time': 0,
-                }
+        """API使用状況メトリクス（プロセス起動以降、メトリクスレジストリに記録された値）"""
+        api_names = [name for name in ['newsapi', 'deepl', 'claude', 'gnews', 'nvd']
+                     if self.config.is_service_enabled(name)]
+        api_metrics = {
+            name: {'enabled': True, 'requests_total': 0, 'failures_total': 0,
+                   'rate_limit_hits': 0, 'average_response_time': 0, 'p95_response_time': None}
+            for name in api_names
+        }
+        
+        registry = get_metrics_registry()
+        events = registry.get(STAGE_EVENTS_METRIC)
+        if events is not None:
+            for labels, child in events.children():
+                stats = api_metrics.get(labels['service'])
+                if stats is None:
+                    continue
+                if labels['event'] in ('request_made', 'api_call'):
+                    stats['requests_total'] += int(child.value)
+                elif labels['event'] in ('request_failed', 'error'):
+                    stats['failures_total'] += int(child.value)
+                elif labels['event'] == 'rate_limit_hit':
+                    stats['rate_limit_hits'] += int(child.value)
+        
+        latency = registry.get(STAGE_DURATION_METRIC)
+        if latency is not None:
+            totals: Dict[str, List[float]] = {}
+            for labels, child in latency.children():
+                stats = api_metrics.get(labels['service'])
+                if stats is None or not child.count:
+                    continue
+                total = totals.setdefault(labels['service'], [0.0, 0])
+                total[0] += child.sum
+                total[1] += child.count
+                stats['average_response_time'] = total[0] / total[1]
+                stats['p95_response_time'] = max(stats['p95_response_time'] or 0.0, child.quantile(0.95))
         
         return api_metrics
     
@@ -22,10 +22,15 @@ from email.mime.base import MIMEBase
 from email import encoders
 import numpy as np
 from sklearn.ensemble import IsolationForest
-from sklearn.preprocessing import StandardScaler
 import pickle
 import os
 
+try:
+    from ..utils.online_stats import StreamingStatistics
+except ImportError:
+    # src/ をパスに追加して monitoring をトップレベルパッケージとして読み込んだ場合
+    from utils.online_stats import StreamingStatistics
+
 logger = logging.getLogger(__name__)
 
 class AlertSeverity(Enum):
@@ -114,12 +119,17 @@ class Alert:
 class DynamicThresholdManager:
     """動的閾値管理システム"""
     
+    HISTORY_SIZE = 1000  # 統計を取る直近の件数
+    THRESHOLD_QUANTILE = 0.975  # 分位点ベースの閾値に使う分位
+    EWMA_ALPHA = 0.1
+    
     def __init__(self, db_path: str = "thresholds.db"):
         self.db_path = db_path
         self.thresholds: Dict[str, ThresholdConfig] = {}
-        self.metrics_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
-        self.models: Dict[str, IsolationForest] = {}
-        self.scalers: Dict[str, StandardScaler] = {}
+        self.metrics_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=self.HISTORY_SIZE))
+        self.statistics: Dict[str, StreamingStatistics] = defaultdict(
+            lambda: StreamingStatistics(self.HISTORY_SIZE, self.EWMA_ALPHA, self.THRESHOLD_QUANTILE)
+        )
         self.last_update: Dict[str, datetime] = {}
         
         self._init_database()
@@ -172,11 +182,12 @@ class DynamicThresholdManager:
         if timestamp is None:
             timestamp = datetime.now()
         
-        # 履歴に追加
+        # 履歴と逐次統計に追加
         self.metrics_history[metric_name].append({
             'value': value,
             'timestamp': timestamp
         })
+        self.statistics[metric_name].add(value)
         
         # 閾値を更新（一定間隔で）
         last_update = self.last_update.get(metric_name, datetime.min)
@@ -185,35 +196,31 @@ class DynamicThresholdManager:
             self.last_update[metric_name] = timestamp
     
     def _update_threshold(self, metric_name: str):
-        """指定メトリクスの動的閾値を更新"""
+        """指定メトリクスの動的閾値を更新（逐次統計を読むだけなので O(1)）"""
         if metric_name not in self.thresholds:
             return
         
         config = self.thresholds[metric_name]
-        history = list(self.metrics_history[metric_name])
+        stats = self.statistics.get(metric_name)
         
-        if len(history) < 10:  # 最小データ数
+        if stats is None or stats.count < 10:  # 最小データ数
             return
         
-        values = [item['value'] for item in history]
-        
         # 統計的閾値計算
-        mean = np.mean(values)
-        std = np.std(values)
-        statistical_threshold = mean + (config.std_multiplier * std)
+        statistical_threshold = stats.moments.mean + (config.std_multiplier * stats.moments.std)
         
         # トレンド分析
-        trend_threshold = self._calculate_trend_based_threshold(values, config)
+        trend_threshold = self._calculate_trend_based_threshold(stats, config)
         
-        # 機械学習による異常検知
-        ml_threshold = self._calculate_ml_based_threshold(metric_name, values)
+        # 分布の上側分位点
+        quantile_threshold = self._calculate_quantile_based_threshold(stats)
         
         # 最終閾値を決定（複数手法の統合）
-        candidates = [statistical_threshold, trend_threshold, ml_threshold]
+        candidates = [statistical_threshold, trend_threshold, quantile_threshold]
         candidates = [t for t in candidates if t is not None]
         
         if candidates:
-            new_threshold = np.median(candidates)  # 中央値を使用
+            new_threshold = float(np.median(candidates))  # 中央値を使用
             
             # 適応係数を適用
             adaptive_threshold = config.base_threshold * config.adaptive_factor
@@ -234,76 +241,35 @@ class DynamicThresholdManager:
             
             logger.info(f"Updated threshold for {metric_name}: {old_threshold:.2f} -> {new_threshold:.2f}")
     
-    def _calculate_trend_based_threshold(self, values: List[float], config: ThresholdConfig) -> Optional[float]:
+    def _calculate_trend_based_threshold(self, stats: StreamingStatistics,
+                                         config: ThresholdConfig) -> Optional[float]:
         """トレンドベースの閾値を計算"""
-        if len(values) < 20:
+        if stats.count < 20:
             return None
         
-        try:
-            # 線形回帰でトレンドを計算
-            x = np.arange(len(values))
-            y = np.array(values)
-            
-            coeffs = np.polyfit(x, y, 1)
-            trend_slope = coeffs[0]
-            
-            # トレンドが上昇している場合は閾値を上げる
-            if trend_slope > config.trend_sensitivity:
-                trend_factor = 1 + (trend_slope * 0.1)
-                return config.base_threshold * trend_factor
-            elif trend_slope < -config.trend_sensitivity:
-                trend_factor = 1 - (abs(trend_slope) * 0.05)
-                return config.base_threshold * trend_factor
-            
-            return config.base_threshold
-            
-        except Exception as e:
-            logger.warning(f"Trend calculation failed: {e}")
-            return None
-    
-    def _calculate_ml_based_threshold(self, metric_name: str, values: List[float]) -> Optional[float]:
-        """機械学習ベースの閾値を計算"""
-        if len(values) < 50:
-            return None
+        # 逐次の線形回帰によるトレンド
+        trend_slope = stats.moments.slope
         
-        try:
-            # モデルが存在しない場合は作成
-            if metric_name not in self.models:
-                self.models[metric_name] = IsolationForest(contamination=0.1, random_state=42)
-                self.scalers[metric_name] = StandardScaler()
-            
-            model = self.models[metric_name]
-            scaler = self.scalers[metric_name]
-            
-            # データの前処理
-            reshaped_values = np.array(values).reshape(-1, 1)
-            scaled_values = scaler.fit_transform(reshaped_values)
-            
-            # モデルの訓練
-            model.fit(scaled_values)
-            
-            # 異常スコアを計算
-            anomaly_scores = model.decision_function(scaled_values)
-            
-            # 下位10%の異常スコアを閾値として使用
-            threshold_score = np.percentile(anomaly_scores, 10)
-            
-            # 元のスケールに戻して閾値を計算
-            test_values = np.linspace(min(values), max(values) * 2, 1000).reshape(-1, 1)
-            scaled_test = scaler.transform(test_values)
-            test_scores = model.decision_function(scaled_test)
-            
-            # 閾値スコア以下の値の中で最大値を取得
-            valid_indices = test_scores <= threshold_score
-            if np.any(valid_indices):
-                ml_threshold = np.max(test_values[valid_indices])
-                return float(ml_threshold)
-            
-            return None
-            
-        except Exception as e:
-            logger.warning(f"ML threshold calculation failed: {e}")
+        # トレンドが上昇している場合は閾値を上げる
+        if trend_slope > config.trend_sensitivity:
+            trend_factor = 1 + (trend_slope * 0.1)
+            return config.base_threshold * trend_factor
+        elif trend_slope < -config.trend_sensitivity:
+            trend_factor = 1 - (abs(trend_slope) * 0.05)
+            return config.base_threshold * trend_factor
+        
+        return config.base_threshold
+    
+    def _calculate_quantile_based_threshold(self, stats: StreamingStatistics) -> Optional[float]:
+        """分位点ベースの閾値を計算（直近ウィンドウの P² 推定による上側分位点）"""
+        if stats.quantile.count < 50:
             return None
+        return stats.quantile.value
+    
+    def get_statistics(self, metric_name: str) -> Optional[Dict[str, Any]]:
+        """指定メトリクスの逐次統計（平均・標準偏差・傾き・EWMA・分位点）"""
+        stats = self.statistics.get(metric_name)
+        return stats.snapshot() if stats else None
     
     def _save_threshold_update(self, metric_name: str, threshold: float, reason: str):
         """閾値更新をデータベースに記録"""
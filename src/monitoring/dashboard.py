@@ -24,21 +24,6 @@ from http.server import HTTPServer, SimpleHTTPRequestHandler
 import socketserver
 from urllib.parse import parse_qs, urlparse
 
-# データ可視化
-import json
-import base64
-from io import BytesIO
-try:
-    import matplotlib
-    matplotlib.use('Agg')  # GUIバックエンドを無効化
-    import matplotlib.pyplot as plt
-    import matplotlib.dates as mdates
-    from matplotlib.figure import Figure
-    import seaborn as sns
-    PLOTTING_AVAILABLE = True
-except ImportError:
-    PLOTTING_AVAILABLE = False
-
 # システムメトリクス取得
 import psutil
 import platform
@@ -277,134 +262,6 @@ class MetricsCollector:
             'application_metrics': app_history
         }
 
-class ChartGenerator:
-    """グラフ生成クラス"""
-    
-    def __init__(self):
-        if not PLOTTING_AVAILABLE:
-            logger.warning("matplotlib not available, charts will be disabled")
-        
-        if PLOTTING_AVAILABLE:
-            plt.style.use('seaborn-v0_8' if 'seaborn-v0_8' in plt.style.available else 'default')
-    
-    def generate_system_metrics_chart(self, metrics_history: List[Dict]) -> Optional[str]:
-        """システムメトリクスのチャートを生成してBase64エンコードした画像を返す"""
-        if not PLOTTING_AVAILABLE or not metrics_history:
-            return None
-        
-        try:
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
-            fig.suptitle('System Metrics', fontsize=16)
-            
-            timestamps = [datetime.fromisoformat(m['timestamp']) for m in metrics_history]
-            
-            # CPU使用率
-            cpu_data = [m['cpu_percent'] for m in metrics_history]
-            ax1.plot(timestamps, cpu_data, 'b-', linewidth=2)
-            ax1.set_title('CPU Usage (%)')
-            ax1.set_ylabel('Percentage')
-            ax1.grid(True, alpha=0.3)
-            ax1.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-            
-            # メモリ使用率
-            memory_data = [m['memory_percent'] for m in metrics_history]
-            ax2.plot(timestamps, memory_data, 'r-', linewidth=2)
-            ax2.set_title('Memory Usage (%)')
-            ax2.set_ylabel('Percentage')
-            ax2.grid(True, alpha=0.3)
-            ax2.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-            
-            # ディスク使用率
-            disk_data = [m['disk_usage_percent'] for m in metrics_history]
-            ax3.plot(timestamps, disk_data, 'g-', linewidth=2)
-            ax3.set_title('Disk Usage (%)')
-            ax3.set_ylabel('Percentage')
-            ax3.grid(True, alpha=0.3)
-            ax3.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-            
-            # ネットワークI/O（送信）
-            network_sent_data = [m['network_sent'] / (1024*1024) for m in metrics_history]  # MB
-            ax4.plot(timestamps, network_sent_data, 'orange', linewidth=2)
-            ax4.set_title('Network Sent (MB)')
-            ax4.set_ylabel('Megabytes')
-            ax4.grid(True, alpha=0.3)
-            ax4.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-            
-            plt.tight_layout()
-            
-            # Base64エンコード
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-            buffer.seek(0)
-            
-            chart_data = base64.b64encode(buffer.getvalue()).decode()
-            plt.close(fig)
-            
-            return chart_data
-            
-        except Exception as e:
-            logger.error(f"Error generating system metrics chart: {e}")
-            return None
-    
-    def generate_application_metrics_chart(self, metrics_history: List[Dict]) -> Optional[str]:
-        """アプリケーションメトリクスのチャートを生成"""
-        if not PLOTTING_AVAILABLE or not metrics_history:
-            return None
-        
-        try:
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
-            fig.suptitle('Application Metrics', fontsize=16)
-            
-            timestamps = [datetime.fromisoformat(m['timestamp']) for m in metrics_history]
-            
-            # エラー率
-            error_rate_data = [m['error_rate'] for m in metrics_history]
-            ax1.plot(timestamps, error_rate_data, 'r-', linewidth=2)
-            ax1.set_title('Error Rate (%)')
-            ax1.set_ylabel('Percentage')
-            ax1.grid(True, alpha=0.3)
-            ax1.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-            
-            # アクティブエージェント数
-            active_agents_data = [m['active_agents'] for m in metrics_history]
-            ax2.plot(timestamps, active_agents_data, 'b-', linewidth=2, marker='o')
-            ax2.set_title('Active Agents')
-            ax2.set_ylabel('Count')
-            ax2.grid(True, alpha=0.3)
-            ax2.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-            
-            # 平均レスポンス時間
-            response_time_data = [m['avg_response_time'] for m in metrics_history]
-            ax3.plot(timestamps, response_time_data, 'g-', linewidth=2)
-            ax3.set_title('Average Response Time (ms)')
-            ax3.set_ylabel('Milliseconds')
-            ax3.grid(True, alpha=0.3)
-            ax3.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-            
-            # キャッシュヒット率
-            cache_hit_data = [m['cache_hit_rate'] for m in metrics_history]
-            ax4.plot(timestamps, cache_hit_data, 'purple', linewidth=2)
-            ax4.set_title('Cache Hit Rate (%)')
-            ax4.set_ylabel('Percentage')
-            ax4.grid(True, alpha=0.3)
-            ax4.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-            
-            plt.tight_layout()
-            
-            # Base64エンコード
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-            buffer.seek(0)
-            
-            chart_data = base64.b64encode(buffer.getvalue()).decode()
-            plt.close(fig)
-            
-            return chart_data
-            
-        except Exception as e:
-            logger.error(f"Error generating application metrics chart: {e}")
-            return None
-
 class AlertManager:
     """アラート管理クラス"""
     
@@ -511,6 +368,150 @@ class AlertManager:
                 int(alert.acknowledged)
             ))
 
+class MetricsDeltaStream:
+    """ダッシュボードのチャート系列（通し番号付きの点）と差分メッセージの生成
+    
+    1 tick ごとに点を1つ追加し、クライアントには前回送った番号より後の点だけを
+    列指向の JSON（時刻列と系列ごとの値の列）で送る。同じ番号からの差分は tick 内で
+    1回だけエンコードし、全クライアントで共有する。保持範囲より古い番号からの要求
+    （初回接続・長く遅れたクライアント）には全点を reset 付きで送る。
+    """
+    
+    SYSTEM_SERIES = ('cpu_percent', 'memory_percent', 'disk_usage_percent', 'network_sent_mb')
+    APP_SERIES = ('error_rate', 'active_agents', 'avg_response_time', 'cache_hit_rate')
+    SERIES = SYSTEM_SERIES + APP_SERIES
+    
+    def __init__(self, max_points: int = 720):
+        self.points = deque(maxlen=max_points)  # (通し番号, UNIX ミリ秒, 系列値のタプル)
+        self.seq = 0
+        self.current: Dict[str, Any] = {}
+        self._encoded: Dict[int, str] = {}
+        self.encode_count = 0
+    
+    def append(self, system_metrics: 'SystemMetrics', app_metrics: 'ApplicationMetrics') -> int:
+        """tick の計測値を追加して新しい通し番号を返す"""
+        system = system_metrics.to_dict()
+        app = app_metrics.to_dict()
+        system['network_sent_mb'] = system['network_sent'] / (1024 * 1024)
+        values = tuple(round(float(system[name]), 2) for name in self.SYSTEM_SERIES) + \
+            tuple(round(float(app[name]), 2) for name in self.APP_SERIES)
+        
+        self.seq += 1
+        self.points.append((self.seq, int(system_metrics.timestamp.timestamp() * 1000), values))
+        self.current = {'system_metrics': system, 'app_metrics': app}
+        self._encoded.clear()
+        return self.seq
+    
+    def message_since(self, sent_seq: int) -> str:
+        """sent_seq まで受け取ったクライアント向けの差分メッセージ（JSON文字列）"""
+        message = self._encoded.get(sent_seq)
+        if message is None:
+            message = self._encoded[sent_seq] = self._encode(sent_seq)
+        return message
+    
+    def _encode(self, sent_seq: int) -> str:
+        self.encode_count += 1
+        oldest = self.points[0][0] if self.points else self.seq + 1
+        reset = sent_seq == 0 or sent_seq < oldest - 1
+        points = [point for point in self.points if point[0] > sent_seq]
+        columns = list(zip(*(values for _, _, values in points))) or [()] * len(self.SERIES)
+        return json.dumps({
+            'type': 'metrics_delta',
+            'seq': self.seq,
+            'reset': reset,
+            't': [timestamp for _, timestamp, _ in points],
+            'series': {name: list(column) for name, column in zip(self.SERIES, columns)},
+            'current': self.current,
+        }, separators=(',', ':'), default=str)
+
+
+class ClientChannel:
+    """クライアントごとの送信キュー
+    
+    メトリクスは「どこまで送ったか」だけを持ち、送信中に進んだ tick は次の送信で
+    1つの差分にまとめる（遅いクライアントでも未送信のメッセージは溜まらない）。
+    アラートなどの個別メッセージは上限付きのキューに積み、メトリクスより先に順に送る。送信が send_timeout を
+    超えたクライアントは切断し、他のクライアントへの配信は待たせない。
+    """
+    
+    def __init__(self, websocket, stream: MetricsDeltaStream,
+                 send_timeout: float = 10.0, max_pending_messages: int = 100):
+        self.websocket = websocket
+        self.stream = stream
+        self.send_timeout = send_timeout
+        self.pending_messages: deque = deque(maxlen=max_pending_messages)
+        self.sent_seq = 0
+        self.sent_messages = 0
+        self.coalesced_ticks = 0
+        self.closed = False
+        self._stopping = False
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self, on_close=None):
+        self._task = asyncio.create_task(self._run(on_close))
+        if self.stream.seq:
+            self._wake.set()
+    
+    def notify(self):
+        """新しい tick がある"""
+        self._wake.set()
+    
+    def enqueue(self, message: str):
+        """個別メッセージを送信キューに追加（上限を超えた場合は古いものから捨てる）"""
+        self.pending_messages.append(message)
+        self._wake.set()
+    
+    async def _run(self, on_close):
+        try:
+            while not self._stopping:
+                await self._wake.wait()
+                self._wake.clear()
+                if self._stopping:
+                    break
+                
+                while self.pending_messages:
+                    await self._send(self.pending_messages.popleft())
+                
+                target_seq = self.stream.seq
+                if target_seq > self.sent_seq:
+                    self.coalesced_ticks += max(0, target_seq - self.sent_seq - 1)
+                    await self._send(self.stream.message_since(self.sent_seq))
+                    self.sent_seq = target_seq
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            logger.warning(f"Closing slow dashboard client (send exceeded {self.send_timeout}s)")
+            await self._close()
+        except ConnectionClosed:
+            pass
+        except Exception as e:
+            logger.error(f"Error sending to client: {e}")
+            await self._close()
+        finally:
+            self.closed = True
+            if on_close is not None:
+                on_close(self)
+    
+    async def _send(self, message: str):
+        await asyncio.wait_for(self.websocket.send(message), timeout=self.send_timeout)
+        self.sent_messages += 1
+    
+    async def _close(self):
+        try:
+            await asyncio.wait_for(self.websocket.close(), timeout=1.0)
+        except Exception:
+            pass
+    
+    async def stop(self):
+        # 送信完了と同時のキャンセルは wait_for に握りつぶされることがあるため、フラグでもループを抜ける
+        self._stopping = True
+        self._wake.set()
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
 class WebSocketServer:
     """WebSocketサーバー"""
     
@@ -518,9 +519,11 @@ class WebSocketServer:
         self.host = host
         self.port = port
         self.clients: Set[websockets.WebSocketServerProtocol] = set()
+        self.channels: Dict[Any, ClientChannel] = {}
         self.metrics_collector = MetricsCollector()
-        self.chart_generator = ChartGenerator()
         self.alert_manager = AlertManager()
+        self.metrics_stream = MetricsDeltaStream()
+        self.send_timeout = 10.0
         
     async def register_client(self, websocket: websockets.WebSocketServerProtocol):
         """新しいクライアントを登録"""
@@ -529,12 +532,26 @@ class WebSocketServer:
         
         # 初期データを送信
         await self.send_initial_data(websocket)
+        
+        # 以降のメトリクス・アラートはクライアントごとの送信キュー経由で送る
+        channel = ClientChannel(websocket, self.metrics_stream, send_timeout=self.send_timeout)
+        self.channels[websocket] = channel
+        channel.start(on_close=self._channel_closed)
     
     async def unregister_client(self, websocket: websockets.WebSocketServerProtocol):
         """クライアントの登録を解除"""
         self.clients.discard(websocket)
+        channel = self.channels.pop(websocket, None)
+        if channel is not None:
+            await channel.stop()
         logger.info(f"Client disconnected: {websocket.remote_address}")
     
+    def _channel_closed(self, channel: ClientChannel):
+        """送信に失敗したクライアントを配信対象から外す"""
+        if self.channels.get(channel.websocket) is channel:
+            del self.channels[channel.websocket]
+        self.clients.discard(channel.websocket)
+    
     async def send_initial_data(self, websocket: websockets.WebSocketServerProtocol):
         """初期データをクライアントに送信"""
         try:
@@ -565,8 +582,12 @@ class WebSocketServer:
             logger.error(f"Error sending initial data: {e}")
     
     async def broadcast_metrics_update(self):
-        """すべてのクライアントにメトリクス更新を送信"""
-        if not self.clients:
+        """すべてのクライアントにメトリクス更新を送信
+        
+        計測値を系列に1点追加して各クライアントの送信キューに通知するだけで、送信は待たない。
+        差分メッセージのエンコードは送信時に同じ番号ごとに1回だけ行う。
+        """
+        if not self.channels:
             return
         
         try:
@@ -574,68 +595,24 @@ class WebSocketServer:
             system_metrics = await self.metrics_collector.collect_system_metrics()
             app_metrics = await self.metrics_collector.collect_application_metrics()
             
-            # チャート生成
-            history = self.metrics_collector.get_metrics_history(60)
-            system_chart = self.chart_generator.generate_system_metrics_chart(
-                history['system_metrics']
-            )
-            app_chart = self.chart_generator.generate_application_metrics_chart(
-                history['application_metrics']
-            )
-            
-            update_data = {
-                'type': 'metrics_update',
-                'data': {
-                    'system_metrics': system_metrics.to_dict(),
-                    'app_metrics': app_metrics.to_dict(),
-                    'system_chart': system_chart,
-                    'app_chart': app_chart,
-                    'timestamp': datetime.now().isoformat()
-                }
-            }
-            
-            # 接続が切れたクライアントを特定するためのリスト
-            disconnected_clients = []
-            
-            # すべてのクライアントに送信
-            for client in self.clients.copy():
-                try:
-                    await client.send(json.dumps(update_data))
-                except ConnectionClosed:
-                    disconnected_clients.append(client)
-                except Exception as e:
-                    logger.error(f"Error sending to client: {e}")
-                    disconnected_clients.append(client)
-            
-            # 切断されたクライアントを削除
-            for client in disconnected_clients:
-                self.clients.discard(client)
+            self.metrics_stream.append(system_metrics, app_metrics)
+            for channel in list(self.channels.values()):
+                channel.notify()
                 
         except Exception as e:
             logger.error(f"Error broadcasting metrics: {e}")
     
     async def broadcast_alert(self, alert: AlertData):
         """アラートをすべてのクライアントに送信"""
-        if not self.clients:
+        if not self.channels:
             return
         
-        alert_data = {
+        message = json.dumps({
             'type': 'new_alert',
             'data': alert.to_dict()
-        }
-        
-        disconnected_clients = []
-        for client in self.clients.copy():
-            try:
-                await client.send(json.dumps(alert_data))
-            except ConnectionClosed:
-                disconnected_clients.append(client)
-            except Exception as e:
-                logger.error(f"Error sending alert to client: {e}")
-                disconnected_clients.append(client)
-        
-        for client in disconnected_clients:
-            self.clients.discard(client)
+        })
+        for channel in list(self.channels.values()):
+            channel.enqueue(message)
     
     async def handle_client_message(self, websocket: websockets.WebSocketServerProtocol, message: str):
         """クライアントからのメッセージを処理"""
@@ -652,7 +629,7 @@ class WebSocketServer:
                         'success': success,
                         'alert_id': alert_id
                     }
-                    await websocket.send(json.dumps(response))
+                    await self._reply(websocket, response)
             
             elif action == 'dismiss_alert':
                 alert_id = data.get('alert_id')
@@ -663,7 +640,7 @@ class WebSocketServer:
                         'success': success,
                         'alert_id': alert_id
                     }
-                    await websocket.send(json.dumps(response))
+                    await self._reply(websocket, response)
             
             elif action == 'get_history':
                 minutes = data.get('minutes', 60)
@@ -672,11 +649,19 @@ class WebSocketServer:
                     'type': 'history_data',
                     'data': history
                 }
-                await websocket.send(json.dumps(response))
+                await self._reply(websocket, response)
                 
         except Exception as e:
             logger.error(f"Error handling client message: {e}")
     
+    async def _reply(self, websocket: websockets.WebSocketServerProtocol, response: Dict[str, Any]):
+        """クライアントへの応答（送信キューがあればメトリクス送信と順序を揃えてそこへ積む）"""
+        channel = self.channels.get(websocket)
+        if channel is not None:
+            channel.enqueue(json.dumps(response))
+        else:
+            await websocket.send(json.dumps(response))
+    
     def _get_system_info(self) -> Dict[str, Any]:
         """システム情報を取得"""
         return {
@@ -867,10 +852,23 @@ class HTTPStaticServer:
             color: rgba(255, 255, 255, 0.7);
         }
         
-        .chart-image {
-            max-width: 100%;
-            height: auto;
-            border-radius: 10px;
+        .mini-charts {
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            gap: 10px;
+            width: 100%;
+            height: 100%;
+            padding: 10px;
+        }
+        
+        .mini-chart-title {
+            font-size: 0.85rem;
+            margin-bottom: 4px;
+        }
+        
+        .mini-chart svg {
+            width: 100%;
+            height: 100px;
         }
         
         .alerts-container {
@@ -1027,6 +1025,11 @@ class HTTPStaticServer:
                 this.maxReconnectAttempts = 10;
                 this.reconnectAttempts = 0;
                 
+                // チャート系列（差分で受け取った点を60分分保持）
+                this.windowMs = 60 * 60 * 1000;
+                this.times = [];
+                this.values = {};
+                
                 this.connect();
             }
             
@@ -1089,8 +1092,8 @@ class HTTPStaticServer:
                     case 'initial_data':
                         this.updateInitialData(data.data);
                         break;
-                    case 'metrics_update':
-                        this.updateMetrics(data.data);
+                    case 'metrics_delta':
+                        this.applyDelta(data);
                         break;
                     case 'new_alert':
                         this.addAlert(data.data);
@@ -1114,22 +1117,50 @@ class HTTPStaticServer:
                 }
             }
             
-            updateMetrics(data) {
-                if (data.system_metrics) {
-                    this.updateSystemMetrics(data.system_metrics);
+            applyDelta(data) {
+                if (data.reset) {
+                    this.times = [];
+                    this.values = {};
                 }
                 
-                if (data.app_metrics) {
-                    this.updateAppMetrics(data.app_metrics);
+                this.times = this.times.concat(data.t);
+                for (const [name, points] of Object.entries(data.series)) {
+                    this.values[name] = (this.values[name] || []).concat(points);
+                }
+                
+                // 表示範囲より古い点を削除
+                const cutoff = this.times[this.times.length - 1] - this.windowMs;
+                let drop = 0;
+                while (drop < this.times.length && this.times[drop] < cutoff) {
+                    drop++;
+                }
+                if (drop > 0) {
+                    this.times = this.times.slice(drop);
+                    for (const name of Object.keys(this.values)) {
+                        this.values[name] = this.values[name].slice(drop);
+                    }
                 }
                 
-                if (data.system_chart) {
-                    this.updateChart('systemChart', data.system_chart);
+                if (data.current.system_metrics) {
+                    this.updateSystemMetrics(data.current.system_metrics);
                 }
                 
-                if (data.app_chart) {
-                    this.updateChart('appChart', data.app_chart);
+                if (data.current.app_metrics) {
+                    this.updateAppMetrics(data.current.app_metrics);
                 }
+                
+                this.renderChart('systemChart', [
+                    ['cpu_percent', 'CPU Usage (%)', '#4fc3f7'],
+                    ['memory_percent', 'Memory Usage (%)', '#ef5350'],
+                    ['disk_usage_percent', 'Disk Usage (%)', '#66bb6a'],
+                    ['network_sent_mb', 'Network Sent (MB)', '#ffa726']
+                ]);
+                this.renderChart('appChart', [
+                    ['error_rate', 'Error Rate (%)', '#ef5350'],
+                    ['active_agents', 'Active Agents', '#4fc3f7'],
+                    ['avg_response_time', 'Average Response Time (ms)', '#66bb6a'],
+                    ['cache_hit_rate', 'Cache Hit Rate (%)', '#ab47bc']
+                ]);
             }
             
             updateSystemMetrics(metrics) {
@@ -1144,13 +1175,30 @@ class HTTPStaticServer:
                 document.getElementById('avgResponseTime').textContent = metrics.avg_response_time.toFixed(0);
             }
             
-            updateChart(elementId, chartData) {
-                const element = document.getElementById(elementId);
-                if (chartData) {
-                    element.innerHTML = `<img class="chart-image" src="data:image/png;base64,${chartData}" alt="Chart">`;
-                } else {
-                    element.innerHTML = 'チャート生成中...';
-                }
+            renderChart(elementId, series) {
+                const width = 280;
+                const height = 100;
+                const charts = series.map(([name, label, color]) => {
+                    const values = this.values[name] || [];
+                    const min = Math.min(...values);
+                    const span = (Math.max(...values) - min) || 1;
+                    const step = values.length > 1 ? width / (values.length - 1) : 0;
+                    const points = values.map((value, i) =>
+                        `${(i * step).toFixed(1)},${(height - (value - min) / span * height).toFixed(1)}`
+                    ).join(' ');
+                    const latest = values.length ? values[values.length - 1] : '-';
+                    
+                    return `
+                        <div class="mini-chart">
+                            <div class="mini-chart-title">${label}: ${latest}</div>
+                            <svg viewBox="0 0 ${width} ${height}" preserveAspectRatio="none">
+                                <polyline fill="none" stroke="${color}" stroke-width="2" points="${points}"/>
+                            </svg>
+                        </div>
+                    `;
+                });
+                
+                document.getElementById(elementId).innerHTML = `<div class="mini-charts">${charts.join('')}</div>`;
             }
             
             updateAlerts(alerts) {
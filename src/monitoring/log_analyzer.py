@@ -13,8 +13,6 @@ from collections import defaultdict, deque
 from concurrent.futures import ThreadPoolExecutor
 import sqlite3
 import logging
-from sklearn.cluster import DBSCAN
-from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.ensemble import IsolationForest
 import numpy as np
 import pandas as pd
@@ -24,8 +22,52 @@ import time
 from queue import Queue, Empty
 import hashlib
 
+from .log_tailer import LogRollupBatch, LogTailer
+from .log_templates import DrainTemplateMiner, LogTemplate, template_regex
+
 logger = logging.getLogger(__name__)
 
+# レスポンス時間の抽出パターン（優先順）
+RESPONSE_TIME_PATTERNS = [
+    re.compile(r'response time[:\s]*(\d+(?:\.\d+)?)\s*ms', re.IGNORECASE),
+    re.compile(r'took[:\s]*(\d+(?:\.\d+)?)\s*ms', re.IGNORECASE),
+    re.compile(r'duration[:\s]*(\d+(?:\.\d+)?)\s*ms', re.IGNORECASE),
+    re.compile(r'(\d+(?:\.\d+)?)\s*ms', re.IGNORECASE)
+]
+RESPONSE_TIME_HINT = re.compile(r'\d\s*ms', re.IGNORECASE)
+
+_REGEX_META = set('\\.^$*+?{}[]|()')
+
+
+def _leading_literals(pattern: str) -> Optional[Tuple[str, ...]]:
+    """パターンの各分岐の先頭リテラル（小文字）を返す
+    
+    いずれのリテラルも含まない行はパターンに一致しないため、事前フィルタに使える。
+    単純な「(a|b|c)」形式以外や、リテラルで始まらない分岐がある場合は None。
+    """
+    body = pattern
+    if body.startswith('(') and body.endswith(')'):
+        body = body[1:-1]
+    if '(' in body or ')' in body:
+        return None
+    
+    literals = []
+    for branch in body.split('|'):
+        literal = []
+        for char in branch:
+            if char in _REGEX_META:
+                # 直後の量指定子で省略可能になる文字は必須ではない
+                if char in '*?{' and literal:
+                    literal.pop()
+                break
+            literal.append(char)
+        if not literal:
+            return None
+        literals.append(''.join(literal).lower())
+    
+    return tuple(literals)
+
+
 @dataclass
 class LogEntry:
     """ログエントリを表現するデータクラス"""
@@ -90,6 +132,9 @@ class LogPatternDetector:
         self.min_frequency = 3
         self.pattern_cache = {}
         
+        # エラーログのテンプレートをオンラインで集計（LogAnalysisEngine が1行ずつ投入）
+        self.template_miner = DrainTemplateMiner()
+        
         # 事前定義された重要パターン
         self.predefined_patterns = {
             'error_404': r'HTTP/\d\.\d"\s+404',
@@ -107,6 +152,28 @@ class LogPatternDetector:
         # パターンをコンパイル
         for pattern_id, pattern in self.predefined_patterns.items():
             self.compiled_patterns[pattern_id] = re.compile(pattern, re.IGNORECASE)
+        
+        # 必須リテラルによる事前フィルタ（正規表現の検索より大幅に安価な部分文字列検索）
+        self.pattern_literals = {
+            pattern_id: _leading_literals(pattern)
+            for pattern_id, pattern in self.predefined_patterns.items()
+        }
+        self.literal_index: Dict[str, List[str]] = defaultdict(list)
+        for pattern_id, literals in self.pattern_literals.items():
+            for literal in set(literals or ()):
+                self.literal_index[literal].append(pattern_id)
+    
+    def match_pattern_ids(self, text: str) -> List[str]:
+        """テキストに一致する事前定義パターンIDを返す"""
+        lowered = text.lower()
+        candidates = set()
+        for literal in [literal for literal in self.literal_index if literal in lowered]:
+            candidates.update(self.literal_index[literal])
+        
+        # リテラルを持たないパターンは常に正規表現で検索
+        return [pattern_id for pattern_id, compiled_pattern in self.compiled_patterns.items()
+                if (pattern_id in candidates or self.pattern_literals.get(pattern_id) is None)
+                and compiled_pattern.search(text)]
     
     def detect_patterns(self, log_entries: List[LogEntry]) -> List[LogPattern]:
         """ログエントリからパターンを検出"""
@@ -114,72 +181,72 @@ class LogPatternDetector:
         
         # 事前定義パターンのマッチング
         for entry in log_entries:
-            for pattern_id, compiled_pattern in self.compiled_patterns.items():
-                if compiled_pattern.search(entry.message) or compiled_pattern.search(entry.raw_line):
-                    pattern_matches[pattern_id].append(entry)
+            matched = self.match_pattern_ids(entry.raw_line)
+            if entry.message not in entry.raw_line:
+                matched = set(matched) | set(self.match_pattern_ids(entry.message))
+            for pattern_id in matched:
+                pattern_matches[pattern_id].append(entry)
+        
+        pattern_stats = {
+            pattern_id: {
+                'frequency': len(matches),
+                'error_count': sum(1 for match in matches if match.level in ['ERROR', 'CRITICAL']),
+                'first_seen': min(match.timestamp for match in matches),
+                'last_seen': max(match.timestamp for match in matches),
+                'examples': [match.message for match in matches[:5]]
+            }
+            for pattern_id, matches in pattern_matches.items()
+        }
         
         # 動的パターン検出
-        dynamic_patterns = self._detect_dynamic_patterns(log_entries)
-        pattern_matches.update(dynamic_patterns)
+        for template in self._detect_dynamic_patterns(log_entries):
+            pattern_stats[template.pattern_id] = {
+                'frequency': template.size,
+                'error_count': template.size,
+                'first_seen': template.first_seen,
+                'last_seen': template.last_seen,
+                'examples': template.examples,
+                'template': template.template
+            }
         
-        # LogPatternオブジェクトに変換
+        return self.build_patterns(pattern_stats)
+    
+    def build_patterns(self, pattern_stats: Dict[str, Dict[str, Any]]) -> List[LogPattern]:
+        """パターン別の集計値（frequency, error_count, first_seen, last_seen, examples,
+        動的パターンの場合は template）からLogPatternを生成"""
         detected_patterns = []
-        for pattern_id, matches in pattern_matches.items():
-            if len(matches) >= self.min_frequency:
+        for pattern_id, stats in pattern_stats.items():
+            if stats['frequency'] >= self.min_frequency:
+                template = stats.get('template')
                 pattern = LogPattern(
                     pattern_id=pattern_id,
-                    regex_pattern=self.predefined_patterns.get(pattern_id, "dynamic"),
-                    frequency=len(matches),
-                    first_seen=min(match.timestamp for match in matches),
-                    last_seen=max(match.timestamp for match in matches),
-                    severity=self._calculate_severity(pattern_id, matches),
-                    description=self._generate_description(pattern_id, matches),
-                    examples=[match.message for match in matches[:5]]
+                    regex_pattern=(template_regex(template) if template
+                                   else self.predefined_patterns.get(pattern_id, "dynamic")),
+                    frequency=stats['frequency'],
+                    first_seen=stats['first_seen'],
+                    last_seen=stats['last_seen'],
+                    severity=self._severity_from_counts(pattern_id, stats['error_count'], stats['frequency']),
+                    description=(f'動的検出パターン: {template}' if template
+                                 else self._generate_description(pattern_id, [])),
+                    examples=stats['examples'][:5]
                 )
                 detected_patterns.append(pattern)
                 self.patterns[pattern_id] = pattern
         
         return detected_patterns
     
-    def _detect_dynamic_patterns(self, log_entries: List[LogEntry]) -> Dict[str, List[LogEntry]]:
-        """機械学習による動的パターン検出"""
-        if len(log_entries) < 10:
-            return {}
-        
-        # エラーレベルのログのみを対象
-        error_logs = [entry for entry in log_entries if entry.level in ['ERROR', 'CRITICAL']]
-        
-        if len(error_logs) < 5:
-            return {}
-        
-        # TF-IDFベクトル化
-        messages = [entry.message for entry in error_logs]
-        vectorizer = TfidfVectorizer(max_features=100, stop_words='english', ngram_range=(1, 2))
-        
-        try:
-            tfidf_matrix = vectorizer.fit_transform(messages)
-            
-            # DBSCANクラスタリングでパターンをグループ化
-            clustering = DBSCAN(eps=0.5, min_samples=3)
-            cluster_labels = clustering.fit_predict(tfidf_matrix.toarray())
-            
-            # クラスタごとにパターンを作成
-            dynamic_patterns = defaultdict(list)
-            for i, label in enumerate(cluster_labels):
-                if label != -1:  # ノイズではない
-                    cluster_id = f"dynamic_cluster_{label}"
-                    dynamic_patterns[cluster_id].append(error_logs[i])
-            
-            return dict(dynamic_patterns)
+    def _detect_dynamic_patterns(self, log_entries: List[LogEntry]) -> List[LogTemplate]:
+        """エラーログをテンプレートに分類する動的パターン検出（エントリ群ごとに独立して集計）"""
+        miner = DrainTemplateMiner()
+        for entry in log_entries:
+            if entry.level in ['ERROR', 'CRITICAL']:
+                miner.add(entry.message, entry.timestamp)
         
-        except Exception as e:
-            logger.warning(f"Dynamic pattern detection failed: {e}")
-            return {}
+        return list(miner.templates.values())
     
-    def _calculate_severity(self, pattern_id: str, matches: List[LogEntry]) -> str:
-        """パターンの重要度を計算"""
-        error_count = sum(1 for match in matches if match.level in ['ERROR', 'CRITICAL'])
-        error_ratio = error_count / len(matches)
+    def _severity_from_counts(self, pattern_id: str, error_count: int, total: int) -> str:
+        """エラー件数と総件数からパターンの重要度を計算"""
+        error_ratio = error_count / total
         
         if error_ratio > 0.8 or pattern_id in ['memory_error', 'disk_space', 'database_error']:
             return 'CRITICAL'
@@ -365,27 +432,24 @@ class PerformanceAnomalyDetector:
         }
 
 class LogAnalysisEngine:
-    """メインログ分析エンジン"""
+    """メインログ分析エンジン
+    
+    ログファイルは LogTailer で前回以降の追記分だけを読み込み、時間×レベル×モジュール別の
+    ロールアップテーブルに加算してから分析する（全エントリをメモリに展開しない）。
+    """
     
     def __init__(self, log_directory: str, db_path: str = None):
         self.log_directory = Path(log_directory)
         self.db_path = db_path or "logs_analysis.db"
         self.pattern_detector = LogPatternDetector()
         self.anomaly_detector = PerformanceAnomalyDetector()
+        self.tailer = LogTailer(self.log_directory)
         
-        # ログパーサーの正規表現パターン
-        self.log_patterns = {
-            'python_logging': re.compile(
-                r'\[(?P<timestamp>\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2},\d{3})\]\s+'
-                r'\[(?P<level>\w+)\]\s+\[(?P<module>[\w\.]+)\]\s+(?P<message>.*)'
-            ),
-            'standard': re.compile(
-                r'(?P<timestamp>\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s+'
-                r'(?P<level>\w+)\s+(?P<module>\S+)\s+(?P<message>.*)'
-            )
-        }
+        # パターン別の例
+        self.pattern_examples: Dict[str, List[str]] = {}
         
         self.executor = ThreadPoolExecutor(max_workers=4)
+        self._ingest_lock = threading.Lock()
         self._init_database()
     
     def _init_database(self):
@@ -427,54 +491,102 @@ class LogAnalysisEngine:
                     anomalies_detected INTEGER
                 )
             """)
+            
+            # 時間別ロールアップ（hour は 'YYYY-MM-DDTHH:00:00'）
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS log_hourly_stats (
+                    hour TEXT NOT NULL,
+                    level TEXT NOT NULL,
+                    module TEXT NOT NULL,
+                    entries INTEGER NOT NULL,
+                    PRIMARY KEY (hour, level, module)
+                )
+            """)
+            
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS log_pattern_stats (
+                    pattern_id TEXT NOT NULL,
+                    hour TEXT NOT NULL,
+                    level TEXT NOT NULL,
+                    matches INTEGER NOT NULL,
+                    first_seen TEXT NOT NULL,
+                    last_seen TEXT NOT NULL,
+                    PRIMARY KEY (pattern_id, hour, level)
+                )
+            """)
+            
+            # 動的パターン（エラーログのテンプレート）
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS log_templates (
+                    pattern_id TEXT PRIMARY KEY,
+                    cluster_id INTEGER NOT NULL,
+                    template TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_seen TEXT NOT NULL
+                )
+            """)
+            
+            self.tailer.load(conn)
+            
+            # 最近出現したテンプレートから解析木を復元（IDを維持して集計を引き継ぐ）
+            miner = self.pattern_detector.template_miner
+            rows = conn.execute("""
+                SELECT cluster_id, template, size FROM (
+                    SELECT * FROM log_templates ORDER BY last_seen DESC LIMIT ?
+                ) ORDER BY last_seen
+            """, (miner.max_clusters,)).fetchall()
+            for cluster_id, template, size in rows:
+                miner.restore(cluster_id, template, size)
+            miner.next_id = max(miner.next_id, conn.execute(
+                "SELECT COALESCE(MAX(cluster_id) + 1, 0) FROM log_templates").fetchone()[0])
+            
+            for pattern_id, examples in conn.execute("SELECT pattern_id, examples FROM log_patterns"):
+                self.pattern_examples[pattern_id] = json.loads(examples or '[]')[:5]
     
     async def analyze_logs(
         self, 
         time_range: Optional[Tuple[datetime, datetime]] = None,
         log_levels: Optional[List[str]] = None
     ) -> Dict[str, Any]:
-        """ログファイルを分析してパターンと異常を検出"""
-        logger.info("Starting comprehensive log analysis")
-        
-        # ログファイルを収集
-        log_files = self._collect_log_files(time_range)
-        logger.info(f"Found {len(log_files)} log files to analyze")
+        """新しいログ行を取り込み、指定範囲のロールアップからパターンと異常を検出"""
+        logger.info("Starting incremental log analysis")
+        loop = asyncio.get_event_loop()
         
-        # ログエントリをパース
-        log_entries = []
-        for log_file in log_files:
-            entries = await self._parse_log_file(log_file, log_levels)
-            log_entries.extend(entries)
+        # 追記分を読み込んでロールアップに加算
+        batch = await loop.run_in_executor(
+            self.executor,
+            self._ingest_new_lines,
+            time_range[0] if time_range else None
+        )
+        logger.info(f"Parsed {batch.entries} new log entries from {self.tailer.files_scanned} files")
         
-        logger.info(f"Parsed {len(log_entries)} log entries")
+        # メトリクス分析とパターン検出を並行実行
+        metrics_task = loop.run_in_executor(
+            self.executor, self._analyze_metrics, time_range, log_levels, batch
+        )
+        patterns_task = loop.run_in_executor(
+            self.executor, self._run_pattern_detection, time_range, log_levels
+        )
+        metrics_analysis = await metrics_task
+        detected_patterns = await patterns_task
         
-        if not log_entries:
+        total_entries = sum(metrics_analysis['log_level_distribution'].values())
+        if not total_entries:
             return {
                 'summary': {
-                    'log_files_processed': len(log_files),
+                    'log_files_processed': self.tailer.files_scanned,
                     'total_entries': 0,
+                    'new_entries': batch.entries,
                     'patterns_detected': 0,
                     'anomalies_detected': 0
                 },
                 'patterns': [],
                 'anomalies': [],
-                'metrics': {}
+                'metrics': {},
+                'trends': {},
+                'recommendations': []
             }
         
-        # パターン検出を並行実行
-        patterns_task = asyncio.create_task(
-            self._run_pattern_detection(log_entries)
-        )
-        
-        # メトリクス分析を並行実行
-        metrics_task = asyncio.create_task(
-            self._analyze_metrics(log_entries)
-        )
-        
-        # 結果を待つ
-        detected_patterns = await patterns_task
-        metrics_analysis = await metrics_task
-        
         # 異常検知
         anomalies = []
         if metrics_analysis['performance_metrics']:
@@ -488,9 +600,11 @@ class LogAnalysisEngine:
         # サマリーを作成
         summary = {
             'analysis_time': datetime.now().isoformat(),
-            'log_files_processed': len(log_files),
-            'total_entries': len(log_entries),
-            'error_entries': sum(1 for entry in log_entries if entry.level in ['ERROR', 'CRITICAL']),
+            'log_files_processed': self.tailer.files_scanned,
+            'total_entries': total_entries,
+            'new_entries': batch.entries,
+            'error_entries': sum(count for level, count in metrics_analysis['log_level_distribution'].items()
+                                 if level in ['ERROR', 'CRITICAL']),
             'patterns_detected': len(detected_patterns),
             'anomalies_detected': len(anomalies)
         }
@@ -502,168 +616,192 @@ class LogAnalysisEngine:
             'patterns': [pattern.to_dict() for pattern in detected_patterns],
             'anomalies': [anomaly.__dict__ for anomaly in anomalies],
             'metrics': metrics_analysis,
-            'trends': self._calculate_trends(log_entries),
+            'trends': self._calculate_trends(metrics_analysis['error_rate_trend']),
             'recommendations': self._generate_recommendations(detected_patterns, anomalies)
         }
     
-    def _collect_log_files(self, time_range: Optional[Tuple[datetime, datetime]] = None) -> List[Path]:
-        """指定時間範囲のログファイルを収集"""
-        log_files = []
-        
-        if not self.log_directory.exists():
-            logger.warning(f"Log directory not found: {self.log_directory}")
-            return log_files
-        
-        for log_file in self.log_directory.rglob("*.log"):
-            if time_range:
-                # ファイルの最終更新時刻をチェック
-                file_mtime = datetime.fromtimestamp(log_file.stat().st_mtime)
-                if not (time_range[0] <= file_mtime <= time_range[1]):
-                    continue
+    def _ingest_new_lines(self, since: Optional[datetime] = None) -> LogRollupBatch:
+        """追記された行を集計し、ロールアップとチェックポイントを同一トランザクションで保存"""
+        with self._ingest_lock:
+            batch = LogRollupBatch(
+                self.pattern_detector.match_pattern_ids,
+                self._extract_response_time,
+                self._mine_template
+            )
             
-            log_files.append(log_file)
-        
-        return sorted(log_files, key=lambda f: f.stat().st_mtime)
-    
-    async def _parse_log_file(
-        self, 
-        log_file: Path, 
-        log_levels: Optional[List[str]] = None
-    ) -> List[LogEntry]:
-        """ログファイルをパースしてLogEntryのリストを生成"""
-        entries = []
-        
-        try:
-            with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
+            template_miner = self.pattern_detector.template_miner
+            dirty_templates = []
+            try:
+                for log_file, line_number, line in self.tailer.read_new_lines(since):
+                    batch.add(log_file, line_number, line)
+                
+                dirty_templates = template_miner.pop_dirty()
+                with sqlite3.connect(self.db_path) as conn:
+                    conn.executemany("""
+                        INSERT INTO log_hourly_stats (hour, level, module, entries)
+                        VALUES (?, ?, ?, ?)
+                        ON CONFLICT(hour, level, module) DO UPDATE SET
+                            entries = entries + excluded.entries
+                    """, [(hour, level, module, count)
+                          for (hour, level, module), count in batch.hourly.items()])
                     
-                    # ログパターンにマッチを試行
-                    parsed_entry = None
-                    for pattern_name, pattern in self.log_patterns.items():
-                        match = pattern.match(line)
-                        if match:
-                            parsed_entry = self._create_log_entry(match, line, log_file, line_num)
-                            break
+                    conn.executemany("""
+                        INSERT INTO log_pattern_stats (pattern_id, hour, level, matches, first_seen, last_seen)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(pattern_id, hour, level) DO UPDATE SET
+                            matches = matches + excluded.matches,
+                            first_seen = min(first_seen, excluded.first_seen),
+                            last_seen = max(last_seen, excluded.last_seen)
+                    """, [(pattern_id, hour, level, count, first_seen.isoformat(), last_seen.isoformat())
+                          for (pattern_id, hour, level), (count, first_seen, last_seen)
+                          in batch.pattern_hits.items()])
                     
-                    # パターンにマッチしない場合は簡単なエントリを作成
-                    if not parsed_entry:
-                        parsed_entry = LogEntry(
-                            timestamp=datetime.now(),
-                            level='INFO',
-                            module=log_file.stem,
-                            message=line,
-                            raw_line=line,
-                            metadata={'file': str(log_file), 'line_number': line_num}
-                        )
+                    conn.executemany("""
+                        INSERT OR REPLACE INTO log_templates (pattern_id, cluster_id, template, size, last_seen)
+                        VALUES (?, ?, ?, ?, ?)
+                    """, [(template.pattern_id, template.cluster_id, template.template, template.size,
+                           template.last_seen.isoformat())
+                          for template in dirty_templates])
                     
-                    # レベルフィルタリング
-                    if log_levels is None or parsed_entry.level in log_levels:
-                        entries.append(parsed_entry)
-        
-        except Exception as e:
-            logger.error(f"Error parsing log file {log_file}: {e}")
-        
-        return entries
-    
-    def _create_log_entry(self, match: re.Match, raw_line: str, log_file: Path, line_num: int) -> LogEntry:
-        """正規表現マッチからLogEntryを作成"""
-        groups = match.groupdict()
-        
-        # タイムスタンプの解析
-        timestamp_str = groups.get('timestamp', '')
-        try:
-            if ',' in timestamp_str:
-                timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S,%f')
-            else:
-                timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-        except ValueError:
-            timestamp = datetime.now()
+                    self.tailer.save(conn)
+            except Exception:
+                self.tailer.discard()
+                template_miner.mark_dirty(dirty_templates)
+                raise
+            
+            for pattern_id, examples in batch.pattern_examples.items():
+                stored = self.pattern_examples.setdefault(pattern_id, [])
+                stored.extend(examples[:5 - len(stored)])
+            
+            return batch
+    
+    def _rollup_filter(
+        self,
+        time_range: Optional[Tuple[datetime, datetime]],
+        log_levels: Optional[List[str]]
+    ) -> Tuple[str, List[Any]]:
+        """ロールアップテーブル用の時間範囲・レベル条件"""
+        if time_range:
+            start = time_range[0].replace(minute=0, second=0, microsecond=0).isoformat()
+            end = time_range[1].isoformat()
+        else:
+            start, end = '', '9999'
+        levels = json.dumps(log_levels) if log_levels is not None else None
         
-        return LogEntry(
-            timestamp=timestamp,
-            level=groups.get('level', 'INFO').upper(),
-            module=groups.get('module', log_file.stem),
-            message=groups.get('message', ''),
-            raw_line=raw_line,
-            metadata={
-                'file': str(log_file),
-                'line_number': line_num
-            }
+        return (
+            "hour >= ? AND hour <= ? AND (? IS NULL OR level IN (SELECT value FROM json_each(?)))",
+            [start, end, levels, levels]
         )
     
-    async def _run_pattern_detection(self, log_entries: List[LogEntry]) -> List[LogPattern]:
-        """パターン検出を別スレッドで実行"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self.executor,
-            self.pattern_detector.detect_patterns,
-            log_entries
-        )
+    def _mine_template(self, message: str, timestamp: datetime) -> str:
+        """エラーメッセージをテンプレートに割り当ててパターンIDを返す"""
+        return self.pattern_detector.template_miner.add(message, timestamp).pattern_id
     
-    async def _analyze_metrics(self, log_entries: List[LogEntry]) -> Dict[str, Any]:
-        """ログエントリからメトリクスを分析"""
-        metrics = {
-            'log_level_distribution': defaultdict(int),
-            'module_distribution': defaultdict(int),
-            'hourly_distribution': defaultdict(int),
-            'error_rate_trend': [],
-            'performance_metrics': {},
-            'top_error_modules': [],
-            'response_times': []
-        }
+    def _run_pattern_detection(
+        self,
+        time_range: Optional[Tuple[datetime, datetime]],
+        log_levels: Optional[List[str]]
+    ) -> List[LogPattern]:
+        """パターン別ロールアップ（事前定義パターンとテンプレート）からパターンを検出"""
+        where, params = self._rollup_filter(time_range, log_levels)
         
-        # 基本統計の計算
-        for entry in log_entries:
-            metrics['log_level_distribution'][entry.level] += 1
-            metrics['module_distribution'][entry.module] += 1
-            metrics['hourly_distribution'][entry.timestamp.hour] += 1
-            
-            # レスポンス時間の抽出（ログメッセージから）
-            response_time = self._extract_response_time(entry.message)
-            if response_time:
-                metrics['response_times'].append(response_time)
-        
-        # エラー率のトレンド計算
-        metrics['error_rate_trend'] = self._calculate_error_rate_trend(log_entries)
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(f"""
+                SELECT s.pattern_id, s.frequency, s.error_count, s.first_seen, s.last_seen, t.template
+                FROM (
+                    SELECT pattern_id, SUM(matches) AS frequency,
+                           SUM(CASE WHEN level IN ('ERROR', 'CRITICAL') THEN matches ELSE 0 END) AS error_count,
+                           MIN(first_seen) AS first_seen, MAX(last_seen) AS last_seen
+                    FROM log_pattern_stats
+                    WHERE {where}
+                    GROUP BY pattern_id
+                ) s
+                LEFT JOIN log_templates t ON t.pattern_id = s.pattern_id
+            """, params).fetchall()
+        
+        return self.pattern_detector.build_patterns({
+            pattern_id: {
+                'frequency': frequency,
+                'error_count': error_count,
+                'first_seen': datetime.fromisoformat(first_seen),
+                'last_seen': datetime.fromisoformat(last_seen),
+                'examples': self.pattern_examples.get(pattern_id, []),
+                'template': template
+            }
+            for pattern_id, frequency, error_count, first_seen, last_seen, template in rows
+        })
+    
+    def _analyze_metrics(
+        self,
+        time_range: Optional[Tuple[datetime, datetime]],
+        log_levels: Optional[List[str]],
+        batch: LogRollupBatch
+    ) -> Dict[str, Any]:
+        """ロールアップからメトリクスを分析（レスポンス時間は今回の新規行から算出）"""
+        where, params = self._rollup_filter(time_range, log_levels)
         
-        # 上位エラーモジュール
-        error_counts = defaultdict(int)
-        for entry in log_entries:
-            if entry.level in ['ERROR', 'CRITICAL']:
-                error_counts[entry.module] += 1
+        with sqlite3.connect(self.db_path) as conn:
+            level_rows = conn.execute(
+                f"SELECT level, SUM(entries) FROM log_hourly_stats WHERE {where} GROUP BY level", params
+            ).fetchall()
+            module_rows = conn.execute(
+                f"SELECT module, SUM(entries) FROM log_hourly_stats WHERE {where} GROUP BY module", params
+            ).fetchall()
+            hour_of_day_rows = conn.execute(f"""
+                SELECT CAST(substr(hour, 12, 2) AS INTEGER), SUM(entries)
+                FROM log_hourly_stats WHERE {where} GROUP BY 1
+            """, params).fetchall()
+            hourly_rows = conn.execute(f"""
+                SELECT hour, SUM(entries),
+                       SUM(CASE WHEN level IN ('ERROR', 'CRITICAL') THEN entries ELSE 0 END)
+                FROM log_hourly_stats WHERE {where} GROUP BY hour ORDER BY hour
+            """, params).fetchall()
+            top_error_modules = conn.execute(f"""
+                SELECT module, SUM(entries) FROM log_hourly_stats
+                WHERE {where} AND level IN ('ERROR', 'CRITICAL')
+                GROUP BY module ORDER BY 2 DESC LIMIT 10
+            """, params).fetchall()
         
-        metrics['top_error_modules'] = sorted(
-            error_counts.items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )[:10]
+        metrics = {
+            'log_level_distribution': dict(level_rows),
+            'module_distribution': dict(module_rows),
+            'hourly_distribution': dict(hour_of_day_rows),
+            'error_rate_trend': [
+                {
+                    'timestamp': hour,
+                    'error_rate': errors / total if total > 0 else 0,
+                    'total_logs': total,
+                    'error_logs': errors
+                }
+                for hour, total, errors in hourly_rows
+            ],
+            'performance_metrics': {},
+            'top_error_modules': [tuple(row) for row in top_error_modules]
+        }
         
         # パフォーマンスメトリクス
-        if metrics['response_times']:
+        response_times = [np.asarray(values) for level, values in batch.response_times.items()
+                          if values and (log_levels is None or level in log_levels)]
+        if response_times:
+            response_times = np.concatenate(response_times)
             metrics['performance_metrics'] = {
-                'avg_response_time': np.mean(metrics['response_times']),
-                'p95_response_time': np.percentile(metrics['response_times'], 95),
-                'p99_response_time': np.percentile(metrics['response_times'], 99),
-                'max_response_time': np.max(metrics['response_times']),
-                'total_requests': len(metrics['response_times'])
+                'avg_response_time': np.mean(response_times),
+                'p95_response_time': np.percentile(response_times, 95),
+                'p99_response_time': np.percentile(response_times, 99),
+                'max_response_time': np.max(response_times),
+                'total_requests': len(response_times)
             }
         
-        return dict(metrics)
+        return metrics
     
     def _extract_response_time(self, message: str) -> Optional[float]:
         """ログメッセージからレスポンス時間を抽出"""
-        patterns = [
-            r'response time[:\s]*(\d+(?:\.\d+)?)\s*ms',
-            r'took[:\s]*(\d+(?:\.\d+)?)\s*ms',
-            r'duration[:\s]*(\d+(?:\.\d+)?)\s*ms',
-            r'(\d+(?:\.\d+)?)\s*ms'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
+        # 全パターンに共通する「数値+ms」がなければ個別の検索を省略
+        if not RESPONSE_TIME_HINT.search(message):
+            return None
+        
+        for pattern in RESPONSE_TIME_PATTERNS:
+            match = pattern.search(message)
             if match:
                 try:
                     return float(match.group(1))
@@ -672,48 +810,18 @@ class LogAnalysisEngine:
         
         return None
     
-    def _calculate_error_rate_trend(self, log_entries: List[LogEntry]) -> List[Dict[str, Any]]:
-        """エラー率のトレンドを計算"""
-        if not log_entries:
-            return []
-        
-        # 時間別にログエントリをグループ化
-        hourly_counts = defaultdict(lambda: {'total': 0, 'errors': 0})
-        
-        for entry in log_entries:
-            hour_key = entry.timestamp.replace(minute=0, second=0, microsecond=0)
-            hourly_counts[hour_key]['total'] += 1
-            
-            if entry.level in ['ERROR', 'CRITICAL']:
-                hourly_counts[hour_key]['errors'] += 1
-        
-        # エラー率を計算
-        trend_data = []
-        for hour, counts in sorted(hourly_counts.items()):
-            error_rate = counts['errors'] / counts['total'] if counts['total'] > 0 else 0
-            trend_data.append({
-                'timestamp': hour.isoformat(),
-                'error_rate': error_rate,
-                'total_logs': counts['total'],
-                'error_logs': counts['errors']
-            })
-        
-        return trend_data
-    
-    def _calculate_trends(self, log_entries: List[LogEntry]) -> Dict[str, Any]:
-        """長期トレンドの計算"""
-        if len(log_entries) < 2:
+    def _calculate_trends(self, error_rate_trend: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """長期トレンドの計算（時間別エラー率から日別に集約）"""
+        if sum(point['total_logs'] for point in error_rate_trend) < 2:
             return {}
         
         # 日別統計
         daily_stats = defaultdict(lambda: {'total': 0, 'errors': 0})
         
-        for entry in log_entries:
-            date_key = entry.timestamp.date()
-            daily_stats[date_key]['total'] += 1
-            
-            if entry.level in ['ERROR', 'CRITICAL']:
-                daily_stats[date_key]['errors'] += 1
+        for point in error_rate_trend:
+            date_key = point['timestamp'][:10]
+            daily_stats[date_key]['total'] += point['total_logs']
+            daily_stats[date_key]['errors'] += point['error_logs']
         
         # トレンド分析
         dates = sorted(daily_stats.keys())
@@ -0,0 +1,298 @@
+"""
+ストリーミングログテイラー
+inode・オフセットのチェックポイントを保持し、前回以降に追記されたバイトだけを読み込む
+"""
+import hashlib
+import logging
+import os
+import re
+import time
+from array import array
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# ローテーション済みファイル（RotatingFileHandler の *.log.1 など）も追跡する
+DEFAULT_LOG_GLOBS = ('*.log', '*.log.[0-9]*')
+
+# 先頭バイトのハッシュで切り詰め・inode再利用を検出
+FINGERPRINT_BYTES = 256
+
+ERROR_LEVELS = ('ERROR', 'CRITICAL')
+
+# python_logging 形式と standard 形式を1つの正規表現に統合
+LOG_LINE_PATTERN = re.compile(
+    r'(?:\[(?P<bracket_timestamp>\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2},\d{3})\]\s+'
+    r'\[(?P<bracket_level>\w+)\]\s+\[(?P<bracket_module>[\w\.]+)\]'
+    r'|(?P<timestamp>\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s+'
+    r'(?P<level>\w+)\s+(?P<module>\S+))'
+    r'\s+(?P<message>.*)'
+)
+
+CHECKPOINT_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS log_checkpoints (
+        device INTEGER NOT NULL,
+        inode INTEGER NOT NULL,
+        path TEXT NOT NULL,
+        offset INTEGER NOT NULL,
+        line_count INTEGER NOT NULL,
+        fingerprint TEXT NOT NULL,
+        mtime_ns INTEGER NOT NULL,
+        PRIMARY KEY (device, inode)
+    )
+"""
+
+CHECKPOINT_UPSERT_SQL = """
+    INSERT OR REPLACE INTO log_checkpoints
+        (device, inode, path, offset, line_count, fingerprint, mtime_ns)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def parse_timestamp(value: str) -> datetime:
+    """ログのタイムスタンプを解析（解析できない場合は現在時刻）"""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        if ',' in value:
+            return datetime.strptime(value, '%Y-%m-%d %H:%M:%S,%f')
+        return datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+    except ValueError:
+        return datetime.now()
+
+
+def parse_log_line(line: str, default_module: str) -> Tuple[datetime, str, str, str]:
+    """1行を (timestamp, level, module, message) に分解"""
+    match = LOG_LINE_PATTERN.match(line)
+    if not match:
+        return datetime.now(), 'INFO', default_module, line
+
+    if match.group('bracket_timestamp') is not None:
+        timestamp, level, module = match.group('bracket_timestamp', 'bracket_level', 'bracket_module')
+    else:
+        timestamp, level, module = match.group('timestamp', 'level', 'module')
+    return parse_timestamp(timestamp), level.upper(), module, match.group('message')
+
+
+@dataclass
+class LogCheckpoint:
+    """ファイル（device, inode）ごとの読み込み位置"""
+    device: int
+    inode: int
+    path: str
+    offset: int = 0
+    line_count: int = 0
+    fingerprint: str = ''
+    mtime_ns: int = 0
+
+
+def _fingerprint(handle, length: int) -> str:
+    """ファイル先頭 length バイトのハッシュ"""
+    handle.seek(0)
+    return hashlib.sha1(handle.read(length)).hexdigest()
+
+
+class LogTailer:
+    """追記分だけを行単位で返すログテイラー
+
+    チェックポイントは (device, inode) をキーにするため、ローテーションで
+    ファイル名が変わっても読み込み位置を引き継ぐ。読み込み結果は保留状態で保持し、
+    集計結果と同じトランザクションで save() したときに確定する。
+    """
+
+    def __init__(
+        self,
+        log_directory: Path,
+        globs: Tuple[str, ...] = DEFAULT_LOG_GLOBS,
+        partial_line_grace: float = 2.0
+    ):
+        self.log_directory = Path(log_directory)
+        self.globs = globs
+        # 改行で終わらない末尾行は、更新が止まってからこの秒数経過するまで読まない
+        self.partial_line_grace = partial_line_grace
+        self.checkpoints: Dict[Tuple[int, int], LogCheckpoint] = {}
+        self._pending: Dict[Tuple[int, int], LogCheckpoint] = {}
+        self._present: Optional[set] = None
+        self.files_scanned = 0
+        self.bytes_read = 0
+
+    def load(self, conn):
+        """データベースからチェックポイントを読み込み"""
+        conn.execute(CHECKPOINT_TABLE_SQL)
+        rows = conn.execute("""
+            SELECT device, inode, path, offset, line_count, fingerprint, mtime_ns
+            FROM log_checkpoints
+        """).fetchall()
+        self.checkpoints = {(row[0], row[1]): LogCheckpoint(*row) for row in rows}
+
+    def save(self, conn):
+        """保留中のチェックポイントを書き込み、消えたファイルの記録を削除"""
+        conn.executemany(CHECKPOINT_UPSERT_SQL, [
+            (cp.device, cp.inode, cp.path, cp.offset, cp.line_count, cp.fingerprint, cp.mtime_ns)
+            for cp in self._pending.values()
+        ])
+        self.checkpoints.update(self._pending)
+        self._pending.clear()
+
+        if self._present is not None:
+            vanished = [key for key in self.checkpoints if key not in self._present]
+            conn.executemany("DELETE FROM log_checkpoints WHERE device = ? AND inode = ?", vanished)
+            for key in vanished:
+                del self.checkpoints[key]
+
+    def discard(self):
+        """保留中の読み込み位置を破棄（次回同じ範囲を再読込）"""
+        self._pending.clear()
+
+    def discover(self) -> List[Tuple[Path, os.stat_result]]:
+        """追跡対象ファイルを更新時刻順に列挙"""
+        if not self.log_directory.exists():
+            logger.warning(f"Log directory not found: {self.log_directory}")
+            self._present = set()
+            return []
+
+        files = {}
+        for pattern in self.globs:
+            for path in self.log_directory.rglob(pattern):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                files.setdefault((stat.st_dev, stat.st_ino), (path, stat))
+
+        self._present = set(files)
+        return sorted(files.values(), key=lambda item: item[1].st_mtime_ns)
+
+    def read_new_lines(self, since: Optional[datetime] = None) -> Iterator[Tuple[Path, int, str]]:
+        """前回の位置以降に追記された行を (path, line_number, line) で返す"""
+        self.files_scanned = 0
+        self.bytes_read = 0
+        since_ts = since.timestamp() if since else None
+
+        for path, stat in self.discover():
+            # 範囲開始より前に更新が止まったファイルに新しい行はない
+            if since_ts is not None and stat.st_mtime < since_ts:
+                continue
+            self.files_scanned += 1
+
+            key = (stat.st_dev, stat.st_ino)
+            checkpoint = self._pending.get(key) or self.checkpoints.get(key)
+            if (checkpoint and checkpoint.offset == stat.st_size
+                    and checkpoint.mtime_ns == stat.st_mtime_ns):
+                continue
+
+            try:
+                yield from self._read_file(path, stat, checkpoint)
+            except OSError as e:
+                logger.error(f"Error reading log file {path}: {e}")
+
+    def _read_file(
+        self,
+        path: Path,
+        stat: os.stat_result,
+        checkpoint: Optional[LogCheckpoint]
+    ) -> Iterator[Tuple[Path, int, str]]:
+        """1ファイルの追記分を読み込み、完了時に保留チェックポイントを更新"""
+        offset, line_number = 0, 0
+        settled = time.time() - stat.st_mtime >= self.partial_line_grace
+
+        with open(path, 'rb') as handle:
+            if checkpoint and checkpoint.offset <= stat.st_size:
+                prefix = min(checkpoint.offset, FINGERPRINT_BYTES)
+                if _fingerprint(handle, prefix) == checkpoint.fingerprint:
+                    offset, line_number = checkpoint.offset, checkpoint.line_count
+            if checkpoint and offset == 0 and checkpoint.offset:
+                logger.info(f"Log file truncated or replaced, re-reading from start: {path}")
+
+            start = offset
+            handle.seek(offset)
+            for raw in handle:
+                # stat時点のサイズを超える行・書きかけの行は次回に回す
+                if offset + len(raw) > stat.st_size:
+                    break
+                if not raw.endswith(b'\n') and not settled:
+                    break
+                offset += len(raw)
+                line_number += 1
+                line = raw.decode('utf-8', errors='ignore').strip()
+                if line:
+                    yield path, line_number, line
+
+            fingerprint = _fingerprint(handle, min(offset, FINGERPRINT_BYTES))
+
+        self.bytes_read += offset - start
+        self._pending[(stat.st_dev, stat.st_ino)] = LogCheckpoint(
+            device=stat.st_dev,
+            inode=stat.st_ino,
+            path=str(path),
+            offset=offset,
+            line_count=line_number,
+            fingerprint=fingerprint,
+            mtime_ns=stat.st_mtime_ns
+        )
+
+
+class LogRollupBatch:
+    """1回の読み込みで得た新規行のローリング集計
+
+    エントリのリストは保持せず、時間×レベル×モジュール別件数、パターン別件数、
+    レベル別レスポンス時間だけを持つ。エラー行は mine_template でテンプレートに割り当て、
+    そのIDもパターンとして数える。
+    """
+
+    def __init__(
+        self,
+        match_pattern_ids: Callable[[str], List[str]],
+        extract_response_time: Callable[[str], Optional[float]],
+        mine_template: Callable[[str, datetime], str],
+        example_limit: int = 5
+    ):
+        self.match_pattern_ids = match_pattern_ids
+        self.extract_response_time = extract_response_time
+        self.mine_template = mine_template
+        self.example_limit = example_limit
+        self.entries = 0
+        self.hourly: Counter = Counter()
+        # (pattern_id, hour, level) -> [件数, 初回, 最終]
+        self.pattern_hits: Dict[Tuple[str, str, str], list] = {}
+        self.pattern_examples: Dict[str, List[str]] = defaultdict(list)
+        self.response_times: Dict[str, array] = defaultdict(lambda: array('d'))
+        self._default_modules: Dict[Path, str] = {}
+
+    def add(self, path: Path, line_number: int, line: str):
+        """1行を集計に加える"""
+        default_module = self._default_modules.get(path)
+        if default_module is None:
+            default_module = self._default_modules[path] = path.stem
+        timestamp, level, module, message = parse_log_line(line, default_module)
+        hour = timestamp.isoformat(timespec='hours') + ':00:00'
+        self.entries += 1
+        self.hourly[(hour, level, module)] += 1
+
+        pattern_ids = self.match_pattern_ids(line)
+        if level in ERROR_LEVELS:
+            pattern_ids.append(self.mine_template(message, timestamp))
+
+        for pattern_id in pattern_ids:
+            key = (pattern_id, hour, level)
+            hit = self.pattern_hits.get(key)
+            if hit is None:
+                self.pattern_hits[key] = [1, timestamp, timestamp]
+            else:
+                hit[0] += 1
+                hit[1] = min(hit[1], timestamp)
+                hit[2] = max(hit[2], timestamp)
+            examples = self.pattern_examples[pattern_id]
+            if len(examples) < self.example_limit:
+                examples.append(message)
+
+        response_time = self.extract_response_time(message)
+        if response_time:
+            self.response_times[level].append(response_time)
+
@@ -0,0 +1,182 @@
+"""
+ログテンプレートマイナー
+Drain方式の固定深さ解析木で、ログメッセージをテンプレート（可変部分を <*> にした文字列）に
+ほぼ一定時間で割り当て、テンプレートごとの件数をオンラインで保持する
+"""
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+PARAM = '<*>'
+
+# 数値・16進数・IPアドレス・UUID など、トークン全体が可変値のものを <*> に置き換える
+VARIABLE_TOKEN = re.compile(
+    r'^(?:[-+]?\d+(?:[.,:]\d+)*(?:ms|s|%|kb|mb|gb)?'
+    r'|0x[0-9a-f]+'
+    r'|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
+    r'|\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?)$',
+    re.IGNORECASE
+)
+
+
+def tokenize(message: str) -> List[str]:
+    """メッセージを空白で分割し、可変値のトークンを <*> に置き換える"""
+    return [PARAM if VARIABLE_TOKEN.match(token) else token for token in message.split()]
+
+
+def template_regex(template: str) -> str:
+    """テンプレート文字列に一致する正規表現"""
+    return r'\s+'.join(r'\S+' if token == PARAM else re.escape(token) for token in template.split())
+
+
+@dataclass
+class LogTemplate:
+    """テンプレート（クラスタ）"""
+    cluster_id: int
+    tokens: List[str]
+    size: int = 0
+    first_seen: Optional[datetime] = None
+    last_seen: Optional[datetime] = None
+    examples: List[str] = field(default_factory=list)
+
+    @property
+    def pattern_id(self) -> str:
+        return f"dynamic_cluster_{self.cluster_id}"
+
+    @property
+    def template(self) -> str:
+        return ' '.join(self.tokens)
+
+
+class DrainTemplateMiner:
+    """Drain方式のテンプレートマイナー
+
+    解析木は「トークン数 → 先頭 depth - 2 個のトークン → テンプレート一覧」の固定深さで、
+    1行あたりの比較は同じ葉のテンプレートだけに限られる。テンプレート数は max_clusters で
+    上限を設け、超えた場合は最も長く出現していないものから破棄する。
+    """
+
+    def __init__(
+        self,
+        depth: int = 4,
+        similarity_threshold: float = 0.4,
+        max_children: int = 100,
+        max_clusters: int = 1000,
+        example_limit: int = 5
+    ):
+        self.prefix_length = max(depth - 2, 1)
+        self.similarity_threshold = similarity_threshold
+        self.max_children = max_children
+        self.max_clusters = max_clusters
+        self.example_limit = example_limit
+        self.templates: 'OrderedDict[int, LogTemplate]' = OrderedDict()
+        self.root: Dict[int, dict] = {}
+        self._leaves: Dict[int, List[int]] = {}
+        self.next_id = 0
+        # 保存が必要な（追加・更新された）テンプレートID
+        self.dirty: set = set()
+        self._lock = threading.Lock()
+
+    def add(self, message: str, timestamp: Optional[datetime] = None) -> LogTemplate:
+        """メッセージをテンプレートに割り当て、件数を更新"""
+        tokens = tokenize(message)
+        timestamp = timestamp or datetime.now()
+
+        with self._lock:
+            leaf = self._leaf(tokens)
+            template = self._best_match(leaf, tokens)
+            if template is None:
+                template = self._create(leaf, tokens)
+            else:
+                template.tokens = [
+                    token if token == new_token else PARAM
+                    for token, new_token in zip(template.tokens, tokens)
+                ]
+                self.templates.move_to_end(template.cluster_id)
+
+            template.size += 1
+            if template.first_seen is None or timestamp < template.first_seen:
+                template.first_seen = timestamp
+            if template.last_seen is None or timestamp > template.last_seen:
+                template.last_seen = timestamp
+            if len(template.examples) < self.example_limit:
+                template.examples.append(message)
+            self.dirty.add(template.cluster_id)
+            return template
+
+    def restore(self, cluster_id: int, template: str, size: int = 0):
+        """保存済みテンプレートを解析木に戻す（IDを維持）"""
+        tokens = template.split()
+        with self._lock:
+            restored = self._create(self._leaf(tokens), tokens, cluster_id)
+            restored.size = size
+            self.next_id = max(self.next_id, cluster_id + 1)
+
+    def top_templates(self, limit: int = 10) -> List[LogTemplate]:
+        """件数の多いテンプレート"""
+        with self._lock:
+            return sorted(self.templates.values(), key=lambda t: t.size, reverse=True)[:limit]
+
+    def pop_dirty(self) -> List[LogTemplate]:
+        """前回以降に追加・更新されたテンプレートを取り出す"""
+        with self._lock:
+            changed = [self.templates[cluster_id] for cluster_id in self.dirty
+                       if cluster_id in self.templates]
+            self.dirty.clear()
+            return changed
+
+    def mark_dirty(self, templates: List[LogTemplate]):
+        """保存に失敗したテンプレートを次回の保存対象に戻す"""
+        with self._lock:
+            self.dirty.update(template.cluster_id for template in templates
+                              if template.cluster_id in self.templates)
+
+    def _leaf(self, tokens: List[str]) -> List[int]:
+        """トークン数と先頭トークンで解析木をたどり、葉（テンプレートIDのリスト）を返す"""
+        node = self.root.setdefault(len(tokens), {})
+        for token in tokens[:self.prefix_length]:
+            # 数字を含むトークンは可変値とみなしてワイルドカードの枝へ
+            key = PARAM if any(char.isdigit() for char in token) else token
+            if key not in node:
+                if len(node) >= self.max_children:
+                    key = PARAM
+                node = node.setdefault(key, {})
+            else:
+                node = node[key]
+        return node.setdefault(None, [])
+
+    def _best_match(self, leaf: List[int], tokens: List[str]) -> Optional[LogTemplate]:
+        """葉の中で類似度が閾値以上かつ最大のテンプレート"""
+        best, best_score = None, (-1.0, -1)
+        for cluster_id in leaf:
+            template = self.templates[cluster_id]
+            same = params = 0
+            for token, new_token in zip(template.tokens, tokens):
+                if token == PARAM:
+                    params += 1
+                elif token == new_token:
+                    same += 1
+            similarity = same / len(tokens) if tokens else 1.0
+            if similarity >= self.similarity_threshold and (similarity, params) > best_score:
+                best, best_score = template, (similarity, params)
+        return best
+
+    def _create(self, leaf: List[int], tokens: List[str], cluster_id: Optional[int] = None) -> LogTemplate:
+        """新しいテンプレートを作成し、上限を超えたら最も古いものを破棄"""
+        if cluster_id is None:
+            cluster_id = self.next_id
+            self.next_id += 1
+        template = LogTemplate(cluster_id=cluster_id, tokens=list(tokens))
+        self.templates[cluster_id] = template
+        self._leaves[cluster_id] = leaf
+        leaf.append(cluster_id)
+
+        while len(self.templates) > self.max_clusters:
+            evicted_id, _ = self.templates.popitem(last=False)
+            self._leaves.pop(evicted_id).remove(evicted_id)
+            self.dirty.discard(evicted_id)
+
+        return template
@@ -14,12 +14,17 @@ from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
 from pathlib import Path
-import threading
 from contextlib import asynccontextmanager
 import statistics
 import gc
 import sys
 
+try:
+    from ..utils.metrics import MetricsRegistry, get_metrics_registry
+except ImportError:
+    # src/ をパスに追加して monitoring をトップレベルパッケージとして読み込んだ場合
+    from utils.metrics import MetricsRegistry, get_metrics_registry
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -201,51 +206,68 @@ class MetricsCollector:
         }
 
 class ApplicationMetricsCollector:
-    """アプリケーションメトリクス収集器"""
+    """アプリケーションメトリクス収集器（値はメトリクスレジストリに記録）"""
     
-    def __init__(self):
-        self.metrics = {
-            'active_tasks': 0,
-            'completed_tasks': 0,
-            'failed_tasks': 0,
-            'cache_hits': 0,
-            'cache_misses': 0,
-            'api_calls_count': 0,
-            'api_calls_failed': 0,
-            'database_queries': 0,
-            'database_query_time': 0.0,
-            'gc_collections': 0
-        }
-        self.lock = threading.Lock()
+    COUNTER_METRICS = (
+        'completed_tasks', 'failed_tasks', 'cache_hits', 'cache_misses',
+        'api_calls_count', 'api_calls_failed', 'database_queries', 'database_query_time'
+    )
+    GAUGE_METRICS = ('active_tasks',)
+    
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        registry = registry or get_metrics_registry()
+        counters = registry.counter('news_app_events_total', 'Application counters', ('metric',))
+        gauges = registry.gauge('news_app_gauge', 'Application gauges', ('metric',))
+        # 記録のたびにラベル検索しないよう、子メトリクスを事前に解決しておく
+        self._counters = {name: counters.labels(name) for name in self.COUNTER_METRICS}
+        self._gauges = {name: gauges.labels(name) for name in self.GAUGE_METRICS}
+        self._process = psutil.Process()
         
     def increment(self, metric_name: str, value: int = 1):
         """メトリクス増分"""
-        with self.lock:
-            if metric_name in self.metrics:
-                self.metrics[metric_name] += value
+        gauge = self._gauges.get(metric_name)
+        if gauge is not None:
+            gauge.inc(value)
+            return
+        counter = self._counters.get(metric_name)
+        if counter is not None:
+            counter.inc(value)
     
     def set_value(self, metric_name: str, value: float):
-        """メトリクス値設定"""
-        with self.lock:
-            self.metrics[metric_name] = value
+        """メトリクス値設定（カウンターは単調増加のため、ゲージのみ設定可能）"""
+        gauge = self._gauges.get(metric_name)
+        if gauge is not None:
+            gauge.set(value)
+        else:
+            logger.debug(f"set_value ignored for counter metric: {metric_name}")
+    
+    @property
+    def metrics(self) -> Dict[str, float]:
+        """現在値の辞書"""
+        values = {name: child.value for name, child in self._counters.items()}
+        values.update((name, child.value) for name, child in self._gauges.items())
+        return values
     
     def get_current_metrics(self) -> ApplicationMetrics:
         """現在のメトリクス取得"""
-        with self.lock:
-            # メモリ使用量
-            process = psutil.Process()
-            memory_mb = process.memory_info().rss / 1024 / 1024
-            
-            # GC統計
-            gc_stats = gc.get_stats()
-            total_collections = sum(stat['collections'] for stat in gc_stats)
-            
-            return ApplicationMetrics(
-                timestamp=datetime.now(),
-                memory_usage_mb=memory_mb,
-                gc_collections=total_collections,
-                **self.metrics.copy()
-            )
+        # メモリ使用量
+        memory_mb = self._process.memory_info().rss / 1024 / 1024
+        
+        # GC統計
+        gc_stats = gc.get_stats()
+        total_collections = sum(stat['collections'] for stat in gc_stats)
+        
+        values = {
+            name: value if name == 'database_query_time' else int(value)
+            for name, value in self.metrics.items()
+        }
+        
+        return ApplicationMetrics(
+            timestamp=datetime.now(),
+            memory_usage_mb=memory_mb,
+            gc_collections=total_collections,
+            **values
+        )
 
 class AlertManager:
     """アラート管理"""
@@ -3,6 +3,12 @@ Notification Module
 通知モジュール
 """
 
-from .gmail_sender import GmailSender
+try:
+    from ..utils.lazy_exports import lazy_exports
+except ImportError:
+    from utils.lazy_exports import lazy_exports
 
-__all__ = ['GmailSender']
\ No newline at end of file
+# サブモジュールは属性の初回参照時に読み込む（起動時間短縮）
+lazy_exports(globals(), {
+    'GmailSender': '.gmail_sender',
+})
@@ -33,6 +33,7 @@ except ImportError:
 
 from models.article import Article
 from utils.config import get_config
+from utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -91,8 +92,12 @@ class GmailSender:
     
     async def send_daily_report(self, html_content: str = None, 
                               pdf_path: Optional[str] = None,
-                              articles: List[Article] = None) -> bool:
-        """日次レポート送信 - プレーンテキスト形式専用（SMTP使用）"""
+                              articles: List[Article] = None,
+                              pdf_bytes: Optional[bytes] = None) -> bool:
+        """日次レポート送信 - プレーンテキスト形式専用（SMTP使用）
+        
+        pdf_bytes が渡された場合はディスクを再読込せずそのまま添付する。
+        """
         try:
             # OAuth2は使わずSMTP直接送信
             # 現在時刻を取得
@@ -133,7 +138,8 @@ class GmailSender:
                 subject=subject,
                 text_content=text_content,
                 pdf_path=pdf_path,
-                email_type='daily'
+                email_type='daily',
+                pdf_bytes=pdf_bytes
             )
             
             # 統計更新
@@ -219,6 +225,7 @@ class GmailSender:
             self._update_send_stats('weekly', False, str(e))
             return False
     
+    @traced('gmail.send_email', category='send')
     async def _send_email(self, recipients: List[str], 
                          subject: str,
                          html_content: str,
@@ -302,24 +309,28 @@ class GmailSender:
         """PDF添付"""
         try:
             with open(pdf_path, 'rb') as f:
-                attachment = MIMEBase('application', 'pdf')
-                attachment.set_payload(f.read())
-            
-            encoders.encode_base64(attachment)
-            
-            # ファイル名設定
-            filename = os.path.basename(pdf_path)
-            attachment.add_header(
-                'Content-Disposition',
-                f'attachment; filename="{filename}"'
-            )
+                pdf_bytes = f.read()
             
-            message.attach(attachment)
-            logger.debug(f"PDF attached: {filename}")
+            self._attach_pdf_bytes(message, pdf_bytes, os.path.basename(pdf_path))
             
         except Exception as e:
             logger.warning(f"Failed to attach PDF {pdf_path}: {e}")
     
+    def _attach_pdf_bytes(self, message: MIMEMultipart, pdf_bytes: bytes, filename: str):
+        """メモリ上のPDFバイト列を添付"""
+        attachment = MIMEBase('application', 'pdf')
+        attachment.set_payload(pdf_bytes)
+        encoders.encode_base64(attachment)
+        
+        # ファイル名設定
+        attachment.add_header(
+            'Content-Disposition',
+            f'attachment; filename="{filename}"'
+        )
+        
+        message.attach(attachment)
+        logger.debug(f"PDF attached: {filename}")
+    
     def _generate_japanese_summary(self, article) -> str:
         """日本語概要の自動生成"""
         try:
@@ -578,9 +589,11 @@ class GmailSender:
             logger.error(f"Text email generation failed: {e}")
             return f"メール生成エラー: {str(e)}"
     
+    @traced('gmail.send_text_email', category='send')
     async def _send_text_email(self, recipients: List[str], subject: str,
                               text_content: str, pdf_path: Optional[str] = None,
-                              email_type: str = 'general') -> bool:
+                              email_type: str = 'general',
+                              pdf_bytes: Optional[bytes] = None) -> bool:
         """プレーンテキストメール送信"""
         try:
             import smtplib
@@ -606,7 +619,10 @@ class GmailSender:
                     message.attach(text_part)
                     
                     # PDF添付（オプション）
-                    if pdf_path and os.path.exists(pdf_path):
+                    if pdf_bytes:
+                        filename = os.path.basename(pdf_path) if pdf_path else 'news_report.pdf'
+                        self._attach_pdf_bytes(message, pdf_bytes, filename)
+                    elif pdf_path and os.path.exists(pdf_path):
                         self._attach_pdf(message, pdf_path)
                     
                     # SMTP送信
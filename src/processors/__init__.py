@@ -8,12 +8,14 @@ This package contains modules for:
 - Deduplication processing
 """
 
-from .translator import DeepLTranslator
-from .analyzer import ClaudeAnalyzer
-from .deduplicator import ArticleDeduplicator
+try:
+    from ..utils.lazy_exports import lazy_exports
+except ImportError:
+    from utils.lazy_exports import lazy_exports
 
-__all__ = [
-    'DeepLTranslator',
-    'ClaudeAnalyzer', 
-    'ArticleDeduplicator'
-]
\ No newline at end of file
+# サブモジュールは属性の初回参照時に読み込む（起動時間短縮）
+lazy_exports(globals(), {
+    'DeepLTranslator': '.translator',
+    'ClaudeAnalyzer': '.analyzer',
+    'ArticleDeduplicator': '.deduplicator',
+})
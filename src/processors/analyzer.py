@@ -25,11 +25,11 @@ os.environ['ANTHROPIC_CONTEXT_MODE'] = 'context7'
 os.environ['ANTHROPIC_ENHANCED_REASONING'] = 'true'
 os.environ['ANTHROPIC_DEEP_ANALYSIS'] = 'enabled'
 
-import anthropic
-
 from utils.config import get_config
-from utils.cache_manager import CacheManager
+from utils.cache_manager import get_cache_manager
 from utils.rate_limiter import get_rate_limiter
+from utils.metrics import stage_event_counter, stage_latency_histogram
+from utils.tracing import current_span, traced
 from models.article import Article
 
 
@@ -102,7 +102,7 @@ class ClaudeAnalyzer:
     
     def __init__(self, config=None):
         self.config = config or get_config()
-        self.cache_manager = CacheManager()
+        self.cache_manager = get_cache_manager()
         self.rate_limiter = get_rate_limiter()
         
         # Claude API設定 - Claude 4 Sonnet対応
@@ -126,6 +126,8 @@ class ClaudeAnalyzer:
         
         # Claude クライアント初期化
         if self.api_key:
+            # Anthropic SDK は読み込みが重いためクライアント作成時に読み込む
+            import anthropic
             self.client = anthropic.AsyncAnthropic(api_key=self.api_key)
         else:
             self.client = None
@@ -139,6 +141,11 @@ class ClaudeAnalyzer:
             'errors': 0,
             'total_processing_time': 0.0
         }
+        stage_events = stage_event_counter()
+        self._metric_cache_hits = stage_events.labels('analyze', 'claude', 'cache_hit')
+        self._metric_api_calls = stage_events.labels('analyze', 'claude', 'api_call')
+        self._metric_errors = stage_events.labels('analyze', 'claude', 'error')
+        self._metric_latency = stage_latency_histogram().labels('analyze', 'claude')
         
         logger.info("Claude Analyzer initialized")
     
@@ -155,6 +162,7 @@ class ClaudeAnalyzer:
             if cached_result:
                 logger.debug("Analysis cache hit")
                 self.analysis_stats['cache_hits'] += 1
+                self._metric_cache_hits.inc()
                 self._apply_cached_analysis(article, cached_result)
                 return article
             
@@ -175,6 +183,8 @@ class ClaudeAnalyzer:
             self.analysis_stats['total_requests'] += 1
             self.analysis_stats['api_calls'] += 1
             self.analysis_stats['total_processing_time'] += processing_time
+            self._metric_api_calls.inc()
+            self._metric_latency.observe(processing_time)
             
             logger.debug(f"Article analysis completed: {article.url} in {processing_time:.2f}s")
             return article
@@ -182,6 +192,7 @@ class ClaudeAnalyzer:
         except Exception as e:
             logger.error(f"Article analysis failed: {e}")
             self.analysis_stats['errors'] += 1
+            self._metric_errors.inc()
             return article
     
     async def analyze_batch(self, articles: List[Article]) -> List[Article]:
@@ -232,8 +243,10 @@ class ClaudeAnalyzer:
             logger.error(f"Batch analysis failed: {e}")
             raise AnalysisError(f"Batch analysis failed: {e}")
     
+    @traced('claude.analyze', category='analyze')
     async def _perform_analysis(self, article: Article) -> AnalysisResult:
         """AI分析実行"""
+        current_span().set('url', article.url)
         try:
             if not self.client:
                 raise AnalysisError("Claude API client not initialized")
@@ -620,28 +633,45 @@ class ClaudeAnalyzer:
             logger.error(f"Daily summary generation failed: {e}")
             return f"本日は{len(articles)}件の記事を分析しました。詳細は添付のレポートをご確認ください。"
     
-    async def create_weekly_summary(self, articles: List[Article]) -> str:
-        """週次サマリー生成 - トレンド分析強化"""
+    async def create_weekly_summary(self, articles: List[Article],
+                                    rollup: Optional[Dict[str, Any]] = None) -> str:
+        """週次サマリー生成 - トレンド分析強化
+
+        rollup（Database.get_period_summary の結果）が渡された場合は
+        記事を走査せず集計済みの値を使用する。
+        """
         try:
-            if not articles:
-                return "今週は分析対象の記事がありませんでした。"
-            
-            # トレンド分析を実行
-            trend_analysis = await self._perform_trend_analysis(articles)
+            if rollup is not None:
+                total_articles = rollup.get('total_articles', 0)
+            else:
+                total_articles = len(articles)
             
-            # 週次統計計算
-            total_articles = len(articles)
-            urgent_articles = len([a for a in articles if getattr(a, 'importance_score', 5) >= 8])
+            if not total_articles:
+                return "今週は分析対象の記事がありませんでした。"
             
-            # カテゴリ別分析
-            category_analysis = {}
-            for article in articles:
-                category = getattr(article, 'category', 'その他')
-                category_name = category.value if hasattr(category, 'value') else str(category)
-                if category_name not in category_analysis:
-                    category_analysis[category_name] = {'count': 0, 'importance_sum': 0}
-                category_analysis[category_name]['count'] += 1
-                category_analysis[category_name]['importance_sum'] += getattr(article, 'importance_score', 5)
+            if rollup is not None:
+                trend_analysis = self._trend_analysis_from_keywords(rollup.get('top_keywords', []))
+                urgent_articles = rollup.get('high_importance_count', 0)
+                category_analysis = {
+                    name: {'count': data['count'], 'importance_sum': data['importance_sum']}
+                    for name, data in rollup.get('categories', {}).items()
+                }
+            else:
+                # トレンド分析を実行
+                trend_analysis = await self._perform_trend_analysis(articles)
+                
+                # 週次統計計算
+                urgent_articles = len([a for a in articles if getattr(a, 'importance_score', 5) >= 8])
+                
+                # カテゴリ別分析
+                category_analysis = {}
+                for article in articles:
+                    category = getattr(article, 'category', 'その他')
+                    category_name = category.value if hasattr(category, 'value') else str(category)
+                    if category_name not in category_analysis:
+                        category_analysis[category_name] = {'count': 0, 'importance_sum': 0}
+                    category_analysis[category_name]['count'] += 1
+                    category_analysis[category_name]['importance_sum'] += getattr(article, 'importance_score', 5)
             
             # トップカテゴリ
             top_categories = sorted(category_analysis.items(), key=lambda x: x[1]['count'], reverse=True)[:3]
@@ -663,7 +693,8 @@ class ClaudeAnalyzer:
             
         except Exception as e:
             logger.error(f"Weekly summary generation failed: {e}")
-            return f"今週は{len(articles)}件の記事を分析しました。"
+            total = rollup.get('total_articles', 0) if rollup is not None else len(articles)
+            return f"今週は{total}件の記事を分析しました。"
     
     async def _perform_trend_analysis(self, articles: List[Article]) -> Dict[str, Any]:
         """トレンド分析実行"""
@@ -687,19 +718,9 @@ class ClaudeAnalyzer:
             # トップキーワード抽出
             top_keywords = sorted(keyword_frequency.items(), key=lambda x: x[1], reverse=True)[:10]
             
-            # 新興トピックの特定（出現頻度が中程度で重要度が高いもの）
-            emerging_topics = []
-            for keyword, freq in top_keywords:
-                if 2 <= freq <= 5:  # 適度な頻度
-                    emerging_topics.append(keyword)
-            
-            return {
-                'top_keywords': [kw[0] for kw in top_keywords[:5]],
-                'emerging_topics': emerging_topics[:5],
-                'sentiment_distribution': sentiment_distribution,
-                'rising_trends': [kw[0] for kw in top_keywords if kw[1] >= 3][:3],
-                'declining_trends': []  # 履歴データがないため空
-            }
+            trend = self._trend_analysis_from_keywords(top_keywords)
+            trend['sentiment_distribution'] = sentiment_distribution
+            return trend
             
         except Exception as e:
             logger.error(f"Trend analysis failed: {e}")
@@ -711,6 +732,24 @@ class ClaudeAnalyzer:
                 'declining_trends': []
             }
     
+    def _trend_analysis_from_keywords(self, top_keywords: List[tuple]) -> Dict[str, Any]:
+        """頻度順の (キーワード, 出現数) からトレンド情報を作成"""
+        top_keywords = list(top_keywords)[:10]
+        
+        # 新興トピックの特定（出現頻度が中程度で重要度が高いもの）
+        emerging_topics = []
+        for keyword, freq in top_keywords:
+            if 2 <= freq <= 5:  # 適度な頻度
+                emerging_topics.append(keyword)
+        
+        return {
+            'top_keywords': [kw[0] for kw in top_keywords[:5]],
+            'emerging_topics': emerging_topics[:5],
+            'sentiment_distribution': {},
+            'rising_trends': [kw[0] for kw in top_keywords if kw[1] >= 3][:3],
+            'declining_trends': []  # 履歴データがないため空
+        }
+    
     def get_analysis_statistics(self) -> Dict[str, Any]:
         """分析統計情報取得 - 強化版"""
         cache_hit_rate = (self.analysis_stats['cache_hits'] / 
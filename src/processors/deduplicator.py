@@ -9,8 +9,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import hashlib
 import logging
+import math
 from datetime import datetime, timedelta
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Optional, Sequence, Set, Tuple, TYPE_CHECKING
 from dataclasses import dataclass
 import difflib
 import re
@@ -18,9 +19,107 @@ import re
 from models.article import Article
 from utils.cache_manager import get_cache_manager
 
+if TYPE_CHECKING:
+    from utils.async_executor import AsyncExecutor, SharedColumns
+
 
 logger = logging.getLogger(__name__)
 
+_NO_SOURCE = object()
+
+# 共通キーワード判定で除外する語
+STOP_WORDS = frozenset({
+    'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had', 
+    'her', 'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his', 
+    'how', 'its', 'may', 'new', 'now', 'old', 'see', 'two', 'who', 'boy',
+    'この', 'その', 'あの', 'どの', 'です', 'ます', 'である', 'だった'
+})
+_WORD_PATTERN = re.compile(r'\b\w{3,}\b')  # 3文字以上の単語
+
+
+def common_keywords(text1: str, text2: str) -> Set[str]:
+    """共通キーワード抽出（簡単な単語分割、日本語対応は制限的）"""
+    words1 = set(_WORD_PATTERN.findall(text1)) - STOP_WORDS
+    words2 = set(_WORD_PATTERN.findall(text2)) - STOP_WORDS
+    return words1.intersection(words2)
+
+
+def _ratio_exceeds(text1: str, text2: str, threshold: float) -> bool:
+    """SequenceMatcher の一致率が threshold を超えるか
+
+    ratio() <= quick_ratio() <= real_quick_ratio() なので、安価な上限で足りない組は
+    ratio() を計算せずに除外する（判定結果は ratio() のみの場合と同じ）。
+    """
+    matcher = difflib.SequenceMatcher(None, text1, text2)
+    return (matcher.real_quick_ratio() > threshold and
+            matcher.quick_ratio() > threshold and
+            matcher.ratio() > threshold)
+
+
+def keys_similar(key1: Tuple[str, str, str, float], key2: Tuple[str, str, str, float],
+                 title_threshold: float, content_threshold: float) -> bool:
+    """比較キー（タイトル・比較用本文・配信元・公開時刻）による類似判定"""
+    title1, content1, source1, published1 = key1
+    title2, content2, source2, published2 = key2
+    
+    # タイトル類似度チェック
+    if _ratio_exceeds(title1, title2, title_threshold):
+        return True
+    
+    # 内容類似度チェック
+    if content1 and content2 and _ratio_exceeds(content1, content2, content_threshold):
+        return True
+    
+    # 同一ソース・1時間以内の記事で、タイトルに3つ以上の共通キーワードがある場合
+    if (source1 and source1 == source2 and
+            not math.isnan(published1) and not math.isnan(published2) and
+            abs(published1 - published2) < 3600):
+        return len(common_keywords(title1, title2)) >= 3
+    
+    return False
+
+
+def similar_pairs(keys: Sequence[Tuple[str, str, str, float]], rows: Sequence[int],
+                  title_threshold: float, content_threshold: float) -> List[Tuple[int, int]]:
+    """rows の各行 i について、i より後ろの行 j と類似する組 (i, j) を列挙"""
+    size = len(keys)
+    pairs = []
+    for i in rows:
+        key = keys[i]
+        for j in range(i + 1, size):
+            if keys_similar(key, keys[j], title_threshold, content_threshold):
+                pairs.append((i, j))
+    return pairs
+
+
+def similar_pairs_on_shared(columns: 'SharedColumns', start: int, stop: int,
+                            title_threshold: float, content_threshold: float) -> List[Tuple[int, int]]:
+    """プロセスプール側: 共有メモリの比較キー列から [start, stop) 行の類似組を列挙"""
+    keys = list(zip(columns.texts('title'), columns.texts('content'),
+                    columns.texts('source'), columns.numbers('published')))
+    return similar_pairs(keys, range(start, stop), title_threshold, content_threshold)
+
+
+def balanced_row_ranges(size: int, parts: int) -> List[Tuple[int, int]]:
+    """行 i の比較数（size - 1 - i）の合計がほぼ等しくなるように行範囲を分割"""
+    total = size * (size - 1) // 2
+    parts = max(1, min(parts, size))
+    ranges = []
+    start = 0
+    covered = 0
+    for part in range(1, parts + 1):
+        target = total * part // parts
+        stop = start
+        while stop < size and (covered < target or stop == start):
+            covered += size - 1 - stop
+            stop += 1
+        if part == parts:
+            stop = size
+        if stop > start:
+            ranges.append((start, stop))
+        start = stop
+    return ranges
+
 
 @dataclass
 class DuplicationResult:
@@ -56,41 +155,97 @@ class ArticleDeduplicator:
             url_deduped = self._deduplicate_by_url(articles)
             logger.debug(f"URL deduplication: {len(articles)} -> {len(url_deduped)}")
             
-            # 内容類似度による重複検出
-            content_deduped, duplicate_groups = self._deduplicate_by_content(url_deduped)
-            logger.debug(f"Content deduplication: {len(url_deduped)} -> {len(content_deduped)}")
+            return self._finish_deduplication(articles, url_deduped, None, start_time)
             
-            # 過去記事との重複チェック
-            final_articles = self._check_historical_duplicates(content_deduped)
-            logger.debug(f"Historical deduplication: {len(content_deduped)} -> {len(final_articles)}")
-            
-            # 重複キャッシュを更新
-            self._update_duplicate_cache(final_articles)
-            
-            processing_time = (datetime.now() - start_time).total_seconds()
-            duplicate_count = len(articles) - len(final_articles)
+        except Exception as e:
+            logger.error(f"Deduplication failed: {e}")
+            return self._fallback_result(articles, start_time)
+    
+    async def deduplicate_async(self, articles: List[Article], executor: 'AsyncExecutor',
+                                min_articles: int = 200) -> DuplicationResult:
+        """記事リストから重複を除去（内容類似度の総当たり比較をプロセスプールで実行）
+        
+        URL重複除去後の件数が min_articles 未満の場合、またはプロセスプールでの比較に失敗した
+        場合は deduplicate と同じくプロセス内で比較する。
+        """
+        start_time = datetime.now()
+        
+        try:
+            logger.info(f"Starting deduplication for {len(articles)} articles")
             
-            result = DuplicationResult(
-                unique_articles=final_articles,
-                duplicate_count=duplicate_count,
-                duplicate_groups=duplicate_groups,
-                processing_time=processing_time
-            )
+            url_deduped = self._deduplicate_by_url(articles)
+            logger.debug(f"URL deduplication: {len(articles)} -> {len(url_deduped)}")
             
-            logger.info(f"Deduplication completed: {duplicate_count} duplicates removed "
-                       f"in {processing_time:.2f}s")
+            similar = None
+            if len(url_deduped) >= min_articles:
+                try:
+                    similar = await self.find_similar_pairs(url_deduped, executor)
+                except Exception as e:
+                    # プール破損・共有メモリ確保失敗などはプロセス内の比較で続行
+                    logger.warning(f"Process pool similarity failed, comparing in-process: {e}")
             
-            return result
+            return self._finish_deduplication(articles, url_deduped, similar, start_time)
             
         except Exception as e:
             logger.error(f"Deduplication failed: {e}")
-            # エラー時は元の記事リストを返す
-            return DuplicationResult(
-                unique_articles=articles,
-                duplicate_count=0,
-                duplicate_groups=[],
-                processing_time=(datetime.now() - start_time).total_seconds()
-            )
+            return self._fallback_result(articles, start_time)
+    
+    async def find_similar_pairs(self, articles: List[Article],
+                                 executor: 'AsyncExecutor') -> Set[Tuple[int, int]]:
+        """全記事の類似組 (i, j)（i < j）をプロセスプールで列挙
+        
+        記事オブジェクトは送らず、比較キーの列だけを共有メモリに置いて各プロセスに参照させる。
+        """
+        keys = [self._comparison_keys(article) for article in articles]
+        titles, contents, sources, published = zip(*keys) if keys else ((), (), (), ())
+        
+        chunks = await executor.map_shared(
+            similar_pairs_on_shared,
+            {'title': titles, 'content': contents, 'source': sources},
+            {'published': published},
+            ranges=balanced_row_ranges(len(keys), executor.worker_pool.process_pool_size),
+            args=(self.title_similarity_threshold, self.content_similarity_threshold)
+        )
+        return {pair for chunk in chunks for pair in chunk}
+    
+    def _finish_deduplication(self, articles: List[Article], url_deduped: List[Article],
+                              similar: Optional[Set[Tuple[int, int]]],
+                              start_time: datetime) -> DuplicationResult:
+        """内容類似度・過去記事との重複除去とキャッシュ更新"""
+        # 内容類似度による重複検出
+        content_deduped, duplicate_groups = self._deduplicate_by_content(url_deduped, similar)
+        logger.debug(f"Content deduplication: {len(url_deduped)} -> {len(content_deduped)}")
+        
+        # 過去記事との重複チェック
+        final_articles = self._check_historical_duplicates(content_deduped)
+        logger.debug(f"Historical deduplication: {len(content_deduped)} -> {len(final_articles)}")
+        
+        # 重複キャッシュを更新
+        self._update_duplicate_cache(final_articles)
+        
+        processing_time = (datetime.now() - start_time).total_seconds()
+        duplicate_count = len(articles) - len(final_articles)
+        
+        result = DuplicationResult(
+            unique_articles=final_articles,
+            duplicate_count=duplicate_count,
+            duplicate_groups=duplicate_groups,
+            processing_time=processing_time
+        )
+        
+        logger.info(f"Deduplication completed: {duplicate_count} duplicates removed "
+                   f"in {processing_time:.2f}s")
+        
+        return result
+    
+    def _fallback_result(self, articles: List[Article], start_time: datetime) -> DuplicationResult:
+        """エラー時は元の記事リストを返す"""
+        return DuplicationResult(
+            unique_articles=articles,
+            duplicate_count=0,
+            duplicate_groups=[],
+            processing_time=(datetime.now() - start_time).total_seconds()
+        )
     
     def _deduplicate_by_url(self, articles: List[Article]) -> List[Article]:
         """URLによる重複除去"""
@@ -124,12 +279,29 @@ class ArticleDeduplicator:
         
         return unique_articles
     
-    def _deduplicate_by_content(self, articles: List[Article]) -> Tuple[List[Article], List[List[Article]]]:
-        """内容による重複除去"""
+    def _deduplicate_by_content(self, articles: List[Article],
+                                similar: Optional[Set[Tuple[int, int]]] = None
+                                ) -> Tuple[List[Article], List[List[Article]]]:
+        """内容による重複除去
+        
+        similar（類似組 (i, j) の集合）を渡した場合は比較せずにそれを使う。渡さない場合は
+        比較キーを記事ごとに一度だけ作り、未処理の組だけを比較する。
+        """
         unique_articles = []
         duplicate_groups = []
         processed_indices = set()
         
+        if similar is None:
+            keys = [self._comparison_keys(article) for article in articles]
+            title_threshold = self.title_similarity_threshold
+            content_threshold = self.content_similarity_threshold
+            
+            def is_similar(i: int, j: int) -> bool:
+                return keys_similar(keys[i], keys[j], title_threshold, content_threshold)
+        else:
+            def is_similar(i: int, j: int) -> bool:
+                return (i, j) in similar
+        
         for i, article in enumerate(articles):
             if i in processed_indices:
                 continue
@@ -142,7 +314,7 @@ class ArticleDeduplicator:
                 if j in processed_indices:
                     continue
                 
-                if self._are_articles_similar(article, other_article):
+                if is_similar(i, j):
                     similar_group.append(other_article)
                     processed_indices.add(j)
             
@@ -158,24 +330,28 @@ class ArticleDeduplicator:
         return unique_articles, duplicate_groups
     
     def _check_historical_duplicates(self, articles: List[Article]) -> List[Article]:
-        """過去記事との重複チェック"""
-        unique_articles = []
+        """過去記事との重複チェック（キャッシュの参照・保存はそれぞれ一括で行う）"""
+        cache_keys = [f"url_hash:{self._url_hash(article.url)}" for article in articles]
+        cached = self.cache.get_many(cache_keys, 'dedup')
         
-        for article in articles:
-            url_hash = hashlib.md5(self._normalize_url(article.url).encode()).hexdigest()
-            
-            # キャッシュから過去の記事をチェック
-            cache_key = f"url_hash:{url_hash}"
-            if not self.cache.exists(cache_key, 'dedup'):
+        unique_articles = []
+        new_entries = {}
+        for article, cache_key in zip(articles, cache_keys):
+            if cache_key not in cached and cache_key not in new_entries:
                 unique_articles.append(article)
                 # 新しい記事をキャッシュに保存
-                self.cache.set(cache_key, article.url, expire=self.cache_expire, category='dedup')
+                new_entries[cache_key] = article.url
             else:
-                cached_url = self.cache.get(cache_key, 'dedup')
+                cached_url = cached.get(cache_key, new_entries.get(cache_key))
                 logger.debug(f"Historical duplicate found: {article.url} (cached: {cached_url})")
         
+        self.cache.set_many(new_entries, expire=self.cache_expire, category='dedup')
         return unique_articles
     
+    def _url_hash(self, url: str) -> str:
+        """正規化URLのハッシュ"""
+        return hashlib.md5(self._normalize_url(url).encode()).hexdigest()
+    
     def _normalize_url(self, url: str) -> str:
         """URL正規化"""
         if not url:
@@ -213,38 +389,27 @@ class ArticleDeduplicator:
     
     def _are_articles_similar(self, article1: Article, article2: Article) -> bool:
         """記事の類似性判定"""
-        # タイトル類似度チェック（属性名を修正）
-        title1 = (getattr(article1, 'translated_title', None) or article1.title or "").lower()
-        title2 = (getattr(article2, 'translated_title', None) or article2.title or "").lower()
-        
-        title_similarity = difflib.SequenceMatcher(None, title1, title2).ratio()
-        if title_similarity > self.title_similarity_threshold:
-            return True
+        return keys_similar(self._comparison_keys(article1), self._comparison_keys(article2),
+                            self.title_similarity_threshold, self.content_similarity_threshold)
+    
+    def _comparison_keys(self, article: Article) -> Tuple[str, str, str, float]:
+        """類似判定用のキー（小文字タイトル・比較用本文・配信元・公開時刻のUNIX秒）
         
-        # 内容類似度チェック
-        content1 = self._extract_content_for_comparison(article1)
-        content2 = self._extract_content_for_comparison(article2)
+        配信元属性がない記事は空文字列（配信元による判定をしない）、公開時刻が
+        datetime でない記事は NaN とする。
+        """
+        title = (getattr(article, 'translated_title', None) or article.title or "").lower()
         
-        if content1 and content2:
-            content_similarity = difflib.SequenceMatcher(None, content1, content2).ratio()
-            if content_similarity > self.content_similarity_threshold:
-                return True
+        source = getattr(article, 'source', _NO_SOURCE)
+        source_key = '' if source is _NO_SOURCE else repr(source)
         
-        # 同一ソース・同一時間の記事チェック
+        published = getattr(article, 'published_at', None)
         try:
-            if (article1.source == article2.source and 
-                article1.published_at and article2.published_at and
-                isinstance(article1.published_at, datetime) and isinstance(article2.published_at, datetime) and
-                abs((article1.published_at - article2.published_at).total_seconds()) < 3600):  # 1時間以内
-                
-                # タイトルに共通キーワードが多い場合
-                common_keywords = self._get_common_keywords(title1, title2)
-                if len(common_keywords) >= 3:  # 3つ以上の共通キーワード
-                    return True
-        except (TypeError, AttributeError):
-            pass
+            published_ts = published.timestamp() if isinstance(published, datetime) else math.nan
+        except (OverflowError, OSError, ValueError):
+            published_ts = math.nan
         
-        return False
+        return title, self._extract_content_for_comparison(article), source_key, published_ts
     
     def _extract_content_for_comparison(self, article: Article) -> str:
         """比較用の内容抽出"""
@@ -266,22 +431,7 @@ class ArticleDeduplicator:
         text1 = str(text1) if text1 is not None else ''
         text2 = str(text2) if text2 is not None else ''
         
-        # 簡単な単語分割（日本語対応は制限的）
-        words1 = set(re.findall(r'\b\w{3,}\b', text1))  # 3文字以上の単語
-        words2 = set(re.findall(r'\b\w{3,}\b', text2))
-        
-        # ストップワード除去
-        stop_words = {
-            'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had', 
-            'her', 'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his', 
-            'how', 'its', 'may', 'new', 'now', 'old', 'see', 'two', 'who', 'boy',
-            'この', 'その', 'あの', 'どの', 'です', 'ます', 'である', 'だった'
-        }
-        
-        words1 = words1 - stop_words
-        words2 = words2 - stop_words
-        
-        return words1.intersection(words2)
+        return common_keywords(text1, text2)
     
     def _select_best_article(self, similar_articles: List[Article]) -> Article:
         """類似記事グループから最適な記事を選択"""
@@ -332,20 +482,19 @@ class ArticleDeduplicator:
         return selected_article
     
     def _update_duplicate_cache(self, articles: List[Article]):
-        """重複キャッシュの更新"""
+        """重複キャッシュの更新（1トランザクションで一括保存）"""
+        entries = {}
         for article in articles:
-            url_hash = hashlib.md5(self._normalize_url(article.url).encode()).hexdigest()
-            cache_key = f"url_hash:{url_hash}"
-            
             # URLハッシュをキャッシュに保存
-            self.cache.set(cache_key, article.url, expire=self.cache_expire, category='dedup')
+            entries[f"url_hash:{self._url_hash(article.url)}"] = article.url
             
             # 内容ハッシュもキャッシュ
             content_for_hash = self._extract_content_for_comparison(article)
             if content_for_hash:
                 content_hash = hashlib.md5(content_for_hash.encode()).hexdigest()
-                content_cache_key = f"content_hash:{content_hash}"
-                self.cache.set(content_cache_key, article.url, expire=self.cache_expire, category='dedup')
+                entries[f"content_hash:{content_hash}"] = article.url
+        
+        self.cache.set_many(entries, expire=self.cache_expire, category='dedup')
     
     def get_stats(self) -> Dict[str, any]:
         """重複除去統計情報を取得"""
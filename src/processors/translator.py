@@ -18,9 +18,12 @@ from dataclasses import dataclass
 from enum import Enum
 
 from utils.config import get_config
-from utils.cache_manager import CacheManager
+from utils.cache_manager import get_cache_manager
 from utils.rate_limiter import get_rate_limiter
 from utils.simple_translator import SimpleTranslator
+from utils.metrics import stage_event_counter, stage_latency_histogram
+from utils.tracing import current_span, traced
+from collectors.session_manager import get_api_client
 from models.article import Article, ArticleLanguage
 
 
@@ -70,7 +73,7 @@ class DeepLTranslator:
     
     def __init__(self, config=None):
         self.config = config or get_config()
-        self.cache_manager = CacheManager()
+        self.cache_manager = get_cache_manager()
         self.rate_limiter = get_rate_limiter()
         
         # DeepL API設定
@@ -113,6 +116,11 @@ class DeepLTranslator:
             'api_calls': 0,
             'errors': 0
         }
+        stage_events = stage_event_counter()
+        self._metric_cache_hits = stage_events.labels('translate', 'deepl', 'cache_hit')
+        self._metric_api_calls = stage_events.labels('translate', 'deepl', 'api_call')
+        self._metric_errors = stage_events.labels('translate', 'deepl', 'error')
+        self._metric_latency = stage_latency_histogram().labels('translate', 'deepl')
         
         if not self.api_key:
             logger.warning("DeepL API key not configured")
@@ -179,6 +187,7 @@ class DeepLTranslator:
         except Exception as e:
             logger.error(f"Article translation failed: {e}. Using fallback translator.")
             self.translation_stats['errors'] += 1
+            self._metric_errors.inc()
             # フォールバック: SimpleTranslatorを使用
             return self._fallback_translation(article)
     
@@ -212,6 +221,9 @@ class DeepLTranslator:
                 batch_characters = sum(len(a.title or '') + len(getattr(a, 'content', '') or '') for a in batch)
                 await self.rate_limiter.wait_if_needed('deepl', batch_characters)
                 
+                # キャッシュ済み翻訳を1回の問い合わせでメモリキャッシュに読み込む
+                self._prefetch_cached_translations(batch)
+                
                 # バッチ翻訳実行
                 batch_results = await asyncio.gather(
                     *[translate_with_semaphore(article) for article in batch],
@@ -261,6 +273,7 @@ class DeepLTranslator:
             if cached_result:
                 logger.debug("Translation cache hit")
                 self.translation_stats['cache_hits'] += 1
+                self._metric_cache_hits.inc()
                 return TranslationResult(
                     original_text=text,
                     translated_text=cached_result['translated_text'],
@@ -301,8 +314,11 @@ class DeepLTranslator:
             self.translation_stats['total_characters'] += len(text)
             self.translation_stats['api_calls'] += 1
             
+            self._metric_api_calls.inc()
+            
             processing_time = (datetime.now() - start_time).total_seconds()
             result.processing_time = processing_time
+            self._metric_latency.observe(processing_time)
             
             logger.debug(f"Translation completed: {len(text)} chars in {processing_time:.2f}s")
             return result
@@ -310,11 +326,14 @@ class DeepLTranslator:
         except Exception as e:
             logger.error(f"Text translation failed: {e}")
             self.translation_stats['errors'] += 1
+            self._metric_errors.inc()
             raise TranslationError(f"Translation failed: {e}")
     
+    @traced('deepl.translate', category='translate')
     async def _call_deepl_api(self, request: TranslationRequest, 
                             quality: TranslationQuality = None) -> TranslationResult:
         """DeepL API呼び出し"""
+        current_span().set('chars', len(request.text)).set('target_lang', request.target_lang)
         try:
             if not self.api_key:
                 raise TranslationError("DeepL API key not configured")
@@ -337,14 +356,15 @@ class DeepLTranslator:
                 elif quality == TranslationQuality.PREFER_QUALITY:
                     params['formality'] = 'prefer_quality'
             
-            # API呼び出し
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.api_url, data=params) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise TranslationError(f"DeepL API error {response.status}: {error_text}")
-                    
-                    result_data = await response.json()
+            # API呼び出し（共有クライアントの Keep-Alive 接続を使い、429・5xx は再試行）
+            statuses = []
+            api_client = await get_api_client()
+            result_data = await api_client.request(
+                'deepl', 'POST', self.api_url, data=params,
+                on_response=lambda status, elapsed_ms, attempt: statuses.append(status)
+            )
+            if result_data is None:
+                raise TranslationError(f"DeepL API error {statuses[-1] if statuses else 'no response'}")
             
             # レスポンス解析
             if 'translations' not in result_data or not result_data['translations']:
@@ -396,6 +416,24 @@ class DeepLTranslator:
         """言語コードをDeepL形式に変換"""
         return self.supported_languages.get(lang_code.lower(), lang_code.upper())
     
+    def _prefetch_cached_translations(self, articles: List[Article]):
+        """記事の翻訳対象テキストのキャッシュをまとめて取得
+
+        CacheManager.get_many はヒットした値をメモリキャッシュに載せるため、
+        続く _translate_text のキャッシュ参照はデータベースに問い合わせない。
+        """
+        cache_keys = []
+        for article in articles:
+            source_lang = 'en'
+            if hasattr(article, 'language') and article.language and hasattr(article.language, 'value'):
+                source_lang = article.language.value
+            for text in (article.title, article.description, article.content):
+                if text:
+                    cache_keys.append(self._generate_cache_key(text, source_lang, 'ja'))
+        
+        if cache_keys:
+            self.cache_manager.get_many(cache_keys)
+    
     def _generate_cache_key(self, text: str, source_lang: str, target_lang: str) -> str:
         """キャッシュキー生成"""
         key_text = f"{source_lang}:{target_lang}:{text}"
@@ -407,13 +445,11 @@ class DeepLTranslator:
             if not self.api_key:
                 return {'error': 'API key not configured'}
             
-            async with aiohttp.ClientSession() as session:
-                params = {'auth_key': self.api_key}
-                async with session.get(self.usage_url, params=params) as response:
-                    if response.status != 200:
-                        return {'error': f'API error {response.status}'}
-                    
-                    usage_data = await response.json()
+            api_client = await get_api_client()
+            usage_data = await api_client.request('deepl', 'GET', self.usage_url,
+                                                  params={'auth_key': self.api_key}, max_retries=1)
+            if usage_data is None:
+                return {'error': 'API error'}
             
             # 使用量情報と統計を組み合わせ
             return {
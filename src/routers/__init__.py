@@ -0,0 +1,4 @@
+"""
+API Routers
+FastAPI ルーター
+"""
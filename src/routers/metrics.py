@@ -0,0 +1,28 @@
+"""
+Metrics Router
+メトリクス出力API（Prometheus テキスト形式とJSONスナップショット）
+"""
+
+from typing import Dict, Any
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from ..utils.metrics import get_metrics_registry
+
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("", response_class=PlainTextResponse)
+async def prometheus_metrics() -> PlainTextResponse:
+    """Prometheus のスクレイプ用エンドポイント"""
+    return PlainTextResponse(get_metrics_registry().to_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@router.get("/snapshot")
+async def metrics_snapshot() -> Dict[str, Any]:
+    """全メトリクスの現在値（ヒストグラムは件数・合計・分位点の推定値付き）"""
+    return get_metrics_registry().snapshot()
@@ -0,0 +1,58 @@
+"""
+Article Search Router
+記事全文検索API
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, status
+
+from ..models.database_orm import AsyncDatabase
+from ..models.article_search import SNIPPET_MARKERS, html_snippet
+
+
+router = APIRouter()
+
+
+def get_article_database(request: Request) -> AsyncDatabase:
+    """記事データベース（アプリ状態の AsyncDatabase）"""
+    return request.app.state.article_db
+
+
+@router.get("")
+async def search_articles(
+    request: Request,
+    q: str = Query(..., min_length=1, description="検索語（空白区切りでAND、\"...\"でフレーズ）"),
+    category: Optional[str] = Query(None, description="カテゴリ"),
+    days: Optional[int] = Query(None, ge=1, le=3650, description="対象期間（日数）"),
+    start_date: Optional[datetime] = Query(None, description="開始日時"),
+    end_date: Optional[datetime] = Query(None, description="終了日時"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0)
+) -> Dict[str, Any]:
+    """保存済み記事の全文検索（関連度順、ハイライト付きスニペット）
+
+    snippet はエスケープ済みのHTML断片（一致箇所のみ <mark>）。その他の項目は生のテキスト。
+    """
+    if days and not start_date:
+        start_date = datetime.now() - timedelta(days=days)
+
+    database = get_article_database(request)
+    try:
+        hits = await database.search_articles(
+            q, category=category, start_date=start_date, end_date=end_date,
+            limit=limit, offset=offset, highlight=SNIPPET_MARKERS
+        )
+    except ValueError as e:  # SearchQueryError
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    for hit in hits:
+        hit['snippet'] = html_snippet(hit['snippet'])
+
+    return {
+        "query": q,
+        "count": len(hits),
+        "offset": offset,
+        "results": hits
+    }
@@ -179,13 +179,16 @@ class ReportDeliveryService:
             raise ReportDeliveryError(f"Failed to deliver urgent alert: {e}")
     
     async def deliver_weekly_summary(self, articles: List[Article], 
-                                   start_date: datetime, end_date: datetime) -> Dict[str, Any]:
-        """週間サマリーの配信"""
+                                   start_date: datetime, end_date: datetime,
+                                   rollup: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """週間サマリーの配信（rollup指定時は集計テーブルの統計を使用）"""
         try:
             self.logger.info(f"Starting weekly summary delivery for {len(articles)} articles")
             
             # Generate weekly report
-            reports = await self.report_generator.generate_weekly_report(articles, start_date, end_date)
+            reports = await self.report_generator.generate_weekly_report(
+                articles, start_date, end_date, rollup=rollup
+            )
             
             # Prepare weekly email content
             email_data = self._prepare_weekly_email(articles, reports, start_date, end_date)
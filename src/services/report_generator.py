@@ -26,6 +26,7 @@ except ImportError:
 from utils.config import get_config
 from models.article import Article, ArticleCategory
 from services.ai_analyzer import ClaudeAnalyzer
+from generators.article_columns import ArticleColumns
 
 
 logger = logging.getLogger(__name__)
@@ -230,8 +231,11 @@ class ReportGenerator:
                 )
                 articles_by_category[category.value] = category_articles
         
+        # Columnar view shared by all statistics below
+        columns = ArticleColumns.from_articles(articles)
+        
         # Advanced statistics
-        statistics = self._calculate_advanced_statistics(articles)
+        statistics = self._calculate_advanced_statistics(articles, columns)
         
         # Top articles by importance
         top_articles = sorted(articles, key=lambda x: x.importance_score, reverse=True)[:10]
@@ -249,16 +253,7 @@ class ReportGenerator:
                            hasattr(a, 'cvss_score') and a.cvss_score and a.cvss_score >= 7.0]
         
         # Trending keywords
-        all_keywords = []
-        for article in articles:
-            if hasattr(article, 'keywords') and article.keywords:
-                all_keywords.extend(article.keywords)
-        
-        keyword_counts = {}
-        for keyword in all_keywords:
-            keyword_counts[keyword] = keyword_counts.get(keyword, 0) + 1
-        
-        trending_keywords = sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        trending_keywords = columns.trending_keywords(10)
         
         # Report metadata
         now = datetime.now()
@@ -283,81 +278,12 @@ class ReportGenerator:
             'report_type': report_type
         }
     
-    def _calculate_advanced_statistics(self, articles: List[Article]) -> Dict[str, Any]:
-        """Calculate comprehensive statistics"""
-        if not articles:
-            return {}
-        
-        # Basic stats
-        total_articles = len(articles)
-        
-        # Importance distribution
-        importance_scores = [a.importance_score for a in articles]
-        avg_importance = sum(importance_scores) / total_articles
-        max_importance = max(importance_scores)
-        min_importance = min(importance_scores)
-        
-        # Importance level counts
-        critical_count = len([a for a in articles if a.importance_score >= 9])
-        high_count = len([a for a in articles if 7 <= a.importance_score < 9])
-        medium_count = len([a for a in articles if 5 <= a.importance_score < 7])
-        low_count = len([a for a in articles if a.importance_score < 5])
-        
-        # Sentiment analysis
-        sentiment_scores = [a.sentiment_score for a in articles if hasattr(a, 'sentiment_score')]
-        avg_sentiment = sum(sentiment_scores) / len(sentiment_scores) if sentiment_scores else 0
-        
-        positive_count = len([s for s in sentiment_scores if s > 0.1])
-        negative_count = len([s for s in sentiment_scores if s < -0.1])
-        neutral_count = len([s for s in sentiment_scores if -0.1 <= s <= 0.1])
-        
-        # Language distribution
-        language_counts = {}
-        for article in articles:
-            lang = getattr(article, 'language', 'unknown')
-            language_counts[lang] = language_counts.get(lang, 0) + 1
-        
-        # Source distribution
-        source_counts = {}
-        for article in articles:
-            source = getattr(article, 'source', {})
-            source_name = source.get('name', 'Unknown') if isinstance(source, dict) else str(source)
-            source_counts[source_name] = source_counts.get(source_name, 0) + 1
-        
-        # Time distribution (articles by hour)
-        hour_counts = {}
-        for article in articles:
-            if hasattr(article, 'published_at') and article.published_at:
-                try:
-                    if isinstance(article.published_at, str):
-                        dt = datetime.fromisoformat(article.published_at.replace('Z', '+00:00'))
-                    else:
-                        dt = article.published_at
-                    hour = dt.hour
-                    hour_counts[hour] = hour_counts.get(hour, 0) + 1
-                except Exception:
-                    pass
-        
-        return {
-            'avg_importance': round(avg_importance, 2),
-            'max_importance': max_importance,
-            'min_importance': min_importance,
-            'importance_distribution': {
-                'critical': critical_count,
-                'high': high_count,
-                'medium': medium_count,
-                'low': low_count
-            },
-            'sentiment_analysis': {
-                'avg_sentiment': round(avg_sentiment, 2),
-                'positive_count': positive_count,
-                'negative_count': negative_count,
-                'neutral_count': neutral_count
-            },
-            'language_distribution': dict(sorted(language_counts.items(), key=lambda x: x[1], reverse=True)[:5]),
-            'source_distribution': dict(sorted(source_counts.items(), key=lambda x: x[1], reverse=True)[:5]),
-            'time_distribution': hour_counts
-        }
+    def _calculate_advanced_statistics(self, articles: List[Article],
+                                       columns: Optional[ArticleColumns] = None) -> Dict[str, Any]:
+        """Calculate comprehensive statistics in a single pass over the articles"""
+        if columns is None:
+            columns = ArticleColumns.from_articles(articles)
+        return columns.advanced_statistics()
     
     def _get_report_title(self, report_type: str, date: datetime) -> str:
         """Generate report title based on type and date"""
@@ -881,7 +807,11 @@ class ReportGenerator:
             return []
     
     def calculate_content_hash(self, articles: List[Article]) -> str:
-        """Calculate hash of article content for change detection"""
+        """Calculate hash of article content for change detection
+
+        Order-independent md5 over title, url and importance. Kept stable for
+        stored hashes; the report build cache uses compute_content_hash instead.
+        """
         content_strings = []
         
         for article in articles:
@@ -899,11 +829,16 @@ class ReportGenerator:
         )
     
     async def generate_weekly_report(self, articles: List[Article], 
-                                   start_date: datetime, end_date: datetime) -> Dict[str, str]:
-        """Generate weekly summary report"""
+                                   start_date: datetime, end_date: datetime,
+                                   rollup: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+        """Generate weekly summary report
+
+        rollup (Database.get_period_summary) が指定された場合、件数・カテゴリ・
+        キーワード集計は集計テーブルの値を使い、articles は上位記事の表示にのみ使う。
+        """
         try:
             # Prepare weekly report data
-            report_data = await self._prepare_weekly_report_data(articles, start_date, end_date)
+            report_data = await self._prepare_weekly_report_data(articles, start_date, end_date, rollup)
             
             # Generate reports
             generated_reports = {}
@@ -924,19 +859,34 @@ class ReportGenerator:
             raise ReportGenerationError(f"Failed to generate weekly report: {e}")
     
     async def _prepare_weekly_report_data(self, articles: List[Article], 
-                                        start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+                                        start_date: datetime, end_date: datetime,
+                                        rollup: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Prepare data for weekly report"""
         
-        # Basic statistics
-        total_articles = len(articles)
-        urgent_articles = [a for a in articles if getattr(a, 'is_urgent', False)]
-        urgent_count = len(urgent_articles)
-        
         # Time period information
         period_days = (end_date - start_date).days + 1
         
-        # Category analysis
-        category_analysis = self._analyze_categories_weekly(articles)
+        # Columnar view shared by all statistics below
+        columns = ArticleColumns.from_articles(articles)
+        
+        if rollup is not None:
+            # Pre-aggregated daily rollups (no full article scan)
+            total_articles = rollup.get('total_articles', 0)
+            urgent_count = rollup.get('urgent_count', 0)
+            avg_importance = rollup.get('avg_importance', 0)
+            category_analysis = self._categories_from_rollup(rollup)
+            trending_keywords = list(rollup.get('top_keywords', []))
+        else:
+            # Basic statistics
+            total_articles = len(articles)
+            urgent_count = len([a for a in articles if getattr(a, 'is_urgent', False)])
+            avg_importance = columns.mean_importance()
+            
+            # Category analysis
+            category_analysis = self._analyze_categories_weekly(articles, columns)
+            
+            # Trending keywords for the week
+            trending_keywords = self._calculate_weekly_trending_keywords(articles, columns)
         
         # Top articles by importance
         top_articles = sorted(articles, key=lambda x: getattr(x, 'importance_score', 5), reverse=True)[:10]
@@ -950,23 +900,15 @@ class ReportGenerator:
         weekly_summary = ""
         if self.ai_analyzer and articles:
             try:
-                weekly_summary = await self.ai_analyzer.create_weekly_summary(articles)
+                weekly_summary = await self.ai_analyzer.create_weekly_summary(articles, rollup=rollup)
             except Exception as e:
                 logger.warning(f"Failed to generate weekly summary: {e}")
         
         # Advanced statistics
-        statistics = self._calculate_advanced_statistics(articles)
-        
-        # Trending keywords for the week
-        trending_keywords = self._calculate_weekly_trending_keywords(articles)
+        statistics = self._calculate_advanced_statistics(articles, columns)
         
         # Additional weekly metrics
-        unique_sources = len(set(
-            getattr(getattr(a, 'source', {}), 'name', 'Unknown') 
-            if isinstance(getattr(a, 'source', {}), dict) 
-            else str(getattr(a, 'source', 'Unknown'))
-            for a in articles
-        ))
+        unique_sources = columns.unique_source_count()
         
         now = datetime.now()
         
@@ -980,7 +922,7 @@ class ReportGenerator:
             'total_articles': total_articles,
             'urgent_articles': urgent_count,
             'categories_count': len(category_analysis),
-            'avg_importance': sum(getattr(a, 'importance_score', 5) for a in articles) / total_articles if articles else 0,
+            'avg_importance': avg_importance,
             'unique_sources': unique_sources,
             'processing_time': 0,  # Will be updated
             'top_articles': top_articles,
@@ -994,54 +936,30 @@ class ReportGenerator:
             'report_type': 'weekly'
         }
     
-    def _analyze_categories_weekly(self, articles: List[Article]) -> Dict[str, Dict[str, Any]]:
+    def _analyze_categories_weekly(self, articles: List[Article],
+                                   columns: Optional[ArticleColumns] = None) -> Dict[str, Dict[str, Any]]:
         """Analyze articles by category for weekly report"""
+        if columns is None:
+            columns = ArticleColumns.from_articles(articles)
+        return columns.categories_weekly()
+    
+    def _categories_from_rollup(self, rollup: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Convert rollup categories to the weekly category analysis format"""
         category_data = {}
-        
-        for article in articles:
-            category = getattr(article, 'detailed_category', 
-                             getattr(article, 'category', '未分類'))
-            
-            if category not in category_data:
-                category_data[category] = {
-                    'count': 0,
-                    'urgent_count': 0,
-                    'total_importance': 0,
-                    'keywords': []
-                }
-            
-            cat_data = category_data[category]
-            cat_data['count'] += 1
-            cat_data['total_importance'] += getattr(article, 'importance_score', 5)
-            
-            if getattr(article, 'is_urgent', False):
-                cat_data['urgent_count'] += 1
-            
-            if hasattr(article, 'keywords') and getattr(article, 'keywords', None):
-                cat_data['keywords'].extend(article.keywords)
-        
-        # Calculate averages and top keywords
-        for category, data in category_data.items():
-            data['avg_importance'] = data['total_importance'] / data['count'] if data['count'] > 0 else 0
-            
-            # Count keyword frequency
-            keyword_counts = {}
-            for keyword in data['keywords']:
-                keyword_counts[keyword] = keyword_counts.get(keyword, 0) + 1
-            
-            data['top_keywords'] = [k for k, v in sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True)[:5]]
-        
+        for category, data in rollup.get('categories', {}).items():
+            category_data[category] = {
+                'count': data['count'],
+                'urgent_count': data['urgent_count'],
+                'total_importance': data['importance_sum'],
+                'keywords': [],
+                'avg_importance': data['avg_importance'],
+                'top_keywords': data['top_keywords']
+            }
         return category_data
     
-    def _calculate_weekly_trending_keywords(self, articles: List[Article]) -> List[tuple]:
+    def _calculate_weekly_trending_keywords(self, articles: List[Article],
+                                            columns: Optional[ArticleColumns] = None) -> List[tuple]:
         """Calculate trending keywords for the week"""
-        all_keywords = []
-        for article in articles:
-            if hasattr(article, 'keywords') and getattr(article, 'keywords', None):
-                all_keywords.extend(article.keywords)
-        
-        keyword_counts = {}
-        for keyword in all_keywords:
-            keyword_counts[keyword] = keyword_counts.get(keyword, 0) + 1
-        
-        return sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True)[:15]
\ No newline at end of file
+        if columns is None:
+            columns = ArticleColumns.from_articles(articles)
+        return columns.trending_keywords(15)
@@ -21,6 +21,8 @@ import json
 
 from utils.config import get_config
 from utils.logger import setup_logger
+from utils.loop_watchdog import LoopWatchdog
+from utils.profiler import RunProfiler, install_signal_trigger
 from .news_collector import NewsCollector
 from .report_generator import ReportGenerator
 from .email_delivery import GmailDeliveryService
@@ -144,6 +146,9 @@ class NewsDeliveryScheduler:
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
+        
+        # SIGUSR1 profiles the next task run (or the rest of the running one)
+        install_signal_trigger()
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
@@ -359,14 +364,30 @@ class NewsDeliveryScheduler:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=7)
             
-            # This would typically query the database for articles from the past week
-            # For now, we'll create a simple summary
+            # Aggregate from daily rollup tables (no article rows are loaded)
+            loop = asyncio.get_running_loop()
+            rollup = await loop.run_in_executor(
+                None, self.news_collector.db.get_period_summary, start_date, end_date
+            )
             
             summary_data = {
                 "period": f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}",
                 "generated_at": datetime.now().isoformat(),
-                "total_articles": 0,  # Would be calculated from database
-                "urgent_alerts": 0,   # Would be calculated from database
+                "total_articles": rollup['total_articles'],
+                "urgent_alerts": rollup['urgent_count'],
+                "high_importance_articles": rollup['high_importance_count'],
+                "avg_importance": round(rollup['avg_importance'], 2),
+                "sentiment_distribution": rollup['sentiment_distribution'],
+                "daily_counts": rollup['daily_counts'],
+                "categories": {
+                    name: {
+                        "count": data['count'],
+                        "avg_importance": round(data['avg_importance'], 2),
+                        "top_keywords": data['top_keywords']
+                    }
+                    for name, data in rollup['categories'].items()
+                },
+                "trending_keywords": rollup['top_keywords'],
                 "delivery_success_rate": 100.0  # Would be calculated from delivery records
             }
             
@@ -415,6 +436,20 @@ class NewsDeliveryScheduler:
         """Main scheduler loop"""
         self.logger.info("Scheduler loop started")
         
+        # Log and export event loop stalls caused by blocking calls in tasks
+        watchdog = LoopWatchdog.from_config(self.config)
+        if watchdog is not None:
+            watchdog.start()
+        
+        try:
+            await self._run_scheduler_loop()
+        finally:
+            if watchdog is not None:
+                watchdog.stop()
+        
+        self.logger.info("Scheduler loop ended")
+    
+    async def _run_scheduler_loop(self):
         while self.running:
             try:
                 current_time = datetime.now()
@@ -426,7 +461,7 @@ class NewsDeliveryScheduler:
                         
                         try:
                             # Run the task
-                            await task.task_func()
+                            await self._run_profiled(task)
                             
                             # Update task state
                             task.last_run = current_time
@@ -451,8 +486,15 @@ class NewsDeliveryScheduler:
             except Exception as e:
                 self.logger.error(f"Scheduler loop error: {e}")
                 await asyncio.sleep(60)
-        
-        self.logger.info("Scheduler loop ended")
+    
+    async def _run_profiled(self, task: ScheduledTask):
+        """Run a task, sampling its stacks when profiling is enabled or requested"""
+        profiler = RunProfiler(self.config, task.name)
+        try:
+            with profiler:
+                await task.task_func()
+        finally:
+            profiler.write()
     
     def get_status(self) -> Dict[str, Any]:
         """Get scheduler status"""
@@ -499,7 +541,7 @@ class NewsDeliveryScheduler:
         self.logger.info(f"Running task '{task_name}' manually...")
         
         try:
-            await task.task_func()
+            await self._run_profiled(task)
             task.last_run = datetime.now()
             task.run_count += 1
             self.logger.info(f"Task '{task_name}' completed successfully")
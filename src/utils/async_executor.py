@@ -3,11 +3,16 @@ Async Executor Engine
 非同期実行エンジン - 並列処理、タスク管理、リソース制御
 """
 
+import array
 import asyncio
+import functools
+import itertools
 import time
 import psutil
 import logging
-from typing import Any, Dict, List, Optional, Callable, Union, TypeVar, Awaitable, Generic
+import multiprocessing
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Callable, Sequence, Tuple, Union, TypeVar, Awaitable, Generic
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
@@ -188,46 +193,219 @@ class ResourceMonitor:
         return self.stats.copy()
 
 class TaskQueue:
-    """タスクキュー"""
+    """タスクキュー
+
+    全優先度を1つの asyncio.PriorityQueue に (優先度の降順, 投入順) で並べるため、
+    取り出しは優先度ごとのキューを走査せずに O(log n)。空のときの get は
+    タスクが投入されるまで待機する（ポーリングしない）。
+    """
     
     def __init__(self, max_size: int = 1000):
         self.max_size = max_size
-        self.queues = {
-            TaskPriority.URGENT: asyncio.PriorityQueue(),
-            TaskPriority.HIGH: asyncio.PriorityQueue(), 
-            TaskPriority.NORMAL: asyncio.PriorityQueue(),
-            TaskPriority.LOW: asyncio.PriorityQueue()
-        }
+        self.queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self.sizes = {priority: 0 for priority in TaskPriority}
         self.task_counter = 0
     
     async def put(self, task: Task):
         """タスク追加"""
-        priority_queue = self.queues[task.config.priority]
+        self.put_nowait(task)
+    
+    def put_nowait(self, task: Task):
+        """タスク追加（待機なし）"""
+        priority = task.config.priority
         
-        # キューサイズチェック
-        if priority_queue.qsize() >= self.max_size:
-            raise asyncio.QueueFull(f"Task queue full for priority {task.config.priority}")
+        # キューサイズチェック（優先度ごと）
+        if self.sizes[priority] >= self.max_size:
+            raise asyncio.QueueFull(f"Task queue full for priority {priority}")
         
-        # 優先度付きでキューに追加
-        await priority_queue.put((self.task_counter, task))
+        # 優先度の高い順、同じ優先度は投入順
+        self.queue.put_nowait((-priority.value, self.task_counter, task))
         self.task_counter += 1
+        self.sizes[priority] += 1
     
-    async def get(self) -> Optional[Task]:
-        """タスク取得（優先度順）"""
-        # 緊急 > 高 > 通常 > 低の順で取得
-        for priority in [TaskPriority.URGENT, TaskPriority.HIGH, TaskPriority.NORMAL, TaskPriority.LOW]:
-            priority_queue = self.queues[priority]
-            if not priority_queue.empty():
-                try:
-                    _, task = await asyncio.wait_for(priority_queue.get(), timeout=0.01)
-                    return task
-                except asyncio.TimeoutError:
-                    continue
-        return None
+    async def get(self, timeout: Optional[float] = None) -> Optional[Task]:
+        """タスク取得（優先度順、空ならタスク投入まで待機。timeout 経過時は None）"""
+        try:
+            if timeout is None:
+                entry = await self.queue.get()
+            else:
+                entry = await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+        return self._take(entry)
+    
+    def get_nowait(self) -> Optional[Task]:
+        """タスク取得（空なら None）"""
+        try:
+            return self._take(self.queue.get_nowait())
+        except asyncio.QueueEmpty:
+            return None
+    
+    def _take(self, entry) -> Task:
+        _, _, task = entry
+        self.sizes[task.config.priority] -= 1
+        return task
     
     def qsize(self) -> Dict[TaskPriority, int]:
         """キューサイズ"""
-        return {priority: queue.qsize() for priority, queue in self.queues.items()}
+        return dict(self.sizes)
+
+class SharedColumns:
+    """同じ行数の列を1つの共有メモリブロックに詰めたバッチ
+
+    文字列列は UTF-8 の連結バイト列と int64 の終端オフセット、数値列は float64 の配列として
+    配置する。プロセスプールへ送るのは handle（共有メモリ名・行数・配置）だけで、
+    ワーカーは attach して必要な行だけを読む。記事オブジェクトを呼び出しごとに
+    pickle するより転送量・CPUとも小さい。
+    """
+    
+    def __init__(self, shm: shared_memory.SharedMemory, size: int,
+                 layout: Dict[str, Tuple], owner: bool):
+        self.shm = shm
+        self.size = size
+        self.layout = layout
+        self.owner = owner
+        self._views: List[memoryview] = []
+    
+    @classmethod
+    def create(cls, text_columns: Dict[str, Sequence[Optional[str]]],
+               numeric_columns: Optional[Dict[str, Sequence[float]]] = None) -> 'SharedColumns':
+        """列データを共有メモリに書き込む（None の文字列は空文字列として扱う）"""
+        numeric_columns = numeric_columns or {}
+        lengths = {len(values) for values in itertools.chain(text_columns.values(), numeric_columns.values())}
+        if len(lengths) > 1:
+            raise ValueError(f"All columns must have the same length: {sorted(lengths)}")
+        size = lengths.pop() if lengths else 0
+        
+        blobs = {}
+        ends = {}
+        for name, values in text_columns.items():
+            encoded = [(value or '').encode('utf-8') for value in values]
+            blobs[name] = b''.join(encoded)
+            ends[name] = list(itertools.accumulate(map(len, encoded)))
+        
+        # 8バイト境界が必要なオフセット・数値を先に、文字列本体を後ろに置く
+        layout: Dict[str, Tuple] = {}
+        position = 0
+        offsets_at = {}
+        for name in text_columns:
+            offsets_at[name] = position
+            position += 8 * size
+        for name in numeric_columns:
+            layout[name] = ('float', position)
+            position += 8 * size
+        for name in text_columns:
+            layout[name] = ('text', offsets_at[name], position, len(blobs[name]))
+            position += len(blobs[name])
+        
+        shm = shared_memory.SharedMemory(create=True, size=max(1, position))
+        columns = cls(shm, size, layout, owner=True)
+        try:
+            for name in text_columns:
+                _, at, data_at, data_length = layout[name]
+                columns._view(at, 8 * size, 'q')[:] = memoryview(array.array('q', ends[name]))
+                shm.buf[data_at:data_at + data_length] = blobs[name]
+            for name, values in numeric_columns.items():
+                _, at = layout[name]
+                columns._view(at, 8 * size, 'd')[:] = memoryview(array.array('d', values))
+        except Exception:
+            columns.close()
+            raise
+        return columns
+    
+    @property
+    def handle(self) -> Tuple[str, int, Dict[str, Tuple]]:
+        """プロセスプールへ送る参照情報"""
+        return (self.shm.name, self.size, self.layout)
+    
+    @classmethod
+    def attach(cls, handle: Tuple[str, int, Dict[str, Tuple]]) -> 'SharedColumns':
+        """handle から共有メモリを開く（ワーカー側、解放は作成側が行う）"""
+        name, size, layout = handle
+        return cls(shared_memory.SharedMemory(name=name), size, layout, owner=False)
+    
+    def _view(self, at: int, length: int, fmt: str) -> memoryview:
+        view = self.shm.buf[at:at + length].cast(fmt)
+        self._views.append(view)
+        return view
+    
+    def texts(self, name: str, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        """文字列列の [start, stop) 行"""
+        kind, at, data_at, _ = self.layout[name]
+        if kind != 'text':
+            raise TypeError(f"Column {name} is not a text column")
+        stop = self.size if stop is None else min(stop, self.size)
+        if start >= stop:
+            return []
+        ends = self._view(at, 8 * self.size, 'q')
+        data = self.shm.buf
+        result = []
+        begin = ends[start - 1] if start else 0
+        for index in range(start, stop):
+            end = ends[index]
+            result.append(str(data[data_at + begin:data_at + end], 'utf-8'))
+            begin = end
+        return result
+    
+    def numbers(self, name: str) -> memoryview:
+        """数値列（float64 の memoryview、コピーしない）"""
+        kind, at = self.layout[name][:2]
+        if kind != 'float':
+            raise TypeError(f"Column {name} is not a numeric column")
+        return self._view(at, 8 * self.size, 'd')
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def close(self):
+        """共有メモリを閉じる（作成側は削除も行う）"""
+        for view in self._views:
+            view.release()
+        self._views.clear()
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def split_rows(size: int, parts: int) -> List[Tuple[int, int]]:
+    """0..size の行を parts 個以下の連続範囲に等分"""
+    parts = max(1, min(parts, size))
+    step, extra = divmod(size, parts)
+    ranges = []
+    start = 0
+    for index in range(parts):
+        stop = start + step + (1 if index < extra else 0)
+        if stop > start:
+            ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def _run_on_shared_columns(func: Callable, handle: Tuple, start: int, stop: int, args: tuple) -> Any:
+    """プロセスプール側の入口（共有メモリを開いて func(columns, start, stop, *args) を実行）"""
+    columns = SharedColumns.attach(handle)
+    try:
+        return func(columns, start, stop, *args)
+    finally:
+        columns.close()
+
+
+def _process_pool_context():
+    """プロセスプールの開始方式
+
+    プールは DB・ウォッチドッグ・プロファイラのスレッドが動いてから作られるため、
+    他スレッドが持つロックごと複製する fork ではなく forkserver（無ければ spawn）を使う。
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
 
 class WorkerPool:
     """ワーカープール"""
@@ -235,15 +413,20 @@ class WorkerPool:
     def __init__(self, 
                  max_workers: int = 10,
                  thread_pool_size: int = 4,
-                 process_pool_size: int = 2):
+                 process_pool_size: int = 2,
+                 on_result: Optional[Callable[[TaskResult], None]] = None):
         self.max_workers = max_workers
         self.active_workers = 0
         self.worker_tasks = []
         self.thread_pool = ThreadPoolExecutor(max_workers=thread_pool_size)
-        self.process_pool = ProcessPoolExecutor(max_workers=process_pool_size)
+        self.process_pool = ProcessPoolExecutor(max_workers=process_pool_size,
+                                                mp_context=_process_pool_context())
+        self.process_pool_size = process_pool_size
         self.running = False
         self.task_queue = None
         self.rate_limiters = {}
+        self.on_result = on_result  # タスク完了（リトライ待ちを除く）ごとに呼ぶ
+        self.process = psutil.Process()
         
     async def start(self, task_queue: TaskQueue):
         """ワーカー開始"""
@@ -262,11 +445,8 @@ class WorkerPool:
         
         while self.running:
             try:
-                # タスク取得
+                # タスク取得（投入まで待機）
                 task = await self.task_queue.get()
-                if task is None:
-                    await asyncio.sleep(0.1)
-                    continue
                 
                 self.active_workers += 1
                 logger.debug(f"Worker {worker_name} processing task {task.task_id}")
@@ -276,6 +456,9 @@ class WorkerPool:
                 
                 self.active_workers -= 1
                 
+                if result is not None and self.on_result is not None:
+                    self.on_result(result)
+                
             except asyncio.CancelledError:
                 logger.info(f"Worker {worker_name} cancelled")
                 break
@@ -289,7 +472,7 @@ class WorkerPool:
         task.status = TaskStatus.RUNNING
         task.started_at = datetime.now()
         
-        initial_memory = psutil.Process().memory_info().rss / 1024 / 1024
+        initial_memory = self.process.memory_info().rss / 1024 / 1024
         
         try:
             # タイムアウト設定
@@ -297,16 +480,18 @@ class WorkerPool:
             
             # 実行方式選択
             if task.config.use_process_pool:
-                result = await self._run_in_process_pool(task)
+                run = self._run_in_process_pool(task)
             elif task.config.use_thread_pool:
-                result = await self._run_in_thread_pool(task)
+                run = self._run_in_thread_pool(task)
             else:
-                result = await self._run_async(task)
+                run = self._run_async(task)
             
             # タイムアウト処理
-            if timeout:
+            if not timeout:
+                result = await run
+            else:
                 try:
-                    result = await asyncio.wait_for(result, timeout=timeout)
+                    result = await asyncio.wait_for(run, timeout=timeout)
                 except asyncio.TimeoutError:
                     task.status = TaskStatus.TIMEOUT
                     task.error = TimeoutError(f"Task {task.task_id} timed out after {timeout}s")
@@ -354,16 +539,31 @@ class WorkerPool:
         )
     
     async def _run_in_process_pool(self, task: Task):
-        """プロセスプール実行"""
+        """プロセスプール実行（func はモジュールレベルの関数であること）"""
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(
             self.process_pool, 
-            lambda: task.func(*task.args, **task.kwargs)
+            functools.partial(task.func, *task.args, **task.kwargs)
         )
     
+    async def map_shared(self, func: Callable, columns: SharedColumns,
+                         ranges: List[Tuple[int, int]], *args) -> List[Any]:
+        """共有メモリの列を行範囲ごとにプロセスプールで処理
+        
+        各プロセスで func(columns, start, stop, *args) を実行し、範囲の順に結果を返す。
+        送るのは handle と範囲だけなので、func はモジュールレベルの関数であること。
+        """
+        loop = asyncio.get_running_loop()
+        futures = [
+            loop.run_in_executor(self.process_pool, _run_on_shared_columns,
+                                 func, columns.handle, start, stop, args)
+            for start, stop in ranges
+        ]
+        return list(await asyncio.gather(*futures))
+    
     def _create_task_result(self, task: Task, initial_memory: float) -> TaskResult:
         """タスク結果作成"""
-        final_memory = psutil.Process().memory_info().rss / 1024 / 1024
+        final_memory = self.process.memory_info().rss / 1024 / 1024
         
         return TaskResult(
             task_id=task.task_id,
@@ -388,11 +588,14 @@ class WorkerPool:
         if self.worker_tasks:
             await asyncio.gather(*self.worker_tasks, return_exceptions=True)
         
-        # エグゼキューターのシャットダウン
-        self.thread_pool.shutdown(wait=False)
-        self.process_pool.shutdown(wait=False)
+        self.shutdown_executors()
         
         logger.info("Workers stopped")
+    
+    def shutdown_executors(self):
+        """スレッドプール・プロセスプールのシャットダウン"""
+        self.thread_pool.shutdown(wait=False)
+        self.process_pool.shutdown(wait=False)
 
 class AsyncExecutor:
     """非同期実行エンジン"""
@@ -401,13 +604,16 @@ class AsyncExecutor:
                  max_workers: int = 10,
                  max_queue_size: int = 1000,
                  memory_limit: float = 2048,
-                 enable_monitoring: bool = True):
+                 enable_monitoring: bool = True,
+                 process_pool_size: int = 2):
         self.max_workers = max_workers
         self.max_queue_size = max_queue_size
         self.task_queue = TaskQueue(max_queue_size)
-        self.worker_pool = WorkerPool(max_workers)
+        self.worker_pool = WorkerPool(max_workers, process_pool_size=process_pool_size,
+                                      on_result=self._record_result)
         self.resource_monitor = ResourceMonitor(memory_limit) if enable_monitoring else None
         self.task_results = {}
+        self.result_waiters: Dict[str, asyncio.Future] = {}
         self.running = False
         self.stats = {
             'tasks_submitted': 0,
@@ -465,20 +671,36 @@ class AsyncExecutor:
         
         return task_ids
     
+    def _record_result(self, result: TaskResult):
+        """ワーカーからの完了通知（結果を保存し、待機中の呼び出し元を起こす）"""
+        self.task_results[result.task_id] = result
+        if result.is_successful:
+            self.stats['tasks_completed'] += 1
+            self.stats['total_execution_time'] += result.execution_time
+        else:
+            self.stats['tasks_failed'] += 1
+        
+        waiter = self.result_waiters.pop(result.task_id, None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+    
+    def _result_waiter(self, task_id: str) -> asyncio.Future:
+        waiter = self.result_waiters.get(task_id)
+        if waiter is None:
+            waiter = asyncio.get_running_loop().create_future()
+            self.result_waiters[task_id] = waiter
+        return waiter
+    
     async def wait_for_task(self, task_id: str, timeout: Optional[float] = None) -> TaskResult:
-        """タスク完了待機"""
-        start_time = time.time()
-        
-        while True:
-            if task_id in self.task_results:
-                result = self.task_results[task_id]
-                del self.task_results[task_id]  # メモリ節約
-                return result
-            
-            if timeout and time.time() - start_time > timeout:
+        """タスク完了待機（完了通知まで待機し、ポーリングしない）"""
+        if task_id not in self.task_results:
+            waiter = self._result_waiter(task_id)
+            try:
+                await asyncio.wait_for(asyncio.shield(waiter), timeout=timeout)
+            except asyncio.TimeoutError:
                 raise asyncio.TimeoutError(f"Task {task_id} did not complete within {timeout}s")
-            
-            await asyncio.sleep(0.1)
+        
+        return self.task_results.pop(task_id)  # メモリ節約
     
     async def wait_for_batch(self, 
                             task_ids: List[str], 
@@ -493,13 +715,15 @@ class AsyncExecutor:
             return results
         
         elif return_when == 'FIRST_COMPLETED':
-            while True:
-                for task_id in task_ids:
-                    if task_id in self.task_results:
-                        result = self.task_results[task_id]
-                        del self.task_results[task_id]
-                        return [result]
-                await asyncio.sleep(0.1)
+            completed = [task_id for task_id in task_ids if task_id in self.task_results]
+            if not completed:
+                waiters = [self._result_waiter(task_id) for task_id in task_ids]
+                done, _ = await asyncio.wait(waiters, timeout=timeout,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    raise asyncio.TimeoutError(f"No task completed within {timeout}s")
+                completed = [task_id for task_id in task_ids if task_id in self.task_results]
+            return [self.task_results.pop(completed[0])]
         
         else:
             raise ValueError(f"Invalid return_when value: {return_when}")
@@ -540,6 +764,25 @@ class AsyncExecutor:
         
         return stats
     
+    async def map_shared(self,
+                         func: Callable,
+                         text_columns: Dict[str, Sequence[Optional[str]]],
+                         numeric_columns: Optional[Dict[str, Sequence[float]]] = None,
+                         ranges: Optional[List[Tuple[int, int]]] = None,
+                         args: tuple = ()) -> List[Any]:
+        """列データを共有メモリに1回だけ書き、行範囲ごとにプロセスプールで処理
+        
+        ranges を省略した場合は行をプロセス数で等分する。ワーカーの開始（start）は不要。
+        
+        使用例:
+            results = await executor.map_shared(
+                translate_rows, {'title': titles, 'content': contents}, args=(200,))
+        """
+        with SharedColumns.create(text_columns, numeric_columns) as columns:
+            if ranges is None:
+                ranges = split_rows(len(columns), self.worker_pool.process_pool_size)
+            return await self.worker_pool.map_shared(func, columns, ranges, *args)
+    
     async def process_parallel_batches(self,
                                      items: List[Any],
                                      processor_func: Callable,
@@ -595,6 +838,8 @@ class AsyncExecutor:
     async def stop(self):
         """エグゼキューター停止"""
         if not self.running:
+            # map_shared のみ使用した場合もプールは終了する
+            self.worker_pool.shutdown_executors()
             return
         
         self.running = False
@@ -10,7 +10,7 @@ import pickle
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Optional, Dict, Union
+from typing import Any, Optional, Dict, List, Union
 from contextlib import contextmanager
 
 from .config import get_config
@@ -21,6 +21,9 @@ logger = logging.getLogger(__name__)
 
 class CacheManager:
     """キャッシュマネージャー - メモリとSQLiteによるキャッシュシステム"""
+
+    # 一括取得の IN 句1文あたりのキー数（SQLite のバインド変数上限 999 未満）
+    BULK_CHUNK_SIZE = 500
     
     def __init__(self, config=None):
         self.config = config or get_config()
@@ -216,7 +219,108 @@ class CacheManager:
         except Exception as e:
             logger.error(f"Failed to get cache for key '{key}': {e}")
             return None
-    
+
+    def get_many(self, keys: List[str], category: str = 'default') -> Dict[str, Any]:
+        """複数キーをまとめて取得（ヒットしたキーのみ返す）
+
+        メモリキャッシュにないキーは SELECT ... WHERE key IN (...) の1文で読み、
+        アクセス回数の更新も1文・1トランザクションで行う。
+        """
+        results: Dict[str, Any] = {}
+        try:
+            now = datetime.now()
+            pending: Dict[str, str] = {}
+            for key in keys:
+                cache_key = self._generate_key(key, category)
+                cached = self._memory_cache.get(cache_key)
+                if cached is not None:
+                    if now < cached['expire_at']:
+                        results[key] = cached['value']
+                        continue
+                    del self._memory_cache[cache_key]
+                pending[cache_key] = key
+
+            if not pending:
+                return results
+
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cache_keys = list(pending)
+                found: List[str] = []
+                for start in range(0, len(cache_keys), self.BULK_CHUNK_SIZE):
+                    chunk = cache_keys[start:start + self.BULK_CHUNK_SIZE]
+                    placeholders = ','.join('?' * len(chunk))
+                    cursor.execute(f'''
+                        SELECT key, value_type, value_data, expire_at
+                        FROM cache
+                        WHERE key IN ({placeholders}) AND expire_at > ?
+                    ''', (*chunk, now))
+
+                    for row in cursor.fetchall():
+                        value = self._deserialize_value(row['value_type'], row['value_data'])
+                        self._memory_cache[row['key']] = {
+                            'value': value,
+                            'expire_at': datetime.fromisoformat(row['expire_at']),
+                            'category': category
+                        }
+                        results[pending[row['key']]] = value
+                        found.append(row['key'])
+
+                for start in range(0, len(found), self.BULK_CHUNK_SIZE):
+                    chunk = found[start:start + self.BULK_CHUNK_SIZE]
+                    placeholders = ','.join('?' * len(chunk))
+                    cursor.execute(f'''
+                        UPDATE cache
+                        SET last_accessed = ?, access_count = access_count + 1
+                        WHERE key IN ({placeholders})
+                    ''', (now, *chunk))
+                conn.commit()
+
+            logger.debug(f"Cache bulk get: {len(results)}/{len(keys)} hits (category: {category})")
+            return results
+
+        except Exception as e:
+            logger.error(f"Failed to get cache for {len(keys)} keys: {e}")
+            return results
+
+    def set_many(self, items: Dict[str, Any], expire: Optional[int] = None,
+                 category: str = 'default') -> bool:
+        """複数キーをまとめて設定（executemany の1トランザクション）"""
+        if not items:
+            return True
+        try:
+            if expire is None:
+                expire = self.default_ttl.get(f"{category}_cache", 3600)
+
+            expire_at = datetime.now() + timedelta(seconds=expire)
+
+            rows = []
+            for key, value in items.items():
+                cache_key = self._generate_key(key, category)
+                self._memory_cache[cache_key] = {
+                    'value': value,
+                    'expire_at': expire_at,
+                    'category': category
+                }
+                value_type, value_data = self._serialize_value(value)
+                rows.append((cache_key, value_type, value_data, category, expire_at))
+
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany('''
+                    INSERT OR REPLACE INTO cache
+                    (key, value_type, value_data, category, expire_at)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', rows)
+                conn.commit()
+
+            logger.debug(f"Cached {len(rows)} keys (category: {category}, expire: {expire}s)")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to set cache for {len(items)} keys: {e}")
+            return False
+
     def delete(self, key: str, category: str = 'default') -> bool:
         """キャッシュから値を削除"""
         try:
@@ -15,10 +15,14 @@ from datetime import datetime, timedelta
 from abc import ABC, abstractmethod
 from enum import Enum
 import logging
+import sys
 import threading
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 import weakref
 
+logger = logging.getLogger(__name__)
+
 try:
     import redis.asyncio as redis
     REDIS_AVAILABLE = True
@@ -32,8 +36,6 @@ try:
 except ImportError:
     MEMCACHED_AVAILABLE = False
 
-logger = logging.getLogger(__name__)
-
 T = TypeVar('T')
 
 class CacheBackend(Enum):
@@ -107,16 +109,17 @@ class CacheSerializer:
     @staticmethod
     def deserialize(data: bytes) -> Any:
         """オブジェクトデシリアライズ"""
-        parts = data.split(b':', 2)
-        if len(parts) != 3:
+        # 形式は "<json|pickle>[:gzip]:<データ>"（データ自体にも ':' が含まれ得る）
+        parts = data.split(b':', 1)
+        if len(parts) != 2:
             raise ValueError("Invalid serialized data format")
         
-        method_part = parts[1]
-        obj_data = parts[2]
+        method_part, obj_data = parts
         
         # 圧縮解除
-        if b'gzip' in method_part:
-            obj_data = gzip.decompress(obj_data)
+        if obj_data.startswith(b'gzip:'):
+            method_part += b':gzip'
+            obj_data = gzip.decompress(obj_data[len(b'gzip:'):])
         
         # デシリアライズ
         if b'json' in method_part:
@@ -158,84 +161,382 @@ class BaseCacheBackend(ABC):
     async def get_stats(self) -> Dict[str, Any]:
         """統計取得"""
         pass
+    
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """複数値取得（ヒットしたキーのみ、既定はキーごとの取得）"""
+        results = {}
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                results[key] = value
+        return results
+    
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> Dict[str, bool]:
+        """複数値設定（既定はキーごとの設定）"""
+        return {key: await self.set(key, value, ttl) for key, value in items.items()}
+
+def estimate_size(value: Any, max_items: int = 64) -> int:
+    """値のおおよそのメモリサイズ（バイト）
+
+    シリアライズせずに sys.getsizeof で見積もる。コンテナは先頭 max_items 件の平均から
+    全体を推定するため、大きなリストでも一定時間で済む（入れ子は1段まで）。
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, (str, bytes, bytearray, int, float, bool)) or value is None:
+        return size
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = value
+    else:
+        attributes = getattr(value, '__dict__', None)
+        return size + (estimate_size(attributes, max_items) if attributes is not None else 0)
+
+    count = len(value)
+    if not count:
+        return size
+    sampled = 0
+    sample_size = 0
+    for item in items:
+        if sampled >= max_items:
+            break
+        if isinstance(item, tuple) and isinstance(value, dict):
+            sample_size += sys.getsizeof(item[0]) + sys.getsizeof(item[1])
+        else:
+            sample_size += sys.getsizeof(item)
+        sampled += 1
+    return size + sample_size * count // sampled
+
+
+class LRUEvictionIndex:
+    """最終アクセスが最も古いキーから削除（OrderedDict の末尾移動・先頭取り出しで O(1)）"""
+
+    name = 'lru'
+
+    def __init__(self):
+        self._order: 'OrderedDict[str, None]' = OrderedDict()
+
+    def add(self, key: str):
+        self._order[key] = None
+        self._order.move_to_end(key)
+
+    def touch(self, key: str):
+        self._order.move_to_end(key)
+
+    def remove(self, key: str):
+        self._order.pop(key, None)
+
+    def victim(self) -> Optional[str]:
+        """次に削除するキー（削除はしない）"""
+        return next(iter(self._order), None)
+
+    def clear(self):
+        self._order.clear()
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+
+class FIFOEvictionIndex(LRUEvictionIndex):
+    """追加順に削除（アクセスでは順序を変えない）"""
+
+    name = 'fifo'
+
+    def add(self, key: str):
+        if key not in self._order:
+            self._order[key] = None
+
+    def touch(self, key: str):
+        pass
+
+
+class LFUEvictionIndex:
+    """アクセス回数が最も少ないキー（同数なら古い方）から削除
+
+    回数ごとのキー集合（挿入順）と最小回数を保持し、追加・アクセス・削除候補の取得とも O(1)。
+    最小回数のキーを明示削除した直後だけ、次の候補取得で回数の種類数ぶん探索する。
+    """
+
+    name = 'lfu'
+
+    def __init__(self):
+        self._counts: Dict[str, int] = {}
+        self._buckets: Dict[int, 'OrderedDict[str, None]'] = {}
+        self._min_count = 0
+
+    def add(self, key: str):
+        if key in self._counts:
+            self.touch(key)
+            return
+        self._counts[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_count = 1
+
+    def touch(self, key: str):
+        count = self._counts[key]
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        self._counts[key] = count + 1
+        self._buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    def remove(self, key: str):
+        count = self._counts.pop(key, None)
+        if count is None:
+            return
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+
+    def victim(self) -> Optional[str]:
+        bucket = self._buckets.get(self._min_count)
+        if not bucket and self._buckets:
+            self._min_count = min(self._buckets)
+            bucket = self._buckets[self._min_count]
+        return next(iter(bucket), None) if bucket else None
+
+    def clear(self):
+        self._counts.clear()
+        self._buckets.clear()
+        self._min_count = 0
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+
+EVICTION_POLICIES = {
+    index.name: index for index in (LRUEvictionIndex, FIFOEvictionIndex, LFUEvictionIndex)
+}
+
+
+class FrequencySketch:
+    """アクセス頻度の近似カウンタ（Count-Min スケッチ、4ビット相当の飽和カウンタ）
+
+    キーごとの表を持たず、depth 行 × width 列のカウンタの最小値で頻度を見積もる。
+    加算回数が sample_size に達するたびに全カウンタを半減させ（エージング）、
+    過去に多く読まれただけのキーが頻度を持ち続けないようにする。
+    """
+
+    MAX_COUNT = 15
+    _SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0x27D4EB2F165667C5)
+    _MASK = (1 << 64) - 1
+
+    def __init__(self, expected_entries: int, depth: int = 4, sample_factor: int = 10):
+        if not 1 <= depth <= len(self._SEEDS):
+            raise ValueError(f"depth must be between 1 and {len(self._SEEDS)}")
+        # 列数は想定件数以上の2の累乗（乗算ハッシュの上位ビットを列番号に使う）
+        self.width = 1 << max(4, (max(1, expected_entries) - 1).bit_length())
+        self.depth = depth
+        self.sample_size = sample_factor * max(1, expected_entries)
+        self.additions = 0
+        self.resets = 0
+        self._shift = 64 - (self.width.bit_length() - 1)
+        self._rows = [bytearray(self.width) for _ in range(depth)]
+
+    def _indexes(self, key: str):
+        h = hash(key) & self._MASK
+        shift = self._shift
+        mask = self._MASK
+        return [(((h ^ (seed >> 7)) * seed) & mask) >> shift for seed in self._SEEDS[:self.depth]]
+
+    def frequency(self, key: str) -> int:
+        """見積もり頻度（実際の回数以上、MAX_COUNT で頭打ち）"""
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+
+    def increment(self, key: str):
+        """頻度を1加算（最小値のカウンタのみ増やす保守的更新）"""
+        indexes = self._indexes(key)
+        current = min(row[index] for row, index in zip(self._rows, indexes))
+        if current < self.MAX_COUNT:
+            for row, index in zip(self._rows, indexes):
+                if row[index] == current:
+                    row[index] = current + 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self._age()
+
+    def _age(self):
+        """全カウンタと加算回数を半減"""
+        halve = bytes(count >> 1 for count in range(256))
+        self._rows = [row.translate(halve) for row in self._rows]
+        self.additions //= 2
+        self.resets += 1
+
+    def clear(self):
+        for row in self._rows:
+            row[:] = bytes(self.width)
+        self.additions = 0
+
+
+class TinyLFUAdmission:
+    """頻度スケッチによる受け入れ判定（TinyLFU）
+
+    満杯のキャッシュに新しいキーを入れるとき、削除候補より見積もり頻度が高い場合だけ
+    受け入れる。1回しか読まれないキーが頻繁に読まれるエントリを押し出すのを防ぐ。
+    """
+
+    name = 'tinylfu'
+
+    def __init__(self, expected_entries: int):
+        self.sketch = FrequencySketch(expected_entries)
+        self.admitted = 0
+        self.rejected = 0
+
+    def record(self, key: str):
+        """アクセスを記録（ヒット・ミスとも）"""
+        self.sketch.increment(key)
+
+    def admit(self, candidate: str, victim: str) -> bool:
+        """candidate を入れるために victim を削除してよいか"""
+        if self.sketch.frequency(candidate) > self.sketch.frequency(victim):
+            self.admitted += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "policy": self.name,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "sketch_resets": self.sketch.resets
+        }
+
+
+ADMISSION_POLICIES = ('none', TinyLFUAdmission.name)
+
 
 class MemoryCacheBackend(BaseCacheBackend):
-    """インメモリキャッシュバックエンド"""
+    """インメモリキャッシュバックエンド
+
+    削除順は eviction_policy（'lru' / 'fifo' / 'lfu'）の索引が O(1) で管理し、
+    メモリ使用量は設定・削除のたびに見積もりサイズを加減して更新する。
+    """
     
-    def __init__(self, max_size: int = 1000, default_ttl: float = 3600):
+    def __init__(self, max_size: int = 1000, default_ttl: float = 3600,
+                 eviction_policy: str = 'lru'):
+        if eviction_policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy: {eviction_policy} "
+                             f"(choose from {', '.join(EVICTION_POLICIES)})")
         self.max_size = max_size
         self.default_ttl = default_ttl
+        self.eviction_policy = eviction_policy
         self.cache: Dict[str, CacheEntry] = {}
-        self.access_order = []  # LRU用
+        self.eviction_index = EVICTION_POLICIES[eviction_policy]()
         self.stats = CacheStats()
         self.lock = asyncio.Lock()
     
     async def get(self, key: str) -> Optional[Any]:
         """値取得"""
         async with self.lock:
-            if key not in self.cache:
-                self.stats.misses += 1
-                self.stats.update_hit_rate()
-                return None
-            
-            entry = self.cache[key]
-            
-            # 有効期限チェック
-            if entry.is_expired:
-                await self._evict_key(key)
-                self.stats.misses += 1
-                self.stats.update_hit_rate()
-                return None
-            
-            # アクセス情報更新
-            entry.accessed_at = time.time()
-            entry.access_count += 1
-            
-            # LRU更新
-            if key in self.access_order:
-                self.access_order.remove(key)
-            self.access_order.append(key)
-            
-            self.stats.hits += 1
-            self.stats.update_hit_rate()
-            return entry.value
+            return self._get(key, time.time())
+    
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """複数値取得（ロック取得は1回）"""
+        results = {}
+        async with self.lock:
+            now = time.time()
+            for key in keys:
+                value = self._get(key, now)
+                if value is not None:
+                    results[key] = value
+        return results
     
     async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
         """値設定"""
         async with self.lock:
-            ttl = ttl or self.default_ttl
-            
-            # サイズ計算（近似値）
-            try:
-                size = len(pickle.dumps(value))
-            except:
-                size = 0
-            
-            entry = CacheEntry(
-                value=value,
-                created_at=time.time(),
-                accessed_at=time.time(),
-                ttl=ttl,
-                size=size
-            )
-            
-            # 容量チェック・LRU削除
-            await self._ensure_capacity()
-            
-            self.cache[key] = entry
-            if key not in self.access_order:
-                self.access_order.append(key)
-            
-            self.stats.sets += 1
-            self.stats.total_entries = len(self.cache)
-            self.stats.memory_usage += size
-            
+            self._set(key, value, ttl, time.time())
             return True
     
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> Dict[str, bool]:
+        """複数値設定（ロック取得は1回）"""
+        async with self.lock:
+            now = time.time()
+            for key, value in items.items():
+                self._set(key, value, ttl, now)
+        return {key: True for key in items}
+    
+    async def admit_many(self, items: Dict[str, Any], admission: 'TinyLFUAdmission',
+                         ttl: Optional[float] = None) -> Dict[str, bool]:
+        """受け入れ判定付きの複数値設定（ロック取得は1回）
+
+        既存キーの更新と空きがある場合はそのまま設定する。満杯なら削除候補と比べ、
+        admission が拒否したキーは設定しない（削除候補もそのまま残す）。
+        """
+        results = {}
+        async with self.lock:
+            now = time.time()
+            for key, value in items.items():
+                if key not in self.cache and len(self.cache) >= self.max_size:
+                    victim = self.eviction_index.victim()
+                    if victim is not None and not self.cache[victim].is_expired and \
+                            not admission.admit(key, victim):
+                        results[key] = False
+                        continue
+                self._set(key, value, ttl, now)
+                results[key] = True
+        return results
+    
+    def _get(self, key: str, now: float) -> Optional[Any]:
+        """値取得（ロック取得済みで呼ぶ）"""
+        entry = self.cache.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            self.stats.update_hit_rate()
+            return None
+        
+        # 有効期限チェック
+        if entry.ttl is not None and now - entry.created_at > entry.ttl:
+            self._remove(key)
+            self.stats.misses += 1
+            self.stats.update_hit_rate()
+            return None
+        
+        # アクセス情報更新
+        entry.accessed_at = now
+        entry.access_count += 1
+        self.eviction_index.touch(key)
+        
+        self.stats.hits += 1
+        self.stats.update_hit_rate()
+        return entry.value
+    
+    def _set(self, key: str, value: Any, ttl: Optional[float], now: float):
+        """値設定（ロック取得済みで呼ぶ）"""
+        entry = CacheEntry(
+            value=value,
+            created_at=now,
+            accessed_at=now,
+            ttl=ttl or self.default_ttl,
+            size=estimate_size(value)
+        )
+        
+        previous = self.cache.get(key)
+        if previous is not None:
+            # 上書き（件数は変わらないので削除不要）
+            self.stats.memory_usage -= previous.size
+        else:
+            # 容量チェック・削除
+            self._ensure_capacity()
+        
+        self.cache[key] = entry
+        self.eviction_index.add(key)
+        
+        self.stats.sets += 1
+        self.stats.total_entries = len(self.cache)
+        self.stats.memory_usage += entry.size
+    
     async def delete(self, key: str) -> bool:
         """値削除"""
         async with self.lock:
-            return await self._evict_key(key)
+            removed = self._remove(key)
+            if removed:
+                self.stats.deletes += 1
+            return removed
     
     async def exists(self, key: str) -> bool:
         """キー存在チェック"""
@@ -248,35 +549,35 @@ class MemoryCacheBackend(BaseCacheBackend):
         """全削除"""
         async with self.lock:
             self.cache.clear()
-            self.access_order.clear()
+            self.eviction_index.clear()
             self.stats.total_entries = 0
             self.stats.memory_usage = 0
             return True
     
-    async def _evict_key(self, key: str) -> bool:
-        """キー削除"""
-        if key in self.cache:
-            entry = self.cache[key]
-            del self.cache[key]
-            if key in self.access_order:
-                self.access_order.remove(key)
-            self.stats.deletes += 1
-            self.stats.total_entries = len(self.cache)
-            self.stats.memory_usage -= entry.size
-            return True
-        return False
+    def _remove(self, key: str) -> bool:
+        """キー削除（ロック取得済みで呼ぶ）"""
+        entry = self.cache.pop(key, None)
+        if entry is None:
+            return False
+        self.eviction_index.remove(key)
+        self.stats.total_entries = len(self.cache)
+        self.stats.memory_usage -= entry.size
+        return True
     
-    async def _ensure_capacity(self):
-        """容量確保（LRU削除）"""
-        while len(self.cache) >= self.max_size and self.access_order:
-            oldest_key = self.access_order[0]
-            await self._evict_key(oldest_key)
+    def _ensure_capacity(self):
+        """新しいキー1件分の容量確保（削除方針の候補から削除）"""
+        while len(self.cache) >= self.max_size:
+            victim = self.eviction_index.victim()
+            if victim is None:
+                break
+            self._remove(victim)
             self.stats.evictions += 1
     
     async def get_stats(self) -> Dict[str, Any]:
         """統計取得"""
         return {
             "backend": "memory",
+            "eviction_policy": self.eviction_policy,
             "hits": self.stats.hits,
             "misses": self.stats.misses,
             "hit_rate": self.stats.hit_rate,
@@ -367,6 +668,67 @@ class RedisCacheBackend(BaseCacheBackend):
             logger.error(f"Redis set error: {str(e)}")
             return False
     
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """複数値取得（MGET 1往復）"""
+        if not keys:
+            return {}
+        if not self.redis_client:
+            await self.connect()
+        
+        try:
+            values = await self.redis_client.mget([self._make_key(key) for key in keys])
+        except Exception as e:
+            logger.error(f"Redis mget error: {str(e)}")
+            self.stats.misses += len(keys)
+            self.stats.update_hit_rate()
+            return {}
+        
+        results = {}
+        for key, data in zip(keys, values):
+            if data is None:
+                self.stats.misses += 1
+                continue
+            try:
+                results[key] = self.serializer.deserialize(data)
+                self.stats.hits += 1
+            except Exception as e:
+                logger.error(f"Redis deserialize error for '{key}': {str(e)}")
+                self.stats.misses += 1
+        self.stats.update_hit_rate()
+        return results
+    
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> Dict[str, bool]:
+        """複数値設定（SET/SETEX を1つのパイプラインで送信）"""
+        if not items:
+            return {}
+        if not self.redis_client:
+            await self.connect()
+        
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, value in items.items():
+                data = self.serializer.serialize(
+                    value,
+                    compress=len(str(value)) > self.compress_threshold
+                )
+                if ttl:
+                    pipe.setex(self._make_key(key), int(ttl), data)
+                else:
+                    pipe.set(self._make_key(key), data)
+            replies = await pipe.execute(raise_on_error=False)
+        except Exception as e:
+            logger.error(f"Redis pipeline set error: {str(e)}")
+            return {key: False for key in items}
+        
+        results = {}
+        for key, reply in zip(items, replies):
+            ok = not isinstance(reply, Exception) and bool(reply)
+            if not ok:
+                logger.error(f"Redis set error for '{key}': {reply}")
+            results[key] = ok
+        self.stats.sets += sum(results.values())
+        return results
+    
     async def delete(self, key: str) -> bool:
         """値削除"""
         if not self.redis_client:
@@ -441,20 +803,43 @@ class RedisCacheBackend(BaseCacheBackend):
         }
 
 class HybridCacheBackend(BaseCacheBackend):
-    """ハイブリッドキャッシュバックエンド（L1: Memory, L2: Redis）"""
+    """ハイブリッドキャッシュバックエンド（L1: Memory, L2: Redis）
+
+    admission_policy='tinylfu' の場合、L1 が満杯のときの L1 への書き込み（L2 ヒットの
+    プロモートと、L2 にも書く設定）は頻度スケッチで L1 の削除候補と比べて受け入れを決める。
+    拒否された値も L2 には残る。L2 がない場合は L1 が唯一の保存先なので常に書き込む。
+    """
     
     def __init__(self, 
                  l1_max_size: int = 500,
                  l1_ttl: float = 1800,  # 30分
                  redis_url: str = "redis://localhost:6379",
-                 redis_ttl: float = 86400):  # 24時間
+                 redis_ttl: float = 86400,  # 24時間
+                 admission_policy: str = 'tinylfu'):
+        if admission_policy not in ADMISSION_POLICIES:
+            raise ValueError(f"Unknown admission policy: {admission_policy} "
+                             f"(choose from {', '.join(ADMISSION_POLICIES)})")
         self.l1_cache = MemoryCacheBackend(l1_max_size, l1_ttl)
         self.l2_cache = RedisCacheBackend(redis_url) if REDIS_AVAILABLE else None
         self.redis_ttl = redis_ttl
+        self.admission = TinyLFUAdmission(l1_max_size) if admission_policy == TinyLFUAdmission.name else None
         self.stats = CacheStats()
     
+    def _record_access(self, keys: List[str]):
+        if self.admission is not None:
+            for key in keys:
+                self.admission.record(key)
+    
+    async def _write_l1(self, items: Dict[str, Any], ttl: Optional[float] = None) -> Dict[str, bool]:
+        """L1 への書き込み（L2 がある場合は受け入れ判定を通す）"""
+        if self.admission is not None and self.l2_cache:
+            return await self.l1_cache.admit_many(items, self.admission, ttl)
+        return await self.l1_cache.set_many(items, ttl)
+    
     async def get(self, key: str) -> Optional[Any]:
         """値取得（L1→L2の順）"""
+        self._record_access([key])
+        
         # L1キャッシュから取得
         value = await self.l1_cache.get(key)
         if value is not None:
@@ -467,7 +852,7 @@ class HybridCacheBackend(BaseCacheBackend):
             value = await self.l2_cache.get(key)
             if value is not None:
                 # L1にプロモート
-                await self.l1_cache.set(key, value)
+                await self._write_l1({key: value})
                 self.stats.hits += 1
                 self.stats.update_hit_rate()
                 return value
@@ -478,7 +863,7 @@ class HybridCacheBackend(BaseCacheBackend):
     
     async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
         """値設定（L1とL2の両方）"""
-        l1_result = await self.l1_cache.set(key, value, ttl)
+        l1_result = (await self._write_l1({key: value}, ttl))[key]
         
         l2_result = True
         if self.l2_cache:
@@ -490,6 +875,34 @@ class HybridCacheBackend(BaseCacheBackend):
         
         return l1_result or l2_result
     
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """複数値取得（L1で一括取得し、残りをL2から一括取得してL1にプロモート）"""
+        self._record_access(keys)
+        results = await self.l1_cache.get_many(keys)
+        
+        missing = [key for key in keys if key not in results]
+        if missing and self.l2_cache:
+            promoted = await self.l2_cache.get_many(missing)
+            if promoted:
+                await self._write_l1(promoted)
+                results.update(promoted)
+        
+        self.stats.hits += len(results)
+        self.stats.misses += len(keys) - len(results)
+        self.stats.update_hit_rate()
+        return results
+    
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> Dict[str, bool]:
+        """複数値設定（L1とL2の両方に一括設定）"""
+        results = await self._write_l1(items, ttl)
+        
+        if self.l2_cache:
+            l2_results = await self.l2_cache.set_many(items, ttl or self.redis_ttl)
+            results = {key: results.get(key, False) or l2_results.get(key, False) for key in items}
+        
+        self.stats.sets += sum(results.values())
+        return results
+    
     async def delete(self, key: str) -> bool:
         """値削除（L1とL2の両方）"""
         l1_result = await self.l1_cache.delete(key)
@@ -516,6 +929,8 @@ class HybridCacheBackend(BaseCacheBackend):
     async def clear(self) -> bool:
         """全削除"""
         l1_result = await self.l1_cache.clear()
+        if self.admission is not None:
+            self.admission.sketch.clear()
         
         l2_result = True
         if self.l2_cache:
@@ -530,6 +945,7 @@ class HybridCacheBackend(BaseCacheBackend):
         combined_stats = {
             "backend": "hybrid",
             "l1_stats": l1_stats,
+            "admission": self.admission.stats() if self.admission else {"policy": "none"},
             "hits": self.stats.hits,
             "misses": self.stats.misses,
             "hit_rate": self.stats.hit_rate,
@@ -560,7 +976,8 @@ class AdvancedCacheManager:
         if backend_type == CacheBackend.MEMORY:
             return MemoryCacheBackend(
                 max_size=self.config.get('memory_max_size', 1000),
-                default_ttl=self.config.get('memory_ttl', 3600)
+                default_ttl=self.config.get('memory_ttl', 3600),
+                eviction_policy=self.config.get('memory_eviction_policy', 'lru')
             )
         elif backend_type == CacheBackend.REDIS and REDIS_AVAILABLE:
             return RedisCacheBackend(
@@ -571,7 +988,8 @@ class AdvancedCacheManager:
             return HybridCacheBackend(
                 l1_max_size=self.config.get('l1_max_size', 500),
                 l1_ttl=self.config.get('l1_ttl', 1800),
-                redis_url=self.config.get('redis_url', 'redis://localhost:6379')
+                redis_url=self.config.get('redis_url', 'redis://localhost:6379'),
+                admission_policy=self.config.get('l1_admission_policy', 'tinylfu')
             )
         else:
             logger.warning(f"Backend {backend_type} not available, using memory cache")
@@ -625,21 +1043,18 @@ class AdvancedCacheManager:
         return value
     
     async def mget(self, keys: List[str], namespace: Optional[str] = None) -> Dict[str, Any]:
-        """複数値取得"""
-        results = {}
-        for key in keys:
-            value = await self.get(key, namespace)
-            if value is not None:
-                results[key] = value
-        return results
+        """複数値取得（バックエンドの一括取得を1回呼ぶ）"""
+        namespaced = {self._make_namespaced_key(key, namespace): key for key in keys}
+        found = await self.backend.get_many(list(namespaced))
+        return {namespaced[key]: value for key, value in found.items()}
     
     async def mset(self, items: Dict[str, Any], ttl: Optional[float] = None, 
                    namespace: Optional[str] = None) -> Dict[str, bool]:
-        """複数値設定"""
-        results = {}
-        for key, value in items.items():
-            results[key] = await self.set(key, value, ttl, namespace)
-        return results
+        """複数値設定（バックエンドの一括設定を1回呼ぶ）"""
+        namespaced = {self._make_namespaced_key(key, namespace): key for key in items}
+        stored = await self.backend.set_many(
+            {key: items[original] for key, original in namespaced.items()}, ttl)
+        return {namespaced[key]: ok for key, ok in stored.items()}
     
     async def cache_warming(self, 
                            keys_factory: Callable[[], List[str]], 
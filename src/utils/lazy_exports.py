@@ -0,0 +1,30 @@
+"""
+Lazy Exports
+パッケージの公開名をサブモジュールの初回参照時に読み込む（起動時間短縮）
+"""
+
+import importlib
+from typing import Any, Dict
+
+
+def lazy_exports(namespace: Dict[str, Any], exports: Dict[str, str]):
+    """パッケージの globals() に __all__ / __getattr__ / __dir__ を設定する
+
+    exports は {公開名: 相対モジュール名}。参照された値は namespace にキャッシュし、
+    2回目以降はモジュール属性として直接解決される。
+    """
+    package = namespace['__name__']
+
+    def __getattr__(name):
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(exports[name], package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(exports))
+
+    namespace['__all__'] = list(exports)
+    namespace['__getattr__'] = __getattr__
+    namespace['__dir__'] = __dir__
@@ -0,0 +1,257 @@
+"""
+Event Loop Watchdog
+イベントループ監視 - 一定間隔のハートビートでイベントループの遅延（lag）を計測し、
+閾値を超えてループを止めた処理（コルーチン内の同期I/Oなど）をスタック・パイプライン段階付きで
+検出して、メトリクスとログに出力する
+
+ループが止まっている間に監視スレッドがループスレッドのスタックと実行中タスクのスパンを
+採取するため、どの処理が止めているかを止まっている最中の状態で特定できる。
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import traceback
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+
+from .metrics import MetricsRegistry, exponential_buckets, get_metrics_registry
+from .tracing import get_active_tracer
+
+logger = logging.getLogger(__name__)
+
+# ループ遅延・ブロック時間のバケット（秒）: 1ms〜約16秒
+LOOP_LAG_BUCKETS = exponential_buckets(0.001, 2, 15)
+
+# ブロック箇所の特定に使うソースディレクトリ（この下の最も内側のフレームを箇所とする）
+SRC_ROOT = str(Path(__file__).resolve().parents[1])
+
+
+@dataclass
+class BlockingFinding:
+    """ループを閾値以上止めた1回分の記録"""
+    stage: str
+    span: Optional[str]
+    task: Optional[str]
+    site: str
+    stack: List[str]
+    detected_at: datetime = field(default_factory=datetime.now)
+    duration: Optional[float] = None  # ループ再開時に確定（秒）
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'stage': self.stage,
+            'span': self.span,
+            'task': self.task,
+            'site': self.site,
+            'stack': self.stack,
+            'detected_at': self.detected_at.isoformat(),
+            'duration': round(self.duration, 4) if self.duration is not None else None
+        }
+
+
+class LoopWatchdog:
+    """イベントループの遅延計測とブロッキング処理の検出
+
+    使用例（イベントループ上で）:
+        with LoopWatchdog(block_threshold=0.1) as watchdog:
+            await run()
+        logger.info(watchdog.summary())
+    """
+
+    def __init__(self, interval: float = 0.05, block_threshold: float = 0.1,
+                 max_findings: int = 200, registry: Optional[MetricsRegistry] = None):
+        """
+        Args:
+            interval: ハートビート間隔（秒）
+            block_threshold: ブロックとみなすループ停止時間（秒）
+            max_findings: 保持する検出記録の上限（超過分はメトリクスとログのみ）
+            registry: 記録先のメトリクスレジストリ
+        """
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self.max_findings = max_findings
+        self.findings: List[BlockingFinding] = []
+        self.block_count = 0
+        self.max_lag = 0.0
+
+        registry = registry or get_metrics_registry()
+        self._lag = registry.histogram(
+            'news_event_loop_lag_seconds', 'Delay of event loop heartbeats beyond their schedule',
+            buckets=LOOP_LAG_BUCKETS)
+        self._blocks = registry.counter(
+            'news_event_loop_blocks_total', 'Event loop stalls longer than the blocking threshold', ('stage',))
+        self._block_seconds = registry.histogram(
+            'news_event_loop_block_seconds', 'Duration of event loop stalls by pipeline stage', ('stage',),
+            buckets=LOOP_LAG_BUCKETS)
+
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._last_beat = 0.0
+        self._expected = 0.0
+        self._pending: Optional[BlockingFinding] = None
+
+    # ------------------------------------------------------------------
+    # 開始・停止（ループスレッドから呼ぶ）
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_config(cls, config) -> Optional['LoopWatchdog']:
+        """設定の loop_watchdog セクションから作成（enabled が false なら None）"""
+        if not config.get('loop_watchdog', 'enabled', default=True):
+            return None
+        return cls(
+            interval=config.get('loop_watchdog', 'interval_ms', default=50) / 1000,
+            block_threshold=config.get('loop_watchdog', 'block_threshold_ms', default=100) / 1000
+        )
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> 'LoopWatchdog':
+        if self._thread is not None:
+            return self
+        self.loop = loop or asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._last_beat = perf_counter()
+        self._expected = self._last_beat + self.interval
+        self._handle = self.loop.call_later(self.interval, self._beat)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name='loop-watchdog', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is None:
+            return
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        # 停止までループが再開しなかった検出は、検出からの経過時間で確定する
+        with self._lock:
+            pending, self._pending = self._pending, None
+        if pending is not None:
+            self._record(pending, perf_counter() - self._expected)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    # ------------------------------------------------------------------
+    # ハートビート（ループスレッド）
+    # ------------------------------------------------------------------
+
+    def _beat(self):
+        now = perf_counter()
+        lag = max(0.0, now - self._expected)
+        self._lag.observe(lag)
+        self.max_lag = max(self.max_lag, lag)
+
+        with self._lock:
+            pending, self._pending = self._pending, None
+            self._last_beat = now
+        if pending is not None:
+            self._record(pending, lag)
+
+        self._expected = now + self.interval
+        self._handle = self.loop.call_later(self.interval, self._beat)
+
+    def _record(self, finding: BlockingFinding, duration: float):
+        finding.duration = duration
+        self.block_count += 1
+        self._blocks.labels(stage=finding.stage).inc()
+        self._block_seconds.labels(stage=finding.stage).observe(duration)
+        if len(self.findings) < self.max_findings:
+            self.findings.append(finding)
+        logger.warning(
+            f"Event loop blocked for {duration:.3f}s in stage '{finding.stage}' at {finding.site}"
+            f" (task={finding.task}, span={finding.span})\n" + ''.join(finding.stack[-8:]).rstrip()
+        )
+
+    # ------------------------------------------------------------------
+    # 監視（監視スレッド）
+    # ------------------------------------------------------------------
+
+    def _watch(self):
+        poll = min(self.interval, self.block_threshold) / 2
+        while not self._stop.wait(poll):
+            with self._lock:
+                if self._pending is not None:
+                    continue
+                stalled = perf_counter() - self._last_beat - self.interval
+                if stalled < self.block_threshold:
+                    continue
+                self._pending = self._capture()
+
+    def _capture(self) -> BlockingFinding:
+        """止まっているループスレッドのスタックと実行中タスクのスパンを採取"""
+        frame = sys._current_frames().get(self._loop_thread)
+        stack = traceback.format_list(traceback.extract_stack(frame)) if frame is not None else []
+
+        site = '<unknown>'
+        if frame is not None:
+            innermost = None
+            walker = frame
+            while walker is not None:
+                filename = walker.f_code.co_filename
+                if innermost is None:
+                    innermost = walker
+                if filename.startswith(SRC_ROOT) and not filename.endswith(('loop_watchdog.py', 'tracing.py')):
+                    innermost = walker
+                    break
+                walker = walker.f_back
+            site = f"{Path(innermost.f_code.co_filename).name}:{innermost.f_lineno} in {innermost.f_code.co_name}"
+
+        task = asyncio.current_task(self.loop)
+        tracer = get_active_tracer()
+        span = None
+        if tracer is not None:
+            span = tracer.open_span(task if task is not None else self._loop_thread)
+
+        if span is None:
+            stage = 'unknown'
+        else:
+            # pipeline スパンは名前（collect / render ...）、それ以外はカテゴリを段階とする
+            stage = span.name if span.category in ('pipeline', 'app') else span.category
+
+        return BlockingFinding(
+            stage=stage,
+            span=span.name if span is not None else None,
+            task=task.get_name() if task is not None else None,
+            site=site,
+            stack=stack
+        )
+
+    # ------------------------------------------------------------------
+    # 集計
+    # ------------------------------------------------------------------
+
+    def summary(self) -> Dict[str, Any]:
+        """最大遅延・ブロック回数と、段階別の回数・合計時間・箇所"""
+        by_stage: Dict[str, Dict[str, Any]] = defaultdict(
+            lambda: {'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0, 'sites': defaultdict(int)})
+        for finding in self.findings:
+            stage = by_stage[finding.stage]
+            stage['count'] += 1
+            stage['total_seconds'] = round(stage['total_seconds'] + finding.duration, 4)
+            stage['max_seconds'] = round(max(stage['max_seconds'], finding.duration), 4)
+            stage['sites'][finding.site] += 1
+
+        return {
+            'max_lag': round(self.max_lag, 4),
+            'lag_p99': self._lag.labels().quantile(0.99),
+            'blocks': self.block_count,
+            'by_stage': {name: {**data, 'sites': dict(data['sites'])} for name, data in by_stage.items()}
+        }
@@ -0,0 +1,468 @@
+"""
+Metrics Registry
+メトリクスレジストリ - プロセス内のカウンター・ゲージ・ヒストグラムを一元管理し、
+スナップショットとPrometheusテキスト形式で出力する
+"""
+
+import math
+import re
+import sys
+import threading
+from bisect import bisect_left
+from datetime import datetime
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# レイテンシ用の固定バケット（秒）: 1ms〜5分をおおむね対数間隔で区切る
+DEFAULT_LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0
+)
+SNAPSHOT_QUANTILES = (0.5, 0.9, 0.99)
+
+# パイプライン段階（collect / translate / analyze ...）とサービス別の共通メトリクス
+STAGE_LABELS = ('stage', 'service')
+STAGE_DURATION_METRIC = 'news_stage_duration_seconds'
+STAGE_EVENTS_METRIC = 'news_stage_events_total'
+
+METRIC_NAME = re.compile(r'^[a-zA-Z_:][a-zA-Z0-9_:]*$')
+LABEL_NAME = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+
+
+def exponential_buckets(start: float, factor: float, count: int) -> Tuple[float, ...]:
+    """start から factor 倍ずつ増える count 個のバケット境界"""
+    if start <= 0 or factor <= 1 or count < 1:
+        raise ValueError("start must be > 0, factor > 1 and count >= 1")
+    return tuple(start * factor ** i for i in range(count))
+
+
+class _ThreadCells:
+    """スレッドごとの集計セル
+
+    記録時は各スレッドが自分専用のセルだけを更新するためロックを取らない。
+    ロックはスレッドが初めて記録するとき（セル登録）と集計時のセル一覧コピーだけで使う。
+    """
+
+    __slots__ = ('_factory', '_local', '_cells', '_lock')
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._local = threading.local()
+        self._cells: List[list] = []
+        self._lock = threading.Lock()
+
+    def get(self) -> list:
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell = self._factory()
+            with self._lock:
+                self._cells.append(cell)
+            self._local.cell = cell
+            return cell
+
+    def all(self) -> List[list]:
+        with self._lock:
+            return list(self._cells)
+
+
+class CounterChild:
+    """ラベル値ごとのカウンター"""
+
+    __slots__ = ('_cells',)
+
+    def __init__(self):
+        self._cells = _ThreadCells(lambda: [0.0])
+
+    def inc(self, amount: float = 1.0):
+        """カウンターを増やす（負の値は不可）"""
+        if amount < 0:
+            raise ValueError("Counters can only be incremented by non-negative amounts")
+        self._cells.get()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return sum(cell[0] for cell in self._cells.all())
+
+
+class GaugeChild:
+    """ラベル値ごとのゲージ
+
+    inc/dec はスレッドごとの差分として記録し、set はその時点の差分合計を基準値に織り込む。
+    """
+
+    __slots__ = ('_cells', '_base', '_lock')
+
+    def __init__(self):
+        self._cells = _ThreadCells(lambda: [0.0])
+        self._base = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        self._cells.get()[0] += amount
+
+    def dec(self, amount: float = 1.0):
+        self._cells.get()[0] -= amount
+
+    def set(self, value: float):
+        with self._lock:
+            self._base = value - sum(cell[0] for cell in self._cells.all())
+
+    @property
+    def value(self) -> float:
+        return self._base + sum(cell[0] for cell in self._cells.all())
+
+
+class _Timer:
+    """経過時間をヒストグラムに記録するコンテキストマネージャー"""
+
+    __slots__ = ('_child', '_start')
+
+    def __init__(self, child: 'HistogramChild'):
+        self._child = child
+
+    def __enter__(self):
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._child.observe(perf_counter() - self._start)
+        return False
+
+
+class HistogramChild:
+    """ラベル値ごとの固定バケットヒストグラム
+
+    セルは [バケットごとの件数..., +Inf の件数, 合計, 最大値] のリスト。
+    """
+
+    __slots__ = ('_bounds', '_cells', '_sum_index', '_max_index')
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self._bounds = bounds
+        size = len(bounds) + 1
+        self._sum_index = size
+        self._max_index = size + 1
+        self._cells = _ThreadCells(lambda: [0] * size + [0.0, -math.inf])
+
+    def observe(self, value: float):
+        cell = self._cells.get()
+        cell[bisect_left(self._bounds, value)] += 1
+        cell[self._sum_index] += value
+        if value > cell[self._max_index]:
+            cell[self._max_index] = value
+
+    def time(self) -> _Timer:
+        """with ブロックの経過時間（秒）を記録"""
+        return _Timer(self)
+
+    def totals(self) -> Tuple[List[int], float, float]:
+        """全スレッド分を合算した（バケット別件数, 合計, 最大値）"""
+        counts = [0] * (len(self._bounds) + 1)
+        total, maximum = 0.0, -math.inf
+        for cell in self._cells.all():
+            for i in range(len(counts)):
+                counts[i] += cell[i]
+            total += cell[self._sum_index]
+            maximum = max(maximum, cell[self._max_index])
+        return counts, total, maximum
+
+    @property
+    def count(self) -> int:
+        return sum(self.totals()[0])
+
+    @property
+    def sum(self) -> float:
+        return self.totals()[1]
+
+    def quantile(self, q: float) -> Optional[float]:
+        """バケット内を線形補間した分位点の推定値（観測がなければ None）"""
+        counts, _, maximum = self.totals()
+        return _estimate_quantile(self._bounds, counts, maximum, q)
+
+
+def _estimate_quantile(bounds: Sequence[float], counts: Sequence[int],
+                       maximum: float, q: float) -> Optional[float]:
+    total = sum(counts)
+    if total == 0:
+        return None
+    rank = q * total
+    cumulative = 0
+    for i, count in enumerate(counts):
+        if count and cumulative + count >= rank:
+            lower = bounds[i - 1] if i > 0 else 0.0
+            upper = bounds[i] if i < len(bounds) else maximum
+            upper = min(upper, maximum)
+            lower = min(lower, upper)
+            return lower + (upper - lower) * (rank - cumulative) / count
+        cumulative += count
+    return maximum
+
+
+class MetricFamily:
+    """同じ名前・ラベル名を持つメトリクスの集合"""
+
+    kind = 'untyped'
+
+    def __init__(self, name: str, documentation: str = '', labelnames: Iterable[str] = ()):
+        if not METRIC_NAME.match(name):
+            raise ValueError(f"Invalid metric name: {name}")
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        for labelname in self.labelnames:
+            if not LABEL_NAME.match(labelname) or labelname == 'le':
+                raise ValueError(f"Invalid label name: {labelname}")
+        self._children: Dict[tuple, Any] = {}
+        self._by_labels: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values, **kwargs):
+        """ラベル値に対応する子メトリクス（初回のみロックを取って作成）
+
+        呼び出し頻度の高い箇所では戻り値を保持しておくと、記録ごとの辞書検索も省ける。
+        """
+        key = values or tuple(kwargs.get(name) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is not None:
+            return child
+
+        if kwargs and (values or set(kwargs) != set(self.labelnames)):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {sorted(kwargs)}")
+        if len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects {len(self.labelnames)} label values, got {len(key)}")
+
+        label_values = tuple(str(value) for value in key)
+        with self._lock:
+            child = self._by_labels.get(label_values)
+            if child is None:
+                child = self._by_labels[label_values] = self._new_child()
+            self._children[key] = child
+        return child
+
+    def children(self) -> List[Tuple[Dict[str, str], Any]]:
+        """（ラベル辞書, 子メトリクス）の一覧"""
+        with self._lock:
+            items = list(self._by_labels.items())
+        return [(dict(zip(self.labelnames, values)), child) for values, child in items]
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _unlabelled(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} has labels {self.labelnames}; use .labels()")
+        return self.labels()
+
+
+class Counter(MetricFamily):
+    """単調増加カウンター"""
+
+    kind = 'counter'
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def inc(self, amount: float = 1.0):
+        self._unlabelled().inc(amount)
+
+
+class Gauge(MetricFamily):
+    """任意に増減する値"""
+
+    kind = 'gauge'
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def inc(self, amount: float = 1.0):
+        self._unlabelled().inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self._unlabelled().dec(amount)
+
+    def set(self, value: float):
+        self._unlabelled().set(value)
+
+
+class Histogram(MetricFamily):
+    """固定バケットのヒストグラム"""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str = '', labelnames: Iterable[str] = (),
+                 buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        bounds = tuple(float(bound) for bound in buckets if not math.isinf(bound))
+        if not bounds or list(bounds) != sorted(set(bounds)):
+            raise ValueError("Histogram buckets must be a non-empty increasing sequence")
+        self.buckets = bounds
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def observe(self, value: float):
+        self._unlabelled().observe(value)
+
+    def time(self) -> _Timer:
+        return self._unlabelled().time()
+
+
+class MetricsRegistry:
+    """メトリクスの登録・スナップショット・Prometheus出力"""
+
+    def __init__(self):
+        self._families: Dict[str, MetricFamily] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str = '', labelnames: Iterable[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str = '', labelnames: Iterable[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str = '', labelnames: Iterable[str] = (),
+                  buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[MetricFamily]:
+        return self._families.get(name)
+
+    def families(self) -> List[MetricFamily]:
+        with self._lock:
+            return sorted(self._families.values(), key=lambda family: family.name)
+
+    def _get_or_create(self, cls, name, documentation, labelnames, **kwargs):
+        family = self._families.get(name)
+        if family is None:
+            with self._lock:
+                family = self._families.get(name)
+                if family is None:
+                    family = self._families[name] = cls(name, documentation, labelnames, **kwargs)
+        if type(family) is not cls or family.labelnames != tuple(labelnames):
+            raise ValueError(
+                f"Metric {name} already registered as {family.kind} with labels {family.labelnames}")
+        return family
+
+    def snapshot(self) -> Dict[str, Any]:
+        """全メトリクスの現在値（JSONに変換可能な辞書）"""
+        metrics = {}
+        for family in self.families():
+            samples = []
+            for labels, child in family.children():
+                if isinstance(family, Histogram):
+                    samples.append(_histogram_sample(family.buckets, labels, child))
+                else:
+                    samples.append({'labels': labels, 'value': child.value})
+            metrics[family.name] = {
+                'type': family.kind,
+                'help': family.documentation,
+                'samples': samples
+            }
+        return {'timestamp': datetime.now().isoformat(), 'metrics': metrics}
+
+    def to_prometheus(self) -> str:
+        """Prometheus テキスト形式（0.0.4）"""
+        lines = []
+        for family in self.families():
+            lines.append(f"# HELP {family.name} {_escape_help(family.documentation)}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            for labels, child in family.children():
+                if isinstance(family, Histogram):
+                    counts, total, _ = child.totals()
+                    cumulative = 0
+                    for bound, count in zip(family.buckets + (math.inf,), counts):
+                        cumulative += count
+                        lines.append(_sample_line(f"{family.name}_bucket",
+                                                  {**labels, 'le': _format_value(bound)}, cumulative))
+                    lines.append(_sample_line(f"{family.name}_sum", labels, total))
+                    lines.append(_sample_line(f"{family.name}_count", labels, cumulative))
+                else:
+                    lines.append(_sample_line(family.name, labels, child.value))
+        return '\n'.join(lines) + '\n' if lines else ''
+
+
+def _histogram_sample(bounds: Tuple[float, ...], labels: Dict[str, str], child: HistogramChild) -> Dict[str, Any]:
+    counts, total, maximum = child.totals()
+    count = sum(counts)
+    sample = {
+        'labels': labels,
+        'count': count,
+        'sum': total,
+        'mean': total / count if count else None,
+        'max': maximum if count else None,
+    }
+    for q in SNAPSHOT_QUANTILES:
+        sample[f"p{int(q * 100)}"] = _estimate_quantile(bounds, counts, maximum, q)
+
+    cumulative, buckets = 0, []
+    for bound, bucket_count in zip(bounds + (math.inf,), counts):
+        cumulative += bucket_count
+        buckets.append([_format_value(bound), cumulative])
+    sample['buckets'] = buckets
+    return sample
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if math.isnan(value):
+        return 'NaN'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_help(text: str) -> str:
+    return text.replace('\\', r'\\').replace('\n', r'\n')
+
+
+def _escape_label(text: str) -> str:
+    return text.replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+
+
+def _sample_line(name: str, labels: Dict[str, str], value: float) -> str:
+    if not labels:
+        return f"{name} {_format_value(value)}"
+    rendered = ','.join(f'{key}="{_escape_label(label)}"' for key, label in labels.items())
+    return f"{name}{{{rendered}}} {_format_value(value)}"
+
+
+# グローバルメトリクスレジストリ
+_metrics_registry_instance = None
+_metrics_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """グローバルメトリクスレジストリ取得"""
+    global _metrics_registry_instance
+    if _metrics_registry_instance is None:
+        with _metrics_registry_lock:
+            if _metrics_registry_instance is None:
+                _metrics_registry_instance = _sibling_registry() or MetricsRegistry()
+    return _metrics_registry_instance
+
+
+def _sibling_registry() -> Optional[MetricsRegistry]:
+    """このファイルが utils.metrics と src.utils.metrics の両方の名前で読み込まれている場合、
+    先に作られた方のレジストリを共有する（記録先が二重にならないように）"""
+    for name in ('utils.metrics', 'src.utils.metrics'):
+        module = sys.modules.get(name)
+        if module is not None and module is not sys.modules.get(__name__):
+            registry = getattr(module, '_metrics_registry_instance', None)
+            if registry is not None:
+                return registry
+    return None
+
+
+def stage_latency_histogram(registry: Optional[MetricsRegistry] = None) -> Histogram:
+    """段階・サービス別の処理時間ヒストグラム（秒）"""
+    return (registry or get_metrics_registry()).histogram(
+        STAGE_DURATION_METRIC, 'Processing latency by pipeline stage and service', STAGE_LABELS)
+
+
+def stage_event_counter(registry: Optional[MetricsRegistry] = None) -> Counter:
+    """段階・サービス別のイベント件数（success / failure / cache_hit など）"""
+    return (registry or get_metrics_registry()).counter(
+        STAGE_EVENTS_METRIC, 'Pipeline events by stage, service and event type', STAGE_LABELS + ('event',))
+
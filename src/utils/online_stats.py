@@ -0,0 +1,253 @@
+"""
+Online Statistics
+逐次統計 - 1標本ごとに O(1) で更新できる推定器（スライディングウィンドウの平均・分散・
+線形トレンド、指数移動平均、直近ウィンドウの P² 分位点推定）
+"""
+
+import math
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+
+class WindowedMoments:
+    """直近 window 件の平均・分散（Welford）と線形回帰の傾き
+
+    追加時は Welford の更新、ウィンドウから外れた値は逆向きの更新で取り除く。
+    傾きは x = 0..n-1（古い順の位置）に対する最小二乗で、Σy と Σxy を保持して求める
+    （先頭が外れると残りの x が1ずつ減るため Σxy から Σy を引く）。
+    浮動小数点の誤差が溜まらないよう、window 件外れるごとに保持値から全量を再計算する
+    （償却 O(1)）。
+    """
+
+    def __init__(self, window: int = 1000):
+        if window < 2:
+            raise ValueError("window must be >= 2")
+        self.window = window
+        self.values: deque = deque()
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._sum_y = 0.0
+        self._sum_xy = 0.0
+        self._evictions = 0
+
+    @property
+    def count(self) -> int:
+        return len(self.values)
+
+    def add(self, value: float):
+        if len(self.values) == self.window:
+            self._evict()
+
+        n = len(self.values)
+        self._sum_y += value
+        self._sum_xy += n * value
+        self.values.append(value)
+
+        delta = value - self.mean
+        self.mean += delta / (n + 1)
+        self._m2 += delta * (value - self.mean)
+
+    def _evict(self):
+        value = self.values.popleft()
+        n = len(self.values)
+        self._sum_y -= value
+        self._sum_xy -= self._sum_y
+
+        if n == 0:
+            self.mean = self._m2 = 0.0
+        else:
+            old_mean = self.mean
+            self.mean = old_mean + (old_mean - value) / n
+            self._m2 = max(0.0, self._m2 - (value - old_mean) * (value - self.mean))
+
+        self._evictions += 1
+        if self._evictions >= self.window:
+            self._resync()
+
+    def _resync(self):
+        self._evictions = 0
+        n = len(self.values)
+        self.mean = math.fsum(self.values) / n if n else 0.0
+        self._m2 = math.fsum((value - self.mean) ** 2 for value in self.values)
+        self._sum_y = math.fsum(self.values)
+        self._sum_xy = math.fsum(index * value for index, value in enumerate(self.values))
+
+    @property
+    def variance(self) -> float:
+        """母分散（numpy.var と同じ ddof=0）"""
+        return self._m2 / len(self.values) if self.values else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def slope(self) -> Optional[float]:
+        """1件あたりの傾き（numpy.polyfit(x, y, 1)[0] と同じ、2件未満なら None）"""
+        n = len(self.values)
+        if n < 2:
+            return None
+        sum_x = n * (n - 1) / 2
+        sum_xx = (n - 1) * n * (2 * n - 1) / 6
+        return (n * self._sum_xy - sum_x * self._sum_y) / (n * sum_xx - sum_x * sum_x)
+
+
+class EWMA:
+    """指数移動平均と指数加重分散"""
+
+    def __init__(self, alpha: float = 0.1):
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.mean: Optional[float] = None
+        self.variance = 0.0
+
+    def add(self, value: float):
+        if self.mean is None:
+            self.mean = value
+            return
+        delta = value - self.mean
+        increment = self.alpha * delta
+        self.mean += increment
+        self.variance = (1 - self.alpha) * (self.variance + delta * increment)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class P2Quantile:
+    """P² アルゴリズムによる分位点の逐次推定（Jain & Chlamtac）
+
+    5つのマーカー（最小・q/2・q・(1+q)/2・最大）の高さと位置だけを持ち、標本を保存しない。
+    単体ではウィンドウを持たず全期間の分位点になる（直近分は WindowedQuantile）。
+    """
+
+    def __init__(self, q: float):
+        if not 0 < q < 1:
+            raise ValueError("q must be in (0, 1)")
+        self.q = q
+        self.count = 0
+        self._heights: List[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * q, 1 + 4 * q, 3 + 2 * q, 5]
+        self._increments = [0, q / 2, q, (1 + q) / 2, 1]
+
+    def add(self, value: float):
+        self.count += 1
+        heights = self._heights
+        if self.count <= 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = next(i for i in range(4) if heights[i] <= value < heights[i + 1])
+
+        positions = self._positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in (1, 2, 3):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or \
+                    (offset <= -1 and positions[i - 1] - positions[i] < -1):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + step * (heights[i + step] - heights[i]) / \
+                        (positions[i + step] - positions[i])
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        heights, positions = self._heights, self._positions
+        return heights[i] + step / (positions[i + 1] - positions[i - 1]) * (
+            (positions[i] - positions[i - 1] + step) * (heights[i + 1] - heights[i]) /
+            (positions[i + 1] - positions[i]) +
+            (positions[i + 1] - positions[i] - step) * (heights[i] - heights[i - 1]) /
+            (positions[i] - positions[i - 1])
+        )
+
+    @property
+    def value(self) -> Optional[float]:
+        """分位点の推定値（標本がなければ None）"""
+        if self.count == 0:
+            return None
+        if self.count <= 5:
+            return self._heights[min(len(self._heights) - 1, int(self.q * len(self._heights)))]
+        return self._heights[2]
+
+
+class WindowedQuantile:
+    """直近ウィンドウの分位点（P² 推定器を半ウィンドウずらして2つ交互に使う）
+
+    古い推定器が window 件に達したら捨てて新しい推定器を始めるため、値は常に
+    直近 window/2 〜 window 件の標本による推定になり、水準の変化に追従する。
+    """
+
+    def __init__(self, q: float, window: int = 1000):
+        if window < 2:
+            raise ValueError("window must be >= 2")
+        self.q = q
+        self.window = window
+        self._estimators: List[P2Quantile] = [P2Quantile(q)]
+
+    @property
+    def count(self) -> int:
+        """推定に使われている標本数"""
+        return self._estimators[0].count
+
+    def add(self, value: float):
+        for estimator in self._estimators:
+            estimator.add(value)
+
+        oldest = self._estimators[0]
+        if len(self._estimators) == 1:
+            if oldest.count >= self.window // 2:
+                self._estimators.append(P2Quantile(self.q))
+        elif oldest.count >= self.window:
+            self._estimators.pop(0)
+            self._estimators.append(P2Quantile(self.q))
+
+    @property
+    def value(self) -> Optional[float]:
+        """分位点の推定値（標本がなければ None）"""
+        return self._estimators[0].value
+
+
+class StreamingStatistics:
+    """1系列分の逐次統計（ウィンドウの平均・分散・傾き・分位点、EWMA）"""
+
+    def __init__(self, window: int = 1000, ewma_alpha: float = 0.1, quantile: float = 0.975):
+        self.moments = WindowedMoments(window)
+        self.ewma = EWMA(ewma_alpha)
+        self.quantile = WindowedQuantile(quantile, window)
+
+    @property
+    def count(self) -> int:
+        return self.moments.count
+
+    def add(self, value: float):
+        self.moments.add(value)
+        self.ewma.add(value)
+        self.quantile.add(value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'count': self.moments.count,
+            'mean': self.moments.mean,
+            'std': self.moments.std,
+            'slope': self.moments.slope,
+            'ewma': self.ewma.mean,
+            'ewma_std': self.ewma.std,
+            f"p{self.quantile.q * 100:g}": self.quantile.value,
+        }
@@ -10,11 +10,13 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 from contextlib import contextmanager
+from collections import deque
 import asyncio
 import threading
 
 from .config import get_config
 from .cache_manager import get_cache_manager
+from .metrics import get_metrics_registry, stage_latency_histogram
 
 
 logger = logging.getLogger(__name__)
@@ -53,16 +55,22 @@ class PerformanceMonitor:
         self.config = config or get_config()
         self.cache = get_cache_manager()
         
-        # パフォーマンス履歴
-        self.metrics_history: List[PerformanceMetrics] = []
+        # 監視設定
+        self.max_history_size = self.config.get('monitoring', 'max_history_size', default=1000)
+        
+        # パフォーマンス履歴（上限付き）
+        self.metrics_history: deque = deque(maxlen=self.max_history_size)
         self.system_metrics_history: List[SystemMetrics] = []
         
         # システム開始時刻
         self.start_time = datetime.now()
         
-        # 監視設定
-        self.max_history_size = self.config.get('monitoring.max_history_size', 1000)
-        self.system_monitor_interval = self.config.get('monitoring.system_monitor_interval', 60)
+        # 操作ごとの処理時間・結果はメトリクスレジストリに集計
+        self._process = psutil.Process()
+        self._operation_latency = stage_latency_histogram()
+        self._operation_results = get_metrics_registry().counter(
+            'news_operations_total', 'Measured operations by name and status', ('operation', 'status'))
+        self.system_monitor_interval = self.config.get('monitoring', 'system_monitor_interval', default=60)
         
         # バックグラウンド監視
         self.monitoring_active = False
@@ -70,18 +78,23 @@ class PerformanceMonitor:
         
         # アラート閾値
         self.alert_thresholds = {
-            'cpu_percent': self.config.get('monitoring.alert_thresholds.cpu_percent', 80),
-            'memory_percent': self.config.get('monitoring.alert_thresholds.memory_percent', 80),
-            'disk_usage_percent': self.config.get('monitoring.alert_thresholds.disk_usage_percent', 90),
-            'operation_duration': self.config.get('monitoring.alert_thresholds.operation_duration', 300)  # 5分
+            'cpu_percent': self.config.get('monitoring', 'alert_thresholds', 'cpu_percent', default=80),
+            'memory_percent': self.config.get('monitoring', 'alert_thresholds', 'memory_percent', default=80),
+            'disk_usage_percent': self.config.get('monitoring', 'alert_thresholds', 'disk_usage_percent', default=90),
+            'operation_duration': self.config.get('monitoring', 'alert_thresholds', 'operation_duration', default=300)  # 5分
         }
     
     @contextmanager
     def measure_operation(self, operation_name: str, **additional_data):
-        """操作のパフォーマンス測定コンテキストマネージャー"""
+        """操作のパフォーマンス測定コンテキストマネージャー
+
+        CPU使用率は psutil.cpu_percent のサンプリング（呼び出しごとに待機が発生する）ではなく、
+        プロセスCPU時間の差分 / 経過時間で求める。
+        """
         start_time = datetime.now()
+        start_counter = time.perf_counter()
+        start_cpu = time.process_time()
         start_memory = self._get_memory_usage()
-        start_cpu = self._get_cpu_usage()
         
         success = True
         error_message = None
@@ -93,18 +106,17 @@ class PerformanceMonitor:
             error_message = str(e)
             raise
         finally:
-            end_time = datetime.now()
+            duration = time.perf_counter() - start_counter
+            cpu_seconds = time.process_time() - start_cpu
             end_memory = self._get_memory_usage()
             
-            duration = (end_time - start_time).total_seconds()
-            
             metrics = PerformanceMetrics(
                 operation_name=operation_name,
                 start_time=start_time,
-                end_time=end_time,
+                end_time=datetime.now(),
                 duration_seconds=duration,
                 memory_usage_mb=end_memory - start_memory,
-                cpu_usage_percent=self._get_cpu_usage() - start_cpu,
+                cpu_usage_percent=(cpu_seconds / duration * 100) if duration > 0 else 0.0,
                 success=success,
                 error_message=error_message,
                 additional_data=additional_data
@@ -118,31 +130,20 @@ class PerformanceMonitor:
     def _get_memory_usage(self) -> float:
         """現在のメモリ使用量（MB）を取得"""
         try:
-            process = psutil.Process()
-            return process.memory_info().rss / 1024 / 1024
-        except Exception:
-            return 0.0
-    
-    def _get_cpu_usage(self) -> float:
-        """現在のCPU使用率を取得"""
-        try:
-            return psutil.cpu_percent(interval=0.1)
+            return self._process.memory_info().rss / 1024 / 1024
         except Exception:
             return 0.0
     
     def _record_metrics(self, metrics: PerformanceMetrics):
         """メトリクスの記録"""
         try:
-            # メモリ履歴に追加
+            # メモリ履歴に追加（deque の上限で古いものから破棄）
             self.metrics_history.append(metrics)
             
-            # 履歴サイズ制限
-            if len(self.metrics_history) > self.max_history_size:
-                self.metrics_history = self.metrics_history[-self.max_history_size:]
-            
-            # キャッシュに保存（短期間）
-            cache_key = f"perf_metrics:{metrics.operation_name}:{metrics.start_time.isoformat()}"
-            self.cache.set(cache_key, metrics.__dict__, expire=3600, category='performance')
+            service = metrics.additional_data.get('service', 'app')
+            self._operation_latency.labels(metrics.operation_name, service).observe(metrics.duration_seconds)
+            self._operation_results.labels(
+                metrics.operation_name, 'success' if metrics.success else 'failure').inc()
             
             logger.debug(f"Performance recorded: {metrics.operation_name} - {metrics.duration_seconds:.2f}s")
             
@@ -0,0 +1,407 @@
+"""
+Sampling Profiler
+サンプリング・プロファイラー - 実行中に一定間隔で全スレッドのスタック（sys._current_frames）と
+待機中の asyncio タスクのスタックを採取し、段階別の collapsed stacks（flamegraph.pl /
+speedscope で表示可能な「frame;frame;frame 件数」形式）に出力する
+
+計測スレッドが消費したCPU時間が経過時間の max_overhead を超えると採取間隔を広げるため、
+本番の定期実行でも有効にできる。設定（profiling.enabled）か SIGUSR1 で有効化する。
+"""
+
+import asyncio
+import bisect
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 待機中とみなすスレッドの末端フレーム（ファイル名, 関数名）- スレッドごとのCPU時計が
+# 使えない環境で空きワーカーの採取を省く
+IDLE_LEAVES = {
+    ('threading.py', 'wait'),
+    ('threading.py', '_wait_for_tstate_lock'),
+    ('queue.py', 'get'),
+}
+
+# 段階に含まれない標本（初期化・後片付け）の段階名
+OUTSIDE_STAGE = 'other'
+
+Stage = Tuple[str, int, int]  # (段階名, 開始 perf_counter_ns, 終了 perf_counter_ns)
+
+_requested = threading.Event()
+_active_session: Optional['RunProfiler'] = None
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _thread_cpu_time(ident: int) -> Optional[float]:
+    """スレッドのCPU時間（取得できない環境では None）"""
+    try:
+        return time.clock_gettime(time.pthread_getcpuclockid(ident))
+    except (AttributeError, OSError, OverflowError):
+        return None
+
+
+def _coroutine_frames(coro) -> List[Any]:
+    """待機中コルーチンの await の連鎖をたどったフレーム（外側から内側の順）
+
+    Task.get_stack() はコルーチンの最外フレームしか返さないため、cr_await を順にたどる。
+    """
+    frames = []
+    while coro is not None:
+        frame = getattr(coro, 'cr_frame', None) or getattr(coro, 'gi_frame', None)
+        if frame is None:
+            break
+        frames.append(frame)
+        coro = getattr(coro, 'cr_await', None) or getattr(coro, 'gi_yieldfrom', None)
+    return frames
+
+
+def _fold(frames) -> str:
+    """外側から内側の順のフレーム列を collapsed stack の1行（件数なし）にする"""
+    return ';'.join(_frame_label(frame).replace(';', ':') for frame in frames)
+
+
+class SamplingProfiler:
+    """バックグラウンドスレッドでスタックを採取するプロファイラー
+
+    標本は採取時刻とスタック文字列の組で保持し、書き出し時に段階（トレースの
+    pipeline スパンなど）の時間帯へ振り分ける。採取間隔を広げた後の標本は
+    基準間隔何回分かを重みとして持つため、件数は常に基準間隔単位の時間に比例する。
+    """
+
+    def __init__(self, interval: float = 0.01, max_overhead: float = 0.02,
+                 max_interval: float = 1.0, sample_tasks: bool = True,
+                 loop: Optional[asyncio.AbstractEventLoop] = None, max_samples: int = 500000):
+        """
+        Args:
+            interval: 基準の採取間隔（秒）
+            max_overhead: 計測スレッドのCPU時間が経過時間に占める割合の上限
+            max_interval: 間隔を広げるときの上限（秒）
+            sample_tasks: 待機中の asyncio タスクのスタックも採取するか
+            loop: タスクを採取するイベントループ（None なら start() を呼んだスレッドのループ）
+            max_samples: 保持する標本数の上限（超過分は破棄して件数のみ記録）
+        """
+        self.base_interval = interval
+        self.interval = interval
+        self.max_overhead = max_overhead
+        self.max_interval = max(max_interval, interval)
+        self.sample_tasks = sample_tasks
+        self.loop = loop
+        self.max_samples = max_samples
+
+        # (採取時刻 ns, 種別 'threads' / 'tasks', スタック, 重み)
+        self.samples: List[Tuple[int, str, str, int]] = []
+        self.dropped_samples = 0
+        self.sample_count = 0
+        self.started_ns: Optional[int] = None
+        self.stopped_ns: Optional[int] = None
+        self.sampler_cpu = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_cpu: Dict[int, float] = {}
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> 'SamplingProfiler':
+        if self.running:
+            return self
+        if self.sample_tasks and self.loop is None:
+            try:
+                self.loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self.loop = None
+        self._stop.clear()
+        self.started_ns = time.perf_counter_ns()
+        self.stopped_ns = None
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.stopped_ns = time.perf_counter_ns()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    @property
+    def overhead(self) -> float:
+        """計測スレッドのCPU時間 / 経過時間"""
+        if self.started_ns is None:
+            return 0.0
+        end_ns = self.stopped_ns or time.perf_counter_ns()
+        elapsed = (end_ns - self.started_ns) / 1e9
+        return self.sampler_cpu / elapsed if elapsed > 0 else 0.0
+
+    # ------------------------------------------------------------------
+    # 採取（計測スレッド）
+    # ------------------------------------------------------------------
+
+    def _run(self):
+        own_ident = threading.get_ident()
+        cpu_started = time.thread_time()
+        while not self._stop.wait(self.interval):
+            self.sample(exclude=own_ident)
+            self.sampler_cpu = time.thread_time() - cpu_started
+            self._adjust_interval()
+
+    def _adjust_interval(self):
+        """CPU使用率が上限を超えたら間隔を倍に、十分下回ったら基準に向けて半分に戻す"""
+        overhead = self.overhead
+        if overhead > self.max_overhead and self.interval < self.max_interval:
+            self.interval = min(self.interval * 2, self.max_interval)
+        elif overhead < self.max_overhead / 4 and self.interval > self.base_interval:
+            self.interval = max(self.interval / 2, self.base_interval)
+
+    def sample(self, exclude: Optional[int] = None):
+        """全スレッド（と待機中タスク）のスタックを1回採取"""
+        timestamp = time.perf_counter_ns()
+        weight = max(1, round(self.interval / self.base_interval))
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        loop_thread = getattr(self.loop, '_thread_id', None)
+        stacks: List[Tuple[str, str]] = []
+
+        for ident, frame in sys._current_frames().items():
+            if ident == exclude:
+                continue
+            # イベントループのスレッドは I/O 待ちも残し、他のスレッドは待機中なら省く
+            if ident != loop_thread and self._is_idle(ident, frame):
+                continue
+            frames = []
+            while frame is not None:
+                frames.append(frame)
+                frame = frame.f_back
+            frames.reverse()
+            stacks.append(('threads', f"{names.get(ident, ident)};{_fold(frames)}"))
+
+        if self.sample_tasks and self.loop is not None and not self.loop.is_closed():
+            stacks.extend(('tasks', stack) for stack in self._task_stacks())
+
+        self.sample_count += 1
+        for kind, stack in stacks:
+            if len(self.samples) < self.max_samples:
+                self.samples.append((timestamp, kind, stack, weight))
+            else:
+                self.dropped_samples += 1
+
+    def _is_idle(self, ident: int, frame) -> bool:
+        """前回の採取からCPU時間が進んでいないスレッドを待機中とみなす"""
+        cpu = _thread_cpu_time(ident)
+        if cpu is None:
+            code = frame.f_code
+            return (os.path.basename(code.co_filename), code.co_name) in IDLE_LEAVES
+        previous = self._thread_cpu.get(ident)
+        self._thread_cpu[ident] = cpu
+        return previous is not None and cpu == previous
+
+    def _task_stacks(self) -> List[str]:
+        """実行中でないタスクの待機スタック（コルーチンの await の連鎖）"""
+        try:
+            tasks = list(asyncio.all_tasks(self.loop))
+        except RuntimeError:
+            # 別スレッドからの走査中にタスク集合が変化した場合は今回は省く
+            return []
+        running = asyncio.current_task(self.loop)
+        stacks = []
+        for task in tasks:
+            if task is running or task.done():
+                continue
+            frames = _coroutine_frames(task.get_coro())
+            if frames:
+                stacks.append(f"task:{task.get_name()};{_fold(frames)};[await]")
+        return stacks
+
+    # ------------------------------------------------------------------
+    # 出力
+    # ------------------------------------------------------------------
+
+    def collapsed(self, stages: Optional[Sequence[Stage]] = None,
+                  default_stage: str = 'run') -> Dict[str, Dict[str, Counter]]:
+        """{段階名: {種別: Counter(スタック → 件数)}} に集計
+
+        stages を渡すと各標本をその時刻を含む段階に割り当てる（どれにも含まれない標本は
+        'other'）。None なら全標本を default_stage にまとめる。
+        """
+        ordered = sorted(stages or [], key=lambda stage: stage[1])
+        starts = [stage[1] for stage in ordered]
+        result: Dict[str, Dict[str, Counter]] = defaultdict(lambda: defaultdict(Counter))
+
+        for timestamp, kind, stack, weight in self.samples:
+            if stages is None:
+                name = default_stage
+            else:
+                index = bisect.bisect_right(starts, timestamp) - 1
+                name = OUTSIDE_STAGE
+                if index >= 0 and timestamp <= ordered[index][2]:
+                    name = ordered[index][0]
+            result[name][kind][stack] += weight
+        return result
+
+    def write_collapsed(self, directory, stages: Optional[Sequence[Stage]] = None,
+                        default_stage: str = 'run') -> List[Path]:
+        """段階ごとに <段階>.folded（スレッド）と <段階>.tasks.folded（待機タスク）を書き出す
+
+        全段階をまとめた all.folded も出力する（段階名が根のフレームになる）。
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        written = []
+        combined: Counter = Counter()
+
+        for stage, kinds in self.collapsed(stages, default_stage).items():
+            filename = stage.replace('/', '_').replace(os.sep, '_')
+            for kind, counts in kinds.items():
+                suffix = '.folded' if kind == 'threads' else f'.{kind}.folded'
+                written.append(_write_folded(directory / f"{filename}{suffix}", counts))
+                if kind == 'threads':
+                    combined.update({f"{stage};{stack}": count for stack, count in counts.items()})
+
+        if combined:
+            written.append(_write_folded(directory / 'all.folded', combined))
+        return written
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'samples': self.sample_count,
+            'stacks': len(self.samples),
+            'dropped_stacks': self.dropped_samples,
+            'interval_ms': round(self.interval * 1000, 3),
+            'overhead_percent': round(self.overhead * 100, 3)
+        }
+
+
+def _write_folded(path: Path, counts: Counter) -> Path:
+    with open(path, 'w', encoding='utf-8') as f:
+        for stack, count in counts.most_common():
+            f.write(f"{stack} {count}\n")
+    return path
+
+
+def stages_from_tracer(tracer) -> Optional[List[Stage]]:
+    """トレーサーの pipeline スパン（根の 'run' を除く）を段階の時間帯にする"""
+    if tracer is None:
+        return None
+    return [(span.name, span.start_ns, span.end_ns) for span in tracer.spans
+            if span.category == 'pipeline' and span.parent_id is not None]
+
+
+# ----------------------------------------------------------------------
+# 実行単位の有効化（設定・シグナル）
+# ----------------------------------------------------------------------
+
+def request_profiling():
+    """次の実行（実行中ならその残り）のプロファイルを要求"""
+    _requested.set()
+    session = _active_session
+    if session is not None:
+        session.start_sampling()
+
+
+def install_signal_trigger(signum: Optional[int] = None) -> bool:
+    """シグナル（既定 SIGUSR1）でプロファイルを要求できるようにする
+
+    メインスレッド以外やシグナルのないプラットフォームでは何もしない。
+    """
+    signum = signum if signum is not None else getattr(signal, 'SIGUSR1', None)
+    if signum is None or threading.current_thread() is not threading.main_thread():
+        return False
+    signal.signal(signum, lambda received, frame: request_profiling())
+    return True
+
+
+class RunProfiler:
+    """1回の実行（main.py の run やスケジューラーのタスク）をプロファイルする
+
+    profiling.enabled が true か、request_profiling()（SIGUSR1）で要求された場合に採取し、
+    終了時に data/profiles/<名前>_<日時>/ へ段階別の collapsed stacks を書き出す。
+
+    使用例:
+        profiler = RunProfiler(config, 'news_delivery', force=args.profile)
+        with profiler:
+            await run()
+        profiler.write(stages_from_tracer(tracer))
+    """
+
+    def __init__(self, config, name: str, force: bool = False):
+        self.config = config
+        self.name = name
+        self.enabled = force or bool(config.get('profiling', 'enabled', default=False))
+        self.started_at = datetime.now()
+        self.profiler: Optional[SamplingProfiler] = None
+        self.output_dir: Optional[Path] = None
+        self._previous: Optional[RunProfiler] = None
+
+    def start_sampling(self):
+        if self.profiler is not None:
+            return
+        _requested.clear()
+        self.profiler = SamplingProfiler(
+            interval=self.config.get('profiling', 'interval_ms', default=10) / 1000,
+            max_overhead=self.config.get('profiling', 'max_overhead_percent', default=2.0) / 100,
+            sample_tasks=self.config.get('profiling', 'sample_tasks', default=True)
+        ).start()
+        logger.info(f"Sampling profiler started for {self.name}")
+
+    def __enter__(self):
+        global _active_session
+        self._previous, _active_session = _active_session, self
+        if self.enabled or _requested.is_set():
+            self.start_sampling()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        global _active_session
+        if _active_session is self:
+            _active_session = self._previous
+        if self.profiler is not None:
+            self.profiler.stop()
+        return False
+
+    def write(self, stages: Optional[Sequence[Stage]] = None) -> Optional[Path]:
+        """採取していれば collapsed stacks を書き出し、古い出力を削除する"""
+        if self.profiler is None:
+            return None
+        try:
+            from utils.path_resolver import get_data_path
+
+            profile_root = get_data_path('profiles')
+            self.output_dir = profile_root / f"{self.name}_{self.started_at:%Y%m%d_%H%M%S}"
+            files = self.profiler.write_collapsed(self.output_dir, stages, default_stage=self.name)
+
+            keep_runs = self.config.get('profiling', 'keep_runs', default=10)
+            runs = sorted((path for path in profile_root.glob(f"{self.name}_*") if path.is_dir()),
+                          key=lambda path: path.name)
+            for old_run in runs[:-keep_runs]:
+                for old_file in old_run.iterdir():
+                    old_file.unlink()
+                old_run.rmdir()
+
+            stats = self.profiler.stats()
+            logger.info(f"Profile written: {self.output_dir} ({len(files)} files, "
+                        f"{stats['samples']} samples, overhead {stats['overhead_percent']:.2f}%)")
+            return self.output_dir
+        except Exception as e:
+            logger.warning(f"Failed to write profile: {e}")
+            return None
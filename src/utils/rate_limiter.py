@@ -13,7 +13,7 @@ from pathlib import Path
 import logging
 
 from .config import get_config
-from .cache_manager import CacheManager
+from .cache_manager import get_cache_manager
 
 
 logger = logging.getLogger(__name__)
@@ -118,7 +118,7 @@ class EnhancedRateLimiter:
     
     def __init__(self, config=None):
         self.config = config or get_config()
-        self.cache_manager = CacheManager()
+        self.cache_manager = get_cache_manager()
         
         # CLAUDE.md仕様準拠のAPI制限設定
         self.limits: Dict[str, RateLimit] = {
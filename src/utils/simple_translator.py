@@ -4,7 +4,80 @@ DeepL APIが利用できない場合の代替翻訳サポート
 """
 
 import re
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """語の集合から接頭辞を共有する正規表現を作成（小文字化済みの語を渡す）
+
+    単純な選択肢の羅列と違い、各位置で先頭文字から1本の経路だけを辿るため
+    語数に依存せずほぼ線形に走査できる。長い語を優先して一致させる。
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: dict) -> str:
+        terminal = '' in node
+        branches = [re.escape(char) + build(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if terminal:
+            # 長い一致を先に試し、失敗したらここで終わる
+            return '(?:' + body + ')?'
+        return body
+
+    return build(trie)
+
+
+class _CompiledDictionary:
+    """置換辞書を1本の正規表現にまとめ、1回の走査で置換する"""
+
+    # 通貨・単位（大文字小文字を区別、$ の後の単位や % も続けて処理）
+    # 末尾の条件分岐で $・単位・% のいずれも無い数字には一致させない
+    _NUMBER = (r'(?-i:(?P<dollar>\$)?(?P<digits>\d+)'
+               r'(?:\s*(?P<unit>billion|million|thousand)|(?P<percent>%))?'
+               r'(?(dollar)|(?(unit)|(?(percent)|(?!)))))')
+    _NUMBER_SUFFIX = {'billion': '億', 'million': '百万', 'thousand': '千', '%': '％'}
+
+    def __init__(self, phrases: Dict[str, str], fragments: Dict[str, str], numbers: bool = True):
+        # 大文字小文字違いの重複キーは辞書順で先の訳語を採用
+        self.phrases: Dict[str, str] = {}
+        for eng, jpn in phrases.items():
+            self.phrases.setdefault(eng.casefold(), jpn)
+        self.fragments: Dict[str, str] = {}
+        for eng, jpn in fragments.items():
+            self.fragments.setdefault(eng.casefold(), jpn)
+
+        alternatives = []
+        if numbers:
+            alternatives.append('(?P<number>' + self._NUMBER + ')')
+        if self.phrases:
+            # フレーズは単語境界で区切られたものだけ
+            alternatives.append(r'\b(?P<phrase>' + _trie_pattern(self.phrases) + r')\b')
+        if self.fragments:
+            # 月名・曜日などは単語境界を問わない
+            alternatives.append('(?P<fragment>' + _trie_pattern(self.fragments) + ')')
+        self.pattern = re.compile('|'.join(alternatives) or '(?!)', re.IGNORECASE)
+
+    def _replace(self, match) -> str:
+        kind = match.lastgroup
+        if kind == 'number':
+            dollar, digits, unit, percent = match.group('dollar', 'digits', 'unit', 'percent')
+            suffix = self._NUMBER_SUFFIX[unit or percent] if (unit or percent) else ''
+            return digits + ('ドル' if dollar else '') + suffix
+        if kind == 'phrase':
+            return self.phrases.get(match.group(kind).casefold(), match.group(kind))
+        return self.fragments.get(match.group(kind).casefold(), match.group(kind))
+
+    def sub(self, text: str) -> str:
+        return self.pattern.sub(self._replace, text)
+
 
 class SimpleTranslator:
     """簡易翻訳・日本語化補助クラス"""
@@ -139,6 +212,54 @@ class SimpleTranslator:
         'deny': '否定',
     }
     
+    # 月名・曜日（単語の一部でも置換する）
+    MONTHS = {
+        'January': '1月', 'February': '2月', 'March': '3月',
+        'April': '4月', 'May': '5月', 'June': '6月',
+        'July': '7月', 'August': '8月', 'September': '9月',
+        'October': '10月', 'November': '11月', 'December': '12月'
+    }
+    WEEKDAYS = {
+        'Monday': '月曜日', 'Tuesday': '火曜日', 'Wednesday': '水曜日',
+        'Thursday': '木曜日', 'Friday': '金曜日',
+        'Saturday': '土曜日', 'Sunday': '日曜日'
+    }
+
+    # 主要な動詞（英語が大半の場合のみ適用）
+    VERB_MAP = {
+        'shoots up': '急上昇',
+        'soared': '急騰',
+        'launched': '開始',
+        'announced': '発表',
+        'increased': '増加',
+        'decreased': '減少'
+    }
+
+    _ASCII_ALPHA = re.compile(r'[A-Za-z]')
+    _PERCENT = re.compile(r'(\d+)%')
+    _DOLLAR = re.compile(r'\$(\d+)')
+    _PROPER_NOUN = re.compile(r'\b[A-Z][a-zA-Z]+\b')
+    _SUMMARY_NUMBER = re.compile(r'\d+[％%]|\d+ドル')
+    _SUMMARY_KEYWORD = re.compile(r'IPO|AI|security|cryptocurrency|blockchain', re.IGNORECASE)
+
+    @classmethod
+    def _dictionary(cls) -> _CompiledDictionary:
+        """クラスごとに一度だけ置換辞書をコンパイル"""
+        compiled = cls.__dict__.get('_compiled_dictionary')
+        if compiled is None:
+            compiled = _CompiledDictionary(
+                cls.COMMON_PHRASES, {**cls.MONTHS, **cls.WEEKDAYS})
+            cls._compiled_dictionary = compiled
+        return compiled
+
+    @classmethod
+    def _verb_dictionary(cls) -> _CompiledDictionary:
+        compiled = cls.__dict__.get('_compiled_verbs')
+        if compiled is None:
+            compiled = _CompiledDictionary({}, cls.VERB_MAP, numbers=False)
+            cls._compiled_verbs = compiled
+        return compiled
+
     @classmethod
     def translate_text(cls, text: str, max_length: int = 200) -> str:
         """
@@ -154,39 +275,8 @@ class SimpleTranslator:
         if not text:
             return ""
         
-        result = text
-        
-        # よく使われるフレーズを置換（大文字小文字を無視）
-        for eng, jpn in cls.COMMON_PHRASES.items():
-            # 単語境界を考慮した置換
-            pattern = r'\b' + re.escape(eng) + r'\b'
-            result = re.sub(pattern, jpn, result, flags=re.IGNORECASE)
-        
-        # 数値の後の単位を日本語化
-        result = re.sub(r'(\d+)\s*billion', r'\1億', result)
-        result = re.sub(r'(\d+)\s*million', r'\1百万', result)
-        result = re.sub(r'(\d+)\s*thousand', r'\1千', result)
-        result = re.sub(r'(\d+)%', r'\1％', result)
-        result = re.sub(r'\$(\d+)', r'\1ドル', result)
-        
-        # 月名を日本語化
-        months = {
-            'January': '1月', 'February': '2月', 'March': '3月',
-            'April': '4月', 'May': '5月', 'June': '6月',
-            'July': '7月', 'August': '8月', 'September': '9月',
-            'October': '10月', 'November': '11月', 'December': '12月'
-        }
-        for eng, jpn in months.items():
-            result = re.sub(eng, jpn, result, flags=re.IGNORECASE)
-        
-        # 曜日を日本語化
-        weekdays = {
-            'Monday': '月曜日', 'Tuesday': '火曜日', 'Wednesday': '水曜日',
-            'Thursday': '木曜日', 'Friday': '金曜日', 
-            'Saturday': '土曜日', 'Sunday': '日曜日'
-        }
-        for eng, jpn in weekdays.items():
-            result = re.sub(eng, jpn, result, flags=re.IGNORECASE)
+        # フレーズ（単語境界・大文字小文字無視）、数値の単位、月名・曜日を1回の走査で置換
+        result = cls._dictionary().sub(text)
         
         # 長すぎる場合は切り詰め
         if len(result) > max_length:
@@ -199,6 +289,28 @@ class SimpleTranslator:
         
         return result
     
+    @classmethod
+    def translate_texts(cls, texts: Iterable[str], max_length: int = 200) -> List[str]:
+        """
+        複数テキストの一括簡易翻訳（同一テキストは一度だけ処理）
+        
+        Args:
+            texts: 元のテキスト群
+            max_length: 最大文字数
+            
+        Returns:
+            入力と同じ順序の日本語化テキスト
+        """
+        translated: Dict[str, str] = {}
+        results = []
+        for text in texts:
+            text = text or ""
+            result = translated.get(text)
+            if result is None:
+                result = translated[text] = cls.translate_text(text, max_length)
+            results.append(result)
+        return results
+    
     @classmethod
     def _is_mostly_english(cls, text: str) -> bool:
         """テキストが主に英語かどうかを判定"""
@@ -206,40 +318,28 @@ class SimpleTranslator:
             return False
         
         # アルファベットの比率を計算
-        alpha_chars = sum(1 for c in text if c.isalpha() and ord(c) < 128)
-        total_chars = sum(1 for c in text if c.isalpha())
+        total_chars = sum(map(str.isalpha, text))
         
         if total_chars == 0:
             return False
         
+        alpha_chars = len(cls._ASCII_ALPHA.findall(text))
+        
         # 70%以上がアルファベットなら英語と判定
         return (alpha_chars / total_chars) > 0.7
     
     @classmethod
     def _convert_to_japanese_structure(cls, text: str, max_length: int = 200) -> str:
         """英語文を日本語的な構造に変換"""
-        # 最も重要な単語を抽出して日本語化
-        important_words = []
-        
         # 企業名、人名は残す
-        proper_nouns = re.findall(r'\b[A-Z][a-zA-Z]+\b', text)
+        proper_nouns = cls._PROPER_NOUN.findall(text)
         
         # 数値は日本語形式に
-        text = re.sub(r'(\d+)%', r'\1％', text)
-        text = re.sub(r'\$(\d+)', r'\1ドル', text)
+        text = cls._PERCENT.sub(r'\1％', text)
+        text = cls._DOLLAR.sub(r'\1ドル', text)
         
         # 主要な動詞を日本語化
-        verb_map = {
-            'shoots up': '急上昇',
-            'soared': '急騰',
-            'launched': '開始',
-            'announced': '発表',
-            'increased': '増加',
-            'decreased': '減少'
-        }
-        
-        for eng, jpn in verb_map.items():
-            text = re.sub(eng, jpn, text, flags=re.IGNORECASE)
+        text = cls._verb_dictionary().sub(text)
         
         # 結果が改善されない場合は、概要として整理
         if cls._is_mostly_english(text):
@@ -249,12 +349,12 @@ class SimpleTranslator:
                 summary_parts.append(proper_nouns[0])
             
             # パーセンテージや数値を抽出
-            numbers = re.findall(r'\d+[％%]|\d+ドル', text)
+            numbers = cls._SUMMARY_NUMBER.findall(text)
             if numbers:
                 summary_parts.extend(numbers[:2])
             
             # IPO、AI、セキュリティなどの重要キーワード
-            keywords = re.findall(r'IPO|AI|security|cryptocurrency|blockchain', text, re.IGNORECASE)
+            keywords = cls._SUMMARY_KEYWORD.findall(text)
             if keywords:
                 for kw in keywords[:2]:
                     kw_jp = cls.COMMON_PHRASES.get(kw, kw)
@@ -283,18 +383,29 @@ class SimpleTranslator:
         Returns:
             日本語要約
         """
-        # タイトルを簡易翻訳
-        translated_title = cls.translate_text(title, max_length=100)
+        return cls.create_summaries([(title, content)], max_length)[0]
+    
+    @classmethod
+    def create_summaries(cls, items: Iterable[Tuple[str, str]], max_length: int = 200) -> List[str]:
+        """
+        複数記事の (タイトル, 内容) から日本語の要約を一括生成
         
-        # 内容から重要部分を抽出
-        if content:
-            # 最初の段落または文を取得
-            first_part = content.split('\n')[0] if '\n' in content else content
-            first_part = first_part.split('. ')[0] if '. ' in first_part else first_part
-            
-            # 簡易翻訳
-            translated_content = cls.translate_text(first_part, max_length=150)
+        Args:
+            items: (記事タイトル, 記事内容) の組
+            max_length: 要約の最大文字数
             
+        Returns:
+            入力と同じ順序の日本語要約
+        """
+        items = list(items)
+        
+        # タイトルと内容の冒頭をそれぞれまとめて簡易翻訳
+        translated_titles = cls.translate_texts((title for title, _ in items), max_length=100)
+        translated_contents = cls.translate_texts(
+            (cls._first_part(content) for _, content in items), max_length=150)
+        
+        summaries = []
+        for translated_title, translated_content in zip(translated_titles, translated_contents):
             # 要約を組み立て
             if translated_title and translated_content:
                 summary = f"{translated_title}。{translated_content}"
@@ -302,11 +413,31 @@ class SimpleTranslator:
                 summary = translated_title
             else:
                 summary = translated_content
-        else:
-            summary = translated_title
-        
-        # 最大長に収める
-        if len(summary) > max_length:
-            summary = summary[:max_length-3] + "..."
+            
+            # 最大長に収める
+            if len(summary) > max_length:
+                summary = summary[:max_length-3] + "..."
+            
+            summaries.append(summary or "記事の要約を生成できませんでした。")
         
-        return summary or "記事の要約を生成できませんでした。"
\ No newline at end of file
+        return summaries
+    
+    @staticmethod
+    def _first_part(content: str) -> str:
+        """最初の段落または文を取得"""
+        if not content:
+            return ""
+        first_part = content.split('\n')[0] if '\n' in content else content
+        return first_part.split('. ')[0] if '. ' in first_part else first_part
+
+
+def summaries_from_shared(columns, start: int, stop: int, max_length: int = 200) -> List[str]:
+    """共有メモリの 'title'・'content' 列の start..stop 行から要約を生成（プロセスプール用）"""
+    titles = columns.texts('title', start, stop)
+    contents = columns.texts('content', start, stop)
+    return SimpleTranslator.create_summaries(zip(titles, contents), max_length)
+
+
+def translations_from_shared(columns, start: int, stop: int, max_length: int = 200) -> List[str]:
+    """共有メモリの 'text' 列の start..stop 行を簡易翻訳（プロセスプール用）"""
+    return SimpleTranslator.translate_texts(columns.texts('text', start, stop), max_length)
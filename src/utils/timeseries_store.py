@@ -0,0 +1,210 @@
+"""
+Time Series Store
+時系列ストア - 数値列を1行1標本で追記する SQLite テーブルと、分・時・日単位の事前集計
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# 集計単位（バケット先頭のローカル時刻を求める関数）
+RESOLUTIONS = {
+    'minute': lambda moment: moment.replace(second=0, microsecond=0),
+    'hour': lambda moment: moment.replace(minute=0, second=0, microsecond=0),
+    'day': lambda moment: moment.replace(hour=0, minute=0, second=0, microsecond=0),
+}
+
+# 既定の保持期間（日）: 生データ・分・時・日
+DEFAULT_RETENTION_DAYS = {'raw': 90, 'minute': 2, 'hour': 30, 'day': 400}
+
+_AGGREGATES = ('sum', 'min', 'max', 'last')
+
+
+class TimeSeriesStore:
+    """追記専用の時系列ストア
+
+    標本は `<series>_samples`（ts と数値列、任意の JSON ペイロード）に追記し、同じトランザクションで
+    `<series>_rollups` の分・時・日バケットを UPSERT する。各バケットは列ごとに
+    sum / min / max / last（バケット内で最新の値）と件数、最新のペイロードを持つため、
+    長期間の範囲集計はバケット数（90日の日単位なら90行）だけ読めば済む。
+
+    時刻はローカル時刻の UNIX 秒で保存し、バケット境界もローカル時刻で切る。
+    """
+
+    def __init__(self, db_path: Path, series: str, fields: Sequence[str],
+                 retention_days: Optional[Dict[str, float]] = None):
+        if not series.isidentifier() or not all(field.isidentifier() for field in fields):
+            raise ValueError(f"Invalid series or field name: {series} {list(fields)}")
+        self.db_path = Path(db_path)
+        self.series = series
+        self.fields = tuple(fields)
+        self.retention_days = {**DEFAULT_RETENTION_DAYS, **(retention_days or {})}
+        self._lock = threading.Lock()
+
+        self.samples_table = f"{series}_samples"
+        self.rollups_table = f"{series}_rollups"
+        self._build_statements()
+        self._init_database()
+
+    def _build_statements(self):
+        fields = self.fields
+        rollup_columns = [f"{field}_{aggregate}" for field in fields for aggregate in _AGGREGATES]
+
+        self._schema = (
+            f'''
+            CREATE TABLE IF NOT EXISTS {self.samples_table} (
+                ts REAL NOT NULL,
+                {', '.join(f'{field} REAL' for field in fields)},
+                payload TEXT
+            )
+            ''',
+            f"CREATE INDEX IF NOT EXISTS idx_{self.samples_table}_ts ON {self.samples_table}(ts)",
+            f'''
+            CREATE TABLE IF NOT EXISTS {self.rollups_table} (
+                resolution TEXT NOT NULL,
+                bucket REAL NOT NULL,
+                count INTEGER NOT NULL,
+                last_ts REAL NOT NULL,
+                last_payload TEXT,
+                {', '.join(f'{column} REAL' for column in rollup_columns)},
+                PRIMARY KEY (resolution, bucket)
+            ) WITHOUT ROWID
+            ''',
+        )
+
+        self._insert_sample_sql = (
+            f"INSERT INTO {self.samples_table} (ts, {', '.join(fields)}, payload) "
+            f"VALUES ({', '.join('?' * (len(fields) + 2))})"
+        )
+
+        # 既存バケットへの加算（SET の右辺の列名は更新前の行を指す）
+        newer = "excluded.last_ts >= last_ts"
+        updates = ["count = count + 1",
+                   "last_ts = MAX(last_ts, excluded.last_ts)",
+                   f"last_payload = CASE WHEN {newer} THEN excluded.last_payload ELSE last_payload END"]
+        for field in fields:
+            updates += [
+                f"{field}_sum = COALESCE({field}_sum, 0) + COALESCE(excluded.{field}_sum, 0)",
+                f"{field}_min = MIN(COALESCE({field}_min, excluded.{field}_min), "
+                f"COALESCE(excluded.{field}_min, {field}_min))",
+                f"{field}_max = MAX(COALESCE({field}_max, excluded.{field}_max), "
+                f"COALESCE(excluded.{field}_max, {field}_max))",
+                f"{field}_last = CASE WHEN {newer} THEN excluded.{field}_last ELSE {field}_last END",
+            ]
+        self._upsert_rollup_sql = (
+            f"INSERT INTO {self.rollups_table} "
+            f"(resolution, bucket, count, last_ts, last_payload, {', '.join(rollup_columns)}) "
+            f"VALUES (?, ?, 1, ?, ?, {', '.join('?' * len(rollup_columns))}) "
+            f"ON CONFLICT(resolution, bucket) DO UPDATE SET {', '.join(updates)}"
+        )
+
+        self._select_samples_sql = (
+            f"SELECT ts, {', '.join(fields)}, payload FROM {self.samples_table} "
+            f"WHERE ts >= ? AND ts < ? ORDER BY ts"
+        )
+        self._select_rollups_sql = (
+            f"SELECT bucket, count, last_ts, last_payload, {', '.join(rollup_columns)} "
+            f"FROM {self.rollups_table} WHERE resolution = ? AND bucket >= ? AND bucket < ? ORDER BY bucket"
+        )
+
+    def _init_database(self):
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.get_connection() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            for statement in self._schema:
+                conn.execute(statement)
+            conn.commit()
+
+    @contextmanager
+    def get_connection(self):
+        """データベース接続コンテキストマネージャー"""
+        conn = sqlite3.connect(str(self.db_path), timeout=30.0)
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def append(self, timestamp: datetime, values: Dict[str, Optional[float]],
+               payload: Optional[Dict[str, Any]] = None):
+        """標本を1件追記し、分・時・日の集計を更新（保持期間を過ぎた行も削除）"""
+        ts = timestamp.timestamp()
+        row = [values.get(field) for field in self.fields]
+        payload_json = json.dumps(payload, ensure_ascii=False) if payload is not None else None
+
+        aggregates = [value for value in row for _ in _AGGREGATES]
+        with self._lock, self.get_connection() as conn:
+            conn.execute(self._insert_sample_sql, (ts, *row, payload_json))
+            conn.executemany(self._upsert_rollup_sql, [
+                (resolution, floor(timestamp).timestamp(), ts, payload_json, *aggregates)
+                for resolution, floor in RESOLUTIONS.items()
+            ])
+            self._prune(conn, ts)
+            conn.commit()
+
+    def _prune(self, conn: sqlite3.Connection, now: float):
+        conn.execute(f"DELETE FROM {self.samples_table} WHERE ts < ?",
+                     (now - self.retention_days['raw'] * 86400,))
+        for resolution in RESOLUTIONS:
+            conn.execute(f"DELETE FROM {self.rollups_table} WHERE resolution = ? AND bucket < ?",
+                         (resolution, now - self.retention_days[resolution] * 86400))
+
+    def samples(self, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+        """[start, end) の標本（古い順）"""
+        with self.get_connection() as conn:
+            rows = conn.execute(self._select_samples_sql, (start.timestamp(), end.timestamp())).fetchall()
+        return [self._sample_from_row(row) for row in rows]
+
+    def latest(self, since: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """最新の標本（since 以降に無ければ None）"""
+        with self.get_connection() as conn:
+            row = conn.execute(
+                f"SELECT ts, {', '.join(self.fields)}, payload FROM {self.samples_table} "
+                f"WHERE ts >= ? ORDER BY ts DESC LIMIT 1",
+                (since.timestamp() if since else float('-inf'),)
+            ).fetchone()
+        return self._sample_from_row(row) if row else None
+
+    def rollups(self, resolution: str, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+        """[start, end) に先頭がある集計バケット（古い順）
+
+        各要素は bucket（バケット先頭の datetime）・count・last_ts・payload（最新の標本のもの）と、
+        列ごとの {'sum', 'min', 'max', 'last', 'mean'} を持つ。
+        """
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"Unknown resolution: {resolution}")
+        start_bucket = RESOLUTIONS[resolution](start).timestamp()
+        with self.get_connection() as conn:
+            rows = conn.execute(self._select_rollups_sql,
+                                (resolution, start_bucket, end.timestamp())).fetchall()
+
+        buckets = []
+        for bucket, count, last_ts, last_payload, *aggregates in rows:
+            entry = {
+                'bucket': datetime.fromtimestamp(bucket),
+                'count': count,
+                'last_ts': datetime.fromtimestamp(last_ts),
+                'payload': json.loads(last_payload) if last_payload else None,
+            }
+            for index, field in enumerate(self.fields):
+                values = dict(zip(_AGGREGATES, aggregates[index * 4:index * 4 + 4]))
+                values['mean'] = values['sum'] / count if values['sum'] is not None and count else None
+                entry[field] = values
+            buckets.append(entry)
+        return buckets
+
+    def _sample_from_row(self, row) -> Dict[str, Any]:
+        ts, *values, payload = row
+        sample = dict(zip(self.fields, values))
+        sample['timestamp'] = datetime.fromtimestamp(ts)
+        sample['payload'] = json.loads(payload) if payload else None
+        return sample
@@ -0,0 +1,293 @@
+"""
+Pipeline Tracing
+実行トレース - 収集・翻訳・分析・レンダリング・送信の各処理をネストしたスパンとして記録し、
+Chrome トレース形式（chrome://tracing / Perfetto で表示可能）のJSONに出力する
+"""
+
+import asyncio
+import contextvars
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar('current_span', default=None)
+_active_tracer: Optional['Tracer'] = None
+
+
+class _NoopSpan:
+    """トレース無効時に返す何もしないスパン（共有インスタンス）"""
+
+    __slots__ = ()
+
+    def set(self, key: str, value: Any) -> '_NoopSpan':
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """計測区間（with ブロック）"""
+
+    __slots__ = ('tracer', 'name', 'category', 'attributes', 'span_id', 'parent_id',
+                 'track', 'start_ns', 'end_ns', '_token', '_parent')
+
+    def __init__(self, tracer: 'Tracer', name: str, category: str, attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.attributes = attributes
+
+    def set(self, key: str, value: Any) -> 'Span':
+        """属性を追加"""
+        self.attributes[key] = value
+        return self
+
+    def __enter__(self):
+        parent = _current_span.get()
+        self.parent_id = parent.span_id if parent is not None else None
+        self._parent = parent
+        self.span_id = self.tracer._next_id()
+        self.track = self.tracer._track()
+        self.tracer._open[self.track] = self
+        self._token = _current_span.set(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end_ns = time.perf_counter_ns()
+        _current_span.reset(self._token)
+        if self._parent is not None and self._parent.track == self.track:
+            self.tracer._open[self.track] = self._parent
+        else:
+            self.tracer._open.pop(self.track, None)
+        self._parent = None
+        if exc_type is not None:
+            self.attributes['error'] = exc_type.__name__
+        self.tracer._finish(self)
+        return False
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+
+class Tracer:
+    """1回の実行分のスパンを保持し、Chrome トレースとして出力する
+
+    スパンは asyncio タスク（タスク外ではスレッド）ごとのトラックに並べる。同じタスク内の
+    スパンは必ず入れ子になるため、並行実行される収集リクエストもビューア上で重ならない。
+    """
+
+    def __init__(self, run_name: str = 'run', max_spans: int = 100000):
+        self.run_name = run_name
+        self.max_spans = max_spans
+        self.started_at = datetime.now()
+        self.origin_ns = time.perf_counter_ns()
+        self.spans: List[Span] = []
+        self.dropped_spans = 0
+        self._ids = iter(range(1, 2 ** 62))
+        self._tracks: Dict[Any, int] = {}
+        self._track_names: Dict[int, str] = {}
+        self._open: Dict[int, Span] = {}  # トラックごとの実行中で最も内側のスパン
+        self._lock = threading.Lock()
+        self._previous: Optional[Tracer] = None
+
+    # ------------------------------------------------------------------
+    # 有効化
+    # ------------------------------------------------------------------
+
+    def activate(self) -> 'Tracer':
+        """このトレーサーを記録先にする"""
+        global _active_tracer
+        self._previous, _active_tracer = _active_tracer, self
+        return self
+
+    def deactivate(self):
+        global _active_tracer
+        if _active_tracer is self:
+            _active_tracer = self._previous
+        self._previous = None
+
+    def __enter__(self):
+        return self.activate()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.deactivate()
+        return False
+
+    # ------------------------------------------------------------------
+    # 記録（Span から呼ばれる）
+    # ------------------------------------------------------------------
+
+    def _next_id(self) -> int:
+        return next(self._ids)
+
+    def _track(self) -> int:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        key = task if task is not None else threading.get_ident()
+        track = self._tracks.get(key)
+        if track is None:
+            with self._lock:
+                track = self._tracks.setdefault(key, len(self._tracks) + 1)
+                self._track_names[track] = (
+                    task.get_name() if task is not None else threading.current_thread().name)
+        return track
+
+    def open_span(self, owner: Any) -> Optional[Span]:
+        """asyncio タスク（タスク外ではスレッドID）で実行中の最も内側のスパン
+
+        コンテキスト変数は別スレッドから読めないため、監視スレッドからの参照に使う。
+        """
+        track = self._tracks.get(owner)
+        return self._open.get(track) if track is not None else None
+
+    def _finish(self, span: Span):
+        if len(self.spans) < self.max_spans:
+            self.spans.append(span)
+        else:
+            self.dropped_spans += 1
+
+    # ------------------------------------------------------------------
+    # 出力
+    # ------------------------------------------------------------------
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Chrome トレース形式（Trace Event Format）の辞書"""
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [
+            {'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0, 'args': {'name': self.run_name}}
+        ]
+        for track, name in sorted(self._track_names.items()):
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': track, 'args': {'name': name}})
+
+        for span in sorted(self.spans, key=lambda s: s.start_ns):
+            args = {key: _json_safe(value) for key, value in span.attributes.items()}
+            args['span_id'] = span.span_id
+            if span.parent_id is not None:
+                args['parent_id'] = span.parent_id
+            events.append({
+                'name': span.name,
+                'cat': span.category,
+                'ph': 'X',
+                'ts': round((span.start_ns - self.origin_ns) / 1000, 3),
+                'dur': round((span.end_ns - span.start_ns) / 1000, 3),
+                'pid': pid,
+                'tid': span.track,
+                'args': args
+            })
+
+        return {
+            'traceEvents': events,
+            'displayTimeUnit': 'ms',
+            'otherData': {
+                'run_name': self.run_name,
+                'started_at': self.started_at.isoformat(),
+                'span_count': len(self.spans),
+                'dropped_spans': self.dropped_spans
+            }
+        }
+
+    def write(self, path: Union[str, Path]) -> Path:
+        """Chrome トレースJSONを書き出す（空白なしのコンパクト形式）"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False, separators=(',', ':'))
+        return path
+
+    def summary(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """スパン名ごとの件数・合計時間・最大時間（合計時間の降順）"""
+        totals: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+        for span in self.spans:
+            total = totals[span.name]
+            duration = span.duration_ms
+            total[0] += 1
+            total[1] += duration
+            total[2] = max(total[2], duration)
+        rows = [
+            {'name': name, 'count': count, 'total_ms': round(total_ms, 2), 'max_ms': round(max_ms, 2)}
+            for name, (count, total_ms, max_ms) in totals.items()
+        ]
+        return sorted(rows, key=lambda row: row['total_ms'], reverse=True)[:limit]
+
+
+def _json_safe(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def get_active_tracer() -> Optional[Tracer]:
+    """記録中のトレーサー（無効時は None）"""
+    return _active_tracer
+
+
+def trace_span(name: str, category: str = 'app', **attributes) -> Union[Span, _NoopSpan]:
+    """スパンを開始するコンテキストマネージャー（トレース無効時は何もしない）
+
+    使用例:
+        with trace_span('deepl.translate', category='translate', chars=len(text)) as span:
+            result = await call()
+            span.set('status', result.status)
+    """
+    tracer = _active_tracer
+    if tracer is None:
+        return NOOP_SPAN
+    return Span(tracer, name, category, attributes)
+
+
+def current_span() -> Union[Span, _NoopSpan]:
+    """現在のスパン（属性追加用、スパン外では何もしないスパン）"""
+    span = _current_span.get()
+    if span is None or _active_tracer is None:
+        return NOOP_SPAN
+    return span
+
+
+def traced(name: Optional[str] = None, category: str = 'app'):
+    """関数呼び出しをスパンとして記録するデコレータ（同期・非同期関数の両方に対応）"""
+    def decorator(func: Callable):
+        span_name = name or func.__qualname__
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with trace_span(span_name, category):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with trace_span(span_name, category):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def bind_context(func: Callable) -> Callable:
+    """現在のコンテキスト（親スパン）を引き継いで実行する callable
+
+    loop.run_in_executor はコンテキストをコピーしないため、スレッドで実行する処理の
+    スパンを呼び出し元の子にする場合はこれで包む。
+    """
+    return functools.partial(contextvars.copy_context().run, func)
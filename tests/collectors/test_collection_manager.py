@@ -0,0 +1,109 @@
+"""
+Tests for CollectionManager scheduling
+収集スケジューラ（同時実行数の上限・優先度と期限の順序・期限超過時の部分結果）のテスト
+"""
+
+import asyncio
+
+import pytest
+
+from src.collectors.collection_manager import CollectionManager, CollectionResult, CollectionTarget
+
+
+class SchedulerConfig:
+    """収集器をすべて無効にしたテスト用設定"""
+
+    def __init__(self, **collection):
+        self.collection = collection
+
+    def get(self, *keys, default=None):
+        if keys[0] == 'news_sources':
+            return False
+        if keys[0] == 'collection' and len(keys) == 2:
+            return self.collection.get(keys[1], default)
+        return default
+
+
+class RecordingCollectionManager(CollectionManager):
+    """ソースごとの所要秒数だけ待つ収集器に置き換え、開始順と同時実行数を記録する"""
+
+    def __init__(self, targets, durations, **collection):
+        super().__init__(SchedulerConfig(**collection))
+        self.collection_targets = targets
+        self.collectors = {target.source: object() for target in targets}
+        self.durations = durations
+        self.started = []
+        self.running = {}
+        self.peak = 0
+        self.peak_per_source = {}
+
+    async def _collect_from_source(self, source, category, count, filters):
+        self.started.append(f'{source}.{category}')
+        self.running[source] = self.running.get(source, 0) + 1
+        self.peak = max(self.peak, sum(self.running.values()))
+        self.peak_per_source[source] = max(self.peak_per_source.get(source, 0), self.running[source])
+        try:
+            duration = self.durations.get(f'{source}.{category}', 0.01)
+            if isinstance(duration, Exception):
+                raise duration
+            await asyncio.sleep(duration)
+        finally:
+            self.running[source] -= 1
+        return CollectionResult(source=source, category=category, articles_collected=count,
+                                articles_filtered=0, processing_time=duration, success=True)
+
+
+def target(source, category, priority, deadline=None):
+    return CollectionTarget(source, category, 5, priority, deadline_seconds=deadline)
+
+
+class TestCollectionScheduler:
+    """収集スケジューラテスト"""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limits_are_enforced(self):
+        targets = [target(f'source{i % 3}', f'cat{i}', 5) for i in range(9)]
+        manager = RecordingCollectionManager(targets, {}, max_concurrent=2, max_concurrent_per_source=1)
+
+        results = await manager._execute_parallel_collection()
+
+        assert manager.peak == 2
+        assert set(manager.peak_per_source.values()) == {1}
+        assert [result.category for result in results] == [f'cat{i}' for i in range(9)]
+        assert all(result.success for result in results)
+
+    @pytest.mark.asyncio
+    async def test_targets_start_by_priority_then_deadline(self):
+        targets = [target('a', 'low', 6), target('b', 'late', 1, deadline=30),
+                   target('c', 'soon', 1, deadline=5), target('d', 'mid', 3)]
+        manager = RecordingCollectionManager(targets, {}, max_concurrent=1)
+
+        results = await manager._execute_parallel_collection()
+
+        assert manager.started == ['c.soon', 'b.late', 'd.mid', 'a.low']
+        assert [result.category for result in results] == ['soon', 'late', 'mid', 'low']
+
+    @pytest.mark.asyncio
+    async def test_missed_deadline_keeps_other_results(self):
+        targets = [target('fast', 'tech', 1), target('slow', 'security', 1, deadline=0.05),
+                   target('broken', 'general', 2)]
+        durations = {'slow.security': 5, 'broken.general': ValueError('HTTP 500')}
+        manager = RecordingCollectionManager(targets, durations, max_concurrent=3)
+
+        results = {result.source: result for result in await manager._execute_parallel_collection()}
+
+        assert results['fast'].success and results['fast'].articles_collected == 5
+        assert not results['slow'].success and 'Deadline exceeded' in results['slow'].error_message
+        assert (results['broken'].category, results['broken'].error_message) == ('general', 'HTTP 500')
+
+    @pytest.mark.asyncio
+    async def test_targets_not_started_before_session_timeout(self):
+        targets = [target('a', 'first', 1), target('a', 'second', 2)]
+        manager = RecordingCollectionManager(targets, {'a.first': 0.2}, timeout_seconds=0.1,
+                                             target_timeout_seconds=10)
+
+        first, second = await manager._execute_parallel_collection()
+
+        assert not first.success and 'Deadline exceeded' in first.error_message
+        assert not second.success and second.error_message.startswith('Not started')
+        assert manager.started == ['a.first']
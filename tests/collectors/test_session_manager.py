@@ -0,0 +1,95 @@
+"""
+Session Manager Tests
+共有HTTPクライアント（接続再利用・DNSキャッシュの統計、スライディングウィンドウのバッチ）のテスト
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.collectors.session_manager import close_session_pool, get_api_client
+
+
+@asynccontextmanager
+async def local_server(routes):
+    """routes（パス → ハンドラー）を返すローカルHTTPサーバー（ベースURLを返す）"""
+    app = web.Application()
+    for path, handler in routes.items():
+        app.router.add_get(path, handler)
+    server = TestServer(app, host='127.0.0.1')
+    await server.start_server()
+    try:
+        yield f"http://localhost:{server.port}"
+    finally:
+        await close_session_pool()
+        await server.close()
+
+
+async def ok(request):
+    return web.json_response({'path': request.path})
+
+
+async def close_after_response(request):
+    response = web.Response(text='<rss/>')
+    response.force_close()
+    return response
+
+
+class TestOptimizedAPIClient:
+    """共有クライアントテスト"""
+
+    @pytest.mark.asyncio
+    async def test_keep_alive_reuse_is_measured_per_host(self):
+        async with local_server({'/ok': ok}) as base_url:
+            client = await get_api_client()
+            for _ in range(5):
+                assert await client.request('test_service', 'GET', f"{base_url}/ok") == {'path': '/ok'}
+
+            host = client.session_pool.get_statistics()['hosts']['localhost']
+            service = client.session_pool.session_stats['test_service']
+
+        assert host['requests'] == 5
+        assert (host['connections_created'], host['connections_reused']) == (1, 4)
+        assert host['connection_reuse_rate'] == 80
+        assert host['dns_cache_misses'] == 1
+        assert service['request_count'] == 5
+
+    @pytest.mark.asyncio
+    async def test_new_connections_hit_dns_cache(self):
+        async with local_server({'/feed': close_after_response}) as base_url:
+            client = await get_api_client()
+            for _ in range(3):
+                text = await client.request('test_service', 'GET', f"{base_url}/feed", response_type='text')
+                assert text == '<rss/>'
+
+            host = client.session_pool.get_host_statistics()['localhost']
+
+        assert host['connections_created'] == 3 and host['connections_reused'] == 0
+        assert (host['dns_cache_misses'], host['dns_cache_hits']) == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_batch_request_does_not_wait_for_slowest_in_chunk(self):
+        finished = []
+
+        async def slow(request):
+            await asyncio.sleep(0.3)
+            finished.append('slow')
+            return web.json_response({'path': 'slow'})
+
+        async def fast(request):
+            finished.append(request.query['i'])
+            return web.json_response({'path': request.query['i']})
+
+        async with local_server({'/slow': slow, '/fast': fast}) as base_url:
+            client = await get_api_client()
+            requests = [{'url': f"{base_url}/slow"}] + [
+                {'url': f"{base_url}/fast", 'kwargs': {'params': {'i': str(i)}}} for i in range(20)
+            ]
+            results = await client.batch_request('test_service', requests, concurrency=2)
+
+        assert [result['path'] for result in results] == ['slow'] + [str(i) for i in range(20)]
+        # 遅いリクエストが1枠を占有している間も、残りの枠で後続が進む
+        assert finished[-1] == 'slow'
@@ -0,0 +1,106 @@
+"""
+ArticleColumns Tests
+列指向記事統計のテスト
+"""
+
+import pytest
+from datetime import datetime
+
+from src.generators.article_columns import ArticleColumns
+from src.models.article import Article
+
+
+@pytest.fixture
+def articles():
+    base = datetime(2025, 1, 13, 9, 0)
+    data = [
+        # (category, importance, sentiment, cvss, day offset, keywords)
+        ('tech', 9, 0.5, None, 0, ['AI', 'cloud']),
+        ('tech', 6, 0.0, None, 0, ['AI']),
+        ('security', 10, -0.6, 9.8, 1, ['CVE', 'AI']),
+        ('domestic_social', 4, 0.05, None, 2, []),
+        (None, 7, -0.2, None, 2, ['economy']),
+    ]
+    result = []
+    for i, (category, importance, sentiment, cvss, offset, keywords) in enumerate(data):
+        article = Article(
+            url=f"https://example.com/{i}",
+            title=f"Article {i}",
+            category=category,
+            importance_score=importance,
+            sentiment_score=sentiment,
+            cvss_score=cvss,
+            keywords=keywords,
+            source_name=f"Source {i % 2}",
+            published_at=base.replace(day=base.day + offset, hour=9 + i)
+        )
+        result.append(article)
+    return result
+
+
+class TestArticleColumns:
+    """ArticleColumnsテスト"""
+
+    def test_html_statistics(self, articles):
+        stats = ArticleColumns.from_articles(articles).html_statistics()
+
+        assert stats['total_count'] == 5
+        assert stats['avg_importance'] == pytest.approx(7.2)
+        assert stats['high_importance'] == 2
+        assert stats['medium_importance'] == 2
+        assert stats['low_importance'] == 1
+        assert stats['urgent_count'] == 2
+        assert stats['security_count'] == 1
+        assert stats['category_breakdown'] == {'tech': 2, 'security': 1, 'domestic_social': 1}
+
+    def test_advanced_statistics(self, articles):
+        stats = ArticleColumns.from_articles(articles).advanced_statistics()
+
+        assert stats['avg_importance'] == 7.2
+        assert stats['max_importance'] == 10
+        assert stats['min_importance'] == 4
+        assert stats['importance_distribution'] == {'critical': 2, 'high': 1, 'medium': 1, 'low': 1}
+        assert stats['sentiment_analysis'] == {
+            'avg_sentiment': -0.05,
+            'positive_count': 1,
+            'negative_count': 2,
+            'neutral_count': 2
+        }
+        assert stats['source_distribution'] == {'Source 0': 3, 'Source 1': 2}
+        assert stats['time_distribution'] == {9: 1, 10: 1, 11: 1, 12: 1, 13: 1}
+
+    def test_weekly_statistics(self, articles):
+        stats = ArticleColumns.from_articles(articles).weekly_statistics()
+
+        assert stats['daily_counts'] == {'2025-01-13': 2, '2025-01-14': 1, '2025-01-15': 2}
+        assert stats['category_trends']['tech'] == {'2025-01-13': 2}
+        assert stats['peak_day'] == '2025-01-13'
+        assert stats['total_days'] == 3
+
+    def test_categories_weekly_and_keywords(self, articles):
+        columns = ArticleColumns.from_articles(articles)
+        categories = columns.categories_weekly()
+
+        assert categories['tech']['count'] == 2
+        assert categories['tech']['total_importance'] == 15
+        assert categories['tech']['avg_importance'] == 7.5
+        assert categories['tech']['top_keywords'] == ['AI', 'cloud']
+        assert categories['security']['urgent_count'] == 1
+        assert categories['未分類']['keywords'] == ['economy']
+        assert columns.trending_keywords(2) == [('AI', 3), ('cloud', 1)]
+
+    def test_empty_articles(self):
+        columns = ArticleColumns.from_articles([])
+
+        assert columns.html_statistics() == {}
+        assert columns.advanced_statistics() == {}
+        assert columns.weekly_statistics()['peak_day'] is None
+        assert columns.trending_keywords() == []
+
+    def test_string_published_at_and_missing_dates(self, articles):
+        articles[0].published_at = '2025-01-20T08:30:00Z'
+        articles[1].published_at = 'not a date'
+        stats = ArticleColumns.from_articles(articles).weekly_statistics()
+
+        assert stats['daily_counts']['2025-01-20'] == 1
+        assert sum(stats['daily_counts'].values()) == 4
@@ -0,0 +1,129 @@
+"""
+Article Search Tests
+記事全文検索のテスト
+"""
+
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+
+from src.models.database import Database
+from src.models.database_orm import AsyncDatabase
+from src.models.article import Article
+from src.models.article_search import html_snippet
+from src.routers.search import search_articles as search_endpoint
+
+
+class StubConfig:
+    """一時ディレクトリを使う設定スタブ"""
+
+    def __init__(self, root):
+        self.root = root
+
+    def get_storage_path(self, name):
+        return self.root / name
+
+    def get(self, *path, default=None):
+        return default
+
+
+@pytest.fixture
+def config(tmp_path):
+    return StubConfig(tmp_path)
+
+
+@pytest.fixture
+def database(config):
+    db = Database(config)
+    db.save_articles([
+        Article(url="https://example.com/1", title="Ransomware attack hits hospital network",
+                translated_title="ランサムウェア攻撃が病院ネットワークを直撃", category='security',
+                summary="Hospitals report outages", keywords=['ransomware'],
+                published_at=datetime(2025, 1, 10)),
+        Article(url="https://example.com/2", title="Central bank raises interest rates",
+                translated_title="中央銀行が利上げ", category='international_economy',
+                summary="Ransomware is not mentioned in the title", keywords=['金利'],
+                published_at=datetime(2025, 1, 12)),
+        Article(url="https://example.com/3", title="New AI chip announced",
+                translated_title="新しいAIチップを発表", category='tech',
+                keywords=['AI', 'semiconductor'], published_at=datetime(2025, 1, 14)),
+    ])
+    return db
+
+
+class TestArticleSearch:
+    """全文検索テスト"""
+
+    def test_ranking_prefers_title_matches(self, database):
+        hits = database.search_articles("ransomware")
+
+        assert [h['url'] for h in hits] == ["https://example.com/1", "https://example.com/2"]
+        assert hits[0]['rank'] < hits[1]['rank']
+        assert '[' in hits[0]['snippet']
+
+    def test_many_matches_rank_recent_candidates(self, database):
+        # 一致件数が上限以上の場合は新しい候補を列重みで順位付け
+        hits = database.search_articles("ransomware", max_candidates=1)
+        assert [h['url'] for h in hits] == ["https://example.com/2"]
+
+        hits = database.search_articles("ransomware", max_candidates=2)
+        assert [h['url'] for h in hits] == ["https://example.com/1", "https://example.com/2"]
+        assert hits[0]['rank'] < hits[1]['rank']
+        assert '[' in hits[0]['snippet'] and '[' in hits[1]['snippet']
+
+    def test_japanese_and_filters(self, database):
+        assert [h['url'] for h in database.search_articles("ネットワーク")] == ["https://example.com/1"]
+        assert database.search_articles("ransomware", category='tech') == []
+        hits = database.search_articles("ransomware", start_date=datetime(2025, 1, 11))
+        assert [h['url'] for h in hits] == ["https://example.com/2"]
+
+    def test_short_terms_fall_back_to_like(self, database):
+        # 部分一致のため "raises" も該当する
+        assert [h['url'] for h in database.search_articles("AI")] == [
+            "https://example.com/3", "https://example.com/2"]
+        assert [h['url'] for h in database.search_articles("金利")] == ["https://example.com/2"]
+
+    def test_index_follows_updates_and_deletes(self, database):
+        with database.get_connection() as conn:
+            conn.execute("UPDATE articles SET title = 'Quantum computing milestone' WHERE url = ?",
+                         ("https://example.com/3",))
+            conn.execute("DELETE FROM articles WHERE url = ?", ("https://example.com/1",))
+            conn.commit()
+
+        assert [h['url'] for h in database.search_articles("quantum")] == ["https://example.com/3"]
+        assert [h['url'] for h in database.search_articles("hospital")] == []
+
+    def test_empty_query_is_rejected(self, database):
+        with pytest.raises(ValueError):
+            database.search_articles('   ')
+
+    @pytest.mark.asyncio
+    async def test_async_search_uses_same_index(self, config, database):
+        async with AsyncDatabase(config) as db:
+            hits = await db.search_articles('"interest rates"', highlight=('<mark>', '</mark>'))
+
+        assert [h['url'] for h in hits] == ["https://example.com/2"]
+        assert '<mark>' in hits[0]['snippet']
+
+    def test_html_snippet_escapes_article_text(self):
+        snippet = '<b>x</b> \x02<i>hit</i>\x03 stray\x03'
+
+        assert html_snippet(snippet) == '&lt;b&gt;x&lt;/b&gt; <mark>&lt;i&gt;hit&lt;/i&gt;</mark> stray'
+        assert html_snippet(None) is None
+
+    @pytest.mark.asyncio
+    async def test_search_api_escapes_snippets(self, config, database):
+        database.save_articles([
+            Article(url="https://example.com/xss", title='Exploit <script>x</script>',
+                    category='security', published_at=datetime(2025, 1, 15)),
+        ])
+
+        async with AsyncDatabase(config) as db:
+            request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(article_db=db)))
+            response = await search_endpoint(request, q="exploit", category=None, days=None,
+                                             start_date=None, end_date=None, limit=20, offset=0)
+
+        snippet = response['results'][0]['snippet']
+        assert '<script>' not in snippet
+        assert '&lt;script&gt;' in snippet
+        assert '<mark>Exploit</mark>' in snippet
@@ -0,0 +1,112 @@
+"""
+AsyncDatabase Tests
+非同期記事リポジトリのテスト
+"""
+
+import sqlite3
+
+import pytest
+from datetime import datetime, timedelta
+
+from src.models.database_orm import AsyncDatabase, DeliveryHistory
+from src.models.database import Database
+from src.models.article import Article
+
+
+class StubConfig:
+    """一時ディレクトリを使う設定スタブ"""
+
+    def __init__(self, root):
+        self.root = root
+
+    def get_storage_path(self, name):
+        return self.root / name
+
+    def get(self, *path, default=None):
+        return default
+
+
+def make_articles(count, category='tech'):
+    now = datetime.now()
+    return [
+        Article(
+            url=f"https://example.com/{category}/{i}",
+            title=f"Article {i}",
+            category=category,
+            importance_score=i % 10 + 1,
+            keywords=['AI'],
+            published_at=now - timedelta(hours=i)
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_persistent_connections_and_batch_save(tmp_path):
+    async with AsyncDatabase(StubConfig(tmp_path), read_pool_size=2) as db:
+        writer = db._writer
+        assert await db.save_articles_batch(make_articles(150)) == 150
+        # 重複は保存されない
+        assert await db.save_articles_batch(make_articles(150)) == 0
+
+        articles = await db.get_articles(category='tech', limit=10)
+        assert len(articles) == 10
+        assert articles[0]['importance_score'] == 10
+        assert articles[0]['keywords'] == ['AI']
+        assert await db.get_articles(category='security') == []
+
+        # 同一接続を使い回している
+        assert db._writer is writer
+        assert len(db._readers) == 2
+
+    assert db._writer is None
+
+
+@pytest.mark.asyncio
+async def test_shares_rollups_with_sync_database(tmp_path):
+    config = StubConfig(tmp_path)
+    async with AsyncDatabase(config) as db:
+        await db.save_articles_batch(make_articles(5) + make_articles(3, category='security'))
+        assert await db.log_deliveries([
+            DeliveryHistory(delivery_type='scheduled', recipient_email=f"user{i}@example.com",
+                            subject='report', article_count=8)
+            for i in range(2)
+        ]) == 2
+
+    now = datetime.now()
+    summary = Database(config).get_period_summary(now - timedelta(days=1), now)
+    assert summary['total_articles'] == 8
+    assert summary['categories']['security']['count'] == 3
+    assert summary['top_keywords'] == [('AI', 8)]
+
+
+@pytest.mark.asyncio
+async def test_backfills_rollups_before_first_write(tmp_path):
+    config = StubConfig(tmp_path)
+    history = [Article(url=f"https://example.com/old/{i}", title=f"Old {i}", category='tech',
+                       published_at=datetime(2025, 1, 13 + i, 9, 0)) for i in range(2)]
+    database = Database(config)
+    database.save_articles(history)
+    # 集計テーブル導入前のDB（記事だけがある状態）
+    with sqlite3.connect(database.db_path) as conn:
+        conn.execute("DELETE FROM daily_category_rollup")
+
+    async with AsyncDatabase(config) as db:
+        await db.save_articles_batch(make_articles(2))
+
+    with sqlite3.connect(database.db_path) as conn:
+        days = dict(conn.execute(
+            "SELECT day, SUM(article_count) FROM daily_category_rollup GROUP BY day").fetchall())
+    assert days['2025-01-13'] == 1 and days['2025-01-14'] == 1
+    assert sum(days.values()) == 4
+
+    # 当日分だけ集計された（以前の版で空判定が外れた）DBも、欠けた日を再構築する
+    with sqlite3.connect(database.db_path) as conn:
+        conn.execute("DELETE FROM daily_category_rollup WHERE day < '2025-02-01'")
+
+    async with AsyncDatabase(config):
+        pass
+
+    with sqlite3.connect(database.db_path) as conn:
+        total = conn.execute("SELECT SUM(article_count) FROM daily_category_rollup").fetchone()[0]
+    assert total == 4
@@ -0,0 +1,114 @@
+"""
+Async Executor Tests
+非同期実行エンジン（優先度キュー・ワーカープール・完了待機）のテスト
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils.async_executor import (
+    AsyncExecutor, Task, TaskConfig, TaskPriority, TaskQueue, TaskStatus
+)
+
+
+def make_task(task_id, priority=TaskPriority.NORMAL):
+    return Task(task_id, lambda: task_id, config=TaskConfig(priority=priority))
+
+
+class TestTaskQueue:
+    """タスクキューテスト"""
+
+    @pytest.mark.asyncio
+    async def test_priority_then_submission_order(self):
+        queue = TaskQueue()
+        for task_id, priority in (('low', TaskPriority.LOW), ('normal-1', TaskPriority.NORMAL),
+                                  ('urgent', TaskPriority.URGENT), ('normal-2', TaskPriority.NORMAL),
+                                  ('high', TaskPriority.HIGH)):
+            await queue.put(make_task(task_id, priority))
+
+        assert queue.qsize()[TaskPriority.NORMAL] == 2
+        order = [(await queue.get()).task_id for _ in range(5)]
+
+        assert order == ['urgent', 'high', 'normal-1', 'normal-2', 'low']
+        assert sum(queue.qsize().values()) == 0
+        assert queue.get_nowait() is None
+
+    @pytest.mark.asyncio
+    async def test_get_waits_for_put(self):
+        queue = TaskQueue()
+        getter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0.01)
+        assert not getter.done()
+
+        await queue.put(make_task('late'))
+
+        assert (await asyncio.wait_for(getter, timeout=1)).task_id == 'late'
+        assert await queue.get(timeout=0.01) is None
+
+    @pytest.mark.asyncio
+    async def test_max_size_is_per_priority(self):
+        queue = TaskQueue(max_size=1)
+        await queue.put(make_task('a'))
+        await queue.put(make_task('b', TaskPriority.HIGH))
+
+        with pytest.raises(asyncio.QueueFull):
+            await queue.put(make_task('c'))
+
+
+class TestAsyncExecutor:
+    """実行エンジンテスト"""
+
+    @pytest.mark.asyncio
+    async def test_results_are_delivered_to_waiters(self):
+        executor = AsyncExecutor(max_workers=4, enable_monitoring=False)
+
+        async def double(x):
+            await asyncio.sleep(0.01)
+            return x * 2
+
+        try:
+            task_ids = [await executor.submit_task(f'job-{i}', double, (i,)) for i in range(8)]
+            results = await executor.wait_for_batch(task_ids, timeout=5)
+        finally:
+            await executor.stop()
+
+        assert [result.result for result in results] == [i * 2 for i in range(8)]
+        assert all(result.status == TaskStatus.COMPLETED for result in results)
+        assert executor.stats['tasks_completed'] == 8
+        assert executor.task_results == {} and executor.result_waiters == {}
+
+    @pytest.mark.asyncio
+    async def test_first_completed_and_wait_timeout(self):
+        executor = AsyncExecutor(max_workers=2, enable_monitoring=False)
+
+        async def sleep_for(seconds):
+            await asyncio.sleep(seconds)
+            return seconds
+
+        try:
+            slow = await executor.submit_task('slow', sleep_for, (0.5,))
+            fast = await executor.submit_task('fast', sleep_for, (0.01,))
+
+            first = await executor.wait_for_batch([slow, fast], timeout=5, return_when='FIRST_COMPLETED')
+            assert [result.task_id for result in first] == ['fast']
+
+            with pytest.raises(asyncio.TimeoutError):
+                await executor.wait_for_task(slow, timeout=0.01)
+            assert (await executor.wait_for_task(slow, timeout=5)).result == 0.5
+        finally:
+            await executor.stop()
+
+    @pytest.mark.asyncio
+    async def test_task_timeout_is_reported(self):
+        executor = AsyncExecutor(max_workers=1, enable_monitoring=False)
+
+        try:
+            await executor.submit_task('hang', asyncio.sleep, (1,),
+                                       config=TaskConfig(timeout=0.01, max_retries=0))
+            result = await executor.wait_for_task('hang', timeout=5)
+        finally:
+            await executor.stop()
+
+        assert result.status == TaskStatus.TIMEOUT
+        assert executor.stats['tasks_failed'] == 1
@@ -0,0 +1,140 @@
+"""
+Benchmark Gate Tests
+ベンチマーク比較（雑音を考慮した劣化判定）と結果ストアのテスト
+"""
+
+import json
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from compare_benchmarks import BenchmarkComparator, MEDIAN_SE_FACTOR, main
+from results_store import MAD_TO_SIGMA, baseline, latest
+
+
+def result(processes=1, **samples):
+    """{名前: 標本} から結果JSONを作成"""
+    return {'results': {name: {'unit': 'seconds', 'samples': values, 'processes': processes}
+                        for name, values in samples.items()}}
+
+
+STABLE = [1.00, 1.01, 0.99, 1.00, 1.02, 0.98, 1.00]
+SLOW = [1.50, 1.51, 1.49, 1.50, 1.52, 1.48, 1.50]
+FAST = [0.60, 0.61, 0.59, 0.60, 0.62, 0.58, 0.60]
+# 中央値 1.0、MAD 0.5 の大きくばらつく標本
+SPREAD = [0.5, 0.5, 1.0, 1.0, 1.0, 1.5, 1.5, 2.0]
+SPREAD_SHIFTED = [value + 0.3 for value in SPREAD]
+
+
+def write(path, data):
+    path.write_text(json.dumps(data), encoding='utf-8')
+    return str(path)
+
+
+def run_main(monkeypatch, *argv):
+    monkeypatch.setattr(sys, 'argv', ['compare_benchmarks.py', *argv])
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+    return exit_info.value.code
+
+
+class TestBenchmarkComparator:
+    """劣化判定テスト"""
+
+    def test_noise_is_standard_error_of_medians(self):
+        comparator = BenchmarkComparator()
+        metrics = comparator.extract_metrics(result(processes=4, dedup=SPREAD))['dedup']
+
+        assert metrics['median'] == 1.0
+        assert metrics['sigma'] == pytest.approx(0.5 * MAD_TO_SIGMA)
+        assert (metrics['runs'], metrics['n']) == (4, 8)
+
+        comparison = comparator.compare_metrics({'dedup': metrics}, {'dedup': metrics})['dedup']
+        standard_error = MEDIAN_SE_FACTOR * 0.5 * MAD_TO_SIGMA / math.sqrt(4)
+        assert comparison['noise'] == pytest.approx(math.hypot(standard_error, standard_error))
+
+    def test_status_classification(self):
+        comparator = BenchmarkComparator(threshold_percent=10.0, noise_k=3.0)
+        base = comparator.extract_metrics(result(ok=STABLE, slow=STABLE, fast=STABLE, noisy=SPREAD))
+        current = comparator.extract_metrics(result(ok=STABLE, slow=SLOW, fast=FAST, noisy=SPREAD_SHIFTED))
+
+        statuses = {name: data['status'] for name, data in comparator.compare_metrics(base, current).items()}
+
+        assert statuses == {'ok': 'OK', 'slow': 'REGRESSION', 'fast': 'IMPROVED', 'noisy': 'NOISY'}
+
+    def test_gated_names_fall_back_to_all(self):
+        comparator = BenchmarkComparator(gated=['dedup'])
+
+        assert comparator.gated_metrics({'dedup': {}, 'misc': {}}) == ['dedup']
+        assert sorted(comparator.gated_metrics({'misc': {}, 'other': {}})) == ['misc', 'other']
+
+
+class TestCompareBenchmarksGate:
+    """終了コードのテスト"""
+
+    def test_clear_regression_fails(self, tmp_path, monkeypatch):
+        base = write(tmp_path / 'base.json', result(dedup=STABLE))
+        current = write(tmp_path / 'current.json', result(dedup=SLOW))
+
+        assert run_main(monkeypatch, base, current) == 1
+
+    def test_large_change_within_noise_passes(self, tmp_path, monkeypatch):
+        base = write(tmp_path / 'base.json', result(dedup=SPREAD))
+        current = write(tmp_path / 'current.json', result(dedup=SPREAD_SHIFTED))
+
+        assert run_main(monkeypatch, base, current) == 0
+
+    def test_ungated_regression_does_not_fail(self, tmp_path, monkeypatch):
+        base = write(tmp_path / 'base.json', result(dedup=STABLE, misc=STABLE))
+        current = write(tmp_path / 'current.json', result(dedup=STABLE, misc=SLOW))
+
+        assert run_main(monkeypatch, base, current) == 0
+        assert run_main(monkeypatch, base, current, '--gate', 'misc') == 1
+
+    def test_missing_gated_benchmark_fails(self, tmp_path, monkeypatch, capsys):
+        base = write(tmp_path / 'base.json', result(dedup=STABLE, render=STABLE, misc=STABLE))
+        current = write(tmp_path / 'current.json', result(render=STABLE))
+
+        report = tmp_path / 'report.md'
+        assert run_main(monkeypatch, base, current, '--report', str(report)) == 1
+        table = capsys.readouterr().out
+        assert 'MISSING' in table and 'misc' not in table
+        assert '| dedup |' in report.read_text(encoding='utf-8')
+
+        # ゲート対象外が消えただけなら通す
+        assert run_main(monkeypatch, base, current, '--gate', 'render') == 0
+
+    def test_empty_current_results_fail(self, tmp_path, monkeypatch):
+        base = write(tmp_path / 'base.json', result(dedup=STABLE))
+        current = write(tmp_path / 'current.json', {'results': {}})
+
+        assert run_main(monkeypatch, base, current) == 1
+
+
+class TestResultsStoreSelection:
+    """結果ストアからの基準・最新の選択テスト"""
+
+    def test_baseline_file_takes_precedence_over_oldest(self, tmp_path, monkeypatch):
+        write(tmp_path / 'hot_paths_20250101_000000.json', result(dedup=SLOW))
+        latest_path = write(tmp_path / 'hot_paths_20250103_000000.json', result(dedup=SLOW))
+        write(tmp_path / 'hot_paths_20250102_000000.json', result(dedup=SLOW))
+
+        # 基準が未設定なら最も古い結果と比較する（劣化なし）
+        assert baseline('hot_paths', tmp_path).name == 'hot_paths_20250101_000000.json'
+        assert str(latest('hot_paths', tmp_path)) == latest_path
+        assert run_main(monkeypatch, '--store', str(tmp_path)) == 0
+
+        baseline_path = write(tmp_path / 'hot_paths_baseline.json', result(dedup=STABLE))
+        assert str(baseline('hot_paths', tmp_path)) == baseline_path
+        assert str(latest('hot_paths', tmp_path)) == latest_path
+        assert run_main(monkeypatch, '--store', str(tmp_path)) == 1
+
+    def test_store_needs_a_newer_result(self, tmp_path, monkeypatch):
+        write(tmp_path / 'hot_paths_20250101_000000.json', result(dedup=STABLE))
+
+        assert run_main(monkeypatch, '--store', str(tmp_path)) == 2
+        assert run_main(monkeypatch, '--store', str(tmp_path), '--name', 'missing') == 2
@@ -0,0 +1,134 @@
+"""
+Cache Admission Tests
+頻度スケッチ（Count-Min）と TinyLFU によるハイブリッドキャッシュの L1 受け入れ判定のテスト
+"""
+
+import pytest
+
+from src.utils.cache_manager_advanced import (
+    FrequencySketch, HybridCacheBackend, MemoryCacheBackend, TinyLFUAdmission
+)
+
+
+def hybrid_with_l2(l1_max_size=2, admission_policy='tinylfu'):
+    cache = HybridCacheBackend(l1_max_size=l1_max_size, admission_policy=admission_policy)
+    cache.l2_cache = MemoryCacheBackend(max_size=1000)
+    return cache
+
+
+class TestFrequencySketch:
+    """頻度スケッチテスト"""
+
+    def test_frequency_counts_and_saturates(self):
+        sketch = FrequencySketch(expected_entries=64)
+        for _ in range(5):
+            sketch.increment('analysis:1')
+        sketch.increment('newsapi:today')
+
+        assert sketch.frequency('analysis:1') >= 5
+        assert sketch.frequency('newsapi:today') >= 1
+        assert sketch.frequency('never-seen') <= 1
+
+        for _ in range(50):
+            sketch.increment('rss:feed')
+        assert sketch.frequency('rss:feed') == FrequencySketch.MAX_COUNT
+
+    def test_aging_halves_counters(self):
+        sketch = FrequencySketch(expected_entries=16, sample_factor=1)
+        for _ in range(10):
+            sketch.increment('hot')
+        for _ in range(6):
+            sketch.increment('warm')
+
+        assert sketch.resets == 1
+        assert sketch.frequency('hot') == 5
+        assert sketch.frequency('warm') == 3
+        assert sketch.additions == 8
+
+
+class TestTinyLFUAdmission:
+    """ハイブリッドキャッシュの受け入れ判定テスト"""
+
+    @pytest.mark.asyncio
+    async def test_one_off_key_does_not_evict_hot_entries(self):
+        cache = hybrid_with_l2()
+        for key in ('analysis:1', 'rss:feed'):
+            await cache.set(key, key)
+            for _ in range(3):
+                await cache.get(key)
+
+        assert await cache.get('newsapi:today') is None
+        assert await cache.set('newsapi:today', 'response')
+
+        assert 'newsapi:today' not in cache.l1_cache.cache
+        assert set(cache.l1_cache.cache) == {'analysis:1', 'rss:feed'}
+        assert await cache.get('newsapi:today') == 'response'  # L2 からは読める
+        assert cache.admission.rejected >= 1
+
+    @pytest.mark.asyncio
+    async def test_repeatedly_read_l2_entry_is_promoted(self):
+        cache = hybrid_with_l2()
+        await cache.set('old:1', 1)
+        await cache.set('old:2', 2)
+        await cache.l2_cache.set('trending', 'value')
+
+        for _ in range(3):
+            assert await cache.get('trending') == 'value'
+
+        assert 'trending' in cache.l1_cache.cache
+        assert cache.admission.admitted >= 1
+        assert (await cache.get_stats())['admission']['policy'] == 'tinylfu'
+
+    @pytest.mark.asyncio
+    async def test_bulk_promotion_uses_admission(self):
+        cache = hybrid_with_l2()
+        for key in ('analysis:1', 'analysis:2'):
+            await cache.set(key, key)
+            await cache.get(key)
+            await cache.get(key)
+        await cache.l2_cache.set_many({'translation:a': 'a', 'translation:b': 'b'})
+
+        found = await cache.get_many(['translation:a', 'translation:b', 'analysis:1'])
+
+        assert found == {'translation:a': 'a', 'translation:b': 'b', 'analysis:1': 'analysis:1'}
+        assert set(cache.l1_cache.cache) == {'analysis:1', 'analysis:2'}
+
+    @pytest.mark.asyncio
+    async def test_updates_and_l1_only_cache_always_write(self):
+        cache = hybrid_with_l2()
+        await cache.set('a', 1)
+        await cache.set('b', 2)
+        await cache.set('a', 10)
+        assert cache.l1_cache.cache['a'].value == 10
+
+        l1_only = HybridCacheBackend(l1_max_size=1)
+        l1_only.l2_cache = None
+        await l1_only.set('a', 1)
+        await l1_only.get('a')
+        await l1_only.set('b', 2)
+        assert await l1_only.get('b') == 2
+
+    @pytest.mark.asyncio
+    async def test_admission_can_be_disabled(self):
+        cache = hybrid_with_l2(admission_policy='none')
+        await cache.set('hot', 1)
+        for _ in range(5):
+            await cache.get('hot')
+        await cache.set('x', 1)
+        await cache.set('y', 2)
+
+        assert cache.admission is None
+        assert 'hot' not in cache.l1_cache.cache
+
+    def test_unknown_policy_is_rejected(self):
+        with pytest.raises(ValueError):
+            HybridCacheBackend(admission_policy='random')
+
+    def test_admit_compares_estimated_frequency(self):
+        admission = TinyLFUAdmission(expected_entries=16)
+        admission.record('victim')
+        assert not admission.admit('candidate', 'victim')
+        admission.record('candidate')
+        admission.record('candidate')
+        assert admission.admit('candidate', 'victim')
+        assert admission.stats() == {'policy': 'tinylfu', 'admitted': 1, 'rejected': 1, 'sketch_resets': 0}
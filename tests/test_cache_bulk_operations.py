@@ -0,0 +1,216 @@
+"""
+Cache Bulk Operation Tests
+キャッシュ一括取得・設定（メモリ・Redis・SQLite 各層）のテスト
+"""
+
+import pytest
+
+from src.utils.cache_manager import CacheManager
+from src.utils.cache_manager_advanced import (
+    AdvancedCacheManager, CacheBackend, HybridCacheBackend, MemoryCacheBackend, RedisCacheBackend
+)
+
+
+class FakeRedis:
+    """redis.asyncio クライアントの代替（往復回数を数えるインメモリ実装）"""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.round_trips = 0
+
+    async def get(self, key):
+        self.round_trips += 1
+        return self.data.get(key)
+
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key, value):
+        self.round_trips += 1
+        self.data[key] = value
+        return True
+
+    async def setex(self, key, ttl, value):
+        self.round_trips += 1
+        self.data[key] = value
+        self.ttls[key] = ttl
+        return True
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """コマンドを溜めて execute で1往復として実行するパイプライン"""
+
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def set(self, key, value):
+        self.commands.append((key, value, None))
+        return self
+
+    def setex(self, key, ttl, value):
+        self.commands.append((key, value, ttl))
+        return self
+
+    async def execute(self, raise_on_error=True):
+        self.client.round_trips += 1
+        for key, value, ttl in self.commands:
+            self.client.data[key] = value
+            if ttl is not None:
+                self.client.ttls[key] = ttl
+        replies = [True] * len(self.commands)
+        self.commands = []
+        return replies
+
+
+class CountingMemoryBackend(MemoryCacheBackend):
+    """ロック取得回数を数えるインメモリキャッシュ"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock_acquisitions = 0
+        lock = self.lock
+
+        class CountingLock:
+            async def __aenter__(inner):
+                self.lock_acquisitions += 1
+                await lock.acquire()
+
+            async def __aexit__(inner, *exc):
+                lock.release()
+
+        self.lock = CountingLock()
+
+
+class FakeConfig:
+    def __init__(self, path):
+        self.path = path
+
+    def get_storage_path(self, name):
+        return self.path / name
+
+
+def redis_backend():
+    backend = RedisCacheBackend(key_prefix='test:')
+    backend.redis_client = FakeRedis()
+    return backend
+
+
+class TestMemoryBulkOperations:
+    """インメモリ層の一括操作テスト"""
+
+    @pytest.mark.asyncio
+    async def test_bulk_get_and_set_take_the_lock_once(self):
+        cache = CountingMemoryBackend(max_size=100)
+
+        stored = await cache.set_many({f'k{i}': i for i in range(50)})
+        found = await cache.get_many([f'k{i}' for i in range(60)])
+
+        assert all(stored.values()) and len(stored) == 50
+        assert found == {f'k{i}': i for i in range(50)}
+        assert cache.lock_acquisitions == 2
+        stats = await cache.get_stats()
+        assert stats['hits'] == 50 and stats['misses'] == 10
+
+    @pytest.mark.asyncio
+    async def test_bulk_set_respects_capacity(self):
+        cache = MemoryCacheBackend(max_size=3)
+        await cache.set_many({key: key for key in 'abcde'})
+
+        assert await cache.get_many(list('abcde')) == {'c': 'c', 'd': 'd', 'e': 'e'}
+        assert (await cache.get_stats())['evictions'] == 2
+
+
+class TestRedisBulkOperations:
+    """Redis 層の一括操作テスト（インメモリの代替クライアント）"""
+
+    @pytest.mark.asyncio
+    async def test_get_many_is_one_mget(self):
+        backend = redis_backend()
+        await backend.set('a', {'title': 'A'})
+        await backend.set('b', [1, 2])
+        backend.redis_client.round_trips = 0
+
+        found = await backend.get_many(['a', 'b', 'missing'])
+
+        assert found == {'a': {'title': 'A'}, 'b': [1, 2]}
+        assert backend.redis_client.round_trips == 1
+        assert backend.stats.hits == 1 + 1 and backend.stats.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_set_many_is_one_pipeline(self):
+        backend = redis_backend()
+
+        stored = await backend.set_many({f'k{i}': 'x' * i for i in range(20)}, ttl=60)
+
+        assert all(stored.values()) and len(stored) == 20
+        client = backend.redis_client
+        assert client.round_trips == 1
+        assert set(client.ttls.values()) == {60}
+        assert await backend.get('k5') == 'xxxxx'
+
+
+class TestHybridBulkOperations:
+    """L1/L2 の一括操作テスト"""
+
+    @pytest.mark.asyncio
+    async def test_l2_hits_are_promoted_in_bulk(self):
+        hybrid = HybridCacheBackend(l1_max_size=10)
+        hybrid.l2_cache = redis_backend()
+        await hybrid.l2_cache.set_many({'warm': 1, 'cold': 2})
+        await hybrid.l1_cache.set('warm', 1)
+        hybrid.l2_cache.redis_client.round_trips = 0
+
+        found = await hybrid.get_many(['warm', 'cold', 'missing'])
+
+        assert found == {'warm': 1, 'cold': 2}
+        assert hybrid.l2_cache.redis_client.round_trips == 1
+        assert await hybrid.l1_cache.get('cold') == 2
+        assert hybrid.stats.hits == 2 and hybrid.stats.misses == 1
+
+
+class TestAdvancedCacheManagerBulk:
+    """AdvancedCacheManager の mget / mset テスト"""
+
+    @pytest.mark.asyncio
+    async def test_mget_mset_keep_caller_keys_with_namespace(self):
+        manager = AdvancedCacheManager(CacheBackend.MEMORY)
+
+        stored = await manager.mset({'a': 1, 'b': 2}, namespace='translation')
+        found = await manager.mget(['a', 'b', 'c'], namespace='translation')
+
+        assert stored == {'a': True, 'b': True}
+        assert found == {'a': 1, 'b': 2}
+        assert await manager.backend.get('translation:a') == 1
+
+
+class TestSQLiteBulkOperations:
+    """SQLite 層（CacheManager）の一括操作テスト"""
+
+    def test_set_many_then_get_many_reads_database(self, tmp_path):
+        cache = CacheManager(FakeConfig(tmp_path))
+        items = {f'url_hash:{i}': f'https://example.com/{i}' for i in range(1200)}
+
+        assert cache.set_many(items, category='dedup')
+        cache._memory_cache.clear()
+
+        found = cache.get_many(list(items) + ['url_hash:missing'], 'dedup')
+
+        assert found == items
+        assert len(cache._memory_cache) == 1200
+        with cache.get_connection() as conn:
+            counts = {row[0] for row in conn.execute('SELECT access_count FROM cache')}
+        assert counts == {2}
+
+    def test_get_many_uses_memory_and_skips_expired_rows(self, tmp_path):
+        cache = CacheManager(FakeConfig(tmp_path))
+        cache.set('fresh', {'translated_text': 'こんにちは'})
+        cache.set_many({'stale': 'old'}, expire=-1)
+
+        assert cache.get_many(['fresh', 'stale']) == {'fresh': {'translated_text': 'こんにちは'}}
+        assert cache.get('stale') is None
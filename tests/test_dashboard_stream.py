@@ -0,0 +1,169 @@
+"""
+Dashboard Stream Tests
+ダッシュボードのメトリクス差分配信（tick ごとの1回のエンコード・遅いクライアントのまとめ送り・切断）のテスト
+"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.monitoring.dashboard import (
+    AlertData, ApplicationMetrics, ClientChannel, MetricsDeltaStream, SystemMetrics, WebSocketServer
+)
+
+
+class FakeWebSocket:
+    """送信したメッセージを記録する WebSocket（delay 秒かけて送信）"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.messages = []
+        self.closed = False
+        self.remote_address = ('127.0.0.1', 0)
+
+    async def send(self, message):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.messages.append(json.loads(message))
+
+    async def close(self):
+        self.closed = True
+
+    def deltas(self):
+        return [message for message in self.messages if message['type'] == 'metrics_delta']
+
+
+def metrics_at(index):
+    timestamp = datetime(2026, 10, 1, 9, 0) + timedelta(seconds=5 * index)
+    system = SystemMetrics(timestamp, 10.0 + index, 50.0, 1, 30.0, 1, 1024 * 1024 * index, 0, 100, [0.1, 0.1, 0.1])
+    app = ApplicationMetrics(timestamp, 2, 10, 9, 1, 1.5, 250.0, 5, 75.0)
+    return system, app
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestMetricsDeltaStream:
+    """差分メッセージ生成テスト"""
+
+    def test_delta_contains_only_new_points(self):
+        stream = MetricsDeltaStream()
+        for index in range(3):
+            stream.append(*metrics_at(index))
+
+        first = json.loads(stream.message_since(0))
+        delta = json.loads(stream.message_since(2))
+
+        assert first['reset'] and len(first['t']) == 3
+        assert not delta['reset'] and delta['seq'] == 3
+        assert delta['series']['cpu_percent'] == [12.0]
+        assert delta['series']['network_sent_mb'] == [2.0]
+        assert delta['current']['app_metrics']['cache_hit_rate'] == 75.0
+
+    def test_lagging_client_gets_reset_with_retained_points(self):
+        stream = MetricsDeltaStream(max_points=3)
+        for index in range(6):
+            stream.append(*metrics_at(index))
+
+        message = json.loads(stream.message_since(1))
+
+        assert message['reset']
+        assert message['series']['cpu_percent'] == [13.0, 14.0, 15.0]
+
+    def test_same_position_is_encoded_once_per_tick(self):
+        stream = MetricsDeltaStream()
+        stream.append(*metrics_at(0))
+        assert stream.message_since(0) is stream.message_since(0)
+        stream.append(*metrics_at(1))
+        stream.message_since(1)
+        assert stream.encode_count == 2
+
+
+class TestClientChannels:
+    """クライアント送信キューテスト"""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_encodes_once_for_all_clients(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        server = WebSocketServer()
+        clients = [FakeWebSocket() for _ in range(20)]
+        for client in clients:
+            await server.register_client(client)
+
+        for _ in range(3):
+            await server.broadcast_metrics_update()
+            await settle()
+
+        assert server.metrics_stream.encode_count == 3
+        assert all([delta['seq'] for delta in client.deltas()] == [1, 2, 3] for client in clients)
+        assert all(client.messages[0]['type'] == 'initial_data' for client in clients)
+
+        for client in clients:
+            await server.unregister_client(client)
+        assert server.channels == {}
+
+    @pytest.mark.asyncio
+    async def test_slow_client_receives_coalesced_delta(self):
+        stream = MetricsDeltaStream()
+        fast, slow = FakeWebSocket(), FakeWebSocket(delay=0.05)
+        channels = [ClientChannel(fast, stream), ClientChannel(slow, stream)]
+        for channel in channels:
+            channel.start()
+
+        for index in range(5):
+            stream.append(*metrics_at(index))
+            for channel in channels:
+                channel.notify()
+            await settle()
+        await asyncio.sleep(0.2)
+
+        assert [delta['seq'] for delta in fast.deltas()] == [1, 2, 3, 4, 5]
+        slow_deltas = slow.deltas()
+        assert len(slow_deltas) < 5 and slow_deltas[-1]['seq'] == 5
+        assert sum(len(delta['t']) for delta in slow_deltas) == 5
+        assert channels[1].coalesced_ticks > 0
+
+        for channel in channels:
+            await channel.stop()
+
+    @pytest.mark.asyncio
+    async def test_stalled_client_is_dropped_without_blocking_others(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        server = WebSocketServer()
+        server.send_timeout = 0.05
+        healthy, stalled = FakeWebSocket(), FakeWebSocket()
+        await server.register_client(healthy)
+        await server.register_client(stalled)
+        stalled.delay = 60
+
+        started = asyncio.get_running_loop().time()
+        await server.broadcast_metrics_update()
+        await server.broadcast_alert(AlertData('a1', datetime.now(), 'HIGH', 'system', 'CPU high', {}))
+        assert asyncio.get_running_loop().time() - started < 0.5
+        await asyncio.sleep(0.2)
+
+        assert stalled.closed and stalled not in server.clients
+        assert list(server.channels) == [healthy]
+        # アラートは溜まっているメトリクスより先に送る
+        assert [message['type'] for message in healthy.messages[1:]] == ['new_alert', 'metrics_delta']
+
+        await server.unregister_client(healthy)
+
+    @pytest.mark.asyncio
+    async def test_stop_finishes_while_sends_complete(self):
+        stream = MetricsDeltaStream()
+        channels = [ClientChannel(FakeWebSocket(), stream) for _ in range(10)]
+        for channel in channels:
+            channel.start()
+        stream.append(*metrics_at(0))
+        for channel in channels:
+            channel.notify()
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(asyncio.gather(*(channel.stop() for channel in channels)), timeout=1.0)
+
+        assert all(channel.closed for channel in channels)
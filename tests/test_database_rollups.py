@@ -0,0 +1,119 @@
+"""
+Database Rollup Tests
+日次集計テーブルのテスト
+"""
+
+import sqlite3
+import pytest
+from datetime import datetime
+
+from src.models.database import Database
+from src.models.article import Article
+
+
+class StubConfig:
+    """一時ディレクトリを使う設定スタブ"""
+
+    def __init__(self, root):
+        self.root = root
+
+    def get_storage_path(self, name):
+        return self.root / name
+
+    def get(self, *path, default=None):
+        return default
+
+
+def make_article(i, category, day, importance=5, sentiment='neutral', keywords=None):
+    return Article(
+        url=f"https://example.com/{i}",
+        title=f"Article {i}",
+        category=category,
+        importance_score=importance,
+        sentiment=sentiment,
+        keywords=keywords or [],
+        published_at=datetime(2025, 1, day, 9, 0)
+    )
+
+
+@pytest.fixture
+def database(tmp_path):
+    return Database(StubConfig(tmp_path))
+
+
+@pytest.fixture
+def articles():
+    return [
+        make_article(0, 'tech', 13, 9, 'positive', ['AI', 'cloud']),
+        make_article(1, 'tech', 13, 6, 'neutral', ['AI']),
+        make_article(2, 'security', 14, 10, 'negative', ['CVE', 'AI']),
+        make_article(3, None, 15, 4, 'neutral', ['economy']),
+        make_article(4, 'tech', 20, 7, 'positive', ['AI']),  # 期間外
+    ]
+
+
+WEEK = (datetime(2025, 1, 13), datetime(2025, 1, 19))
+
+
+class TestDailyRollups:
+    """日次集計テスト"""
+
+    def test_period_summary_from_rollups(self, database, articles):
+        database.save_articles(articles)
+        summary = database.get_period_summary(*WEEK)
+
+        assert summary['total_articles'] == 4
+        assert summary['avg_importance'] == pytest.approx(29 / 4)
+        assert summary['high_importance_count'] == 2
+        assert summary['urgent_count'] == 1
+        assert summary['sentiment_distribution'] == {'positive': 1, 'neutral': 2, 'negative': 1}
+        assert summary['daily_counts'] == {'2025-01-13': 2, '2025-01-14': 1, '2025-01-15': 1}
+        assert list(summary['categories']) == ['tech', 'security', '未分類']
+        assert summary['categories']['tech']['count'] == 2
+        assert summary['categories']['tech']['avg_importance'] == 7.5
+        assert summary['categories']['tech']['top_keywords'] == ['AI', 'cloud']
+        assert summary['top_keywords'][0] == ('AI', 3)
+
+    def test_rollups_are_incremental_and_skip_duplicates(self, database, articles):
+        database.save_articles(articles[:2])
+        database.save_articles(articles)
+        summary = database.get_period_summary(*WEEK)
+
+        assert summary['total_articles'] == 4
+        assert summary['categories']['tech']['count'] == 2
+
+    def test_rebuild_matches_incremental(self, database, articles):
+        # CVSS だけで緊急扱いの記事も、保存時・再構築時とも重要度で数える
+        cvss_only = Article(url="https://example.com/5", title="Article 5", category='security',
+                            importance_score=5, cvss_score=9.8, published_at=datetime(2025, 1, 14, 9, 0))
+        assert cvss_only.is_urgent
+
+        database.save_articles(articles + [cvss_only])
+        incremental = database.get_period_summary(*WEEK)
+
+        database.rebuild_daily_rollups()
+        rebuilt = database.get_period_summary(*WEEK)
+
+        assert incremental['urgent_count'] == 1
+        assert rebuilt == incremental
+
+    def test_existing_database_is_backfilled(self, tmp_path, database, articles):
+        database.save_articles(articles)
+        with sqlite3.connect(database.db_path) as conn:
+            conn.execute("DELETE FROM daily_category_rollup")
+            conn.execute("DELETE FROM daily_keyword_rollup")
+
+        reopened = Database(StubConfig(tmp_path))
+
+        assert reopened.get_period_summary(*WEEK)['total_articles'] == 4
+
+    def test_rebuild_counts_missing_sentiment_as_neutral(self, database):
+        with sqlite3.connect(database.db_path) as conn:
+            conn.execute(
+                "INSERT INTO articles (url, url_hash, title, category, published_at) "
+                "VALUES ('https://example.com/raw', 'raw', 'Raw', 'tech', '2025-01-14T08:00:00')")
+
+        database.rebuild_daily_rollups()
+
+        summary = database.get_period_summary(*WEEK)
+        assert summary['sentiment_distribution'] == {'positive': 0, 'neutral': 1, 'negative': 0}
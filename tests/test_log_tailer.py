@@ -0,0 +1,190 @@
+"""
+Log Tailer Tests
+ストリーミングログテイラーと増分ログ分析のテスト
+"""
+
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from src.monitoring.log_analyzer import LogAnalysisEngine, LogPatternDetector, _leading_literals
+from src.monitoring.log_tailer import LogTailer, parse_log_line
+
+
+def write_lines(path, lines, mode='a'):
+    with open(path, mode, encoding='utf-8') as f:
+        f.write(''.join(line + '\n' for line in lines))
+
+
+def read_all(tailer, db_path):
+    lines = [line for _, _, line in tailer.read_new_lines()]
+    with sqlite3.connect(db_path) as conn:
+        tailer.save(conn)
+    return lines
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    directory = tmp_path / 'logs'
+    directory.mkdir()
+    return directory
+
+
+@pytest.fixture
+def tailer_factory(log_dir, tmp_path):
+    db_path = tmp_path / 'checkpoints.db'
+
+    def factory(**kwargs):
+        tailer = LogTailer(log_dir, **kwargs)
+        with sqlite3.connect(db_path) as conn:
+            tailer.load(conn)
+        return tailer
+
+    return factory, db_path
+
+
+class TestLogLineParsing:
+    """ログ行パーステスト"""
+
+    def test_combined_pattern_handles_both_formats(self):
+        timestamp, level, module, message = parse_log_line(
+            '[2025-01-01 10:00:00,123] [error] [collectors.nhk] Fetch failed', 'app')
+        assert (timestamp, level, module, message) == (
+            datetime(2025, 1, 1, 10, 0, 0, 123000), 'ERROR', 'collectors.nhk', 'Fetch failed')
+
+        timestamp, level, module, message = parse_log_line('2025-01-01 10:00:00 WARNING main Slow', 'app')
+        assert (timestamp, level, module, message) == (datetime(2025, 1, 1, 10), 'WARNING', 'main', 'Slow')
+
+        _, level, module, message = parse_log_line('Traceback (most recent call last):', 'app')
+        assert (level, module, message) == ('INFO', 'app', 'Traceback (most recent call last):')
+
+    def test_prefilter_matches_individual_patterns(self):
+        detector = LogPatternDetector()
+        lines = ['GET /x HTTP/1.1" 404', 'Connection refused by host unreachable',
+                 'SQL syntax Error near timeout', 'all good', 'quota exceeded for API']
+
+        for line in lines:
+            expected = [pattern_id for pattern_id, pattern in detector.compiled_patterns.items()
+                        if pattern.search(line)]
+            assert detector.match_pattern_ids(line) == expected
+
+    def test_leading_literals(self):
+        assert _leading_literals(r'(Colou?r|SSL.*error)') == ('colo', 'ssl')
+        assert _leading_literals(r'HTTP/\d\.\d"\s+404') == ('http/',)
+        # 入れ子のグループやリテラルで始まらない分岐は常に正規表現で検索する
+        assert _leading_literals(r'(a(b|c)|d)') is None
+        assert _leading_literals(r'(\d+ms|slow)') is None
+
+
+class TestLogTailer:
+    """ストリーミング読み込みテスト"""
+
+    def test_reads_only_appended_lines_across_restarts(self, log_dir, tailer_factory):
+        factory, db_path = tailer_factory
+        log_file = log_dir / 'app.log'
+        write_lines(log_file, ['one', 'two'])
+
+        tailer = factory()
+        assert read_all(tailer, db_path) == ['one', 'two']
+        assert read_all(tailer, db_path) == []
+
+        write_lines(log_file, ['three'])
+        assert read_all(factory(), db_path) == ['three']
+
+    def test_rotation_keeps_position_by_inode(self, log_dir, tailer_factory):
+        factory, db_path = tailer_factory
+        log_file = log_dir / 'app.log'
+        write_lines(log_file, ['one', 'two'])
+        tailer = factory()
+        read_all(tailer, db_path)
+
+        # ローテーション直前の書き込み後にリネームし、新しいファイルへ書き込む
+        write_lines(log_file, ['three'])
+        log_file.rename(log_dir / 'app.log.1')
+        write_lines(log_file, ['four'])
+
+        assert sorted(read_all(tailer, db_path)) == ['four', 'three']
+        assert read_all(tailer, db_path) == []
+
+    def test_truncated_file_is_reread(self, log_dir, tailer_factory):
+        factory, db_path = tailer_factory
+        log_file = log_dir / 'app.log'
+        write_lines(log_file, ['first line', 'second line'])
+        tailer = factory()
+        read_all(tailer, db_path)
+
+        write_lines(log_file, ['new'], mode='w')
+        assert read_all(tailer, db_path) == ['new']
+
+    def test_partial_line_waits_for_newline(self, log_dir, tailer_factory):
+        factory, db_path = tailer_factory
+        log_file = log_dir / 'app.log'
+        tailer = factory(partial_line_grace=60)
+        with open(log_file, 'w', encoding='utf-8') as f:
+            f.write('complete\nhalf')
+
+        assert read_all(tailer, db_path) == ['complete']
+
+        with open(log_file, 'a', encoding='utf-8') as f:
+            f.write(' written\n')
+        assert read_all(tailer, db_path) == ['half written']
+
+    def test_discarded_read_is_repeated(self, log_dir, tailer_factory):
+        factory, db_path = tailer_factory
+        write_lines(log_dir / 'app.log', ['one'])
+        tailer = factory()
+
+        assert [line for _, _, line in tailer.read_new_lines()] == ['one']
+        tailer.discard()
+        assert read_all(tailer, db_path) == ['one']
+
+
+class TestIncrementalLogAnalysis:
+    """増分ログ分析テスト"""
+
+    @pytest.mark.asyncio
+    async def test_rollups_accumulate_only_new_lines(self, log_dir, tmp_path):
+        log_file = log_dir / 'app.log'
+        write_lines(log_file, [
+            '[2025-01-01 10:00:00,000] [INFO] [app.main] Started',
+            '[2025-01-01 10:05:00,000] [ERROR] [app.db] DatabaseError: locked',
+            '[2025-01-01 11:00:00,000] [ERROR] [app.db] DatabaseError: locked',
+        ])
+        db_path = tmp_path / 'logs.db'
+        engine = LogAnalysisEngine(str(log_dir), str(db_path))
+
+        results = await engine.analyze_logs()
+        assert results['summary']['total_entries'] == 3
+        assert results['summary']['new_entries'] == 3
+        assert results['patterns'] == []
+
+        write_lines(log_file, ['[2025-01-02 09:00:00,000] [ERROR] [app.db] DatabaseError: disk I/O took 1200ms'])
+        # 新しいエンジン（再起動相当）でもチェックポイントとロールアップを引き継ぐ
+        engine = LogAnalysisEngine(str(log_dir), str(db_path))
+        results = await engine.analyze_logs(log_levels=['ERROR'])
+
+        summary = results['summary']
+        assert (summary['total_entries'], summary['new_entries'], summary['error_entries']) == (3, 1, 3)
+        assert results['metrics']['top_error_modules'] == [('app.db', 3)]
+        assert results['metrics']['performance_metrics']['max_response_time'] == 1200.0
+        assert [p['pattern_id'] for p in results['patterns']] == ['database_error']
+        assert results['patterns'][0]['frequency'] == 3
+        assert results['patterns'][0]['first_seen'] == '2025-01-01T10:05:00'
+
+    @pytest.mark.asyncio
+    async def test_time_range_filters_rollups(self, log_dir, tmp_path):
+        write_lines(log_dir / 'app.log', [
+            '[2025-01-01 10:00:00,000] [INFO] [app] a',
+            '[2025-01-01 12:30:00,000] [ERROR] [app] b',
+            '[2025-01-01 14:00:00,000] [INFO] [app] c',
+        ])
+        engine = LogAnalysisEngine(str(log_dir), str(tmp_path / 'logs.db'))
+        await engine.analyze_logs()
+
+        results = await engine.analyze_logs(
+            time_range=(datetime(2025, 1, 1, 12, 45), datetime(2025, 1, 1, 13, 0)))
+
+        assert results['summary']['total_entries'] == 1
+        assert results['metrics']['error_rate_trend'] == [{
+            'timestamp': '2025-01-01T12:00:00', 'error_rate': 1.0, 'total_logs': 1, 'error_logs': 1}]
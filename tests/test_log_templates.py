@@ -0,0 +1,129 @@
+"""
+Log Template Tests
+Drain方式テンプレートマイナーのテスト
+"""
+
+import re
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from src.monitoring.log_analyzer import LogAnalysisEngine, LogEntry, LogPatternDetector
+from src.monitoring.log_templates import DrainTemplateMiner, template_regex
+
+
+class TestDrainTemplateMiner:
+    """テンプレートマイナーテスト"""
+
+    def test_variable_parts_become_wildcards(self):
+        miner = DrainTemplateMiner()
+        for user, ip in [('alice', '10.0.0.1'), ('bob', '10.0.0.2'), ('carol', '192.168.1.5')]:
+            template = miner.add(f'Login failed for {user} from {ip}')
+        miner.add('Timeout after 3000ms fetching feed')
+        miner.add('Timeout after 12ms fetching feed')
+
+        assert [(t.template, t.size) for t in miner.top_templates()] == [
+            ('Login failed for <*> from <*>', 3),
+            ('Timeout after <*> fetching feed', 2),
+        ]
+        assert template.examples[0] == 'Login failed for alice from 10.0.0.1'
+
+    def test_dissimilar_messages_stay_separate(self):
+        miner = DrainTemplateMiner()
+        first = miner.add('Database connection failed')
+        second = miner.add('Disk quota exceeded')
+
+        assert first.cluster_id != second.cluster_id
+        assert miner.add('Database connection failed').cluster_id == first.cluster_id
+
+    def test_template_count_is_bounded(self):
+        miner = DrainTemplateMiner(max_clusters=3)
+        for word in ['alpha', 'beta', 'gamma', 'delta']:
+            miner.add(f'{word} service crashed unexpectedly here now')
+
+        assert len(miner.templates) == 3
+        assert [t.template.split()[0] for t in miner.templates.values()] == ['beta', 'gamma', 'delta']
+
+    def test_restore_keeps_ids(self):
+        miner = DrainTemplateMiner()
+        miner.restore(7, 'Login failed for <*> from <*>', size=10)
+
+        template = miner.add('Login failed for dave from 10.0.0.9')
+
+        assert (template.cluster_id, template.size, miner.next_id) == (7, 11, 8)
+        assert re.fullmatch(template_regex(template.template), 'Login failed for eve from 10.1.1.1')
+
+    def test_mark_dirty_returns_templates_for_next_save(self):
+        miner = DrainTemplateMiner()
+        template = miner.add('Disk sda1 is full')
+        dirty = miner.pop_dirty()
+
+        miner.mark_dirty(dirty)
+
+        assert miner.pop_dirty() == [template]
+        assert miner.pop_dirty() == []
+
+
+class TestDynamicPatterns:
+    """動的パターン検出テスト"""
+
+    def test_detect_patterns_reports_templates(self):
+        entries = [
+            LogEntry(timestamp=datetime(2025, 1, 1, 10, minute), level='ERROR', module='app',
+                     message=f'Worker {minute} lost heartbeat', raw_line='')
+            for minute in range(4)
+        ]
+
+        patterns = LogPatternDetector().detect_patterns(entries)
+
+        assert [(p.pattern_id, p.frequency, p.description) for p in patterns] == [
+            ('dynamic_cluster_0', 4, '動的検出パターン: Worker <*> lost heartbeat')]
+        assert patterns[0].severity == 'CRITICAL'
+        assert patterns[0].last_seen == datetime(2025, 1, 1, 10, 3)
+
+    @pytest.mark.asyncio
+    async def test_engine_counts_templates_across_restarts(self, tmp_path):
+        log_dir = tmp_path / 'logs'
+        log_dir.mkdir()
+        log_file = log_dir / 'app.log'
+        db_path = str(tmp_path / 'logs.db')
+
+        def append(*tasks):
+            with open(log_file, 'a', encoding='utf-8') as f:
+                for task in tasks:
+                    f.write(f'[2025-01-01 10:00:00,000] [ERROR] [app] Task {task} exceeded retries\n')
+
+        append(1, 2)
+        await LogAnalysisEngine(str(log_dir), db_path).analyze_logs()
+        append(3)
+        results = await LogAnalysisEngine(str(log_dir), db_path).analyze_logs()
+
+        assert [(p['pattern_id'], p['frequency']) for p in results['patterns']] == [('dynamic_cluster_0', 3)]
+        assert results['patterns'][0]['regex_pattern'] == template_regex('Task <*> exceeded retries')
+
+    @pytest.mark.asyncio
+    async def test_failed_save_keeps_templates_dirty(self, tmp_path, monkeypatch):
+        log_dir = tmp_path / 'logs'
+        log_dir.mkdir()
+        log_file = log_dir / 'app.log'
+        log_file.write_text(
+            '[2025-01-01 10:00:00,000] [ERROR] [app] Task 1 exceeded retries\n', encoding='utf-8')
+        db_path = str(tmp_path / 'logs.db')
+        engine = LogAnalysisEngine(str(log_dir), db_path)
+
+        def locked(conn):
+            raise sqlite3.OperationalError('database is locked')
+
+        save = engine.tailer.save
+        monkeypatch.setattr(engine.tailer, 'save', locked)
+        with pytest.raises(sqlite3.OperationalError):
+            await engine.analyze_logs()
+        monkeypatch.setattr(engine.tailer, 'save', save)
+        # 再読込できない（ローテーションで消えた）場合も失敗分のテンプレートを保存する
+        log_file.unlink()
+        await engine.analyze_logs()
+
+        with sqlite3.connect(db_path) as conn:
+            stored = conn.execute('SELECT template, size FROM log_templates').fetchall()
+        assert stored == [('Task <*> exceeded retries', 1)]
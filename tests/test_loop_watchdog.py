@@ -0,0 +1,95 @@
+"""
+Event Loop Watchdog Tests
+イベントループ監視のテスト
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.utils.loop_watchdog import LoopWatchdog
+from src.utils.metrics import MetricsRegistry
+from src.utils.tracing import Tracer, trace_span
+
+
+def blocking_send(seconds):
+    time.sleep(seconds)
+
+
+class StubConfig:
+    """loop_watchdog セクションだけを持つ設定スタブ"""
+
+    def __init__(self, **section):
+        self.section = section
+
+    def get(self, *path, default=None):
+        if path[0] != 'loop_watchdog':
+            return default
+        return self.section.get(path[1], default)
+
+
+class TestLoopWatchdog:
+    """イベントループ監視テスト"""
+
+    @pytest.mark.asyncio
+    async def test_blocking_call_is_attributed_to_stage_and_site(self):
+        registry = MetricsRegistry()
+        with Tracer('unit'):
+            with LoopWatchdog(interval=0.01, block_threshold=0.05, registry=registry) as watchdog:
+                with trace_span('send', category='pipeline'):
+                    blocking_send(0.2)
+                await asyncio.sleep(0.05)
+
+        assert watchdog.block_count == 1
+        finding = watchdog.findings[0]
+        assert finding.stage == 'send'
+        assert finding.site.startswith('test_loop_watchdog.py:') and finding.site.endswith('blocking_send')
+        assert any('time.sleep' in line or 'blocking_send' in line for line in finding.stack)
+        assert finding.duration >= 0.1
+        assert finding.task is not None
+
+        assert registry.get('news_event_loop_blocks_total').labels(stage='send').value == 1
+        assert registry.get('news_event_loop_block_seconds').labels(stage='send').count == 1
+        summary = watchdog.summary()
+        assert summary['blocks'] == 1 and summary['max_lag'] >= 0.1
+        assert summary['by_stage']['send']['sites'] == {finding.site: 1}
+
+    @pytest.mark.asyncio
+    async def test_nested_span_category_is_used_as_stage(self):
+        with Tracer('unit'):
+            with LoopWatchdog(interval=0.01, block_threshold=0.05, registry=MetricsRegistry()) as watchdog:
+                with trace_span('render', category='pipeline'):
+                    with trace_span('pdf.wkhtmltopdf', category='render'):
+                        blocking_send(0.15)
+                await asyncio.sleep(0.03)
+
+        assert [(f.stage, f.span) for f in watchdog.findings] == [('render', 'pdf.wkhtmltopdf')]
+
+    @pytest.mark.asyncio
+    async def test_awaiting_does_not_count_as_blocking(self):
+        registry = MetricsRegistry()
+        with LoopWatchdog(interval=0.01, block_threshold=0.05, registry=registry) as watchdog:
+            for _ in range(10):
+                await asyncio.sleep(0.02)
+
+        assert watchdog.block_count == 0
+        assert registry.get('news_event_loop_lag_seconds').labels().count >= 5
+        assert watchdog.summary()['by_stage'] == {}
+
+    @pytest.mark.asyncio
+    async def test_stall_at_stop_is_recorded_without_trace(self):
+        watchdog = LoopWatchdog(interval=0.01, block_threshold=0.05, registry=MetricsRegistry()).start()
+        await asyncio.sleep(0.02)
+        blocking_send(0.15)
+        watchdog.stop()
+
+        assert watchdog.block_count == 1
+        assert watchdog.findings[0].stage == 'unknown'
+        assert watchdog.findings[0].to_dict()['duration'] > 0
+
+    def test_from_config(self):
+        watchdog = LoopWatchdog.from_config(StubConfig(interval_ms=20, block_threshold_ms=250))
+
+        assert (watchdog.interval, watchdog.block_threshold) == (0.02, 0.25)
+        assert LoopWatchdog.from_config(StubConfig(enabled=False)) is None
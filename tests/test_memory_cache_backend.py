@@ -0,0 +1,116 @@
+"""
+Memory Cache Backend Tests
+インメモリキャッシュ（削除方針・サイズ管理）のテスト
+"""
+
+import pytest
+
+from src.utils.cache_manager_advanced import (
+    LFUEvictionIndex, LRUEvictionIndex, MemoryCacheBackend, estimate_size
+)
+
+
+class TestEvictionIndexes:
+    """削除方針の索引テスト"""
+
+    def test_lru_victim_is_least_recently_touched(self):
+        index = LRUEvictionIndex()
+        for key in ('a', 'b', 'c'):
+            index.add(key)
+        index.touch('a')
+        assert index.victim() == 'b'
+        index.remove('b')
+        assert index.victim() == 'c'
+        assert len(index) == 2
+
+    def test_lfu_victim_is_least_frequent_then_oldest(self):
+        index = LFUEvictionIndex()
+        for key in ('a', 'b', 'c'):
+            index.add(key)
+        index.touch('a')
+        index.touch('b')
+        assert index.victim() == 'c'
+
+        index.remove('c')
+        assert index.victim() == 'a'
+        index.touch('a')
+        assert index.victim() == 'b'
+        index.add('d')
+        assert index.victim() == 'd'
+
+
+class TestMemoryCacheBackend:
+    """インメモリキャッシュテスト"""
+
+    @pytest.mark.asyncio
+    async def test_lru_evicts_least_recently_used(self):
+        cache = MemoryCacheBackend(max_size=3)
+        for key in ('a', 'b', 'c'):
+            await cache.set(key, key.upper())
+        assert await cache.get('a') == 'A'
+
+        await cache.set('d', 'D')
+
+        assert await cache.get('b') is None
+        assert [await cache.get(key) for key in ('a', 'c', 'd')] == ['A', 'C', 'D']
+        stats = await cache.get_stats()
+        assert stats['evictions'] == 1 and stats['total_entries'] == 3
+
+    @pytest.mark.asyncio
+    async def test_fifo_ignores_access_order(self):
+        cache = MemoryCacheBackend(max_size=2, eviction_policy='fifo')
+        await cache.set('a', 1)
+        await cache.set('b', 2)
+        await cache.get('a')
+        await cache.set('c', 3)
+
+        assert await cache.get('a') is None
+        assert await cache.get('b') == 2
+
+    @pytest.mark.asyncio
+    async def test_lfu_keeps_frequently_read_entries(self):
+        cache = MemoryCacheBackend(max_size=2, eviction_policy='lfu')
+        await cache.set('analysis', 'hot')
+        for _ in range(3):
+            await cache.get('analysis')
+        await cache.set('headline:1', 'once')
+        await cache.set('headline:2', 'once')
+
+        assert await cache.get('analysis') == 'hot'
+        assert await cache.get('headline:1') is None
+
+    @pytest.mark.asyncio
+    async def test_overwrite_does_not_evict_and_keeps_size_accounting(self):
+        cache = MemoryCacheBackend(max_size=2)
+        await cache.set('a', 'x' * 100)
+        await cache.set('b', 'y')
+        await cache.set('a', 'short')
+
+        assert await cache.get('b') == 'y'
+        stats = await cache.get_stats()
+        assert stats['evictions'] == 0
+        assert stats['memory_usage'] == estimate_size('short') + estimate_size('y')
+
+        await cache.delete('a')
+        await cache.delete('b')
+        assert (await cache.get_stats())['memory_usage'] == 0
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_removed_on_read(self):
+        cache = MemoryCacheBackend(max_size=10)
+        await cache.set('stale', 'value', ttl=0.001)
+        cache.cache['stale'].created_at -= 10
+
+        assert await cache.get('stale') is None
+        assert 'stale' not in cache.cache
+        assert len(cache.eviction_index) == 0
+
+    def test_unknown_policy_is_rejected(self):
+        with pytest.raises(ValueError):
+            MemoryCacheBackend(eviction_policy='random')
+
+    def test_estimate_size_scales_with_container_length(self):
+        small = estimate_size([{'title': 'a' * 50}] * 10)
+        large = estimate_size([{'title': 'a' * 50}] * 1000)
+        assert large > small * 50
+        assert estimate_size('abc') < estimate_size('abc' * 100)
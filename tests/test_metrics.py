@@ -0,0 +1,144 @@
+"""
+Metrics Registry Tests
+メトリクスレジストリのテスト
+"""
+
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.metrics import (
+    MetricsRegistry, get_metrics_registry, stage_latency_histogram
+)
+
+
+class TestMetricsRegistry:
+    """レジストリテスト"""
+
+    def test_counter_sums_across_threads(self):
+        counter = MetricsRegistry().counter('jobs_total', 'Jobs', ('stage',))
+        child = counter.labels('collect')
+
+        def work():
+            for _ in range(1000):
+                child.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert child.value == 8000
+        assert counter.labels(stage='collect') is child
+        with pytest.raises(ValueError):
+            child.inc(-1)
+
+    def test_gauge_set_and_delta(self):
+        gauge = MetricsRegistry().gauge('queue_depth')
+        gauge.inc(5)
+        gauge.set(2)
+        gauge.dec()
+
+        assert gauge.labels().value == 1
+
+    def test_histogram_quantiles_and_prometheus_text(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram('latency_seconds', 'Latency', ('stage', 'service'),
+                                       buckets=(0.1, 0.5, 1.0))
+        child = histogram.labels('translate', 'deepl')
+        for value in [0.05, 0.2, 0.3, 0.4, 2.0]:
+            child.observe(value)
+
+        assert (child.count, child.sum) == (5, pytest.approx(2.95))
+        assert child.quantile(0.5) == pytest.approx(0.1 + 0.4 * 1.5 / 3)
+        assert child.quantile(1.0) == 2.0
+
+        text = registry.to_prometheus()
+        assert '# TYPE latency_seconds histogram' in text
+        assert 'latency_seconds_bucket{stage="translate",service="deepl",le="0.5"} 4' in text
+        assert 'latency_seconds_bucket{stage="translate",service="deepl",le="+Inf"} 5' in text
+        assert 'latency_seconds_count{stage="translate",service="deepl"} 5' in text
+
+        sample = registry.snapshot()['metrics']['latency_seconds']['samples'][0]
+        assert (sample['labels'], sample['count'], sample['max']) == (
+            {'stage': 'translate', 'service': 'deepl'}, 5, 2.0)
+
+    def test_label_values_are_normalised_and_escaped(self):
+        registry = MetricsRegistry()
+        counter = registry.counter('http_total', labelnames=('code',))
+        counter.labels(200).inc()
+        counter.labels('200').inc()
+        registry.counter('odd_total', labelnames=('name',)).labels('a"b\nc').inc()
+
+        assert counter.labels(200).value == 2
+        assert 'odd_total{name="a\\"b\\nc"} 1' in registry.to_prometheus()
+
+    def test_conflicting_registration_is_rejected(self):
+        registry = MetricsRegistry()
+        registry.counter('events_total', labelnames=('stage',))
+
+        assert registry.counter('events_total', labelnames=('stage',)) is registry.get('events_total')
+        with pytest.raises(ValueError):
+            registry.gauge('events_total', labelnames=('stage',))
+        with pytest.raises(ValueError):
+            registry.counter('events_total', labelnames=('service',))
+        with pytest.raises(ValueError):
+            registry.get('events_total').labels('a', 'b')
+
+    def test_registry_is_shared_between_import_paths(self):
+        src_dir = str(Path(__file__).parent.parent / 'src')
+        sys.path.insert(0, src_dir)
+        try:
+            from utils.metrics import get_metrics_registry as top_level_registry
+        finally:
+            sys.path.remove(src_dir)
+
+        assert top_level_registry() is get_metrics_registry()
+
+
+class TestRewiredMonitors:
+    """既存モジュールからの記録テスト"""
+
+    def test_application_metrics_collector_records_into_registry(self):
+        from src.monitoring.performance_monitor import ApplicationMetricsCollector
+
+        registry = MetricsRegistry()
+        collector = ApplicationMetricsCollector(registry)
+        collector.increment('active_tasks')
+        collector.increment('completed_tasks', 3)
+        collector.set_value('active_tasks', 4)
+
+        metrics = collector.get_current_metrics()
+        assert (metrics.active_tasks, metrics.completed_tasks) == (4, 3)
+        assert 'news_app_events_total{metric="completed_tasks"} 3' in registry.to_prometheus()
+
+    def test_measure_operation_records_without_cpu_sampling(self):
+        from src.utils.performance_monitor import PerformanceMonitor
+
+        monitor = PerformanceMonitor()
+        child = stage_latency_histogram().labels('unit_test_operation', 'app')
+        before = child.count
+
+        with patch('psutil.cpu_percent') as cpu_percent:
+            with monitor.measure_operation('unit_test_operation'):
+                pass
+            with pytest.raises(RuntimeError):
+                with monitor.measure_operation('unit_test_operation'):
+                    raise RuntimeError('boom')
+
+        cpu_percent.assert_not_called()
+        assert child.count == before + 2
+        results = get_metrics_registry().get('news_operations_total')
+        assert results.labels('unit_test_operation', 'failure').value >= 1
+
+    def test_performance_monitor_history_is_bounded(self):
+        from src.utils.performance_monitor import PerformanceMonitor
+
+        monitor = PerformanceMonitor()
+        assert monitor.max_history_size == 1000
+        assert monitor.metrics_history.maxlen == 1000
+        assert monitor.system_monitor_interval == 60
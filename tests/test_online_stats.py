@@ -0,0 +1,111 @@
+"""
+Online Statistics Tests
+逐次統計（ウィンドウの平均・分散・傾き、EWMA、P² 分位点）と動的閾値管理での利用のテスト
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.monitoring.alert_system import DynamicThresholdManager, ThresholdConfig
+from src.utils.online_stats import (
+    EWMA, P2Quantile, StreamingStatistics, WindowedMoments, WindowedQuantile
+)
+
+
+class TestOnlineEstimators:
+    """逐次推定器テスト"""
+
+    def test_windowed_moments_match_numpy_after_eviction(self):
+        rng = random.Random(7)
+        moments = WindowedMoments(window=50)
+        values = [rng.gauss(100, 15) + index * 0.3 for index in range(333)]
+        for value in values:
+            moments.add(value)
+
+        window = values[-50:]
+        assert moments.count == 50
+        assert moments.mean == pytest.approx(np.mean(window))
+        assert moments.std == pytest.approx(np.std(window))
+        assert moments.slope == pytest.approx(np.polyfit(np.arange(50), window, 1)[0])
+
+    def test_ewma_tracks_level_shift(self):
+        ewma = EWMA(alpha=0.5)
+        for value in [10.0] * 5 + [20.0] * 10:
+            ewma.add(value)
+
+        assert ewma.mean == pytest.approx(20.0, abs=0.01)
+        assert ewma.std < 1.0
+
+    def test_p2_quantile_estimate(self):
+        rng = random.Random(3)
+        values = [rng.gauss(50, 10) for _ in range(5000)]
+        quantile = P2Quantile(0.975)
+        for value in values:
+            quantile.add(value)
+
+        assert quantile.value == pytest.approx(np.percentile(values, 97.5), rel=0.02)
+
+    def test_windowed_quantile_follows_level_shift(self):
+        rng = random.Random(5)
+        quantile = WindowedQuantile(0.975, window=200)
+        for _ in range(1000):
+            quantile.add(rng.gauss(100, 5))
+        recent = [rng.gauss(20, 5) for _ in range(300)]
+        for value in recent:
+            quantile.add(value)
+
+        assert 100 <= quantile.count <= 200
+        assert quantile.value == pytest.approx(np.percentile(recent, 97.5), abs=3)
+
+    def test_small_samples(self):
+        stats = StreamingStatistics(window=10)
+        assert stats.snapshot()['ewma'] is None and stats.quantile.value is None
+        for value in (3.0, 1.0, 2.0):
+            stats.add(value)
+
+        snapshot = stats.snapshot()
+        assert snapshot['count'] == 3 and snapshot['mean'] == pytest.approx(2.0)
+        assert snapshot['p97.5'] == 3.0
+
+
+class TestDynamicThresholdStatistics:
+    """動的閾値の逐次統計による更新テスト"""
+
+    def test_threshold_uses_streaming_statistics(self, tmp_path):
+        manager = DynamicThresholdManager(db_path=str(tmp_path / "thresholds.db"))
+        manager.register_threshold(ThresholdConfig(metric_name="cpu_percent", base_threshold=80.0,
+                                                   min_threshold=40.0, max_threshold=95.0))
+        rng = random.Random(11)
+        started = datetime(2026, 10, 1, 9, 0)
+        values = [rng.gauss(50, 3) for _ in range(200)]
+        for index, value in enumerate(values):
+            manager.add_metric_value("cpu_percent", value, started + timedelta(minutes=index))
+
+        stats = manager.get_statistics("cpu_percent")
+        assert stats['count'] == 200
+        assert stats['mean'] == pytest.approx(np.mean(values))
+
+        # 平均 + 2σ・トレンド（変化なしなら現在の閾値）・97.5% 分位点の中央値
+        threshold = manager.get_threshold("cpu_percent")
+        assert 50 < threshold < 65
+        assert manager.is_anomaly("cpu_percent", 70.0)
+        assert not manager.is_anomaly("cpu_percent", 50.0)
+
+    def test_threshold_follows_shifted_distribution(self, tmp_path):
+        manager = DynamicThresholdManager(db_path=str(tmp_path / "thresholds.db"))
+        manager.register_threshold(ThresholdConfig(metric_name="latency_ms", base_threshold=90.0,
+                                                   min_threshold=10.0, max_threshold=200.0))
+        rng = random.Random(13)
+        started = datetime(2026, 10, 1, 9, 0)
+        values = [rng.gauss(80, 3) for _ in range(1000)] + [rng.gauss(40, 3) for _ in range(2000)]
+        for index, value in enumerate(values):
+            manager.add_metric_value("latency_ms", value, started + timedelta(minutes=index))
+
+        # 分位点も平均・分散と同じく直近ウィンドウだけを反映する
+        stats = manager.get_statistics("latency_ms")
+        assert stats['p97.5'] == pytest.approx(np.percentile(values[-1000:], 97.5), abs=2)
+        assert manager.get_threshold("latency_ms") < 50
+        assert manager.is_anomaly("latency_ms", 60.0)
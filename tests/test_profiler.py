@@ -0,0 +1,131 @@
+"""
+Sampling Profiler Tests
+サンプリング・プロファイラーのテスト
+"""
+
+import asyncio
+import os
+import signal
+import time
+
+import pytest
+
+from src.utils import profiler as profiler_module
+from src.utils.profiler import RunProfiler, SamplingProfiler, install_signal_trigger, request_profiling
+
+
+def busy_loop(seconds):
+    deadline = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < deadline:
+        total += 1
+    return total
+
+
+class FakeConfig:
+    def __init__(self, **profiling):
+        self.profiling = profiling
+
+    def get(self, *path, default=None):
+        if path[0] != 'profiling':
+            return default
+        return self.profiling.get(path[1], default)
+
+
+@pytest.fixture(autouse=True)
+def clear_request():
+    profiler_module._requested.clear()
+    yield
+    profiler_module._requested.clear()
+
+
+class TestSamplingProfiler:
+    """プロファイラーテスト"""
+
+    def test_samples_are_split_by_stage(self, tmp_path):
+        with SamplingProfiler(interval=0.002, sample_tasks=False) as profiler:
+            first_start = time.perf_counter_ns()
+            busy_loop(0.1)
+            first_end = second_start = time.perf_counter_ns()
+            busy_loop(0.1)
+            second_end = time.perf_counter_ns()
+
+        stages = [('collect', first_start, first_end), ('render', second_start, second_end)]
+        collapsed = profiler.collapsed(stages)
+        for stage in ('collect', 'render'):
+            stacks = collapsed[stage]['threads']
+            busy = [stack for stack in stacks if 'busy_loop (test_profiler.py:' in stack]
+            assert busy and all(stack.startswith('MainThread;') for stack in busy)
+
+        files = {path.name for path in profiler.write_collapsed(tmp_path, stages)}
+        assert {'collect.folded', 'render.folded', 'all.folded'} <= files
+        line = (tmp_path / 'all.folded').read_text(encoding='utf-8').splitlines()[0]
+        stack, count = line.rsplit(' ', 1)
+        assert stack.split(';')[0] in ('collect', 'render', 'other')
+        assert int(count) >= 1
+
+    @pytest.mark.asyncio
+    async def test_waiting_tasks_are_sampled(self):
+        async def wait_for_response():
+            await asyncio.sleep(0.2)
+
+        task = asyncio.create_task(wait_for_response(), name='fetch')
+        with SamplingProfiler(interval=0.005) as profiler:
+            await asyncio.sleep(0.1)
+        await task
+
+        tasks = profiler.collapsed()['run']['tasks']
+        assert any(stack.startswith('task:fetch;') and 'wait_for_response' in stack and
+                   stack.endswith('[await]') for stack in tasks)
+
+    def test_interval_backs_off_when_overhead_exceeds_cap(self):
+        with SamplingProfiler(interval=0.001, max_overhead=1e-9, max_interval=0.016,
+                              sample_tasks=False) as profiler:
+            busy_loop(0.2)
+
+        assert profiler.interval == 0.016
+        weights = [weight for _, _, _, weight in profiler.samples]
+        assert max(weights) > 1
+        assert profiler.stats()['samples'] == profiler.sample_count
+
+    def test_sample_limit_counts_dropped(self):
+        profiler = SamplingProfiler(sample_tasks=False, max_samples=2)
+        for _ in range(3):
+            profiler.sample()
+
+        assert len(profiler.samples) == 2
+        assert profiler.dropped_samples >= 1
+
+
+class TestRunProfiler:
+    """実行単位の有効化テスト"""
+
+    def test_disabled_by_default(self):
+        with RunProfiler(FakeConfig(), 'unit') as run:
+            busy_loop(0.01)
+        assert run.profiler is None
+        assert run.write() is None
+
+    def test_config_enables_sampling(self):
+        with RunProfiler(FakeConfig(enabled=True, interval_ms=2, sample_tasks=False), 'unit') as run:
+            busy_loop(0.05)
+        assert not run.profiler.running
+        assert run.profiler.sample_count > 0
+
+    @pytest.mark.skipif(not hasattr(signal, 'SIGUSR1'), reason='requires SIGUSR1')
+    def test_signal_starts_sampling_mid_run_and_arms_next_run(self):
+        previous = signal.getsignal(signal.SIGUSR1)
+        try:
+            assert install_signal_trigger()
+            with RunProfiler(FakeConfig(interval_ms=2, sample_tasks=False), 'unit') as run:
+                assert run.profiler is None
+                os.kill(os.getpid(), signal.SIGUSR1)
+                busy_loop(0.05)
+            assert run.profiler.sample_count > 0
+
+            request_profiling()
+            with RunProfiler(FakeConfig(interval_ms=2, sample_tasks=False), 'unit') as next_run:
+                busy_loop(0.01)
+            assert next_run.profiler is not None
+        finally:
+            signal.signal(signal.SIGUSR1, previous)
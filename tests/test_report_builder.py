@@ -0,0 +1,164 @@
+"""
+Report Builder Tests
+レポートビルドステージのテスト
+"""
+
+import re
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from unittest.mock import Mock
+
+from src.generators.report_builder import _HASH_FIELDS, ReportBuilder, compute_content_hash
+from src.models.article import Article
+
+
+class StubConfig:
+    """最小限の設定スタブ"""
+
+    def get(self, *path, default=None):
+        return default
+
+
+class CountingHTMLGenerator:
+    """レンダリング回数を記録するHTMLジェネレーター"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_daily_report(self, articles, report_date=None):
+        self.calls += 1
+        return f"<html>{len(articles)} articles</html>"
+
+
+def make_pdf_generator(tmp_path, pdf_bytes=b'%PDF-1.4 test'):
+    generator = Mock()
+    generator.wkhtmltopdf_path = '/usr/bin/wkhtmltopdf'
+    generator.output_dir = tmp_path / 'reports'
+    generator.render_pdf_bytes.return_value = pdf_bytes
+    return generator
+
+
+@pytest.fixture
+def articles():
+    return [
+        Article(url=f"https://example.com/{i}", title=f"Article {i}", importance_score=i % 10 + 1)
+        for i in range(5)
+    ]
+
+
+REPORT_DATE = datetime(2025, 1, 15, 7, 0)
+
+
+class TestContentHash:
+    """コンテンツハッシュテスト"""
+
+    def test_hash_is_stable(self, articles):
+        assert compute_content_hash(articles) == compute_content_hash(list(articles))
+
+    def test_hash_changes_with_content(self, articles):
+        before = compute_content_hash(articles)
+        articles[0].summary = "updated summary"
+        assert compute_content_hash(articles) != before
+
+    def test_hash_changes_with_article_body(self, articles):
+        before = compute_content_hash(articles)
+        articles[0].content = "updated body"
+        assert compute_content_hash(articles) != before
+
+    def test_hash_covers_template_fields(self):
+        # テンプレートが表示する記事属性が変われば、キャッシュ済みの生成物を使わない
+        source = (Path(__file__).parent.parent / 'src' / 'generators' / 'html_generator.py').read_text(encoding='utf-8')
+        rendered_fields = set(re.findall(r'\barticle\.(\w+)', source))
+
+        assert rendered_fields and rendered_fields <= set(_HASH_FIELDS)
+
+    def test_hash_includes_report_date(self, articles):
+        other_date = datetime(2025, 1, 16, 7, 0)
+        assert (compute_content_hash(articles, report_date=REPORT_DATE) !=
+                compute_content_hash(articles, report_date=other_date))
+
+
+class TestReportBuilder:
+    """ReportBuilderテスト"""
+
+    def test_single_render_per_format(self, tmp_path, articles):
+        html_generator = CountingHTMLGenerator()
+        pdf_generator = make_pdf_generator(tmp_path)
+        builder = ReportBuilder(StubConfig(), html_generator, pdf_generator,
+                                cache_dir=tmp_path / 'cache')
+
+        report = builder.build_daily_report(articles, REPORT_DATE)
+
+        assert html_generator.calls == 1
+        pdf_generator.render_pdf_bytes.assert_called_once_with(report.html_content)
+        assert report.pdf_bytes == b'%PDF-1.4 test'
+        assert report.pdf_path.endswith('daily_news_report_20250115.pdf')
+        assert not report.cache_hit
+
+    def test_retry_reuses_artifacts(self, tmp_path, articles):
+        html_generator = CountingHTMLGenerator()
+        pdf_generator = make_pdf_generator(tmp_path)
+        builder = ReportBuilder(StubConfig(), html_generator, pdf_generator,
+                                cache_dir=tmp_path / 'cache')
+
+        first = builder.build_daily_report(articles, REPORT_DATE)
+        second = builder.build_daily_report(articles, REPORT_DATE)
+
+        assert second.cache_hit
+        assert second.content_hash == first.content_hash
+        assert html_generator.calls == 1
+        assert pdf_generator.render_pdf_bytes.call_count == 1
+        assert builder.get_build_statistics()['memory_hits'] == 1
+
+    def test_disk_cache_survives_new_builder(self, tmp_path, articles):
+        cache_dir = tmp_path / 'cache'
+        ReportBuilder(StubConfig(), CountingHTMLGenerator(), make_pdf_generator(tmp_path),
+                      cache_dir=cache_dir).build_daily_report(articles, REPORT_DATE)
+
+        html_generator = CountingHTMLGenerator()
+        builder = ReportBuilder(StubConfig(), html_generator, make_pdf_generator(tmp_path),
+                                cache_dir=cache_dir)
+        report = builder.build_daily_report(articles, REPORT_DATE)
+
+        assert report.cache_hit
+        assert report.pdf_bytes == b'%PDF-1.4 test'
+        assert html_generator.calls == 0
+        assert builder.get_build_statistics()['disk_hits'] == 1
+
+    def test_failed_pdf_is_retried(self, tmp_path, articles):
+        html_generator = CountingHTMLGenerator()
+        pdf_generator = make_pdf_generator(tmp_path, pdf_bytes=None)
+        builder = ReportBuilder(StubConfig(), html_generator, pdf_generator,
+                                cache_dir=tmp_path / 'cache')
+
+        builder.build_daily_report(articles, REPORT_DATE)
+        pdf_generator.render_pdf_bytes.return_value = b'%PDF-1.4 retry'
+        report = builder.build_daily_report(articles, REPORT_DATE)
+
+        assert report.pdf_bytes == b'%PDF-1.4 retry'
+        assert pdf_generator.render_pdf_bytes.call_count == 2
+
+    def test_html_only_without_wkhtmltopdf(self, tmp_path, articles):
+        html_generator = CountingHTMLGenerator()
+        builder = ReportBuilder(StubConfig(), html_generator, None,
+                                cache_dir=tmp_path / 'cache')
+
+        builder.build_daily_report(articles, REPORT_DATE)
+        report = builder.build_daily_report(articles, REPORT_DATE)
+
+        assert report.cache_hit
+        assert report.pdf_bytes is None
+        assert report.paths == {}
+        assert html_generator.calls == 1
+
+    def test_eviction_keeps_recent_builds(self, tmp_path, articles):
+        builder = ReportBuilder(StubConfig(), CountingHTMLGenerator(), None,
+                                cache_dir=tmp_path / 'cache', max_cached_builds=2)
+
+        for i in range(4):
+            builder.build_daily_report(articles[:i + 1], REPORT_DATE)
+
+        entries = [p for p in (tmp_path / 'cache').iterdir() if p.is_dir()]
+        assert len(entries) == 2
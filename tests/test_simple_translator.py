@@ -0,0 +1,48 @@
+"""
+Simple Translator Tests
+簡易翻訳（コンパイル済み辞書）のテスト
+"""
+
+from src.utils.simple_translator import SimpleTranslator
+
+
+class TestSimpleTranslator:
+    """簡易翻訳テスト"""
+
+    def test_phrases_numbers_and_calendar_in_one_pass(self):
+        result = SimpleTranslator.translate_text(
+            'Breaking News: US Market rises 5% on Monday after $3 billion deal in May')
+
+        assert result == '速報: 米国 市場 rises 5％ on 月曜日 after 3ドル億 deal in 5月'
+
+    def test_phrases_respect_word_boundaries_and_case(self):
+        assert SimpleTranslator.translate_text('latest news from JAPAN') == '最新ニュース from 日本'
+        # 単語の一部には一致しない
+        assert 'Hacker' in SimpleTranslator.translate_text('Hacker group targets Japan')
+
+    def test_longest_phrase_wins(self):
+        assert SimpleTranslator.translate_text('Data breach in Japan') == 'データ侵害 in 日本'
+        assert SimpleTranslator.translate_text('Global warming hits Global Market') == '地球温暖化 hits グローバル 市場'
+
+    def test_plain_numbers_are_untouched(self):
+        assert SimpleTranslator.translate_text('Japan Economy 2025') == '日本 経済 2025'
+
+    def test_mostly_english_text_is_summarised(self):
+        result = SimpleTranslator.translate_text('Apple shoots up 10% after announced IPO')
+
+        assert result == 'Apple、10％、IPOに関する記事'
+
+    def test_batch_matches_single_translation(self):
+        texts = ['Security update for Japan', '', 'Security update for Japan', 'Election in UK']
+
+        results = SimpleTranslator.translate_texts(texts, max_length=100)
+
+        assert results == [SimpleTranslator.translate_text(t, max_length=100) for t in texts]
+
+    def test_create_summaries(self):
+        items = [('Japan Economy', 'Global Market. Second sentence\nSecond line'), ('', ''), ('Japan', None)]
+
+        summaries = SimpleTranslator.create_summaries(items)
+
+        assert summaries == ['日本 経済。グローバル 市場', '記事の要約を生成できませんでした。', '日本']
+        assert SimpleTranslator.create_summary(*items[0]) == summaries[0]
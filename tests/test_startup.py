@@ -0,0 +1,39 @@
+"""
+Startup Tests
+起動時の遅延読み込みテスト
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+
+
+def loaded_modules(code: str):
+    """新しいインタプリタでコードを実行し、読み込まれたモジュール名を返す"""
+    completed = subprocess.run(
+        [sys.executable, '-c', code + '\nimport json, sys; print(json.dumps(sorted(sys.modules)))'],
+        cwd=SRC_DIR, capture_output=True, text=True, check=True
+    )
+    return set(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+
+class TestLazyStartup:
+    """起動時間テスト"""
+
+    def test_main_import_skips_heavy_subsystems(self):
+        modules = loaded_modules('import main')
+
+        for heavy in ('anthropic', 'jinja2', 'aiohttp', 'collectors.base_collector',
+                      'processors.analyzer', 'utils.monitoring_system'):
+            assert heavy not in modules
+
+    def test_package_exports_load_on_first_use(self):
+        modules = loaded_modules('import processors.deduplicator\n'
+                                 'from generators import ArticleColumns')
+
+        assert 'processors.analyzer' not in modules
+        assert 'generators.html_generator' not in modules
+        assert 'generators.article_columns' in modules
@@ -0,0 +1,126 @@
+"""
+Time Series Store Tests
+時系列ストア（追記・分/時/日集計・保持期間）と収集分析での利用のテスト
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.collectors import collection_analytics
+from src.collectors.collection_analytics import CollectionAnalytics, CollectionMetrics
+from src.utils.timeseries_store import TimeSeriesStore
+
+
+class StubConfig:
+    """一時ディレクトリを使う設定スタブ"""
+
+    def __init__(self, root):
+        self.root = root
+
+    def get_storage_path(self, name):
+        return self.root / name
+
+    def get(self, *path, default=None):
+        return default
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TimeSeriesStore(tmp_path / 'metrics.db', 'collection', ('articles', 'latency'))
+
+
+def make_metrics(timestamp, total, success_rate=95.0, sources=None):
+    return CollectionMetrics(
+        timestamp=timestamp.isoformat(), total_articles=total,
+        articles_by_source=sources or {'newsapi': total}, articles_by_category={'tech': total},
+        articles_by_language={'en': total}, processing_time=total / 10, success_rate=success_rate,
+        duplicate_rate=5.0, average_importance=6.5, urgent_articles=1, errors=[]
+    )
+
+
+class TestTimeSeriesStore:
+    """時系列ストアテスト"""
+
+    def test_rollups_aggregate_each_resolution(self, store):
+        base = datetime(2026, 10, 1, 9, 15, 30)
+        store.append(base, {'articles': 10, 'latency': 2.0}, {'run': 1})
+        store.append(base + timedelta(seconds=20), {'articles': 30, 'latency': 1.0}, {'run': 2})
+        store.append(base + timedelta(hours=2), {'articles': 20, 'latency': None}, {'run': 3})
+
+        minutes = store.rollups('minute', base, base + timedelta(days=1))
+        hours = store.rollups('hour', base, base + timedelta(days=1))
+        (day,) = store.rollups('day', base, base + timedelta(days=1))
+
+        assert [bucket['count'] for bucket in minutes] == [2, 1]
+        assert [bucket['bucket'] for bucket in hours] == [datetime(2026, 10, 1, 9), datetime(2026, 10, 1, 11)]
+        assert day['bucket'] == datetime(2026, 10, 1)
+        assert day['articles'] == {'sum': 60, 'min': 10, 'max': 30, 'last': 20, 'mean': 20}
+        assert (day['latency']['min'], day['latency']['max'], day['latency']['last']) == (1.0, 2.0, None)
+        assert day['payload'] == {'run': 3}
+
+    def test_late_sample_does_not_replace_last(self, store):
+        base = datetime(2026, 10, 1, 12, 0)
+        store.append(base, {'articles': 5}, {'run': 'new'})
+        store.append(base - timedelta(hours=1), {'articles': 1}, {'run': 'old'})
+
+        (day,) = store.rollups('day', base - timedelta(hours=12), base + timedelta(hours=1))
+
+        assert day['articles']['last'] == 5 and day['payload'] == {'run': 'new'}
+        assert [sample['articles'] for sample in store.samples(base - timedelta(days=1), base + timedelta(1))] == [1, 5]
+        assert store.latest()['payload'] == {'run': 'new'}
+        assert store.latest(since=base + timedelta(minutes=1)) is None
+
+    def test_retention_prunes_old_rows(self, tmp_path):
+        store = TimeSeriesStore(tmp_path / 'metrics.db', 'collection', ('articles',),
+                                retention_days={'raw': 2, 'minute': 1})
+        base = datetime(2026, 10, 10, 9, 0)
+        store.append(base - timedelta(days=5), {'articles': 1})
+        store.append(base, {'articles': 2})
+
+        assert len(store.samples(base - timedelta(days=10), base + timedelta(1))) == 1
+        assert len(store.rollups('minute', base - timedelta(days=10), base + timedelta(1))) == 1
+        assert len(store.rollups('day', base - timedelta(days=10), base + timedelta(1))) == 2
+
+    def test_rejects_invalid_names(self, tmp_path):
+        with pytest.raises(ValueError):
+            TimeSeriesStore(tmp_path / 'metrics.db', 'collection; DROP', ('articles',))
+
+
+class TestCollectionAnalyticsTimeSeries:
+    """収集分析の履歴取得テスト"""
+
+    @pytest.fixture
+    def analytics(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(collection_analytics, 'get_config', lambda: StubConfig(tmp_path))
+        return CollectionAnalytics()
+
+    def test_history_has_latest_session_per_day(self, analytics):
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        for days_ago in range(60, 0, -1):
+            day = today - timedelta(days=days_ago)
+            analytics._store_metrics(make_metrics(day.replace(hour=7), 10))
+            analytics._store_metrics(make_metrics(day.replace(hour=18), 20 + days_ago,
+                                                  sources={'newsapi': 5, 'gnews': 5}))
+
+        history = analytics._get_historical_metrics(today - timedelta(days=90), datetime.now())
+
+        assert len(history) == 60
+        assert [metrics.total_articles for metrics in history] == [20 + days_ago for days_ago in range(60, 0, -1)]
+        assert history[-1].articles_by_source == {'newsapi': 5, 'gnews': 5}
+        assert history[-1].timestamp == (today - timedelta(days=1)).replace(hour=18).isoformat()
+        assert isinstance(history[0].urgent_articles, int)
+
+        report = analytics.generate_analytics_report(timedelta(days=30))
+        assert report['report_metadata']['metrics_count'] == 30
+
+    def test_real_time_metrics_and_series(self, analytics):
+        now = datetime.now()
+        analytics._store_metrics(make_metrics(now, 42))
+
+        real_time = analytics.get_real_time_metrics()
+        assert real_time['status'] == 'available'
+        assert real_time['current_metrics']['total_articles'] == 42
+
+        (bucket,) = analytics.get_metrics_series('hour', timedelta(hours=1))
+        assert bucket['sessions'] == 1 and bucket['total_articles']['max'] == 42
@@ -0,0 +1,113 @@
+"""
+Tracing Tests
+実行トレースのテスト
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.utils.tracing import (
+    NOOP_SPAN, Tracer, bind_context, current_span, get_active_tracer, trace_span, traced
+)
+
+
+class TestTracer:
+    """トレーサーテスト"""
+
+    def test_spans_are_noop_without_active_tracer(self):
+        assert get_active_tracer() is None
+        with trace_span('idle') as span:
+            span.set('ignored', True)
+        assert span is NOOP_SPAN
+        assert current_span() is NOOP_SPAN
+
+    def test_nested_spans_record_parent_and_attributes(self):
+        with Tracer('unit') as tracer:
+            with trace_span('run', category='pipeline') as root:
+                with trace_span('translate', category='translate', chars=120):
+                    current_span().set('status', 200)
+
+        assert get_active_tracer() is None
+        child, parent = tracer.spans
+        assert (parent.name, child.name) == ('run', 'translate')
+        assert child.parent_id == root.span_id
+        assert child.attributes == {'chars': 120, 'status': 200}
+        assert parent.start_ns <= child.start_ns <= child.end_ns <= parent.end_ns
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_get_separate_tracks(self):
+        @traced('fetch', category='collect')
+        async def fetch(delay):
+            await asyncio.sleep(delay)
+
+        with Tracer('unit') as tracer:
+            with trace_span('collect', category='pipeline') as root:
+                await asyncio.gather(fetch(0.01), fetch(0.02))
+
+        fetches = [span for span in tracer.spans if span.name == 'fetch']
+        assert [span.parent_id for span in fetches] == [root.span_id, root.span_id]
+        assert len({span.track for span in fetches} | {root.track}) == 3
+
+    @pytest.mark.asyncio
+    async def test_executor_work_keeps_parent_with_bind_context(self):
+        def render():
+            with trace_span('report.html', category='render'):
+                return 'ok'
+
+        with Tracer('unit') as tracer:
+            with trace_span('render', category='pipeline') as root:
+                loop = asyncio.get_running_loop()
+                assert await loop.run_in_executor(None, bind_context(render)) == 'ok'
+
+        html = next(span for span in tracer.spans if span.name == 'report.html')
+        assert html.parent_id == root.span_id
+        assert html.track != root.track
+
+    def test_errors_are_recorded_and_propagated(self):
+        @traced(category='send')
+        def send():
+            raise ConnectionError('smtp down')
+
+        with Tracer('unit') as tracer:
+            with pytest.raises(ConnectionError):
+                send()
+
+        assert tracer.spans[0].attributes['error'] == 'ConnectionError'
+        assert tracer.spans[0].name.endswith('send')
+
+    def test_chrome_trace_output(self, tmp_path):
+        with Tracer('news_delivery') as tracer:
+            with trace_span('run', category='pipeline'):
+                with trace_span('gmail.send', category='send', recipients=['a@example.com']):
+                    pass
+
+        path = tracer.write(tmp_path / 'trace.json')
+        trace = json.loads(path.read_text(encoding='utf-8'))
+
+        complete = [event for event in trace['traceEvents'] if event['ph'] == 'X']
+        assert [event['name'] for event in complete] == ['run', 'gmail.send']
+        assert complete[1]['args']['recipients'] == "['a@example.com']"
+        assert complete[1]['args']['parent_id'] == complete[0]['args']['span_id']
+        assert all(event['dur'] >= 0 for event in complete)
+        assert trace['otherData']['span_count'] == 2
+        assert [row['name'] for row in tracer.summary()][0] == 'run'
+
+    def test_span_limit_counts_dropped(self):
+        with Tracer('unit', max_spans=2) as tracer:
+            for _ in range(5):
+                with trace_span('tick'):
+                    pass
+
+        assert (len(tracer.spans), tracer.dropped_spans) == (2, 3)
+
+    @pytest.mark.asyncio
+    async def test_open_span_tracks_innermost_span_per_task(self):
+        with Tracer('unit') as tracer:
+            task = asyncio.current_task()
+            with trace_span('render', category='pipeline') as outer:
+                with trace_span('report.html', category='render') as inner:
+                    assert tracer.open_span(task) is inner
+                assert tracer.open_span(task) is outer
+            assert tracer.open_span(task) is None